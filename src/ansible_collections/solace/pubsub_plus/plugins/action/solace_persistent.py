@@ -0,0 +1,45 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Action plugin for all modules of the collection, see meta/runtime.yml.
+# - connection solace.pubsub_plus.solace_persistent: runs the module in the persistent process of the host
+# - any other connection: regular module execution
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.module_utils._text import to_text
+from ansible.module_utils.connection import Connection, ConnectionError
+from ansible.plugins.action.normal import ActionModule as ActionNormal
+from ansible.utils.vars import merge_hash
+from ansible.vars.clean import remove_internal_keys
+
+SOLACE_PERSISTENT_CONNECTION = 'solace.pubsub_plus.solace_persistent'
+
+
+class ActionModule(ActionNormal):
+
+    def run(self, tmp=None, task_vars=None):
+        if getattr(self._connection, 'transport', None) != SOLACE_PERSISTENT_CONNECTION or self._task.async_val:
+            return super(ActionModule, self).run(tmp, task_vars)
+
+        self._supports_check_mode = True
+        self._supports_async = False
+        # skip ActionNormal.run(), it executes the module
+        result = super(ActionNormal, self).run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        # the task's action is the module name, resolved_action is this plugin
+        module_name = self._task.action.rpartition('.')[2]
+        module_args = self._task.args.copy()
+        self._update_module_args(module_name, module_args, task_vars)
+
+        try:
+            res = Connection(self._connection.socket_path).exec_solace_module(module_name, module_args)
+        except ConnectionError as e:
+            return merge_hash(result, dict(failed=True, msg=to_text(e)))
+
+        # same as ActionBase._execute_module()
+        data = self._parse_returned_data(res)
+        remove_internal_keys(data)
+        return merge_hash(result, data)
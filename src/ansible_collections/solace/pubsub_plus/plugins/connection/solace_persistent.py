@@ -0,0 +1,142 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: solace_persistent
+short_description: run solace modules in a persistent, warm process per broker / solace cloud account
+description:
+- Runs the modules of this collection in a long-lived local process (ansible-connection) per inventory host instead of
+  transferring the module and starting a new python process for every task.
+- SEMP / Solace Cloud http sessions (keep-alive connections) are pooled per (host, port, user) and the broker's SEMP version
+  is cached, both are re-used by all tasks of the host in the play.
+- Use instead of C(ansible_connection=local). All other modules / actions run locally, same as with the C(local) connection.
+- Module arguments, check mode, module_defaults and results behave the same as with the C(local) connection.
+- Async tasks fall back to regular module execution.
+notes:
+- Tasks for the same host are run one at a time by the persistent process.
+- The task's C(environment) is not passed to the persistent process, set e.g. C(ANSIBLE_SOLACE_ENABLE_LOGGING) before calling ansible-playbook.
+- Set C(persistent_command_timeout) to a value larger than the longest running task, e.g. creating a Solace Cloud service.
+options:
+  persistent_connect_timeout:
+    description:
+    - Idle time in seconds after which the persistent process is shut down.
+    - The next task starts a new process.
+    type: int
+    default: 300
+    ini:
+    - section: persistent_connection
+      key: connect_timeout
+    env:
+    - name: ANSIBLE_PERSISTENT_CONNECT_TIMEOUT
+    vars:
+    - name: ansible_connect_timeout
+  persistent_command_timeout:
+    description:
+    - Max time in seconds a single task may run in the persistent process.
+    type: int
+    default: 3600
+    ini:
+    - section: persistent_connection
+      key: command_timeout
+    env:
+    - name: ANSIBLE_PERSISTENT_COMMAND_TIMEOUT
+    vars:
+    - name: ansible_command_timeout
+  persistent_log_messages:
+    description:
+    - Log the messages exchanged with the persistent process to the ansible log file.
+    type: bool
+    default: false
+    ini:
+    - section: persistent_connection
+      key: log_messages
+    env:
+    - name: ANSIBLE_PERSISTENT_LOG_MESSAGES
+    vars:
+    - name: ansible_persistent_log_messages
+'''
+
+EXAMPLES = '''
+# inventory
+all:
+  hosts:
+    local_broker:
+      ansible_connection: solace.pubsub_plus.solace_persistent
+      sempv2_host: localhost
+      sempv2_port: 8080
+      sempv2_is_secure_connection: false
+      sempv2_username: admin
+      sempv2_password: admin
+      sempv2_timeout: '60'
+'''
+
+import contextlib
+import importlib
+import io
+import json
+import traceback
+
+from ansible.module_utils._text import to_bytes
+from ansible.plugins.connection import NetworkConnectionBase
+
+COLLECTION_MODULES_PACKAGE = 'ansible_collections.solace.pubsub_plus.plugins.modules'
+
+
+class Connection(NetworkConnectionBase):
+
+    transport = 'solace.pubsub_plus.solace_persistent'
+    has_pipelining = False
+
+    def __init__(self, play_context, new_stdin=None, *args, **kwargs):
+        super(Connection, self).__init__(play_context, new_stdin, *args, **kwargs)
+        # no sub plugin (cliconf / httpapi / netconf) to configure
+        self._sub_plugin = {'type': 'external'}
+
+    def _connect(self):
+        # nothing to connect to, the SEMP / Solace Cloud sessions are created on first use
+        self._connected = True
+
+    def exec_solace_module(self, module_name: str, module_args: dict) -> dict:
+        # runs the module in this process
+        # returns: dict(rc, stdout, stderr) as if the module was run in its own process
+        if not self._connected:
+            self._connect()
+        if not module_name.isidentifier():
+            return dict(rc=1, stdout='', stderr=f"invalid module name: '{module_name}'")
+        # import outside of the stdout capture so the module is imported only once per process
+        try:
+            module = importlib.import_module(f"{COLLECTION_MODULES_PACKAGE}.{module_name}")
+        except ImportError:
+            return dict(rc=1, stdout='', stderr=traceback.format_exc())
+        self.queue_message('vvvv', f"running module '{module_name}' in persistent process")
+        return Connection._run_module(module, module_args)
+
+    @staticmethod
+    def _run_module(module, module_args: dict) -> dict:
+        from ansible.module_utils import basic
+        from ansible.module_utils.common import warnings
+        basic._ANSIBLE_ARGS = to_bytes(json.dumps(dict(ANSIBLE_MODULE_ARGS=module_args)))
+        # warnings & deprecations are collected globally per process
+        warnings._global_warnings = []
+        warnings._global_deprecations = []
+        rc = 0
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                module.main()
+        except SystemExit as e:
+            if e.code is None:
+                rc = 0
+            else:
+                rc = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            rc = 1
+            stderr.write(traceback.format_exc())
+        finally:
+            basic._ANSIBLE_ARGS = None
+        return dict(rc=rc, stdout=stdout.getvalue(), stderr=stderr.getvalue())
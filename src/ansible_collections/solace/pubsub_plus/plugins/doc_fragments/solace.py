@@ -55,6 +55,22 @@ options:
     required: false
     default: 10
     type: int
+  connect_timeout:
+    description: Timeout in seconds to establish the connection of each http request. Default is C(timeout).
+    required: false
+    type: float
+  read_timeout:
+    description: Timeout in seconds to wait for the response of each http request. Default is C(timeout).
+    required: false
+    type: float
+  task_deadline:
+    description:
+    - Time budget of the task in seconds, for all its http requests incl. retries, polls and pages.
+    - The timeouts of each request and the delays between retries and polls are shrunk to the remaining time.
+    - The task fails with 'task deadline exceeded' once the time is used up.
+    - Default is no deadline.
+    required: false
+    type: float
   x_broker:
     description: Custom HTTP header with the broker virtual router id, if using a SEMPv2 Proxy/agent infrastructure.
     required: false
@@ -102,6 +118,56 @@ options:
     type: str
 '''
 
+    BROKERS = r'''
+options:
+  brokers:
+    description: The brokers. Arguments not set default to the module's arguments.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description: Name of the broker in the result. Defaults to '{host}:{port}'.
+        type: str
+        required: false
+      host:
+        description: Hostname of Solace Broker.
+        type: str
+        required: false
+      port:
+        description: Management port of Solace Broker.
+        type: int
+        required: false
+      secure_connection:
+        description: If true, use https rather than http.
+        type: bool
+        required: false
+      validate_certs:
+        description: Flag to switch validation of client certificates on/off when using a secure connection.
+        type: bool
+        required: false
+      username:
+        description: Administrator username for Solace Broker.
+        type: str
+        required: false
+      password:
+        description: Administrator password for Solace Broker.
+        type: str
+        required: false
+      timeout:
+        description: Connection timeout in seconds for the http request.
+        type: int
+        required: false
+      msg_vpn:
+        description: The message vpn.
+        type: str
+        required: false
+  msg_vpn:
+    description: The message vpn. Required if not set for every broker.
+    type: str
+    required: false
+'''
+
     BROKER_CONFIG_SOLACE_CLOUD = r'''
 options:
   solace_cloud_home:
@@ -182,6 +248,22 @@ options:
     required: false
     default: 60
     type: int
+  connect_timeout:
+    description: Timeout in seconds to establish the connection of each http request. Default is C(timeout).
+    required: false
+    type: float
+  read_timeout:
+    description: Timeout in seconds to wait for the response of each http request. Default is C(timeout).
+    required: false
+    type: float
+  task_deadline:
+    description:
+    - Time budget of the task in seconds, for all its http requests incl. retries, polls and pages.
+    - The timeouts of each request and the delays between retries and polls are shrunk to the remaining time.
+    - The task fails with 'task deadline exceeded' once the time is used up.
+    - Default is no deadline.
+    required: false
+    type: float
   validate_certs:
     description: Flag to switch validation of client certificates on/off when using a secure connection.
     required: false
@@ -290,10 +372,38 @@ options:
       - config
       - monitor
   page_count:
-    description: "The number of results to be fetched from broker in single call. Note: always returns the entire result set by following the cursor."
+    description:
+    - "The number of results to be fetched from broker in single call. Note: always returns the entire result set by following the cursor."
+    - "With C(adaptive_paging=true): the number of results of the first call."
     required: false
     type: int
     default: 100
+  adaptive_paging:
+    description:
+    - "Grows the number of results per call while the broker's response time and size stay within limits, up to the broker's max count."
+    - "Shrinks it on timeouts and server errors."
+    - "The return C(paging) shows the page sizes used and the number of round trips."
+    required: false
+    type: bool
+    default: false
+  shards:
+    description:
+    - "Splits the collection into up to C(shards) shards by key prefix and reads them concurrently, each with its own cursor."
+    - "Without C(shard_prefixes), the shards are probed with listings of a single object: the common prefix of the keys,
+      then the next characters, e.g. C(key==device-0*), C(key==device-1*) and C(key==device-*,key!=device-0*,key!=device-1*).
+      A collection which fits into a single page is read as a single shard. Skewed keys result in shards of different sizes, see C(shard_prefixes)."
+    - "Results are grouped by shard. Only for modules which document sharding support."
+    required: false
+    type: int
+    default: 1
+  shard_prefixes:
+    description:
+    - "Explicit key prefixes, instead of probing. No prefix may start with another one."
+    - "Example: ['asct-a', 'asct-b'] results in the 3 shards: C(key==asct-a*), C(key==asct-b*) and C(key!=asct-a*,key!=asct-b*)."
+    - "A shard per prefix and a shard for the keys matching no prefix. C(shards) is the number of shards read concurrently, if not set all of them."
+    required: false
+    type: list
+    elements: str
   query_params:
     description: The query parameters.
     required: false
@@ -327,10 +437,38 @@ options:
     choices:
       - monitor
   page_count:
-    description: "The number of results to be fetched from broker in single call. Note: always returns the entire result set by following the cursor."
+    description:
+    - "The number of results to be fetched from broker in single call. Note: always returns the entire result set by following the cursor."
+    - "With C(adaptive_paging=true): the number of results of the first call."
     required: false
     type: int
     default: 100
+  adaptive_paging:
+    description:
+    - "Grows the number of results per call while the broker's response time and size stay within limits, up to the broker's max count."
+    - "Shrinks it on timeouts and server errors."
+    - "The return C(paging) shows the page sizes used and the number of round trips."
+    required: false
+    type: bool
+    default: false
+  shards:
+    description:
+    - "Splits the collection into up to C(shards) shards by key prefix and reads them concurrently, each with its own cursor."
+    - "Without C(shard_prefixes), the shards are probed with listings of a single object: the common prefix of the keys,
+      then the next characters, e.g. C(key==device-0*), C(key==device-1*) and C(key==device-*,key!=device-0*,key!=device-1*).
+      A collection which fits into a single page is read as a single shard. Skewed keys result in shards of different sizes, see C(shard_prefixes)."
+    - "Results are grouped by shard. Only for modules which document sharding support."
+    required: false
+    type: int
+    default: 1
+  shard_prefixes:
+    description:
+    - "Explicit key prefixes, instead of probing. No prefix may start with another one."
+    - "Example: ['asct-a', 'asct-b'] results in the 3 shards: C(key==asct-a*), C(key==asct-b*) and C(key!=asct-a*,key!=asct-b*)."
+    - "A shard per prefix and a shard for the keys matching no prefix. C(shards) is the number of shards read concurrently, if not set all of them."
+    required: false
+    type: list
+    elements: str
   query_params:
     description: The query parameters.
     required: false
@@ -350,3 +488,90 @@ options:
           default: []
           elements: str
 '''
+
+    BULK = r'''
+description:
+- "Streams the input file C(src) in chunks of C(chunk_size) records, memory stays flat regardless of the size of the file."
+- "The existing objects of each chunk are read concurrently, one request per object, only the settings of the chunk are selected."
+- "Creates and updates, or deletes with C(state=absent), are applied concurrently, up to C(max_concurrency) at a time."
+- "The result of every record and the progress after every chunk are written to C(dest), the module returns the counts only."
+- "Not transactional: records already applied are not rolled back. Failed records are reported in C(dest), the remaining records are still applied
+  unless more than C(max_errors) records failed."
+options:
+  src:
+    description:
+    - "The input file on the target, ndjson or csv, optionally gzip compressed."
+    - "ndjson: one json object per line with the key arguments, e.g. C(name), and C(sempv2_settings) (alias C(settings))."
+    - "csv: a header row with the key arguments, all other columns with a value are settings."
+    type: path
+    required: true
+  format:
+    description: "The format of C(src). Default: 'csv' for files ending in '.csv' or '.csv.gz', otherwise 'ndjson'."
+    type: str
+    required: false
+    choices:
+      - ndjson
+      - csv
+  dest:
+    description:
+    - "The output file on the target, ndjson."
+    - "One line per record: C(line), the key arguments, C(action) (created, updated, unchanged, deleted or failed) and C(error)."
+    - "After every chunk a line with C(progress): the number of chunks & records, the counts per action and the duration so far."
+    type: path
+    required: true
+  state:
+    description: Target state of the objects in C(src).
+    type: str
+    required: false
+    default: present
+    choices:
+      - present
+      - absent
+  chunk_size:
+    description: Number of records compared and applied at a time.
+    type: int
+    required: false
+    default: 1000
+  page_count:
+    description: The initial page size of the listing of the existing child objects, e.g. the subscriptions of mqtt sessions, grows adaptively.
+    type: int
+    required: false
+    default: 100
+  max_concurrency:
+    description: Max number of records applied concurrently.
+    type: int
+    required: false
+    default: 8
+  max_errors:
+    description: Stops after the chunk in which the number of failed records exceeds C(max_errors).
+    type: int
+    required: false
+    default: 100
+'''
+
+    JOURNAL = r'''
+options:
+  journal:
+    description:
+    - "The journal file of the operation on the target. The planned and the completed actions are appended, synced to disk in batches."
+    - "With a journal, the actions completed before an error are not rolled back."
+    type: path
+    required: false
+  resume:
+    description:
+    - "Resume the operation of a previous run which did not complete, skipping the actions it completed."
+    - "Starts from scratch if the journal does not exist or the previous run completed.
+      Fails if the journal was written by a different operation, e.g. different names, settings or input file."
+    type: bool
+    required: false
+    default: false
+  journal_max_age:
+    description:
+    - "Max age in seconds of the existing objects recorded in the journal."
+    - "A run resumed within this age uses the recorded objects instead of reading all objects again,
+      it only reads the objects of the actions which may have completed without being recorded."
+    - "Ignored by the bulk modules, they read the existing objects per chunk."
+    type: int
+    required: false
+    default: 3600
+'''
@@ -0,0 +1,75 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Filters to retrieve facts gathered by solace_gather_facts / solace_cloud_get_facts.
+# Same get functions as module solace_get_facts, but evaluated on the controller on a single host's facts:
+# no need to pass 'hostvars' to a module.
+#
+# input: hostvars[{host}], hostvars[{host}].ansible_facts or hostvars[{host}].ansible_facts.solace
+#
+# e.g.
+#   "{{ hostvars[inventory_hostname] | solace.pubsub_plus.solace_facts(['get_vpnAttributes', 'get_serviceVirtualRouterName'], msg_vpn=vpn) }}"
+#   "{{ hostvars['broker-1'] | solace.pubsub_plus.solace_vpn_client_connection_details(msg_vpn=vpn) }}"
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.errors import AnsibleFilterError
+from ansible.module_utils.common.collections import is_string
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_facts import SolaceGetFacts
+
+FILTER_NAME_PREFIX = 'solace.pubsub_plus.'
+
+
+def _get_solace_facts(facts) -> dict:
+    if not isinstance(facts, dict) and not hasattr(facts, 'keys'):
+        raise AnsibleFilterError(f"expected hostvars of a host, its 'ansible_facts' or 'ansible_facts.solace', got: {type(facts)}")
+    if 'ansible_facts' in facts:
+        facts = facts['ansible_facts']
+    if 'vpns' not in facts:
+        if 'solace' not in facts:
+            raise AnsibleFilterError("cannot find 'ansible_facts.solace' - call solace_gather_facts or solace_cloud_get_facts first")
+        facts = facts['solace']
+    return facts
+
+
+def solace_facts(facts, get_functions, msg_vpn=None) -> dict:
+    if is_string(get_functions):
+        get_functions = [get_functions]
+    if not get_functions:
+        raise AnsibleFilterError(f"get_functions: empty. specify at least one of {list(SolaceGetFacts.GET_FUNCTIONS)}")
+    try:
+        return SolaceGetFacts.get_facts(FILTER_NAME_PREFIX + 'solace_facts', _get_solace_facts(facts), msg_vpn, list(get_functions))
+    except AnsibleFilterError:
+        raise
+    except Exception as e:
+        raise AnsibleFilterError(f"solace_facts: {str(e)}")
+
+
+def _create_get_function_filter(get_function: str):
+    field = SolaceGetFacts.GET_FUNCTIONS[get_function][0]
+
+    def _filter(facts, msg_vpn=None):
+        return solace_facts(facts, [get_function], msg_vpn)[field]
+    return _filter
+
+
+class FilterModule(object):
+
+    # filter name: get function
+    GET_FUNCTION_FILTERS = {
+        'solace_vpn_client_connection_details': 'get_vpnClientConnectionDetails',
+        'solace_vpn_attributes': 'get_vpnAttributes',
+        'solace_vpn_bridge_remote_msg_vpn_locations': 'get_vpnBridgeRemoteMsgVpnLocations',
+        'solace_service_trust_store_details': 'get_serviceTrustStoreDetails',
+        'solace_service_virtual_router_name': 'get_serviceVirtualRouterName',
+        'solace_service_dmr_cluster_connection_details': 'get_serviceDmrClusterConnectionDetails'
+    }
+
+    def filters(self):
+        filters = {
+            'solace_facts': solace_facts
+        }
+        for name, get_function in self.GET_FUNCTION_FILTERS.items():
+            filters[name] = _create_get_function_filter(get_function)
+        return filters
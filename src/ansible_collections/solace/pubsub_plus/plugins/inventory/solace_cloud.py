@@ -0,0 +1,205 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: solace_cloud
+short_description: inventory of the services in a Solace Cloud account
+description:
+- Creates one host per Solace Cloud service in the account with the same host vars as
+  M(solace.pubsub_plus.solace_cloud_get_facts) C(get_formattedHostInventory), e.g. C(sempv2_host), C(sempv2_port), C(vpn).
+- The services' details are retrieved concurrently.
+- Use the inventory cache to skip the Solace Cloud api calls on subsequent runs, e.g. C(cache_plugin=ansible.builtin.jsonfile).
+- The inventory file name must end with C(solace_cloud.yml) or C(solace_cloud.yaml).
+notes:
+- "The cache contains the services' SEMP credentials (C(sempv2_username), C(sempv2_password)), same as an inventory file generated
+   with M(solace.pubsub_plus.solace_cloud_get_facts). The api token is never cached."
+- Services which are not in C(creationState=completed) are skipped.
+extends_documentation_fragment:
+- constructed
+- inventory_cache
+options:
+  plugin:
+    description: Marks the file as an inventory for this plugin.
+    type: str
+    required: true
+    choices: ['solace.pubsub_plus.solace_cloud']
+  api_token:
+    description: The API token to access the Solace Cloud Service API.
+    type: str
+    required: true
+    env:
+    - name: SOLACE_CLOUD_API_TOKEN
+  solace_cloud_home:
+    description: The Solace Cloud home region. Same as the module argument, defaults to env var C(ANSIBLE_SOLACE_SOLACE_CLOUD_HOME) / 'us'.
+    type: str
+    required: false
+    choices: ['us', 'au', 'US', 'AU', '']
+  api_base_url:
+    description:
+    - Overrides the Solace Cloud api base url derived from C(solace_cloud_home), e.g. to go through a proxy.
+    - "Example: https://api.solace.cloud/api/v0"
+    type: str
+    required: false
+  timeout:
+    description: Connection timeout in seconds for the http requests.
+    type: int
+    default: 60
+  validate_certs:
+    description: Flag to switch the validation of the certificates of the Solace Cloud api on/off.
+    type: bool
+    default: true
+  service_names:
+    description: Only include the services with these names. Default is all services.
+    type: list
+    elements: str
+    required: false
+  hostname_field:
+    description: The service field to use as the inventory hostname.
+    type: str
+    default: name
+    choices: ['name', 'serviceId']
+  add_api_token:
+    description: Adds the api token to each host as C(solace_cloud_api_token).
+    type: bool
+    default: false
+  max_concurrency:
+    description: Max number of concurrent requests to retrieve the services' details.
+    type: int
+    default: 8
+'''
+
+EXAMPLES = '''
+# solace_cloud.yml
+plugin: solace.pubsub_plus.solace_cloud
+# api_token from env var SOLACE_CLOUD_API_TOKEN
+service_names:
+  - my-service-1
+  - my-service-2
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ./tmp/inventory-cache
+cache_timeout: 3600
+keyed_groups:
+  - key: meta.datacenterId
+    prefix: datacenter
+
+# ansible-playbook -i solace_cloud.yml my.playbook.yml
+# refresh the cache: ansible-playbook -i solace_cloud.yml --flush-cache my.playbook.yml
+'''
+
+from ansible.errors import AnsibleError
+from ansible.module_utils._text import to_native
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+
+
+class _InventoryModule(object):
+    # stands in for the AnsibleModule, SolaceCloudApi and its config only use params, _name and fail_json
+
+    def __init__(self, name: str, params: dict):
+        self._name = name
+        self.params = params
+
+    def fail_json(self, msg, **kwargs):
+        raise AnsibleError(to_native(msg))
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'solace.pubsub_plus.solace_cloud'
+
+    def verify_file(self, path: str) -> bool:
+        if super().verify_file(path):
+            return path.endswith(('solace_cloud.yml', 'solace_cloud.yaml'))
+        return False
+
+    def _get_api(self):
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api_cloud import SolaceCloudApi
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskSolaceCloudConfig
+        api_base_url = self.get_option('api_base_url')
+
+        class _SolaceCloudApi(SolaceCloudApi):
+            def get_api_base_path(self, config: SolaceTaskSolaceCloudConfig) -> str:
+                if api_base_url:
+                    return api_base_url.rstrip('/')
+                return super().get_api_base_path(config)
+
+        module = _InventoryModule(self.NAME, dict(
+            solace_cloud_api_token=self.get_option('api_token'),
+            solace_cloud_home=self.get_option('solace_cloud_home'),
+            timeout=self.get_option('timeout'),
+            validate_certs=self.get_option('validate_certs')
+        ))
+        return _SolaceCloudApi(module), SolaceTaskSolaceCloudConfig(module)
+
+    def _get_hosts(self) -> dict:
+        # returns {hostname: host vars} for all completed services
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_facts import SolaceCloudBrokerFacts
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceApiError
+        api, config = self._get_api()
+        service_names = self.get_option('service_names')
+        try:
+            services = api.get_services_with_details(config, max_workers=self.get_option('max_concurrency'), names=service_names)
+        except SolaceApiError as e:
+            raise AnsibleError(f"solace cloud api error: {e.get_ansible_msg()}")
+        except Exception as e:
+            raise AnsibleError(f"solace cloud api error: {to_native(e)}", orig_exc=e)
+        hostname_field = self.get_option('hostname_field')
+        hosts = {}
+        for service in services:
+            if service is None:
+                # deleted since listing
+                continue
+            if service.get('creationState') != 'completed':
+                self.display.vvv(f"solace_cloud: skipping service '{service.get('name')}', creationState={service.get('creationState')}")
+                continue
+            meta = dict(
+                service_name=service.get('name'),
+                sc_service_id=service.get('serviceId'),
+                datacenterId=service.get('datacenterId'),
+                serviceTypeId=service.get('serviceTypeId'),
+                serviceClassId=service.get('serviceClassId'),
+                eventBrokerVersion=service.get('eventBrokerVersion'),
+                serviceClassDisplayedAttributes=service.get('serviceClassDisplayedAttributes')
+            )
+            facts = SolaceCloudBrokerFacts(self.NAME, service, vpn=None)
+            try:
+                hosts[service[hostname_field]] = facts.get_host_inventory_entry(meta=meta)
+            except Exception as e:
+                raise AnsibleError(f"service '{service.get('name')}': cannot create host entry from service details: {to_native(e)}", orig_exc=e)
+        return hosts
+
+    def _populate(self, hosts: dict):
+        strict = self.get_option('strict')
+        api_token = self.get_option('api_token') if self.get_option('add_api_token') else None
+        for hostname, host_vars in hosts.items():
+            self.inventory.add_host(hostname)
+            for name, value in host_vars.items():
+                self.inventory.set_variable(hostname, name, value)
+            if api_token:
+                self.inventory.set_variable(hostname, 'solace_cloud_api_token', api_token)
+            self._set_composite_vars(self.get_option('compose'), host_vars, hostname, strict=strict)
+            self._add_host_to_composed_groups(self.get_option('groups'), host_vars, hostname, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option('keyed_groups'), host_vars, hostname, strict=strict)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super().parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+        cache_key = self.get_cache_key(path)
+        user_cache_setting = self.get_option('cache')
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
+        hosts = None
+        if attempt_to_read_cache:
+            try:
+                hosts = self._cache[cache_key]
+            except KeyError:
+                cache_needs_update = True
+        if hosts is None:
+            hosts = self._get_hosts()
+        if cache_needs_update:
+            self._cache[cache_key] = hosts
+        self._populate(hosts)
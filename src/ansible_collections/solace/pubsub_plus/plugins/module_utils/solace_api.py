@@ -2,42 +2,245 @@
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
 from __future__ import (absolute_import, division, print_function)
-import os
 __metaclass__ = type
 
 from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_utils import SolaceUtils
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_consts import SolaceTaskOps
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceCloudApiError, SolaceCloudApiResponseDataError, SolaceEnvVarError, SolaceError, SolaceInternalErrorAbstractMethod, SolaceApiError, SolaceParamsValidationError
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceInternalError
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskConfig, SolaceTaskBrokerConfig, SolaceTaskSolaceCloudConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceInternalErrorAbstractMethod, SolaceApiError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceInternalError, SolaceCircuitBreakerOpenError, SolaceTaskDeadlineError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskConfig, SolaceTaskBrokerConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_metrics import SolaceMetrics
 from ansible.module_utils.basic import AnsibleModule
+import concurrent.futures
 import json
+import os
+import re
+import tempfile
+import threading
 import urllib.parse
 import logging
 import time
-import xml.etree.ElementTree as ET
-import re
+import random
+import hashlib
+import http.cookiejar
 
+# NOTE: SEMP v1 and Solace Cloud apis live in their own files and are only
+#       imported by modules / tasks that use them:
+#       - solace_api_sempv1.py: SolaceSempV1Api, SolaceSempV1PagingGetApi
+#       - solace_api_cloud.py: SolaceCloudApi, SolaceCloudApiCertAuthority
 
 SOLACE_API_HAS_IMPORT_ERROR = False
 SOLACE_API_IMPORT_ERR_TRACEBACK = None
 import traceback
 try:
     import requests
-    import xmltodict
 except ImportError:
     SOLACE_API_HAS_IMPORT_ERROR = True
     SOLACE_API_IMPORT_ERR_TRACEBACK = traceback.format_exc()
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class SolaceStateFile(object):
+    # small json state shared by all processes on the controller, e.g. ansible forks and the tasks of a play,
+    # in a file per (kind, key) in ANSIBLE_SOLACE_STATE_DIR, locked with flock.
+    # without flock or if the file cannot be written: state of the process only.
+
+    def __init__(self, kind: str, key: str, get_initial_state, check_state=None):
+        # check_state(state) -> state: validates / expires the state read from the file
+        self.get_initial_state = get_initial_state
+        self.check_state = check_state
+        self.path = None
+        if fcntl is not None:
+            file_name = f"ansible-solace-{kind}-" + hashlib.sha256(key.encode()).hexdigest()[:16] + '.json'
+            self.path = os.path.join(solace_sys.STATE_DIR or tempfile.gettempdir(), file_name)
+        self._state = get_initial_state()
+        self._lock = threading.Lock()
+
+    def _parse(self, raw: bytes) -> dict:
+        try:
+            state = json.loads(raw.decode('utf-8'))
+            return self.check_state(state) if self.check_state else state
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return self.get_initial_state()
+
+    def update(self, func):
+        # applies func(state) to the shared state under the lock, returns func's result
+        with self._lock:
+            if self.path is not None:
+                try:
+                    fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+                    try:
+                        fcntl.flock(fd, fcntl.LOCK_EX)
+                        state = self._parse(os.read(fd, 65536))
+                        result = func(state)
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        os.ftruncate(fd, 0)
+                        os.write(fd, json.dumps(state).encode('utf-8'))
+                        self._state = state
+                        return result
+                    finally:
+                        # releases the lock
+                        os.close(fd)
+                except OSError as e:
+                    logging.warning("state file '%s': %s, using process local state", self.path, str(e))
+                    self.path = None
+            return func(self._state)
+
+    def get(self) -> dict:
+        # the state as of the last update of this process
+        return self._state
+
+
+class SolaceCircuitBreaker(object):
+    # circuit breaker per host (host:port), shared by all processes on the controller and across tasks, see SolaceStateFile.
+    # - closed: calls go through. opens after ANSIBLE_SOLACE_CIRCUIT_BREAKER_FAILURES consecutive connection failures
+    #   (connection errors, timeouts, 502/504) within ANSIBLE_SOLACE_CIRCUIT_BREAKER_WINDOW_SECS.
+    # - open: calls fail fast with SolaceCircuitBreakerOpenError for ANSIBLE_SOLACE_CIRCUIT_BREAKER_OPEN_SECS.
+    # - half open: one probe call goes through, closes on success, opens again on failure.
+
+    STATE_CLOSED = 'closed'
+    STATE_OPEN = 'open'
+    STATE_HALF_OPEN = 'half_open'
+    FAILURE_STATUS_CODES = [502, 504]
+
+    _breakers = dict()
+    _breakers_lock = threading.Lock()
+
+    def __init__(self, host: str):
+        self.host = host
+        self.state_file = SolaceStateFile('circuit', host, self._get_initial_state)
+
+    @classmethod
+    def get(cls, url: str) -> 'SolaceCircuitBreaker':
+        # the breaker of the url's host, None if switched off
+        if solace_sys.CIRCUIT_BREAKER_FAILURES <= 0:
+            return None
+        host = urllib.parse.urlsplit(url).netloc
+        with cls._breakers_lock:
+            breaker = cls._breakers.get(host)
+            if breaker is None:
+                breaker = cls(host)
+                cls._breakers[host] = breaker
+        return breaker
+
+    @staticmethod
+    def _get_initial_state() -> dict:
+        return dict(state=SolaceCircuitBreaker.STATE_CLOSED, failures=0, first_failure_ts=0.0, opened_ts=0.0, last_error=None)
+
+    def before_call(self):
+        # raises SolaceCircuitBreakerOpenError if the call must fail fast
+        def check(state: dict) -> float:
+            # returns the secs until the next probe, 0: call goes through
+            if state['state'] == self.STATE_CLOSED:
+                return 0
+            probe_in_secs = state['opened_ts'] + solace_sys.CIRCUIT_BREAKER_OPEN_SECS - time.time()
+            if probe_in_secs > 0:
+                return probe_in_secs
+            # this call is the probe, the others keep failing fast until it completes or another open period has passed
+            state['state'] = self.STATE_HALF_OPEN
+            state['opened_ts'] = time.time()
+            return 0
+        probe_in_secs = self.state_file.update(check)
+        if probe_in_secs > 0:
+            state = self.state_file.get()
+            raise SolaceCircuitBreakerOpenError(self.host, state['failures'], state['last_error'], probe_in_secs, self.state_file.path)
+
+    def is_open(self) -> bool:
+        # True while calls fail fast, i.e. until the next probe
+        state = self.state_file.get()
+        return state['state'] != self.STATE_CLOSED and state['opened_ts'] + solace_sys.CIRCUIT_BREAKER_OPEN_SECS > time.time()
+
+    def on_success(self):
+        def close(state: dict):
+            if state['state'] != self.STATE_CLOSED:
+                logging.info("circuit breaker '%s': closed", self.host)
+            state.update(self._get_initial_state())
+        # avoid the write if nothing to reset
+        state = self.state_file.get()
+        if state['state'] == self.STATE_CLOSED and state['failures'] == 0:
+            return
+        self.state_file.update(close)
+
+    def on_failure(self, error: str):
+        def fail(state: dict):
+            now = time.time()
+            if state['failures'] == 0 or now - state['first_failure_ts'] > solace_sys.CIRCUIT_BREAKER_WINDOW_SECS:
+                state['failures'] = 0
+                state['first_failure_ts'] = now
+            state['failures'] += 1
+            state['last_error'] = error
+            if state['state'] == self.STATE_HALF_OPEN or state['failures'] >= solace_sys.CIRCUIT_BREAKER_FAILURES:
+                if state['state'] != self.STATE_OPEN:
+                    logging.warning("circuit breaker '%s': open after %d failures, last: %s", self.host, state['failures'], error)
+                state['state'] = self.STATE_OPEN
+                state['opened_ts'] = now
+        self.state_file.update(fail)
+
+
+class _HttpRoundtripLogRecord(object):
+    # formats the roundtrip when the log record is emitted
+
+    def __init__(self, resp, with_bodies: bool):
+        self.resp = resp
+        self.with_bodies = with_bodies
+
+    @staticmethod
+    def _truncate(body) -> str:
+        if not body:
+            return None
+        if isinstance(body, bytes):
+            body = body[:solace_sys.LOG_BODY_MAX_CHARS * 4].decode('utf-8', errors='replace')
+        if len(body) > solace_sys.LOG_BODY_MAX_CHARS:
+            return body[:solace_sys.LOG_BODY_MAX_CHARS] + f"...({len(body)} chars)"
+        return body
+
+    def __str__(self):
+        resp = self.resp
+        log = {
+            'request': {
+                'method': resp.request.method,
+                'url': resp.request.url,
+                'headers': SolaceApi._get_http_masked_headers(resp.request.headers)
+            },
+            'response': {
+                'status_code': resp.status_code,
+                'reason': resp.reason,
+                'elapsed_ms': int(resp.elapsed.total_seconds() * 1000),
+                'headers': dict(resp.headers)
+            }
+        }
+        if self.with_bodies and solace_sys.LOG_BODY_MAX_CHARS > 0:
+            log['request']['body'] = self._truncate(resp.request.body)
+            log['response']['body'] = self._truncate(resp.text)
+        return json.dumps(log)
+
 
 class SolaceApi(object):
 
+    # pooled sessions, one per (scheme, host:port, user), kept for the lifetime of the process.
+    # a single module run re-uses the connection for all its calls,
+    # the solace_persistent connection plugin keeps them warm across tasks.
+    _sessions = dict()
+    _sessions_lock = threading.Lock()
+    # calls in flight per host:port, bounded by ANSIBLE_SOLACE_MAX_CONNECTIONS_PER_HOST across all threads,
+    # the connection pool of each session holds as many connections, so none are discarded and re-opened
+    _host_slots = dict()
+    # responses are decompressed transparently by requests, the encodings are fixed instead of depending on
+    # optional decoders (brotli, zstandard) being installed
+    ACCEPT_ENCODING_COMPRESSED = 'gzip, deflate'
+    ACCEPT_ENCODING_IDENTITY = 'identity'
+
     def __init__(self, module: AnsibleModule):
         SolaceUtils.module_fail_on_import_error(
             module, SOLACE_API_HAS_IMPORT_ERROR, SOLACE_API_IMPORT_ERR_TRACEBACK)
         self.module = module
         self.safe_for_path_array = None
+        self.is_circuit_breaker_bypassed = False
         return
 
     def get_module(self):
@@ -52,9 +255,61 @@ class SolaceApi(object):
     def get_headers(self, config: SolaceTaskConfig, op: str) -> dict:
         return config.get_headers(op)
 
+    @staticmethod
+    def get_session(url: str, auth) -> 'requests.Session':
+        url_parts = urllib.parse.urlsplit(url)
+        if isinstance(auth, tuple):
+            user = auth[0]
+        else:
+            # bearer token
+            user = hashlib.sha256(str(getattr(auth, 'token', '')).encode()).hexdigest()
+        key = (url_parts.scheme, url_parts.netloc, user)
+        with SolaceApi._sessions_lock:
+            session = SolaceApi._sessions.get(key, None)
+            if session is None:
+                session = requests.Session()
+                # don't keep cookies, every request authenticates as before
+                session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                session.headers['Accept-Encoding'] = (SolaceApi.ACCEPT_ENCODING_COMPRESSED if solace_sys.HTTP_COMPRESSION
+                                                      else SolaceApi.ACCEPT_ENCODING_IDENTITY)
+                if solace_sys.MAX_CONNECTIONS_PER_HOST > 0:
+                    adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(solace_sys.MAX_CONNECTIONS_PER_HOST, requests.adapters.DEFAULT_POOLSIZE))
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                SolaceApi._sessions[key] = session
+        return session
+
+    @staticmethod
+    def get_host_slots(url: str) -> threading.BoundedSemaphore:
+        # None: no limit
+        if solace_sys.MAX_CONNECTIONS_PER_HOST <= 0:
+            return None
+        netloc = urllib.parse.urlsplit(url).netloc
+        with SolaceApi._sessions_lock:
+            slots = SolaceApi._host_slots.get(netloc, None)
+            if slots is None:
+                slots = threading.BoundedSemaphore(solace_sys.MAX_CONNECTIONS_PER_HOST)
+                SolaceApi._host_slots[netloc] = slots
+        return slots
+
+    @staticmethod
+    def map_concurrently(func, items: list, max_workers: int) -> list:
+        # calls func for each item, up to max_workers at a time, returns the results in the order of items.
+        # the calls of all threads to the same host are bounded by get_host_slots(), i.e. max_workers can be larger
+        # than the number of connections per host, e.g. when fanning out to many brokers.
+        max_workers = min(max_workers, len(items))
+        if max_workers <= 1:
+            return [func(item) for item in items]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, items))
+
     def set_safe_for_path_array(self, safe_for_path_array):
         self.safe_for_path_array = safe_for_path_array
 
+    def set_circuit_breaker_bypassed(self, is_bypassed: bool):
+        # bypassed: calls record their outcome but never fail fast, e.g. waiting for a broker to become available
+        self.is_circuit_breaker_bypassed = is_bypassed
+
     def make_get_request(self, config: SolaceTaskConfig, path_array: list, module_op=SolaceTaskOps.OP_READ_OBJECT, query_params=None):
         return self.make_request(config, requests.get, path_array, json_body=None, query_params=query_params, module_op=module_op)
 
@@ -107,21 +362,77 @@ class SolaceApi(object):
         if _query_params:
             _query_params_str = urllib.parse.urlencode(
                 _query_params, safe=',*')
-        resp = request_func(
-            _url,
-            json=json_body,
-            auth=self.get_auth(config),
-            timeout=config.get_timeout(),
-            headers=_headers,
-            verify=config.get_validate_certs(),
-            params=_query_params_str)
+        return self.send_request(config, request_func.__name__.upper(), _url, SolaceMetrics.get_path_template(path_array),
+                                 json=json_body,
+                                 auth=self.get_auth(config),
+                                 headers=_headers,
+                                 verify=config.get_validate_certs(),
+                                 params=_query_params_str)
+
+    def get_circuit_breaker(self, url: str) -> 'SolaceCircuitBreaker':
+        # the breaker of the broker, None if switched off
+        return SolaceCircuitBreaker.get(url)
+
+    def send_request(self, config: SolaceTaskConfig, method: str, url: str, path_template: str, **kwargs):
+        # sends the request with the pooled session of the url, within the task deadline, the circuit breaker of the host
+        # and the calls in flight per host, records the call's metrics. kwargs: the arguments of requests, 'auth' is required.
+        _session_request_func = getattr(SolaceApi.get_session(url, kwargs['auth']), method.lower())
+        _what = method + ' ' + path_template
+        config.check_deadline(_what)
+        _circuit_breaker = self.get_circuit_breaker(url)
+        if _circuit_breaker is not None and not self.is_circuit_breaker_bypassed:
+            _circuit_breaker.before_call()
+        _host_slots = SolaceApi.get_host_slots(url)
+        if _host_slots is not None:
+            # waits for a free connection within the remaining time budget, None: no task deadline
+            _remaining_secs = config.get_remaining_secs()
+            if not _host_slots.acquire(timeout=max(_remaining_secs, 0) if _remaining_secs is not None else None):
+                raise SolaceTaskDeadlineError(config.task_deadline, _what)
+        try:
+            _timeout = config.get_request_timeout(_what)
+            SolaceMetrics.begin_request()
+            _start_time_ns = SolaceMetrics.get_time_ns()
+            _start = time.perf_counter()
+            resp = _session_request_func(url, timeout=_timeout, **kwargs)
+        except requests.exceptions.SSLError:
+            # not a failure of the host
+            raise
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # timeout shrunk to the task deadline: not a failure of the host
+            if isinstance(e, requests.exceptions.Timeout):
+                config.check_deadline(_what)
+            if _circuit_breaker is not None:
+                _circuit_breaker.on_failure(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            if _host_slots is not None:
+                _host_slots.release()
+        if _circuit_breaker is not None:
+            if resp.status_code in SolaceCircuitBreaker.FAILURE_STATUS_CODES:
+                _circuit_breaker.on_failure(f"{resp.status_code} {resp.reason}")
+            else:
+                _circuit_breaker.on_success()
+        SolaceMetrics.record_request(method, path_template, resp, _start_time_ns, time.perf_counter() - _start)
         SolaceApi.log_http_roundtrip(resp)
         return resp
 
+    def is_circuit_open(self, config: SolaceTaskConfig) -> bool:
+        # True if calls to the host fail fast, i.e. retrying is pointless
+        if self.is_circuit_breaker_bypassed:
+            return False
+        _circuit_breaker = self.get_circuit_breaker(self.get_url(config, ''))
+        return _circuit_breaker is not None and _circuit_breaker.is_open()
+
+    def on_throttled(self, path_array: list, delay_secs: int) -> float:
+        # 'server too busy': returns the secs to wait before the retry
+        return delay_secs
+
     def make_request(self, config: SolaceTaskConfig, request_func, path_array: list, json_body=None, query_params=None, module_op=None):
         try_count = 0
         delay_secs = 30
         max_tries = 20
+        # 'server too busy' retries are bounded by time, not by tries: their delay may be shorter than delay_secs, see on_throttled()
+        throttled_until = None
         do_retry = True
         while do_retry and try_count < max_tries:
             resp = self._make_request(config,
@@ -133,7 +444,12 @@ class SolaceApi(object):
             if resp.status_code in [502, 504]:
                 logging.warning("resp.status_code: %d, resp.reason: '%s', try number: %d",
                                 resp.status_code, resp.reason, try_count)
-                time.sleep(delay_secs)
+                if self.is_circuit_open(config):
+                    # the retry would fail fast
+                    break
+                _delay_secs = config.get_sleep_secs(delay_secs, f"retrying {resp.status_code} {resp.reason}")
+                SolaceMetrics.record_retry(_delay_secs)
+                time.sleep(_delay_secs)
             elif resp.status_code in [500]:
                 _body = self.get_response_body(resp)
                 if _body is not None:
@@ -141,7 +457,14 @@ class SolaceApi(object):
                         if _body['subCode'] == '5000_104':
                             logging.warning("resp.status_code: %d, resp.message: '%s', try number: %d",
                                             resp.status_code, _body['message'], try_count)
-                            time.sleep(delay_secs)
+                            _throttled_delay_secs = config.get_sleep_secs(self.on_throttled(path_array, delay_secs), "retrying 'server too busy'")
+                            SolaceMetrics.record_retry(_throttled_delay_secs)
+                            time.sleep(_throttled_delay_secs)
+                            if throttled_until is None:
+                                throttled_until = time.monotonic() + max_tries * delay_secs
+                            if time.monotonic() >= throttled_until:
+                                do_retry = False
+                            continue
                             #  "status_code": 500,
                             #   "body": {
                             #   "message": "The server is too busy to respond",
@@ -152,7 +475,9 @@ class SolaceApi(object):
                         elif _body['subCode'] == '5000_102':
                             logging.warning("resp.status_code: %d, resp.message: '%s', try number: %d",
                                             resp.status_code, _body['message'], try_count)
-                            time.sleep(delay_secs)
+                            _delay_secs = config.get_sleep_secs(delay_secs, "retrying 'request in progress'")
+                            SolaceMetrics.record_retry(_delay_secs)
+                            time.sleep(_delay_secs)
 
                             #   "errorId": "3ee0a936e43bdf8b",
                             #     "message": "Job ovd2i0cdxtb is still in progress.",
@@ -222,26 +547,16 @@ class SolaceApi(object):
 
     @staticmethod
     def log_http_roundtrip(resp):
+        # one line per call: status & headers always, bodies truncated & sampled, see solace_sys.LOG_BODY_*
+        # formatted only if the record is emitted: DEBUG for successful calls, INFO for failed calls
         if not solace_sys.ENABLE_LOGGING:
             return
-        request_body = SolaceApi.get_http_request_body(resp)
-        resp_body = SolaceUtils.parse_response_text(resp.text)
-        log = {
-            'request': {
-                'method': resp.request.method,
-                'url': resp.request.url,
-                'headers': SolaceApi._get_http_masked_headers(resp.request.headers),
-                'body': request_body
-            },
-            'response': {
-                'status_code': resp.status_code,
-                'reason': resp.reason,
-                'url': resp.url,
-                'headers': dict(resp.headers),
-                'body': resp_body
-            }
-        }
-        logging.debug("\n%s", json.dumps(log, indent=2))
+        level = logging.INFO if resp.status_code >= 400 else logging.DEBUG
+        if not logging.getLogger().isEnabledFor(level):
+            return
+        with_bodies = (level == logging.INFO or solace_sys.LOG_BODY_SAMPLE_RATE >= 1.0
+                       or random.random() < solace_sys.LOG_BODY_SAMPLE_RATE)
+        logging.log(level, "%s", _HttpRoundtripLogRecord(resp, with_bodies))
         return
 
     @staticmethod
@@ -264,6 +579,9 @@ class SolaceSempV2Api(SolaceApi):
     API_BASE_SEMPV2_ACTION = "/SEMP/v2/action"
     API_BASE_SEMPV2_PRIVATE_ACTION = "/SEMP/v2/__private_action__"
 
+    # (raw_api_version, version) per semp url and user, kept for the lifetime of the process
+    _sempv2_versions = dict()
+
     def __init__(self, module: AnsibleModule):
         super().__init__(module)
         return
@@ -275,6 +593,9 @@ class SolaceSempV2Api(SolaceApi):
         return config.get_semp_url(path)
 
     def get_sempv2_version(self, config: SolaceTaskBrokerConfig):
+        key = (config.get_semp_url(''), config.get_semp_auth()[0])
+        if key in SolaceSempV2Api._sempv2_versions:
+            return SolaceSempV2Api._sempv2_versions[key]
         resp = self.make_get_request(config, [
                                      SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + ["about", "api"], query_params=None)
         raw_api_version = SolaceUtils.get_key(resp, "sempVersion")
@@ -284,6 +605,7 @@ class SolaceSempV2Api(SolaceApi):
         except SolaceInternalError as e:
             raise SolaceInternalError(
                 f"sempv2 version parsing failed: {raw_api_version}") from e
+        SolaceSempV2Api._sempv2_versions[key] = (raw_api_version, v)
         return raw_api_version, v
 
     def handle_bad_response(self, resp, module_op):
@@ -297,10 +619,10 @@ class SolaceSempV2Api(SolaceApi):
             ))
         raise SolaceApiError(resp, _resp, self.get_module()._name, module_op)
 
-    def get_object_settings(self, config: SolaceTaskBrokerConfig, path_array: list, module_op=SolaceTaskOps.OP_READ_OBJECT) -> dict:
+    def get_object_settings(self, config: SolaceTaskBrokerConfig, path_array: list, module_op=SolaceTaskOps.OP_READ_OBJECT, query_params=None) -> dict:
         # returns settings or None if not found
         try:
-            resp = self.make_get_request(config, path_array, module_op)
+            resp = self.make_get_request(config, path_array, module_op, query_params)
         except SolaceApiError as e:
             resp = e.get_resp()
             # check if not found error, otherwise raise error
@@ -317,12 +639,65 @@ class SolaceSempV2Api(SolaceApi):
         return resp
 
 
+class SolaceSempV2PageSize(object):
+    # page size of an adaptive SEMP v2 list read:
+    # - grows by GROWTH_FACTOR while a page's latency & response size stay within half the targets
+    # - shrinks by SHRINK_FACTOR if a page exceeds a target and on timeouts & 5xx
+    # - a count rejected by the broker caps the page size at the largest accepted count.
+    #   the cap is kept per broker & collection for the lifetime of the process.
+
+    MIN_PAGE_SIZE = 10
+    MAX_PAGE_SIZE = 1000
+    GROWTH_FACTOR = 2
+    SHRINK_FACTOR = 0.5
+    TARGET_LATENCY_SECS = 2.0
+    TARGET_RESPONSE_BYTES = 4 * 1024 * 1024
+
+    _max_page_sizes = dict()
+
+    def __init__(self, key: tuple, page_size: int):
+        self.key = key
+        self.max_page_size = SolaceSempV2PageSize._max_page_sizes.get(key, self.MAX_PAGE_SIZE)
+        self.page_size = max(self.MIN_PAGE_SIZE, min(page_size, self.max_page_size))
+        self.accepted_page_size = None
+
+    def can_shrink(self) -> bool:
+        return self.page_size > self.MIN_PAGE_SIZE
+
+    def shrink(self):
+        self.page_size = max(self.MIN_PAGE_SIZE, int(self.page_size * self.SHRINK_FACTOR))
+
+    def is_rejected(self, resp) -> bool:
+        # bad request for a count larger than an accepted one
+        return resp.status_code == 400 and self.accepted_page_size is not None and self.page_size > self.accepted_page_size
+
+    def reject(self):
+        self.max_page_size = self.accepted_page_size
+        self.page_size = self.accepted_page_size
+        SolaceSempV2PageSize._max_page_sizes[self.key] = self.max_page_size
+
+    def accept(self, duration_secs: float, response_bytes: int):
+        self.accepted_page_size = max(self.accepted_page_size or 0, self.page_size)
+        if duration_secs > self.TARGET_LATENCY_SECS or response_bytes > self.TARGET_RESPONSE_BYTES:
+            self.shrink()
+        elif (duration_secs * self.GROWTH_FACTOR <= self.TARGET_LATENCY_SECS
+              and response_bytes * self.GROWTH_FACTOR <= self.TARGET_RESPONSE_BYTES):
+            self.page_size = min(self.page_size * self.GROWTH_FACTOR, self.max_page_size)
+
+
 class SolaceSempV2PagingGetApi(SolaceSempV2Api):
 
+    NEXT_URL_COUNT_REGEX = re.compile(r'([?&])count=\d+')
+    # characters of a key which cannot be used in a shard's where clause
+    SHARD_UNSAFE_CHARS = [',', '\\', '*', '?']
+    # max number of single object listings to split a collection into shards
+    MAX_SHARD_PROBES = 64
+
     def __init__(self, module: AnsibleModule, is_supports_paging: bool = True):
         super().__init__(module)
         self.next_url = None
         self.is_supports_paging = is_supports_paging
+        self.paging = None
         return
 
     def get_url(self, config: SolaceTaskBrokerConfig, path: str) -> str:
@@ -348,13 +723,80 @@ class SolaceSempV2PagingGetApi(SolaceSempV2Api):
     def get_monitor_api_base(self) -> str:
         return SolaceSempV2Api.API_BASE_SEMPV2_MONITOR
 
+    def _make_request(self, config: SolaceTaskConfig, request_func, path_array: list, json_body, query_params, module_op):
+        if self.paging is not None:
+            self.paging['round_trips'] += 1
+        return super()._make_request(config, request_func, path_array, json_body, query_params, module_op)
+
+    def get_paging(self) -> dict:
+        # of the last get_objects() call: number of pages, round trips incl. retries, page sizes in order of use
+        return self.paging
+
+    def _record_page(self, page_size: int):
+        self.paging['pages'] += 1
+        if page_size is not None and page_size not in self.paging['page_sizes']:
+            self.paging['page_sizes'].append(page_size)
+
+    def get_page_adaptive(self, config: SolaceTaskBrokerConfig, path_array: list, query_params: dict, page_size: SolaceSempV2PageSize) -> dict:
+        # returns the body of the next page, retries the page with a smaller page size on timeouts, 5xx and a rejected count
+        module_op = SolaceTaskOps.OP_READ_OBJECT_LIST
+        while True:
+            if self.next_url:
+                self.next_url = self.NEXT_URL_COUNT_REGEX.sub(rf"\g<1>count={page_size.page_size}", self.next_url)
+                _query_params = None
+            else:
+                query_params['count'] = page_size.page_size
+                _query_params = query_params
+            _start = time.perf_counter()
+            try:
+                resp = self._make_request(config, requests.get, path_array, None, _query_params, module_op)
+            except requests.exceptions.Timeout:
+                if not page_size.can_shrink():
+                    raise
+                logging.warning("timeout for page size: %d, retrying with a smaller page size", page_size.page_size)
+                page_size.shrink()
+                SolaceMetrics.record_retry(0)
+                continue
+            if resp.status_code >= 500 and page_size.can_shrink():
+                logging.warning("resp.status_code: %d for page size: %d, retrying with a smaller page size", resp.status_code, page_size.page_size)
+                page_size.shrink()
+                SolaceMetrics.record_retry(0)
+                continue
+            if page_size.is_rejected(resp):
+                logging.warning("resp.status_code: %d for page size: %d, max page size: %d", resp.status_code, page_size.page_size, page_size.accepted_page_size)
+                page_size.reject()
+                SolaceMetrics.record_retry(0)
+                continue
+            if resp.status_code >= 500:
+                # min page size: same retries as any other request, the page size stays at the min
+                body = self.make_get_request(config, path_array, module_op=module_op, query_params=_query_params)
+                self._record_page(page_size.page_size)
+                return body
+            body = self.handle_response(resp, module_op)
+            self._record_page(page_size.page_size)
+            page_size.accept(time.perf_counter() - _start, len(resp.content) if resp.content else 0)
+            return body
+
     def get_objects(self,
                     config: SolaceTaskBrokerConfig,
                     api: str,
                     page_count: int,
                     path_array: list,
                     query_params: dict = None,
-                    get_monitor_api_base_func=get_monitor_api_base) -> list:
+                    get_monitor_api_base_func=None,
+                    adaptive_paging: bool = False) -> list:
+        # adaptive_paging: page_count is the initial page size, see SolaceSempV2PageSize
+        return list(self.iter_objects(config, api, page_count, path_array, query_params, get_monitor_api_base_func, adaptive_paging))
+
+    def iter_objects(self,
+                     config: SolaceTaskBrokerConfig,
+                     api: str,
+                     page_count: int,
+                     path_array: list,
+                     query_params: dict = None,
+                     get_monitor_api_base_func=None,
+                     adaptive_paging: bool = False):
+        # yields the objects page by page, only a single page is held in memory
         _query_params = {}
         if self.is_supports_paging:
             _query_params.update({
@@ -375,13 +817,21 @@ class SolaceSempV2PagingGetApi(SolaceSempV2Api):
                 })
         api_base = self.API_BASE_SEMPV2_CONFIG
         if api == 'monitor':
-            api_base = get_monitor_api_base_func()
+            api_base = (get_monitor_api_base_func or self.get_monitor_api_base)()
         path_array = [api_base] + path_array
-        result_list = []
+        page_size = None
+        if self.is_supports_paging and adaptive_paging:
+            page_size = SolaceSempV2PageSize(
+                (config.get_semp_url(''), SolaceMetrics.get_path_template(path_array)), page_count)
+        self.paging = dict(pages=0, round_trips=0, page_sizes=[])
         hasNextPage = True
         while hasNextPage:
-            body = self.make_get_request(
-                config, path_array, module_op=SolaceTaskOps.OP_READ_OBJECT_LIST, query_params=_query_params)
+            if page_size:
+                body = self.get_page_adaptive(config, path_array, _query_params, page_size)
+            else:
+                body = self.make_get_request(
+                    config, path_array, module_op=SolaceTaskOps.OP_READ_OBJECT_LIST, query_params=_query_params)
+                self._record_page(page_count if self.is_supports_paging else None)
             data_list = []
             # monitor api may have collections as well
             collections_list = []
@@ -389,7 +839,7 @@ class SolaceSempV2PagingGetApi(SolaceSempV2Api):
                 data_list = body['data']
             if "collections" in body.keys():
                 collections_list = body['collections']
-            # merge collections & data into result_list. assuming same index and same length.
+            # merge collections & data into the objects. assuming same index and same length.
             for i, data in enumerate(data_list):
                 result_element = dict(
                     data=data
@@ -397,7 +847,7 @@ class SolaceSempV2PagingGetApi(SolaceSempV2Api):
                 if len(collections_list) > 0:
                     result_element.update(
                         dict(collections=collections_list[i]))
-                result_list.append(result_element)
+                yield result_element
             # check if more pages
             if "meta" not in body:
                 hasNextPage = False
@@ -409,605 +859,144 @@ class SolaceSempV2PagingGetApi(SolaceSempV2Api):
                 self.next_url = body["meta"]["paging"]["nextPageUri"]
                 _query_params = None
         self.next_url = None
-        return result_list
-
-    def get_all_objects_from_config_api(self, config: SolaceTaskBrokerConfig, path_array: list) -> list:
-        return self.get_objects(config, self.API_BASE_SEMPV2_CONFIG, 100, path_array)
-
-
-class SolaceSempV1Api(SolaceApi):
-
-    API_BASE_SEMPV1 = "/SEMP"
-
-    def __init__(self, module: AnsibleModule):
-        super().__init__(module)
-        self.call_num = -1
-
-    def get_sempv1_version(self, config: SolaceTaskBrokerConfig):
-        rpc_xml = "<rpc><show><service></service></show></rpc>"
-        resp = self.make_post_request(
-            config, rpc_xml, SolaceTaskOps.OP_READ_SEMP_VERSION)
-        rpc_reply = resp['rpc-reply']
-        raw_api_version = SolaceUtils.get_key(rpc_reply, "@semp-version")
-        # format: soltr/9_9VMR
-        s = raw_api_version[6:9].replace('_', '.')
-        try:
-            v = SolaceUtils.create_version(s)
-        except SolaceInternalError as e:
-            # try format: soltr/10_0_1VMR
-            s = raw_api_version[6:12].replace('_', '.')
-            try:
-                v = SolaceUtils.create_version(s)
-            except SolaceInternalError as e:
-                raise SolaceInternalError(
-                    f"sempv1 version parsing failed: {raw_api_version}") from e
-        return raw_api_version, v
-
-    def get_headers(self, config: SolaceTaskConfig, op: str) -> dict:
-        headers = {
-            'Content-Type': 'application/xml'
-        }
-        headers.update(config.get_headers(op))
-        return headers
-
-    def handle_response(self, resp, module_op):
-        # SEMP v1 always returns 200 (it seems)
-        # error: rpc-reply.execute-result.@code != ok or missing
-        resp_body = xmltodict.parse(resp.text) if resp.text else None
-        if resp.status_code != 200:
-            raise SolaceApiError(
-                resp, resp_body, self.get_module()._name, module_op)
-        try:
-            code = resp_body['rpc-reply']['execute-result']['@code']
-        except KeyError as e:
-            _err = {
-                'call': xmltodict.parse(SolaceApi.get_http_request_body(resp)),
-                'response': resp_body
-            }
-            raise SolaceApiError(
-                resp, _err, self.get_module()._name, module_op) from e
-        if code != "ok":
-            _err = {
-                'call': xmltodict.parse(SolaceApi.get_http_request_body(resp)),
-                'response': resp_body
-            }
-            raise SolaceApiError(
-                resp, _err, self.get_module()._name, module_op)
-        return resp_body
-
-    def convertDict2Sempv1RpcXmlString(self, d) -> str:
-        rpc_elem = SolaceUtils.convertDict2XmlElem('rpc', d)
-        return ET.tostring(rpc_elem, encoding='utf-8').decode('utf-8')
-
-    def getNextCallKey(self):
-        self.call_num = self.call_num + 1
-        return 'rpc-call-' + str(self.call_num)
-
-    def make_post_request(self, config: SolaceTaskConfig, xml_cmd: str, module_op: str):
-        url = config.get_semp_url(self.API_BASE_SEMPV1)
-        resp = requests.post(
-            url,
-            data=xml_cmd,
-            auth=config.get_semp_auth(),
-            timeout=config.get_timeout(),
-            headers=self.get_headers(config, module_op),
-            params=None
-        )
-        SolaceApi.log_http_roundtrip(resp)
-        return self.handle_response(resp, module_op)
 
-
-class SolaceSempV1PagingGetApi(SolaceSempV1Api):
-
-    def __init__(self, module: AnsibleModule):
-        super().__init__(module)
-        return
-
-    def get_objects(self, config: SolaceTaskBrokerConfig, xml_cmd: str, reponse_list_path_array: list) -> list:
-        result_list = []
-        hasNextPage = True
-        while hasNextPage:
-            semp_resp = self.make_post_request(
-                config, xml_cmd, SolaceTaskOps.OP_READ_OBJECT_LIST)
-            # extract the list
-            _d = semp_resp
-            for path in reponse_list_path_array:
-                if _d and path in _d:
-                    _d = _d[path]
-                else:
-                    # empty list / not found
-                    return []
-            if isinstance(_d, dict):
-                resp = [_d]
-            elif isinstance(_d, list):
-                resp = _d
-            else:
-                raise SolaceInternalError(
-                    f"unknown SEMP v1 return type: {type(_d)}")
-            result_list.extend(resp)
-            # see if there is more
-            more_cookie = None
-            if 'more-cookie' in semp_resp['rpc-reply']:
-                more_cookie = semp_resp['rpc-reply']['more-cookie']
-            if more_cookie:
-                xml_cmd = xmltodict.unparse(more_cookie)
-                hasNextPage = True
-            else:
-                hasNextPage = False
-        return result_list
-
-
-class SolaceCloudApi(SolaceApi):
-
-    ENV_VAR_ANSIBLE_SOLACE_SOLACE_CLOUD_HOME = "ANSIBLE_SOLACE_SOLACE_CLOUD_HOME"
-    ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US = "us"
-    ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_AU = "au"
-    API_BASE_PATH_US = "https://api.solace.cloud/api/v0"
-    API_BASE_PATH_AU = "https://api.solacecloud.com.au/api/v0"
-
-    API_DATA_CENTERS = "datacenters"
-    API_SERVICES = "services"
-    API_REQUESTS = "requests"
-    API_SERVICE_CONNECTION_ENDPOINTS = "serviceConnectionEndpoints"
-
-    def __init__(self, module: AnsibleModule):
-        super().__init__(module)
-        return
-
-    def get_api_base_path(self, config: SolaceTaskSolaceCloudConfig) -> str:
-        solace_cloud_home_value = self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US
-
-        if config.solace_cloud_home is not None and config.solace_cloud_home != '':
-            solace_cloud_home_value = config.solace_cloud_home.lower()
-        else:
-            solaceCloudHomeEnvVal = os.getenv(
-                self.ENV_VAR_ANSIBLE_SOLACE_SOLACE_CLOUD_HOME)
-            if solaceCloudHomeEnvVal is not None and solaceCloudHomeEnvVal != '':
-                if solaceCloudHomeEnvVal.lower() == self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US:
-                    solace_cloud_home_value = self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US
-                elif solaceCloudHomeEnvVal.lower() == self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_AU:
-                    solace_cloud_home_value = self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_AU
-                else:
-                    raise SolaceEnvVarError(self.ENV_VAR_ANSIBLE_SOLACE_SOLACE_CLOUD_HOME,
-                                            solaceCloudHomeEnvVal,
-                                            f"allowed values: {self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US}, {self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_AU}")
-        if solace_cloud_home_value == self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US:
-            return self.API_BASE_PATH_US
-        else:
-            return self.API_BASE_PATH_AU
-
-    def get_auth(self, config: SolaceTaskBrokerConfig) -> str:
-        return config.get_solace_cloud_auth()
-
-    def get_url(self, config: SolaceTaskBrokerConfig, path: str) -> str:
-        return config.get_solace_cloud_url(path)
-
-    def handle_response(self, resp, module_op):
-        # POST: https://api.solace.cloud/api/v0/services: returns 201
-        # POST: ../requests returns 202: accepted if long running request
-        if resp.status_code not in [200, 201, 202]:
-            self.handle_bad_response(resp, module_op)
-        # TODO: test for deleting service (failed state)
-        # import logging
-        # logging.debug(f">>>>> handling good response, resp.status_code={resp.status_code}")
-        return self.handle_good_response(resp, module_op)
-
-    def handle_good_response(self, resp, module_op):
-        _resp = super().handle_good_response(resp, module_op)
-        if _resp == {}:
-            # return the body
-            if resp.text:
-                j = resp.json()
-                return j
-        else:
-            return _resp
-        return {}
-
-    def handle_bad_response(self, resp, module_op):
-        _resp = dict(status_code=resp.status_code,
-                     reason=resp.reason
-                     )
-        _resp.update({'body': SolaceUtils.parse_response_text(resp.text)})
-        raise SolaceApiError(resp, _resp, self.get_module()._name, module_op)
-
-    def get_data_centers(self, config: SolaceTaskSolaceCloudConfig) -> list:
-        # GET /api/v0/datacenters
-        resp = self.make_get_request(
-            config, [self.get_api_base_path(config), self.API_DATA_CENTERS], query_params=None)
-        return resp
-
-    def _transform_service(self, service: dict) -> dict:
-        # ----------
-        # add eventBrokerVersion --> standardized settings across POST and GET
-        # if it doesn't exist
-        # msgVpnAttributes.vmrVersion="9.6.0.46"
-        # eventBrokerVersion="9.6"
-        if "eventBrokerVersion" in service:
-            return service
-        vmrVersion = None
-        if "msgVpnAttributes" in service:
-            if "vmrVersion" in service["msgVpnAttributes"]:
-                vmrVersion = service['msgVpnAttributes']['vmrVersion']
-        if vmrVersion:
-            service['eventBrokerVersion'] = vmrVersion[0:3]
-        else:
-            # total hack, no fallback option though
-            service['eventBrokerVersion'] = '9.6'
-        # ----------
-        return service
-
-    def get_services(self, config: SolaceTaskSolaceCloudConfig) -> list:
-        # GET https://api.solace.cloud/api/v0/services
-        module_op = SolaceTaskOps.OP_READ_OBJECT_LIST
-        try:
-            _resp = self.make_get_request(
-                config, [self.get_api_base_path(config), self.API_SERVICES], module_op)
-        except SolaceApiError as e:
-            resp = e.get_resp()
-            # TODO: what is the code if solace cloud account has 0 services?
-            if resp['status_code'] == 404:
-                return []
-            raise SolaceApiError(e.get_http_resp(), resp,
-                                 self.get_module()._name, module_op) from e
-        if isinstance(_resp, dict):
-            return [self._transform_service(_resp)]
-        # it is a list of services
-        resp = []
-        for _service in _resp:
-            service = self._transform_service(_service)
-            resp.append(service)
-        return resp
-
-    def find_service_by_name_in_services(self, services, name):
-        if isinstance(services, dict):
-            if name == services.get('name'):
-                return services
-        elif isinstance(services, list):
-            for service in services:
-                if name == service.get('name'):
-                    return service
-        else:
-            raise SolaceInternalError(
-                f"solace cloud response not 'dict' nor 'list' but {type(services)}")
-        return None
-
-    def get_service(self, config: SolaceTaskSolaceCloudConfig, service_id: str) -> dict:
-        # GET https://api.solace.cloud/api/v0/services/{{serviceId}}?included=serviceClass
-        # retrieves a single service
-        module_op = SolaceTaskOps.OP_READ_OBJECT
-        try:
-            _resp = self.make_get_request(
-                config, [self.get_api_base_path(config), self.API_SERVICES, service_id], module_op)
-        except SolaceApiError as e:
-            resp = e.get_resp()
-            if resp['status_code'] == 404:
-                return None
-            raise SolaceApiError(e.get_http_resp(), resp,
-                                 self.get_module()._name, module_op) from e
-        return self._transform_service(_resp)
-
-    def get_service_additional_hostnames_prior_9_13(self, config: SolaceTaskSolaceCloudConfig, service_id: str) -> list:
-        # GET https://api.solace.cloud/api/v0/services/{{serviceId}}?connectionDetails=false
-        # retrieves a single service
-        service = self.get_service(config, service_id)
-        if not service:
-            raise SolaceError(
-                f"solace_cloud_service_id={service_id} not found")
-        additionalHostnames = []
-        if 'attributes' in service:
-            if 'additionalHostnames' in service['attributes']:
-                if isinstance(service['attributes']['additionalHostnames'], list):
-                    additionalHostnames = service['attributes']['additionalHostnames']
-        return additionalHostnames
-
-    def get_service_additional_hostnames(self, config: SolaceTaskSolaceCloudConfig, service_id: str) -> list:
-        # GET https://api.solace.cloud/api/v0/services/{{serviceId}}?connectionDetails=false
-        # retrieves a single service
-        service = self.get_service(config, service_id)
-        if not service:
-            raise SolaceError(
-                f"solace_cloud_service_id={service_id} not found")
-        # get the default one, don't include in list
-        default_hostname = service['msgVpnAttributes']['subDomainName']
-        if default_hostname is None:
-            raise SolaceCloudApiError(
-                config.get_module()._name, "service['msgVpnAttributes']['subDomainName'] is None")
-        publicHostnames = []
-        privateHostnames = []
-        allHostnames = []
-        # distinguish between changes in api (depends on the broker version)
-        if "serviceConnectionEndpoints" in service:
-            if isinstance(service['serviceConnectionEndpoints'], list):
-                for serviceConnectionEndpoint in service['serviceConnectionEndpoints']:
-                    if serviceConnectionEndpoint['accessType'] == 'public':
-                        publicHostnames = serviceConnectionEndpoint['hostNames']
-                    else:
-                        privateHostnames = serviceConnectionEndpoint['hostNames']
-        if 'attributes' in service:
-            if 'additionalHostnames' in service['attributes']:
-                if isinstance(service['attributes']['additionalHostnames'], list):
-                    publicHostnames = service['attributes']['additionalHostnames']
-        for publicHostname in publicHostnames:
-            if publicHostname != default_hostname:
-                allHostnames.append(
-                    {"hostName": publicHostname, "accessType": "public"})
-        for privateHostname in privateHostnames:
-            if privateHostname != default_hostname:
-                allHostnames.append(
-                    {"hostName": privateHostname, "accessType": "private"})
-        return allHostnames
-
-    def get_service_connection_endpoint_id(self, config: SolaceTaskSolaceCloudConfig, service_id: str, access_type: str) -> str:
-        service = self.get_service(config, service_id)
-        if not service:
-            raise SolaceError(
-                f"solace_cloud_service_id={service_id} not found")
-        if "serviceConnectionEndpoints" not in service:
-            raise SolaceCloudApiError(
-                config.get_module()._name, "serviceConnectionEndpoints not in service")
-        if not isinstance(service['serviceConnectionEndpoints'], list):
-            raise SolaceCloudApiError(config.get_module(
-            )._name, "not isinstance(service['serviceConnectionEndpoints'], list)")
-        # find the endpoint id by hostname
-        for serviceConnectionEndpoint in service['serviceConnectionEndpoints']:
-            # serviceConnectionEndpoint['serviceConnectionEndpointId']
-            if serviceConnectionEndpoint['accessType'] == access_type:
-                return serviceConnectionEndpoint['serviceConnectionEndpointId']
-        raise SolaceCloudApiResponseDataError(config.get_module(
-        )._name, 'cannot find serviceConnectionEndpointId for accessType', {'accessType': access_type})
-
-    def get_services_with_details(self, config: SolaceTaskSolaceCloudConfig) -> list:
-        # get services, then for each service, get details
-        _services = self.get_services(config)
-        services = []
-        for _service in _services:
-            services.append(self.get_service(config, _service['serviceId']))
-        return services
-
-    def create_service(self, config: SolaceTaskSolaceCloudConfig, wait_timeout_minutes: int, data: dict, try_count=0) -> dict:
-        # POST https://api.solace.cloud/api/v0/services
-        module_op = SolaceTaskOps.OP_CREATE_OBJECT
-        resp = self.make_post_request(
-            config, [self.get_api_base_path(config), self.API_SERVICES], data, module_op)
-        _service_id = resp['serviceId']
-        if wait_timeout_minutes > 0:
-            res = self.wait_for_service_create_completion(
-                config, wait_timeout_minutes, resp['serviceId'])
-            if "failed" in res:
-                logging.warn(
-                    "solace cloud service creation failed, service_id=%s, try number: %d", _service_id, try_count)
-                if try_count < 3:
-                    time.sleep(10)
-                    logging.warn(
-                        "solace cloud service in failed state - deleting service_id=%s ...", _service_id)
-                    _resp = self.delete_service(config, _service_id)
-                    time.sleep(30)
-                    logging.warn("creating solace cloud service again ...")
-                    _resp = self.create_service(
-                        config, wait_timeout_minutes, data, try_count + 1)
-                    logging.warn("new service_id=%s", _resp['serviceId'])
-                    return self.wait_for_service_create_completion(config, wait_timeout_minutes, _resp['serviceId'])
-                else:
-                    r = dict(
-                        msg=f"create service: Solace Cloud API failed to create service after {try_count} attempts",
-                        response=res
-                    )
-                    raise SolaceApiError(
-                        None, r, self.get_module()._name, module_op)
+    @staticmethod
+    def get_shard_where_clauses(shard_key: str, shard_prefixes: list) -> list:
+        # SEMP v2 where only compares numbers with < and >, keys are split with wildcards instead:
+        # a shard per prefix [key==p1*], ..., [key==pn*] and a shard for all other keys [key!=p1*, ..., key!=pn*]
+        where_clauses = [[f"{shard_key}=={p}*"] for p in shard_prefixes]
+        where_clauses.append([f"{shard_key}!={p}*" for p in shard_prefixes])
+        return where_clauses
+
+    def _get_first_page(self, config: SolaceTaskBrokerConfig, path_array: list, where: list, select: list, count: int) -> tuple:
+        # returns the objects of the first page and if there are more pages
+        query_params = dict(count=count)
+        if where:
+            query_params['where'] = ','.join(where)
+        if select:
+            query_params['select'] = ','.join(select)
+        body = self.make_get_request(config, path_array, module_op=SolaceTaskOps.OP_READ_OBJECT_LIST, query_params=query_params)
+        has_next_page = 'nextPageUri' in body.get('meta', {}).get('paging', {})
+        return body.get('data', []), has_next_page
+
+    def _get_safe_prefix(self, prefix: str) -> str:
+        # the prefix up to the first character which cannot be used in a where clause
+        for i, c in enumerate(prefix):
+            if c in self.SHARD_UNSAFE_CHARS:
+                return prefix[:i]
+        return prefix
+
+    def get_shard_where_clauses_probed(self,
+                                       config: SolaceTaskBrokerConfig,
+                                       path_array: list,
+                                       where: list,
+                                       page_count: int,
+                                       shard_key: str,
+                                       shards: int) -> list:
+        # splits the keys into up to 'shards' disjoint where clauses, by the characters following their common prefix:
+        # - the first page of keys: a single shard if there is no next page, otherwise a candidate common prefix
+        # - the common prefix of all keys: binary search with [key!=prefix*] listings of a single object
+        # - a prefix is split into its next characters, each found with a listing of a single object excluding the characters found so far,
+        #   the keys with characters not found are read by a shard [key==prefix*, key!=prefix+c1*, ...]
+        # the shards are not of equal size, e.g. for skewed keys, see shard_prefixes.
+        def probe(probe_where: list) -> str:
+            data, _has_next_page = self._get_first_page(config, path_array, where + probe_where, [shard_key], 1)
+            return str(data[0].get(shard_key)) if data else None
+
+        def get_prefix_where(prefix: str) -> list:
+            return [f"{shard_key}=={prefix}*"] if prefix else []
+
+        sample, has_next_page = self._get_first_page(config, path_array, where, [shard_key], page_count)
+        if not has_next_page:
+            return [[]]
+        candidate = self._get_safe_prefix(os.path.commonprefix([str(d.get(shard_key)) for d in sample]))
+        probes = 1
+        # longest prefix of the candidate all keys start with
+        lo, hi = 0, len(candidate)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            probes += 1
+            if probe([f"{shard_key}!={candidate[:mid]}*"]) is None:
+                lo = mid
             else:
-                return res
-        else:
-            return resp
-
-    def wait_for_service_create_completion(self, config: SolaceTaskSolaceCloudConfig, timeout_minutes: int, service_id: str) -> dict:
-        module_op = SolaceTaskOps.OP_READ_OBJECT
-        is_completed = False
-        is_failed = False
-        try_count = -1
-        delay = 30  # seconds
-        max_retries = (timeout_minutes * 60) // delay
-
-        while not is_completed and not is_failed and try_count < max_retries:
-            logging.debug("service_id:%s, try number: %d",
-                          service_id, try_count + 1)
-            resp = self.get_service(config, service_id)
-            if not resp:
-                # edge case: service deleted before creation completed
-                raise SolaceApiError(
-                    resp, "service not found - may have been deleted while creating", self.get_module()._name, module_op)
-            is_completed = (resp['creationState'] == 'completed')
-            is_failed = (resp['creationState'] == 'failed')
-            try_count += 1
-            if timeout_minutes > 0:
-                time.sleep(delay)
-
-        if is_failed:
-            return dict(
-                failed=True,
-                response=resp
-            )
-        if not is_completed:
-            r = dict(
-                msg=f"create service not completed, timeout(mins)={timeout_minutes}, creationState={resp['creationState']}",
-                response=resp
+                hi = mid - 1
+        # (prefix, exclusions): exclusions None: all keys of the prefix, can be split further
+        split = [(candidate[:lo], None)]
+        expandable = [candidate[:lo]]
+        while expandable and len(split) < shards and probes < self.MAX_SHARD_PROBES:
+            prefix = expandable.pop(0)
+            index = split.index((prefix, None))
+            max_chars = max(1, shards - len(split))
+            chars = []
+            is_exact = False
+            is_complete = False
+            while len(chars) < max_chars and probes < self.MAX_SHARD_PROBES:
+                exclusions = [f"{shard_key}!={prefix}{c}*" for c in chars] + ([f"{shard_key}!={prefix}"] if is_exact else [])
+                key = probe(get_prefix_where(prefix) + exclusions)
+                probes += 1
+                if key is None:
+                    is_complete = True
+                    break
+                if key == prefix:
+                    is_exact = True
+                    continue
+                c = key[len(prefix)]
+                if c in self.SHARD_UNSAFE_CHARS:
+                    break
+                chars.append(c)
+            children = [(prefix + c, None) for c in chars]
+            if not is_complete or is_exact or not chars:
+                children.append((prefix, [f"{shard_key}!={prefix}{c}*" for c in chars]))
+            split[index:index + 1] = children
+            expandable += [prefix + c for c in chars]
+        logging.debug("shards: %d after %d probes", len(split), probes)
+        return [get_prefix_where(prefix) + (exclusions or []) for prefix, exclusions in split]
+
+    def get_objects_sharded(self,
+                            config: SolaceTaskBrokerConfig,
+                            api: str,
+                            page_count: int,
+                            path_array: list,
+                            query_params: dict,
+                            get_monitor_api_base_func,
+                            adaptive_paging: bool,
+                            shard_key: str,
+                            shard_prefixes: list,
+                            shards: int,
+                            max_workers: int) -> list:
+        # pages the shards, up to max_workers at a time, each with its own cursor.
+        # shard_prefixes None: 'shards' shards probed from the keys, see get_shard_where_clauses_probed().
+        # results are concatenated in shard order, i.e. grouped by prefix, the keys matching no prefix last.
+        query_params = query_params if query_params else {}
+        self.paging = dict(pages=0, round_trips=0, page_sizes=[])
+
+        def get_shard(shard_where: list):
+            shard_api = SolaceSempV2PagingGetApi(self.get_module(), self.is_supports_paging)
+            shard_query_params = dict(
+                select=query_params.get('select', None),
+                where=(query_params.get('where', None) or []) + shard_where
             )
-            raise SolaceApiError(None, r, self.get_module()._name, module_op)
-        return resp
-
-    def delete_service(self, config: SolaceTaskSolaceCloudConfig, service_id: str) -> dict:
-        # DELETE https://api.solace.cloud/api/v0/services/{{serviceId}}
-        path_array = [self.get_api_base_path(config),
-                      SolaceCloudApi.API_SERVICES, service_id]
-        return self.make_delete_request(config, path_array)
-
-    def get_object_settings(self, config: SolaceTaskBrokerConfig, path_array: list) -> dict:
-        # returns settings or None if not found
-        module_op = SolaceTaskOps.OP_READ_OBJECT
-        try:
-            _resp = self.make_get_request(config, path_array, module_op)
-            # api oddity: 'some' calls return a list with 1 dict in it
-            # logging.debug(
-            #     f"get_object_settings._resp=\n{json.dumps(_resp, indent=2)}")
-            if isinstance(_resp, list):
-                if len(_resp) == 1 and isinstance(_resp[0], dict):
-                    resp = _resp[0]
-                else:
-                    raise SolaceCloudApiResponseDataError(self.get_module()._name,
-                                                          'api response has more than 1 element in list, needs investigation', {'resp': _resp})
-            else:
-                resp = _resp
-        except SolaceApiError as e:
-            resp = e.get_resp()
-            if resp['status_code'] == 404:
-                return None
-            raise SolaceApiError(e.get_http_resp(), resp,
-                                 self.get_module()._name, module_op) from e
-        return resp
-
-    def get_service_request_status(self, config: SolaceTaskBrokerConfig, service_id: str, request_id: str):
-        module_op = SolaceTaskOps.OP_READ_OBJECT
-        # GET https://api.solace.cloud/api/v0/services/{paste-your-serviceId-here}/requests/{{requestId}}
-        path_array = [self.get_api_base_path(config), self.API_SERVICES,
-                      service_id, self.API_REQUESTS, request_id]
-        resp = self.make_get_request(config, path_array, module_op)
-        # resp may not yet contain 'adminProgress' depending on whether this creation has started yet
-        # add it in
-        if 'adminProgress' not in resp:
-            resp['adminProgress'] = 'inProgress'
-        return resp
-
-    def wait_for_service_requests_to_finish(self, config: SolaceTaskBrokerConfig, timeout_minutes: int, service_id: str):
-        module_op = SolaceTaskOps.OP_READ_OBJECT
-        # GET https://api.solace.cloud/api/v0/services/{paste-your-serviceId-here}/requests
-        # returns list of dicts,
-        # - check all elements,
-        # - if "adminProgress" == "inProgress", wait and try again
-        # - raise SolaceApiError if timeout
-        are_all_completed = False
-        try_count = -1
-        delay = 30  # seconds
-        max_retries = (timeout_minutes * 60) // delay
-        while not are_all_completed and try_count < max_retries:
-            path_array = [self.get_api_base_path(config), self.API_SERVICES,
-                          service_id, self.API_REQUESTS]
-            resp = self.make_get_request(config, path_array, module_op)
-            # logging.debug(f"wait_for_service_requests_to_finish(): resp=\n{json.dumps(resp, indent=2)}")
-            # iterate through list to check if any adminProgress == inProgress
-            # use generator:
-            matches = (
-                respElem for respElem in resp if respElem['adminProgress'] == 'inProgress')
-            notCompletedElement = next(matches, None)
-            if notCompletedElement is None:
-                are_all_completed = True
-            try_count += 1
-            if not are_all_completed and timeout_minutes > 0:
-                time.sleep(delay)
-
-        if not are_all_completed:
-            msg = [
-                "timeout waiting for all outstanding service requests to be completed",
-                f"timeout(mins)={timeout_minutes}",
-                "request in progress:",
-                str(notCompletedElement)]
-            raise SolaceApiError(
-                resp, msg, self.get_module()._name, module_op)
-        return
-
-    def make_service_post_request(self, config: SolaceTaskBrokerConfig, path_array: list, service_id: str, json_body, module_op):
-
-        timeout_minutes = config.get_timeout() // 60
-        # set min timeout to 5 mins
-        timeout_minutes = max(timeout_minutes, 5)
-
-        # check if there are any jobs still running against this service and wait until completed
-        self.wait_for_service_requests_to_finish(
-            config, timeout_minutes, service_id)
-
-        # now make the request
-        resp = self.make_request(config, requests.post, path_array, json_body)
-        # import logging
-        # import json
-        # logging.debug(f"resp (make_request) = \n{json.dumps(resp, indent=2)}")
-        request_id = resp['id']
-        is_completed = False
-        is_failed = False
-        try_count = -1
-        delay = 15  # seconds
-        max_retries = (timeout_minutes * 60) // delay
-        # wait 1 cycle before start polling
-        time.sleep(delay)
-        while not is_completed and not is_failed and try_count < max_retries:
-            resp = self.get_service_request_status(config,
-                                                   service_id,
-                                                   request_id)
-            # import logging, json
-            # logging.debug(f"resp (get_service_request_status)= \n{json.dumps(resp, indent=2)}")
-            is_completed = (resp['adminProgress'] == 'completed')
-            is_failed = (resp['adminProgress'] == 'failed')
-            try_count += 1
-            if timeout_minutes > 0:
-                time.sleep(delay)
-
-        if is_failed:
-            raise SolaceApiError(
-                resp, resp, self.get_module()._name, module_op)
-        if not is_completed:
-            msg = [
-                f"timeout service post request - not completed, timeout(mins)={timeout_minutes}, state={resp['adminProgress']}", str(resp)]
-            raise SolaceInternalError(msg)
-        return resp
-
-
-class SolaceCloudApiCertAuthority(SolaceCloudApi):
-
-    def __init__(self, module: AnsibleModule):
-        super().__init__(module)
-        return
-
-    MAPPINGS = {
-        'certAuthorityName': 'name'
-    }
-
-    # TODO: implement the other OPs: !=, <, >, <=, >=
-    def filter(self, settings: dict, query_params: dict) -> dict:
-        if not query_params:
-            return settings
-        where_list = []
-        if ("where" in query_params and query_params['where'] and len(query_params['where']) > 0):
-            where_list = query_params['where']
-        is_match = True
-        for where in where_list:
-            # OP: ==
-            where_elements = where.split('==')
-            if len(where_elements) != 2:
-                raise SolaceParamsValidationError(
-                    'query_params.where', where, "cannot parse where clause - must be in format '{key}=={pattern}' (other ops are not supported)")
-            sempv2_key = where_elements[0]
-            pattern = where_elements[1]
-            solace_cloud_key = self.MAPPINGS.get(sempv2_key, None)
-            if not solace_cloud_key:
-                raise SolaceParamsValidationError(
-                    'query_params.where', where, f"unknown key for solace cloud '{sempv2_key}' - check with Solace Cloud API settings")
-            # pattern match
-            solace_cloud_value = settings.get(
-                solace_cloud_key, None)
-            if not solace_cloud_value:
-                raise SolaceInternalError(
-                    f"solace-cloud-key={solace_cloud_key} not found in solace cloud settings - likely a key map issue")
-            # create regex
-            regex = pattern.replace("*", ".+")
-            this_match = re.search(regex, solace_cloud_value)
-            is_match = (is_match and this_match)
-            if not is_match:
-                break
-        if is_match:
-            return settings
-        return None
+            objects = shard_api.get_objects(config, api, page_count, path_array, shard_query_params,
+                                            get_monitor_api_base_func, adaptive_paging)
+            return objects, shard_api.get_paging()
+
+        if shard_prefixes is None:
+            api_base = self.API_BASE_SEMPV2_CONFIG
+            if api == 'monitor':
+                api_base = (get_monitor_api_base_func or self.get_monitor_api_base)()
+            shard_wheres = self.get_shard_where_clauses_probed(config, [api_base] + path_array, query_params.get('where', None) or [],
+                                                               page_count, shard_key, shards)
+        else:
+            shard_wheres = self.get_shard_where_clauses(shard_key, shard_prefixes)
+        shard_results = SolaceApi.map_concurrently(get_shard, shard_wheres, max_workers)
+        result_list = []
+        self.paging.update(dict(shards=len(shard_wheres), shard_probes=self.paging['round_trips']))
+        for objects, paging in shard_results:
+            result_list += objects
+            self.paging['pages'] += paging['pages']
+            self.paging['round_trips'] += paging['round_trips']
+            self.paging['page_sizes'] += [s for s in paging['page_sizes'] if s not in self.paging['page_sizes']]
+        return result_list
 
-    def get_cert_authority(self, config, service_id, cert_authority_name, query_params):
-        # GET services/{serviceId}/serviceCertificateAuthorities/{certAuthorityName}
-        path_array = [self.get_api_base_path(config), SolaceCloudApi.API_SERVICES,
-                      service_id, 'serviceCertificateAuthorities', cert_authority_name]
-        resp = self.get_object_settings(config, path_array)
-        cert_authority = resp['certificate']
-        return self.filter(cert_authority, query_params)
+    def get_all_objects_from_config_api(self, config: SolaceTaskBrokerConfig, path_array: list) -> list:
+        return self.get_objects(config, self.API_BASE_SEMPV2_CONFIG, 100, path_array, adaptive_paging=True)
@@ -0,0 +1,624 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_consts import SolaceTaskOps
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_utils import SolaceUtils
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceCloudApiError, SolaceCloudApiResponseDataError, SolaceEnvVarError, SolaceError, SolaceApiError, SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceInternalError, SolaceTaskDeadlineError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskConfig, SolaceTaskBrokerConfig, SolaceTaskSolaceCloudConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceApi, SolaceCircuitBreaker, SolaceStateFile
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_metrics import SolaceMetrics
+from ansible.module_utils.basic import AnsibleModule
+import os
+import logging
+import threading
+import time
+import re
+import urllib.parse
+
+SOLACE_API_CLOUD_HAS_IMPORT_ERROR = False
+SOLACE_API_CLOUD_IMPORT_ERR_TRACEBACK = None
+import traceback
+try:
+    import requests
+except ImportError:
+    SOLACE_API_CLOUD_HAS_IMPORT_ERROR = True
+    SOLACE_API_CLOUD_IMPORT_ERR_TRACEBACK = traceback.format_exc()
+
+
+class SolaceCloudRateLimiter(object):
+    # token bucket per Solace Cloud api host, shared by all processes on the controller, e.g. ansible forks, see SolaceStateFile.
+    # AIMD: the rate increases by RATE_INCREASE per successful call up to ANSIBLE_SOLACE_CLOUD_RATE_LIMIT,
+    # and is multiplied by RATE_DECREASE_FACTOR on 'server too busy', at most once per DECREASE_INTERVAL_SECS,
+    # so the forks throttled by the same burst back off once.
+    # calls wait for their token instead of all retrying after the same fixed delay.
+
+    RATE_INCREASE = 0.1
+    RATE_DECREASE_FACTOR = 0.5
+    DECREASE_INTERVAL_SECS = 2.0
+    MIN_RATE = 0.1
+    # state not updated for this long is reset to the max rate
+    STATE_TTL_SECS = 300
+
+    _limiters = dict()
+    _limiters_lock = threading.Lock()
+
+    def __init__(self, host: str, max_rate: float):
+        self.host = host
+        self.max_rate = max_rate
+        self.state_file = SolaceStateFile('cloud-rate', host, self._get_initial_state, self._check_state)
+
+    @classmethod
+    def get(cls, url: str) -> 'SolaceCloudRateLimiter':
+        # the limiter of the url's host, None if rate limiting is switched off
+        if solace_sys.CLOUD_RATE_LIMIT <= 0:
+            return None
+        host = urllib.parse.urlsplit(url).netloc
+        with cls._limiters_lock:
+            limiter = cls._limiters.get(host)
+            if limiter is None:
+                limiter = cls(host, solace_sys.CLOUD_RATE_LIMIT)
+                cls._limiters[host] = limiter
+        return limiter
+
+    def _get_initial_state(self) -> dict:
+        return dict(rate=self.max_rate, tokens=1.0, ts=time.time(), decrease_ts=0.0)
+
+    def _check_state(self, state: dict) -> dict:
+        if time.time() - state['ts'] > self.STATE_TTL_SECS:
+            return self._get_initial_state()
+        state['rate'] = min(float(state['rate']), self.max_rate)
+        return state
+
+    def acquire(self, config: SolaceTaskConfig) -> float:
+        # takes a token, waits for it if the bucket is empty, returns the secs waited.
+        # raises SolaceTaskDeadlineError instead of waiting past the task deadline
+        def take(state: dict) -> float:
+            now = time.time()
+            capacity = max(1.0, state['rate'])
+            tokens = min(capacity, state['tokens'] + (now - state['ts']) * state['rate']) - 1.0
+            state['tokens'] = tokens
+            state['ts'] = now
+            # a negative balance reserves the token for a later time: callers queue up instead of polling
+            return -tokens / state['rate'] if tokens < 0 else 0.0
+        wait_secs = self.state_file.update(take)
+        if wait_secs > 0:
+            remaining_secs = config.get_remaining_secs()
+            if remaining_secs is not None and wait_secs > remaining_secs:
+                raise SolaceTaskDeadlineError(config.task_deadline, f"rate limit '{self.host}': waiting {wait_secs:.1f} secs")
+            time.sleep(wait_secs)
+        SolaceMetrics.record_rate_limit(self.host, self.state_file.get()['rate'], wait_secs=wait_secs)
+        return wait_secs
+
+    def on_success(self):
+        def increase(state: dict):
+            state['rate'] = min(self.max_rate, state['rate'] + self.RATE_INCREASE)
+        self.state_file.update(increase)
+
+    def on_throttled(self):
+        def decrease(state: dict):
+            now = time.time()
+            if now - state['decrease_ts'] >= self.DECREASE_INTERVAL_SECS:
+                state['rate'] = max(self.MIN_RATE, state['rate'] * self.RATE_DECREASE_FACTOR)
+                state['decrease_ts'] = now
+            # no burst after being throttled
+            state['tokens'] = min(state['tokens'], 0.0)
+        self.state_file.update(decrease)
+        rate = self.state_file.get()['rate']
+        logging.debug("rate limit '%s': throttled, rate=%.3f/s", self.host, rate)
+        SolaceMetrics.record_rate_limit(self.host, rate, is_throttled=True)
+
+
+class SolaceCloudApi(SolaceApi):
+
+    ENV_VAR_ANSIBLE_SOLACE_SOLACE_CLOUD_HOME = "ANSIBLE_SOLACE_SOLACE_CLOUD_HOME"
+    ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US = "us"
+    ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_AU = "au"
+    API_BASE_PATH_US = "https://api.solace.cloud/api/v0"
+    API_BASE_PATH_AU = "https://api.solacecloud.com.au/api/v0"
+
+    API_DATA_CENTERS = "datacenters"
+    API_SERVICES = "services"
+    API_REQUESTS = "requests"
+    API_SERVICE_CONNECTION_ENDPOINTS = "serviceConnectionEndpoints"
+
+    def __init__(self, module: AnsibleModule):
+        super().__init__(module)
+        return
+
+    def get_api_base_path(self, config: SolaceTaskSolaceCloudConfig) -> str:
+        solace_cloud_home_value = self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US
+
+        if config.solace_cloud_home is not None and config.solace_cloud_home != '':
+            solace_cloud_home_value = config.solace_cloud_home.lower()
+        else:
+            solaceCloudHomeEnvVal = os.getenv(
+                self.ENV_VAR_ANSIBLE_SOLACE_SOLACE_CLOUD_HOME)
+            if solaceCloudHomeEnvVal is not None and solaceCloudHomeEnvVal != '':
+                if solaceCloudHomeEnvVal.lower() == self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US:
+                    solace_cloud_home_value = self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US
+                elif solaceCloudHomeEnvVal.lower() == self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_AU:
+                    solace_cloud_home_value = self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_AU
+                else:
+                    raise SolaceEnvVarError(self.ENV_VAR_ANSIBLE_SOLACE_SOLACE_CLOUD_HOME,
+                                            solaceCloudHomeEnvVal,
+                                            f"allowed values: {self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US}, {self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_AU}")
+        if solace_cloud_home_value == self.ANSIBLE_SOLACE_SOLACE_CLOUD_HOME_US:
+            return self.API_BASE_PATH_US
+        else:
+            return self.API_BASE_PATH_AU
+
+    def get_auth(self, config: SolaceTaskBrokerConfig) -> str:
+        return config.get_solace_cloud_auth()
+
+    def get_url(self, config: SolaceTaskBrokerConfig, path: str) -> str:
+        return config.get_solace_cloud_url(path)
+
+    def _make_request(self, config: SolaceTaskSolaceCloudConfig, request_func, path_array: list, json_body, query_params, module_op):
+        # path_array[0]: the api base path, a full url
+        rate_limiter = SolaceCloudRateLimiter.get(path_array[0])
+        if rate_limiter is None:
+            return super()._make_request(config, request_func, path_array, json_body, query_params, module_op)
+        rate_limiter.acquire(config)
+        resp = super()._make_request(config, request_func, path_array, json_body, query_params, module_op)
+        if resp.status_code < 500:
+            rate_limiter.on_success()
+        return resp
+
+    def get_circuit_breaker(self, url: str) -> SolaceCircuitBreaker:
+        # the Solace Cloud api is not a broker: its failures must not fail the tasks of all services, see SolaceCloudRateLimiter
+        return None
+
+    def on_throttled(self, path_array: list, delay_secs: int) -> float:
+        # the retry waits for its token instead of the fixed delay
+        rate_limiter = SolaceCloudRateLimiter.get(path_array[0])
+        if rate_limiter is None:
+            return delay_secs
+        rate_limiter.on_throttled()
+        return 0
+
+    def handle_response(self, resp, module_op):
+        # POST: https://api.solace.cloud/api/v0/services: returns 201
+        # POST: ../requests returns 202: accepted if long running request
+        if resp.status_code not in [200, 201, 202]:
+            self.handle_bad_response(resp, module_op)
+        # TODO: test for deleting service (failed state)
+        # import logging
+        # logging.debug(f">>>>> handling good response, resp.status_code={resp.status_code}")
+        return self.handle_good_response(resp, module_op)
+
+    def handle_good_response(self, resp, module_op):
+        _resp = super().handle_good_response(resp, module_op)
+        if _resp == {}:
+            # return the body
+            if resp.text:
+                j = resp.json()
+                return j
+        else:
+            return _resp
+        return {}
+
+    def handle_bad_response(self, resp, module_op):
+        _resp = dict(status_code=resp.status_code,
+                     reason=resp.reason
+                     )
+        _resp.update({'body': SolaceUtils.parse_response_text(resp.text)})
+        raise SolaceApiError(resp, _resp, self.get_module()._name, module_op)
+
+    def get_data_centers(self, config: SolaceTaskSolaceCloudConfig) -> list:
+        # GET /api/v0/datacenters
+        resp = self.make_get_request(
+            config, [self.get_api_base_path(config), self.API_DATA_CENTERS], query_params=None)
+        return resp
+
+    def _transform_service(self, service: dict) -> dict:
+        # ----------
+        # add eventBrokerVersion --> standardized settings across POST and GET
+        # if it doesn't exist
+        # msgVpnAttributes.vmrVersion="9.6.0.46"
+        # eventBrokerVersion="9.6"
+        if "eventBrokerVersion" in service:
+            return service
+        vmrVersion = None
+        if "msgVpnAttributes" in service:
+            if "vmrVersion" in service["msgVpnAttributes"]:
+                vmrVersion = service['msgVpnAttributes']['vmrVersion']
+        if vmrVersion:
+            service['eventBrokerVersion'] = vmrVersion[0:3]
+        else:
+            # total hack, no fallback option though
+            service['eventBrokerVersion'] = '9.6'
+        # ----------
+        return service
+
+    def get_services(self, config: SolaceTaskSolaceCloudConfig) -> list:
+        # GET https://api.solace.cloud/api/v0/services
+        module_op = SolaceTaskOps.OP_READ_OBJECT_LIST
+        try:
+            _resp = self.make_get_request(
+                config, [self.get_api_base_path(config), self.API_SERVICES], module_op)
+        except SolaceApiError as e:
+            resp = e.get_resp()
+            # TODO: what is the code if solace cloud account has 0 services?
+            if resp['status_code'] == 404:
+                return []
+            raise SolaceApiError(e.get_http_resp(), resp,
+                                 self.get_module()._name, module_op) from e
+        if isinstance(_resp, dict):
+            return [self._transform_service(_resp)]
+        # it is a list of services
+        resp = []
+        for _service in _resp:
+            service = self._transform_service(_service)
+            resp.append(service)
+        return resp
+
+    def find_service_by_name_in_services(self, services, name):
+        if isinstance(services, dict):
+            if name == services.get('name'):
+                return services
+        elif isinstance(services, list):
+            for service in services:
+                if name == service.get('name'):
+                    return service
+        else:
+            raise SolaceInternalError(
+                f"solace cloud response not 'dict' nor 'list' but {type(services)}")
+        return None
+
+    def get_service(self, config: SolaceTaskSolaceCloudConfig, service_id: str) -> dict:
+        # GET https://api.solace.cloud/api/v0/services/{{serviceId}}?included=serviceClass
+        # retrieves a single service
+        module_op = SolaceTaskOps.OP_READ_OBJECT
+        try:
+            _resp = self.make_get_request(
+                config, [self.get_api_base_path(config), self.API_SERVICES, service_id], module_op)
+        except SolaceApiError as e:
+            resp = e.get_resp()
+            if resp['status_code'] == 404:
+                return None
+            raise SolaceApiError(e.get_http_resp(), resp,
+                                 self.get_module()._name, module_op) from e
+        return self._transform_service(_resp)
+
+    def get_service_additional_hostnames_prior_9_13(self, config: SolaceTaskSolaceCloudConfig, service_id: str) -> list:
+        # GET https://api.solace.cloud/api/v0/services/{{serviceId}}?connectionDetails=false
+        # retrieves a single service
+        service = self.get_service(config, service_id)
+        if not service:
+            raise SolaceError(
+                f"solace_cloud_service_id={service_id} not found")
+        additionalHostnames = []
+        if 'attributes' in service:
+            if 'additionalHostnames' in service['attributes']:
+                if isinstance(service['attributes']['additionalHostnames'], list):
+                    additionalHostnames = service['attributes']['additionalHostnames']
+        return additionalHostnames
+
+    def get_service_additional_hostnames(self, config: SolaceTaskSolaceCloudConfig, service_id: str) -> list:
+        # GET https://api.solace.cloud/api/v0/services/{{serviceId}}?connectionDetails=false
+        # retrieves a single service
+        service = self.get_service(config, service_id)
+        if not service:
+            raise SolaceError(
+                f"solace_cloud_service_id={service_id} not found")
+        # get the default one, don't include in list
+        default_hostname = service['msgVpnAttributes']['subDomainName']
+        if default_hostname is None:
+            raise SolaceCloudApiError(
+                config.get_module()._name, "service['msgVpnAttributes']['subDomainName'] is None")
+        publicHostnames = []
+        privateHostnames = []
+        allHostnames = []
+        # distinguish between changes in api (depends on the broker version)
+        if "serviceConnectionEndpoints" in service:
+            if isinstance(service['serviceConnectionEndpoints'], list):
+                for serviceConnectionEndpoint in service['serviceConnectionEndpoints']:
+                    if serviceConnectionEndpoint['accessType'] == 'public':
+                        publicHostnames = serviceConnectionEndpoint['hostNames']
+                    else:
+                        privateHostnames = serviceConnectionEndpoint['hostNames']
+        if 'attributes' in service:
+            if 'additionalHostnames' in service['attributes']:
+                if isinstance(service['attributes']['additionalHostnames'], list):
+                    publicHostnames = service['attributes']['additionalHostnames']
+        for publicHostname in publicHostnames:
+            if publicHostname != default_hostname:
+                allHostnames.append(
+                    {"hostName": publicHostname, "accessType": "public"})
+        for privateHostname in privateHostnames:
+            if privateHostname != default_hostname:
+                allHostnames.append(
+                    {"hostName": privateHostname, "accessType": "private"})
+        return allHostnames
+
+    def get_service_connection_endpoint_id(self, config: SolaceTaskSolaceCloudConfig, service_id: str, access_type: str) -> str:
+        service = self.get_service(config, service_id)
+        if not service:
+            raise SolaceError(
+                f"solace_cloud_service_id={service_id} not found")
+        if "serviceConnectionEndpoints" not in service:
+            raise SolaceCloudApiError(
+                config.get_module()._name, "serviceConnectionEndpoints not in service")
+        if not isinstance(service['serviceConnectionEndpoints'], list):
+            raise SolaceCloudApiError(config.get_module(
+            )._name, "not isinstance(service['serviceConnectionEndpoints'], list)")
+        # find the endpoint id by hostname
+        for serviceConnectionEndpoint in service['serviceConnectionEndpoints']:
+            # serviceConnectionEndpoint['serviceConnectionEndpointId']
+            if serviceConnectionEndpoint['accessType'] == access_type:
+                return serviceConnectionEndpoint['serviceConnectionEndpointId']
+        raise SolaceCloudApiResponseDataError(config.get_module(
+        )._name, 'cannot find serviceConnectionEndpointId for accessType', {'accessType': access_type})
+
+    def get_services_with_details(self, config: SolaceTaskSolaceCloudConfig, max_workers: int = 1, names: list = None) -> list:
+        # get services, then for each service, get details
+        # names: only get the details of the services with these names
+        # max_workers > 1: get the details concurrently, the list call has created the pooled session
+        _services = self.get_services(config)
+        service_ids = [_service['serviceId'] for _service in _services if not names or _service.get('name') in names]
+        return SolaceApi.map_concurrently(lambda service_id: self.get_service(config, service_id), service_ids, max_workers)
+
+    def create_service(self, config: SolaceTaskSolaceCloudConfig, wait_timeout_minutes: int, data: dict, try_count=0) -> dict:
+        # POST https://api.solace.cloud/api/v0/services
+        module_op = SolaceTaskOps.OP_CREATE_OBJECT
+        resp = self.make_post_request(
+            config, [self.get_api_base_path(config), self.API_SERVICES], data, module_op)
+        _service_id = resp['serviceId']
+        if wait_timeout_minutes > 0:
+            res = self.wait_for_service_create_completion(
+                config, wait_timeout_minutes, resp['serviceId'])
+            if "failed" in res:
+                logging.warn(
+                    "solace cloud service creation failed, service_id=%s, try number: %d", _service_id, try_count)
+                if try_count < 3:
+                    _delay = config.get_sleep_secs(10, "recreating failed service")
+                    SolaceMetrics.record_sleep(_delay)
+                    time.sleep(_delay)
+                    logging.warn(
+                        "solace cloud service in failed state - deleting service_id=%s ...", _service_id)
+                    _resp = self.delete_service(config, _service_id)
+                    _delay = config.get_sleep_secs(30, "recreating failed service")
+                    SolaceMetrics.record_sleep(_delay)
+                    time.sleep(_delay)
+                    logging.warn("creating solace cloud service again ...")
+                    _resp = self.create_service(
+                        config, wait_timeout_minutes, data, try_count + 1)
+                    logging.warn("new service_id=%s", _resp['serviceId'])
+                    return self.wait_for_service_create_completion(config, wait_timeout_minutes, _resp['serviceId'])
+                else:
+                    r = dict(
+                        msg=f"create service: Solace Cloud API failed to create service after {try_count} attempts",
+                        response=res
+                    )
+                    raise SolaceApiError(
+                        None, r, self.get_module()._name, module_op)
+            else:
+                return res
+        else:
+            return resp
+
+    def wait_for_service_create_completion(self, config: SolaceTaskSolaceCloudConfig, timeout_minutes: int, service_id: str) -> dict:
+        module_op = SolaceTaskOps.OP_READ_OBJECT
+        is_completed = False
+        is_failed = False
+        try_count = -1
+        delay = 30  # seconds
+        max_retries = (timeout_minutes * 60) // delay
+
+        while not is_completed and not is_failed and try_count < max_retries:
+            logging.debug("service_id:%s, try number: %d",
+                          service_id, try_count + 1)
+            resp = self.get_service(config, service_id)
+            if not resp:
+                # edge case: service deleted before creation completed
+                raise SolaceApiError(
+                    resp, "service not found - may have been deleted while creating", self.get_module()._name, module_op)
+            is_completed = (resp['creationState'] == 'completed')
+            is_failed = (resp['creationState'] == 'failed')
+            try_count += 1
+            if timeout_minutes > 0:
+                _delay = config.get_sleep_secs(delay, "waiting for service creation")
+                SolaceMetrics.record_sleep(_delay)
+                time.sleep(_delay)
+
+        if is_failed:
+            return dict(
+                failed=True,
+                response=resp
+            )
+        if not is_completed:
+            r = dict(
+                msg=f"create service not completed, timeout(mins)={timeout_minutes}, creationState={resp['creationState']}",
+                response=resp
+            )
+            raise SolaceApiError(None, r, self.get_module()._name, module_op)
+        return resp
+
+    def delete_service(self, config: SolaceTaskSolaceCloudConfig, service_id: str) -> dict:
+        # DELETE https://api.solace.cloud/api/v0/services/{{serviceId}}
+        path_array = [self.get_api_base_path(config),
+                      SolaceCloudApi.API_SERVICES, service_id]
+        return self.make_delete_request(config, path_array)
+
+    def get_object_settings(self, config: SolaceTaskBrokerConfig, path_array: list) -> dict:
+        # returns settings or None if not found
+        module_op = SolaceTaskOps.OP_READ_OBJECT
+        try:
+            _resp = self.make_get_request(config, path_array, module_op)
+            # api oddity: 'some' calls return a list with 1 dict in it
+            # logging.debug(
+            #     f"get_object_settings._resp=\n{json.dumps(_resp, indent=2)}")
+            if isinstance(_resp, list):
+                if len(_resp) == 1 and isinstance(_resp[0], dict):
+                    resp = _resp[0]
+                else:
+                    raise SolaceCloudApiResponseDataError(self.get_module()._name,
+                                                          'api response has more than 1 element in list, needs investigation', {'resp': _resp})
+            else:
+                resp = _resp
+        except SolaceApiError as e:
+            resp = e.get_resp()
+            if resp['status_code'] == 404:
+                return None
+            raise SolaceApiError(e.get_http_resp(), resp,
+                                 self.get_module()._name, module_op) from e
+        return resp
+
+    def get_service_request_status(self, config: SolaceTaskBrokerConfig, service_id: str, request_id: str):
+        module_op = SolaceTaskOps.OP_READ_OBJECT
+        # GET https://api.solace.cloud/api/v0/services/{paste-your-serviceId-here}/requests/{{requestId}}
+        path_array = [self.get_api_base_path(config), self.API_SERVICES,
+                      service_id, self.API_REQUESTS, request_id]
+        resp = self.make_get_request(config, path_array, module_op)
+        # resp may not yet contain 'adminProgress' depending on whether this creation has started yet
+        # add it in
+        if 'adminProgress' not in resp:
+            resp['adminProgress'] = 'inProgress'
+        return resp
+
+    def wait_for_service_requests_to_finish(self, config: SolaceTaskBrokerConfig, timeout_minutes: int, service_id: str):
+        module_op = SolaceTaskOps.OP_READ_OBJECT
+        # GET https://api.solace.cloud/api/v0/services/{paste-your-serviceId-here}/requests
+        # returns list of dicts,
+        # - check all elements,
+        # - if "adminProgress" == "inProgress", wait and try again
+        # - raise SolaceApiError if timeout
+        are_all_completed = False
+        try_count = -1
+        delay = 30  # seconds
+        max_retries = (timeout_minutes * 60) // delay
+        while not are_all_completed and try_count < max_retries:
+            path_array = [self.get_api_base_path(config), self.API_SERVICES,
+                          service_id, self.API_REQUESTS]
+            resp = self.make_get_request(config, path_array, module_op)
+            # logging.debug(f"wait_for_service_requests_to_finish(): resp=\n{json.dumps(resp, indent=2)}")
+            # iterate through list to check if any adminProgress == inProgress
+            # use generator:
+            matches = (
+                respElem for respElem in resp if respElem['adminProgress'] == 'inProgress')
+            notCompletedElement = next(matches, None)
+            if notCompletedElement is None:
+                are_all_completed = True
+            try_count += 1
+            if not are_all_completed and timeout_minutes > 0:
+                _delay = config.get_sleep_secs(delay, "waiting for service requests to finish")
+                SolaceMetrics.record_sleep(_delay)
+                time.sleep(_delay)
+
+        if not are_all_completed:
+            msg = [
+                "timeout waiting for all outstanding service requests to be completed",
+                f"timeout(mins)={timeout_minutes}",
+                "request in progress:",
+                str(notCompletedElement)]
+            raise SolaceApiError(
+                resp, msg, self.get_module()._name, module_op)
+        return
+
+    def make_service_post_request(self, config: SolaceTaskBrokerConfig, path_array: list, service_id: str, json_body, module_op):
+
+        timeout_minutes = config.get_timeout() // 60
+        # set min timeout to 5 mins
+        timeout_minutes = max(timeout_minutes, 5)
+
+        # check if there are any jobs still running against this service and wait until completed
+        self.wait_for_service_requests_to_finish(
+            config, timeout_minutes, service_id)
+
+        # now make the request
+        resp = self.make_request(config, requests.post, path_array, json_body)
+        # import logging
+        # import json
+        # logging.debug(f"resp (make_request) = \n{json.dumps(resp, indent=2)}")
+        request_id = resp['id']
+        is_completed = False
+        is_failed = False
+        try_count = -1
+        delay = 15  # seconds
+        max_retries = (timeout_minutes * 60) // delay
+        # wait 1 cycle before start polling
+        _delay = config.get_sleep_secs(delay, "waiting for service request")
+        SolaceMetrics.record_sleep(_delay)
+        time.sleep(_delay)
+        while not is_completed and not is_failed and try_count < max_retries:
+            resp = self.get_service_request_status(config,
+                                                   service_id,
+                                                   request_id)
+            # import logging, json
+            # logging.debug(f"resp (get_service_request_status)= \n{json.dumps(resp, indent=2)}")
+            is_completed = (resp['adminProgress'] == 'completed')
+            is_failed = (resp['adminProgress'] == 'failed')
+            try_count += 1
+            if timeout_minutes > 0:
+                _delay = config.get_sleep_secs(delay, "waiting for service request")
+                SolaceMetrics.record_sleep(_delay)
+                time.sleep(_delay)
+
+        if is_failed:
+            raise SolaceApiError(
+                resp, resp, self.get_module()._name, module_op)
+        if not is_completed:
+            msg = [
+                f"timeout service post request - not completed, timeout(mins)={timeout_minutes}, state={resp['adminProgress']}", str(resp)]
+            raise SolaceInternalError(msg)
+        return resp
+
+
+class SolaceCloudApiCertAuthority(SolaceCloudApi):
+
+    def __init__(self, module: AnsibleModule):
+        super().__init__(module)
+        return
+
+    MAPPINGS = {
+        'certAuthorityName': 'name'
+    }
+
+    # TODO: implement the other OPs: !=, <, >, <=, >=
+    def filter(self, settings: dict, query_params: dict) -> dict:
+        if not query_params:
+            return settings
+        where_list = []
+        if ("where" in query_params and query_params['where'] and len(query_params['where']) > 0):
+            where_list = query_params['where']
+        is_match = True
+        for where in where_list:
+            # OP: ==
+            where_elements = where.split('==')
+            if len(where_elements) != 2:
+                raise SolaceParamsValidationError(
+                    'query_params.where', where, "cannot parse where clause - must be in format '{key}=={pattern}' (other ops are not supported)")
+            sempv2_key = where_elements[0]
+            pattern = where_elements[1]
+            solace_cloud_key = self.MAPPINGS.get(sempv2_key, None)
+            if not solace_cloud_key:
+                raise SolaceParamsValidationError(
+                    'query_params.where', where, f"unknown key for solace cloud '{sempv2_key}' - check with Solace Cloud API settings")
+            # pattern match
+            solace_cloud_value = settings.get(
+                solace_cloud_key, None)
+            if not solace_cloud_value:
+                raise SolaceInternalError(
+                    f"solace-cloud-key={solace_cloud_key} not found in solace cloud settings - likely a key map issue")
+            # create regex
+            regex = pattern.replace("*", ".+")
+            this_match = re.search(regex, solace_cloud_value)
+            is_match = (is_match and this_match)
+            if not is_match:
+                break
+        if is_match:
+            return settings
+        return None
+
+    def get_cert_authority(self, config, service_id, cert_authority_name, query_params):
+        # GET services/{serviceId}/serviceCertificateAuthorities/{certAuthorityName}
+        path_array = [self.get_api_base_path(config), SolaceCloudApi.API_SERVICES,
+                      service_id, 'serviceCertificateAuthorities', cert_authority_name]
+        resp = self.get_object_settings(config, path_array)
+        cert_authority = resp['certificate']
+        return self.filter(cert_authority, query_params)
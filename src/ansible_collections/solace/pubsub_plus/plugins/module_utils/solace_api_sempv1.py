@@ -0,0 +1,134 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_utils import SolaceUtils
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_consts import SolaceTaskOps
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceApiError, SolaceInternalError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskConfig, SolaceTaskBrokerConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceApi
+from ansible.module_utils.basic import AnsibleModule
+
+
+class SolaceSempV1Api(SolaceApi):
+
+    API_BASE_SEMPV1 = "/SEMP"
+
+    def __init__(self, module: AnsibleModule):
+        super().__init__(module)
+        # xmltodict is only imported once a SEMP v1 call is actually made
+        SolaceUtils.module_fail_on_missing_import(module, 'xmltodict')
+        self.call_num = -1
+
+    def get_sempv1_version(self, config: SolaceTaskBrokerConfig):
+        rpc_xml = "<rpc><show><service></service></show></rpc>"
+        resp = self.make_post_request(
+            config, rpc_xml, SolaceTaskOps.OP_READ_SEMP_VERSION)
+        rpc_reply = resp['rpc-reply']
+        raw_api_version = SolaceUtils.get_key(rpc_reply, "@semp-version")
+        # format: soltr/9_9VMR
+        s = raw_api_version[6:9].replace('_', '.')
+        try:
+            v = SolaceUtils.create_version(s)
+        except SolaceInternalError as e:
+            # try format: soltr/10_0_1VMR
+            s = raw_api_version[6:12].replace('_', '.')
+            try:
+                v = SolaceUtils.create_version(s)
+            except SolaceInternalError as e:
+                raise SolaceInternalError(
+                    f"sempv1 version parsing failed: {raw_api_version}") from e
+        return raw_api_version, v
+
+    def get_headers(self, config: SolaceTaskConfig, op: str) -> dict:
+        headers = {
+            'Content-Type': 'application/xml'
+        }
+        headers.update(config.get_headers(op))
+        return headers
+
+    def handle_response(self, resp, module_op):
+        # SEMP v1 always returns 200 (it seems)
+        # error: rpc-reply.execute-result.@code != ok or missing
+        import xmltodict
+        resp_body = xmltodict.parse(resp.text) if resp.text else None
+        if resp.status_code != 200:
+            raise SolaceApiError(
+                resp, resp_body, self.get_module()._name, module_op)
+        try:
+            code = resp_body['rpc-reply']['execute-result']['@code']
+        except KeyError as e:
+            _err = {
+                'call': xmltodict.parse(SolaceApi.get_http_request_body(resp)),
+                'response': resp_body
+            }
+            raise SolaceApiError(
+                resp, _err, self.get_module()._name, module_op) from e
+        if code != "ok":
+            _err = {
+                'call': xmltodict.parse(SolaceApi.get_http_request_body(resp)),
+                'response': resp_body
+            }
+            raise SolaceApiError(
+                resp, _err, self.get_module()._name, module_op)
+        return resp_body
+
+    def convertDict2Sempv1RpcXmlString(self, d) -> str:
+        import xml.etree.ElementTree as ET
+        rpc_elem = SolaceUtils.convertDict2XmlElem('rpc', d)
+        return ET.tostring(rpc_elem, encoding='utf-8').decode('utf-8')
+
+    def getNextCallKey(self):
+        self.call_num = self.call_num + 1
+        return 'rpc-call-' + str(self.call_num)
+
+    def make_post_request(self, config: SolaceTaskConfig, xml_cmd: str, module_op: str):
+        resp = self.send_request(config, 'POST', config.get_semp_url(self.API_BASE_SEMPV1), self.API_BASE_SEMPV1,
+                                 data=xml_cmd,
+                                 auth=config.get_semp_auth(),
+                                 headers=self.get_headers(config, module_op),
+                                 params=None)
+        return self.handle_response(resp, module_op)
+
+
+class SolaceSempV1PagingGetApi(SolaceSempV1Api):
+
+    def __init__(self, module: AnsibleModule):
+        super().__init__(module)
+        return
+
+    def get_objects(self, config: SolaceTaskBrokerConfig, xml_cmd: str, reponse_list_path_array: list) -> list:
+        result_list = []
+        hasNextPage = True
+        while hasNextPage:
+            semp_resp = self.make_post_request(
+                config, xml_cmd, SolaceTaskOps.OP_READ_OBJECT_LIST)
+            # extract the list
+            _d = semp_resp
+            for path in reponse_list_path_array:
+                if _d and path in _d:
+                    _d = _d[path]
+                else:
+                    # empty list / not found
+                    return []
+            if isinstance(_d, dict):
+                resp = [_d]
+            elif isinstance(_d, list):
+                resp = _d
+            else:
+                raise SolaceInternalError(
+                    f"unknown SEMP v1 return type: {type(_d)}")
+            result_list.extend(resp)
+            # see if there is more
+            more_cookie = None
+            if 'more-cookie' in semp_resp['rpc-reply']:
+                more_cookie = semp_resp['rpc-reply']['more-cookie']
+            if more_cookie:
+                import xmltodict
+                xml_cmd = xmltodict.unparse(more_cookie)
+                hasNextPage = True
+            else:
+                hasNextPage = False
+        return result_list
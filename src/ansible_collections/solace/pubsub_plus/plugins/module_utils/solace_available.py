@@ -0,0 +1,129 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceApiError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_metrics import SolaceMetrics
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+import logging
+import time
+import traceback
+import uuid
+
+SOLACE_AVAILABLE_HAS_IMPORT_ERROR = False
+SOLACE_AVAILABLE_ERR_TRACEBACK = None
+try:
+    import requests
+except ImportError:
+    SOLACE_AVAILABLE_HAS_IMPORT_ERROR = True
+    SOLACE_AVAILABLE_ERR_TRACEBACK = traceback.format_exc()
+
+
+class SolaceBrokerAvailability(object):
+    # polls a single broker's semp & spool until available or the deadline (time.monotonic()) has passed.
+    # probes raise SolaceApiError on the last try and on auth errors, return (False, msg) otherwise.
+
+    # adaptive polling: first retry after INITIAL_DELAY_SECONDS, increasing by BACKOFF_FACTOR up to MAX_DELAY_SECONDS
+    INITIAL_DELAY_SECONDS = 0.25
+    BACKOFF_FACTOR = 1.5
+    MAX_DELAY_SECONDS = 5
+
+    PROBE_READ_ONLY = 'read_only'
+    PROBE_WRITE = 'write'
+    PROBES = [PROBE_READ_ONLY, PROBE_WRITE]
+
+    def __init__(self, sempv2_api: SolaceSempV2Api, config: SolaceTaskBrokerConfig, msg_vpn: str, probe: str = PROBE_READ_ONLY):
+        self.sempv2_api = sempv2_api
+        # waits for the broker: polls through an open circuit breaker, the first successful call closes it
+        self.sempv2_api.set_circuit_breaker_bypassed(True)
+        self.config = config
+        self.msg_vpn = msg_vpn
+        self.probe = probe
+
+    def poll(self, probe_func, deadline: float):
+        # calls probe_func(is_last_try) -> (is_available, ex) until available or the deadline has passed
+        # the deadline is bounded by the task deadline
+        remaining = self.config.get_remaining_secs()
+        if remaining is not None:
+            deadline = min(deadline, time.monotonic() + remaining)
+        delay = self.INITIAL_DELAY_SECONDS
+        try_count = 0
+        while True:
+            logging.debug("try number: %d", try_count)
+            is_last_try = time.monotonic() + delay >= deadline
+            is_available, ex = probe_func(is_last_try)
+            if is_available or is_last_try:
+                return is_available, ex
+            try_count += 1
+            SolaceMetrics.record_retry(delay)
+            time.sleep(delay)
+            delay = min(delay * self.BACKOFF_FACTOR, self.MAX_DELAY_SECONDS)
+
+    def _handle_api_error(self, e: SolaceApiError, is_last_try: bool):
+        if is_last_try or e.get_sempv2_error_code() == 72:
+            raise e
+        logging.debug("%s: %s", type(e), str(e))
+        return False, e.get_ansible_msg()
+
+    def probe_semp(self, is_last_try: bool):
+        try:
+            self.sempv2_api.make_get_request(
+                self.config, [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + ["about", "api"])
+            return True, None
+        except SolaceApiError as e:
+            return self._handle_api_error(e, is_last_try)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.SSLError) as e:
+            logging.debug("%s: %s", type(e), str(e))
+            return False, str(e)
+
+    def probe_spool_read_only(self, is_last_try: bool):
+        # vpn is operationally up & its queues can be read, via the monitor api
+        vpn_path_array = [SolaceSempV2Api.API_BASE_SEMPV2_MONITOR, 'msgVpns', self.msg_vpn]
+        try:
+            vpn = self.sempv2_api.make_get_request(
+                self.config, vpn_path_array, query_params={'select': 'msgVpnName,state'})
+            state = vpn.get('state')
+            if state != 'up':
+                return False, f"msgVpn '{self.msg_vpn}': state={state}"
+            self.sempv2_api.make_get_request(
+                self.config, vpn_path_array + ['queues'], query_params={'count': 1, 'select': 'queueName'})
+            return True, None
+        except SolaceApiError as e:
+            return self._handle_api_error(e, is_last_try)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.SSLError) as e:
+            logging.debug("%s: %s", type(e), str(e))
+            return False, str(e)
+
+    def probe_spool_write(self, is_last_try: bool):
+        # creates & deletes a test queue
+        queue_name = str(uuid.uuid4())
+        data = {
+            'msgVpnName': self.msg_vpn,
+            'queueName': queue_name
+        }
+        create_path_array = [
+            SolaceSempV2Api.API_BASE_SEMPV2_CONFIG, 'msgVpns', self.msg_vpn, 'queues']
+        delete_path_array = [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG,
+                             'msgVpns', self.msg_vpn, 'queues', queue_name]
+        try:
+            self.sempv2_api.make_post_request(
+                self.config, create_path_array, data)
+            self.sempv2_api.make_delete_request(
+                self.config, delete_path_array)
+            return True, None
+        except SolaceApiError as e:
+            return self._handle_api_error(e, is_last_try)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.SSLError) as e:
+            logging.debug("%s: %s", type(e), str(e))
+            return False, str(e)
+
+    def wait_semp_available(self, deadline: float):
+        return self.poll(self.probe_semp, deadline)
+
+    def wait_spool_available(self, deadline: float):
+        if self.probe == self.PROBE_WRITE:
+            return self.poll(self.probe_spool_write, deadline)
+        return self.poll(self.probe_spool_read_only, deadline)
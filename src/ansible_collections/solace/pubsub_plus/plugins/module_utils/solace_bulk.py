@@ -0,0 +1,415 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceApiError, SolaceError, SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceInternalErrorAbstractMethod, SolaceTaskDeadlineError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceApi, SolaceSempV2Api, SolaceSempV2PagingGetApi
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_journal import SolaceJournal
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerActionTask
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_utils import SolaceUtils
+import csv
+import gzip
+import itertools
+import json
+import logging
+import os
+import time
+
+
+class SolaceBulkObjectType(object):
+    # a SEMP v2 config collection of a vpn provisioned from a file, e.g. clientUsernames
+    # - keys: the key attributes in the order of the object's path, key_args: their names in the file & results
+    # - write_only: settings not returned by SEMP, only sent on create, e.g. passwords
+    # - child: a collection of each object, provisioned with its object, e.g. the subscriptions of mqtt sessions
+
+    def __init__(self, name: str, collection: str, keys: list, key_args: list,
+                 write_only: list = None, child: 'SolaceBulkObjectType' = None):
+        self.name = name
+        self.collection = collection
+        self.keys = keys
+        self.key_args = key_args
+        self.write_only = write_only or []
+        self.child = child
+
+
+class SolaceBulkRecord(object):
+
+    def __init__(self, line_number: int, key_values: tuple, settings: dict = None, children: list = None, error: str = None):
+        self.line_number = line_number
+        self.key_values = key_values
+        self.settings = settings
+        # list of (name, settings), None: children not managed
+        self.children = children
+        self.action = 'failed' if error else None
+        self.error = error
+        self.child_counts = None
+
+    def get_result(self, object_type: SolaceBulkObjectType) -> dict:
+        result = dict(line=self.line_number)
+        result.update(zip(object_type.key_args, self.key_values))
+        result['action'] = self.action or 'skipped'
+        if self.child_counts:
+            result[object_type.child.name] = self.child_counts
+        if self.error is not None:
+            result['error'] = self.error
+        return result
+
+
+class SolaceBulkInput(object):
+    # streams the records of an ndjson or csv file, optionally gzip compressed, one line at a time.
+    # - ndjson: one object per line, {key args, 'sempv2_settings' (alias 'settings'), child: [name | {name, sempv2_settings}]}
+    # - csv: a header row, columns: the key args, the child names separated by whitespace, all other non-empty columns are settings
+
+    FORMAT_NDJSON = 'ndjson'
+    FORMAT_CSV = 'csv'
+    FORMATS = [FORMAT_NDJSON, FORMAT_CSV]
+    SETTINGS_KEYS = ['sempv2_settings', 'settings']
+    GZIP_MAGIC = b'\x1f\x8b'
+
+    def __init__(self, path: str, input_format: str, object_type: SolaceBulkObjectType, key_defaults: dict, is_solace_cloud: bool):
+        self.path = path
+        self.input_format = input_format or self.get_format(path)
+        self.object_type = object_type
+        self.key_defaults = key_defaults
+        self.is_solace_cloud = is_solace_cloud
+
+    @classmethod
+    def get_format(cls, path: str) -> str:
+        name = path[:-3] if path.endswith('.gz') else path
+        return cls.FORMAT_CSV if name.lower().endswith('.csv') else cls.FORMAT_NDJSON
+
+    def open(self):
+        with open(self.path, 'rb') as f:
+            is_gzip = f.read(2) == self.GZIP_MAGIC
+        if is_gzip:
+            return gzip.open(self.path, 'rt', encoding='utf-8', newline='')
+        return open(self.path, 'r', encoding='utf-8', newline='')
+
+    def _convert_settings(self, settings: dict) -> dict:
+        if settings is None:
+            return None
+        settings = dict(settings)
+        SolaceUtils.type_conversion(settings, self.is_solace_cloud)
+        return settings
+
+    def _parse_children(self, items) -> list:
+        children = []
+        for item in items:
+            if isinstance(item, str):
+                children.append((item, None))
+            elif isinstance(item, dict) and item.get('name'):
+                settings = next((item[k] for k in self.SETTINGS_KEYS if item.get(k) is not None), None)
+                children.append((str(item['name']), self._convert_settings(settings)))
+            else:
+                raise ValueError(f"{self.object_type.child.name}: must be a name or a dict with 'name', got: {item}")
+        return children
+
+    def _get_key_values(self, item: dict) -> tuple:
+        key_values = []
+        for key_arg in self.object_type.key_args:
+            value = item.get(key_arg) or self.key_defaults.get(key_arg)
+            if not value:
+                raise ValueError(f"missing '{key_arg}'")
+            key_values.append(str(value))
+        return tuple(key_values)
+
+    def _parse_ndjson(self, line: str) -> tuple:
+        item = json.loads(line)
+        if not isinstance(item, dict):
+            raise ValueError("must be a json object")
+        child_name = self.object_type.child.name if self.object_type.child else None
+        unknown = set(item.keys()) - set(self.object_type.key_args + self.SETTINGS_KEYS + [child_name])
+        if unknown:
+            raise ValueError(f"unknown keys: {sorted(unknown)}")
+        settings = next((item[k] for k in self.SETTINGS_KEYS if item.get(k) is not None), None)
+        if settings is not None and not isinstance(settings, dict):
+            raise ValueError("settings must be a json object")
+        children = self._parse_children(item[child_name]) if child_name and item.get(child_name) is not None else None
+        return self._get_key_values(item), self._convert_settings(settings), children
+
+    def _parse_csv(self, row: dict) -> tuple:
+        child_name = self.object_type.child.name if self.object_type.child else None
+        settings = {k: v for k, v in row.items()
+                    if k not in self.object_type.key_args and k != child_name and k is not None and v not in (None, '')}
+        SolaceUtils.deep_dict_convert_strs_to_types(settings)
+        children = None
+        if child_name and row.get(child_name):
+            children = [(name, None) for name in row[child_name].split()]
+        return self._get_key_values(row), self._convert_settings(settings) if settings else None, children
+
+    def __iter__(self):
+        with self.open() as f:
+            if self.input_format == self.FORMAT_CSV:
+                reader = csv.DictReader(f)
+                if not reader.fieldnames or self.object_type.key_args[0] not in reader.fieldnames:
+                    raise SolaceParamsValidationError('src', self.path, f"csv header row must include the column '{self.object_type.key_args[0]}'")
+                lines = ((reader.line_num, row) for row in reader)
+                parse_func = self._parse_csv
+            else:
+                lines = ((i + 1, line) for i, line in enumerate(f) if line.strip())
+                parse_func = self._parse_ndjson
+            for line_number, line in lines:
+                try:
+                    key_values, settings, children = parse_func(line)
+                except ValueError as e:
+                    yield SolaceBulkRecord(line_number, (), error=f"invalid record: {e}")
+                    continue
+                yield SolaceBulkRecord(line_number, key_values, settings, children)
+
+
+class SolaceBulkProvision(object):
+    # provisions the objects of an input file in chunks of records:
+    # the existing objects of each chunk are read concurrently, selecting only the settings of the chunk,
+    # creates, updates & deletes are applied concurrently. the result of each object and the progress after each chunk
+    # are written to the output file, memory is bounded by the chunk size, not the size of the file.
+
+    ACTIONS = ['created', 'updated', 'unchanged', 'deleted', 'failed']
+    ACTIONS_CHANGED = ['created', 'updated', 'deleted']
+
+    def __init__(self, module, config: SolaceTaskBrokerConfig, object_type: SolaceBulkObjectType,
+                 msg_vpn: str, state: str, page_count: int, max_concurrency: int):
+        self.module = module
+        self.config = config
+        self.object_type = object_type
+        self.msg_vpn = msg_vpn
+        self.state = state
+        self.page_count = page_count
+        self.max_concurrency = max_concurrency
+        self.sempv2_api = SolaceSempV2Api(module)
+        self.counts = {a: 0 for a in self.ACTIONS}
+        self.records = 0
+        self.chunks = 0
+
+    def _get_vpn_path_array(self, path_array: list) -> list:
+        return ['msgVpns', self.msg_vpn] + path_array
+
+    def _get_object_path_array(self, key_values: tuple) -> list:
+        return self._get_vpn_path_array([self.object_type.collection, ','.join(key_values)])
+
+    def _get_compare_settings(self, settings: dict) -> dict:
+        return {k: v for k, v in (settings or {}).items() if k not in self.object_type.write_only}
+
+    def _get_existing_settings(self, record: SolaceBulkRecord) -> dict:
+        # the settings of the record's object, None if it does not exist
+        select = list(self.object_type.keys) + sorted(self._get_compare_settings(record.settings).keys())
+        return self.sempv2_api.get_object_settings(self.config,
+                                                   [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + self._get_object_path_array(record.key_values),
+                                                   query_params=dict(select=','.join(select)))
+
+    def get_existing(self, chunk: list) -> dict:
+        # key values -> settings of the existing objects of the chunk.
+        # a GET per object: SEMP has no 'in' or range filter for listing a set of keys, a listing per chunk would read the whole collection.
+        settings = SolaceApi.map_concurrently(self._get_existing_settings, chunk, self.max_concurrency)
+        return {r.key_values: s for r, s in zip(chunk, settings) if s is not None}
+
+    def _apply_children(self, record: SolaceBulkRecord, is_new: bool) -> bool:
+        # creates missing children and updates their settings, children not in the record are kept
+        child = self.object_type.child
+        path_array = self._get_object_path_array(record.key_values) + [child.collection]
+        existing = dict()
+        if not is_new:
+            api = SolaceSempV2PagingGetApi(self.module)
+            for obj in api.iter_objects(self.config, 'config', self.page_count, path_array, adaptive_paging=True):
+                existing[str(obj['data'].get(child.keys[0]))] = obj['data']
+        counts = dict(created=0, updated=0)
+        for name, settings in record.children:
+            current = existing.get(name)
+            if current is None:
+                data = {child.keys[0]: name}
+                data.update(settings or {})
+                self.sempv2_api.make_post_request(self.config, [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + path_array, data)
+                counts['created'] += 1
+            elif settings and SolaceUtils.deep_dict_diff(settings, current, {}):
+                self.sempv2_api.make_patch_request(self.config, [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + path_array + [name], settings)
+                counts['updated'] += 1
+        record.child_counts = counts
+        return counts['created'] > 0 or counts['updated'] > 0
+
+    def _apply_present(self, record: SolaceBulkRecord, current_settings: dict) -> str:
+        path_array = [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + self._get_object_path_array(record.key_values)
+        if current_settings is None:
+            data = dict(zip(self.object_type.keys, record.key_values))
+            data.update(record.settings or {})
+            self.sempv2_api.make_post_request(
+                self.config, [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + self._get_vpn_path_array([self.object_type.collection]), data)
+            if record.children:
+                self._apply_children(record, True)
+            return 'created'
+        action = 'unchanged'
+        settings = self._get_compare_settings(record.settings)
+        if settings and SolaceUtils.deep_dict_diff(settings, current_settings, {}):
+            # write-only settings are only sent on create
+            self.sempv2_api.make_patch_request(self.config, path_array, settings)
+            action = 'updated'
+        if record.children and self._apply_children(record, False):
+            action = 'updated'
+        return action
+
+    def _apply_absent(self, record: SolaceBulkRecord, current_settings: dict) -> str:
+        if current_settings is None:
+            return 'unchanged'
+        self.sempv2_api.make_delete_request(
+            self.config, [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + self._get_object_path_array(record.key_values))
+        return 'deleted'
+
+    def apply_record(self, record: SolaceBulkRecord, current_settings: dict):
+        apply_func = self._apply_absent if self.state == 'absent' else self._apply_present
+        try:
+            record.action = apply_func(record, current_settings)
+        except SolaceTaskDeadlineError:
+            raise
+        except SolaceApiError as e:
+            logging.debug("bulk: line %d failed: %s", record.line_number, str(e))
+            record.action = 'failed'
+            record.error = e.get_ansible_msg()
+        except SolaceError as e:
+            record.action = 'failed'
+            record.error = e.to_list()
+
+    def apply_chunk(self, chunk: list):
+        seen = set()
+        records = []
+        for record in chunk:
+            if record.error is not None:
+                continue
+            if record.key_values in seen:
+                record.action = 'failed'
+                record.error = "duplicate record"
+                continue
+            seen.add(record.key_values)
+            records.append(record)
+        if not records:
+            return
+        existing = self.get_existing(records)
+        SolaceApi.map_concurrently(lambda r: self.apply_record(r, existing.get(r.key_values)), records, self.max_concurrency)
+
+    def get_progress(self, start: float) -> dict:
+        return dict(
+            chunks=self.chunks,
+            records=self.records,
+            counts=dict(self.counts),
+            duration_secs=round(time.monotonic() - start, 3)
+        )
+
+    def run(self, records, out, chunk_size: int, max_errors: int, journal: SolaceJournal = None) -> bool:
+        # returns False if stopped after more than max_errors failed records
+        start = time.monotonic()
+        records = iter(records)
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                return True
+            self.apply_chunk(chunk)
+            self.chunks += 1
+            self.records += len(chunk)
+            for record in chunk:
+                self.counts[record.action] += 1
+                out.write(json.dumps(record.get_result(self.object_type)) + '\n')
+                if journal and record.action != 'failed':
+                    journal.append('done', [record.line_number, record.action])
+            out.write(json.dumps(dict(progress=self.get_progress(start))) + '\n')
+            out.flush()
+            if self.counts['failed'] > max_errors:
+                return False
+
+
+class SolaceBulkTask(SolaceBrokerActionTask):
+    # a bulk module: provisions the objects of the file 'src', writes the results to the file 'dest'
+
+    def __init__(self, module):
+        super().__init__(module)
+
+    def get_object_type(self) -> SolaceBulkObjectType:
+        raise SolaceInternalErrorAbstractMethod()
+
+    def get_key_defaults(self) -> dict:
+        return dict()
+
+    def get_journal_operation(self) -> dict:
+        # a journal can only be resumed for the same, unchanged input file
+        params = self.get_module().params
+        src_stat = os.stat(params['src'])
+        return dict(
+            module=self.get_module()._name,
+            host=params['host'],
+            port=params['port'],
+            msg_vpn=params['msg_vpn'],
+            state=params['state'],
+            src=os.path.realpath(params['src']),
+            src_size=src_stat.st_size,
+            src_mtime=src_stat.st_mtime_ns,
+            key_defaults=self.get_key_defaults()
+        )
+
+    def validate_params(self):
+        params = self.get_module().params
+        if not os.path.isfile(params['src']):
+            raise SolaceParamsValidationError('src', params['src'], "file not found")
+        for arg in ['chunk_size', 'page_count', 'max_concurrency']:
+            if params[arg] <= 0:
+                raise SolaceParamsValidationError(arg, params[arg], "must be > 0")
+        if params['max_errors'] < 0:
+            raise SolaceParamsValidationError('max_errors', params['max_errors'], "must be >= 0")
+        SolaceJournal.validate_params(params)
+
+    def do_task(self):
+        self.validate_params()
+        params = self.get_module().params
+        object_type = self.get_object_type()
+        bulk_input = SolaceBulkInput(params['src'], params['format'], object_type, self.get_key_defaults(), self.get_config().is_solace_cloud())
+        bulk = SolaceBulkProvision(self.get_module(), self.get_config(), object_type, params['msg_vpn'], params['state'],
+                                   params['page_count'], params['max_concurrency'])
+        records = bulk_input
+        journal = SolaceJournal(params['journal'], self.get_journal_operation()) if params['journal'] else None
+        journal_state = journal.load() if journal and params['resume'] else None
+        if journal_state:
+            # records completed by the previous runs are skipped, failed records are applied again
+            done_lines = set(line_number for line_number, _action in journal_state.done)
+            records = (r for r in bulk_input if r.line_number not in done_lines)
+            self.update_result({'journal': dict(path=journal.path, resumed=True, skipped=len(done_lines))})
+        elif journal:
+            self.update_result({'journal': dict(path=journal.path, resumed=False, skipped=0)})
+        start = time.monotonic()
+        is_completed = False
+        try:
+            if journal:
+                journal.open(journal_state is not None)
+            # the results of a resumed run are appended to the results of the previous runs
+            with open(params['dest'], 'a' if journal_state else 'w', encoding='utf-8') as out:
+                is_completed = bulk.run(records, out, params['chunk_size'], params['max_errors'], journal)
+        finally:
+            if journal:
+                journal.close(is_completed and bulk.counts['failed'] == 0)
+        self.changed = any(bulk.counts[a] > 0 for a in SolaceBulkProvision.ACTIONS_CHANGED)
+        self.update_result({
+            'changed': self.changed,
+            'dest': params['dest'],
+            'records': bulk.records,
+            'chunks': bulk.chunks,
+            'counts': bulk.counts,
+            'duration_secs': round(time.monotonic() - start, 3)
+        })
+        msg = None
+        if bulk.counts['failed'] > 0:
+            self.update_result({'rc': 1})
+            msg = [f"{bulk.counts['failed']} records failed, see '{params['dest']}'"]
+            if not is_completed:
+                msg.append(f"stopped after more than max_errors={params['max_errors']} failed records")
+        return msg, self.get_result()
+
+    @staticmethod
+    def arg_spec_bulk() -> dict:
+        return dict(
+            src=dict(type='path', required=True),
+            format=dict(type='str', required=False, choices=SolaceBulkInput.FORMATS),
+            dest=dict(type='path', required=True),
+            state=dict(type='str', default='present', choices=['present', 'absent']),
+            chunk_size=dict(type='int', required=False, default=1000),
+            page_count=dict(type='int', required=False, default=100),
+            max_concurrency=dict(type='int', required=False, default=8),
+            max_errors=dict(type='int', required=False, default=100)
+        )
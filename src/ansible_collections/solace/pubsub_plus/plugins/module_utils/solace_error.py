@@ -167,3 +167,21 @@ class SolaceError(Exception):
 
     def get_result_update(self):
         return self.result_update
+
+
+class SolaceCircuitBreakerOpenError(SolaceError):
+    # calls to the host fail fast, see SolaceCircuitBreaker
+    def __init__(self, host: str, failures: int, last_error: str, probe_in_secs: float, state_path: str):
+        message = [
+            f"circuit breaker open for '{host}': {failures} consecutive connection failures, last: {last_error}",
+            f"failing fast, next probe call in {probe_in_secs:.0f} secs"
+        ]
+        if state_path:
+            message.append(f"to reset, delete the state file: {state_path}")
+        super().__init__(message)
+
+
+class SolaceTaskDeadlineError(SolaceError):
+    # the task's time budget (task_deadline) is used up
+    def __init__(self, task_deadline: float, what: str):
+        super().__init__([f"task deadline of {task_deadline:g} secs exceeded", f"while: {what}"])
@@ -4,8 +4,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceInternalErrorAbstractMethod, SolaceApiError, SolaceInternalError, SolaceFeatureNotSupportedError, SolaceModuleUsageError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceParamsValidationError
 import json
 import logging
 from urllib.parse import urlparse
@@ -228,6 +228,30 @@ class SolaceCloudBrokerFacts(SolaceBrokerFacts):
     def _get_broker_mgmt_type(self) -> str:
         return "solace_cloud"
 
+    def get_host_inventory_entry(self, api_token: str = None, meta: dict = None) -> dict:
+        # the inventory host entry of the service
+        # used by solace_cloud_get_facts and the inventory plugin solace_cloud
+        secured_semp_details = self.get_semp_client_connection_details()
+        msg_vpn_attributes = self.get_msg_vpn_attributes()
+        host_entry = {
+            'meta': meta,
+            'ansible_connection': 'local',
+            'broker_type': 'solace_cloud',
+            'solace_cloud_service_id': self.input_dict['serviceId'],
+            'sempv2_host': secured_semp_details['secured']['uri_components']['host'],
+            "sempv2_port": secured_semp_details['secured']['uri_components']['port'],
+            "sempv2_is_secure_connection": True,
+            "sempv2_validate_certs": True,
+            "sempv2_username": secured_semp_details['authentication']['username'],
+            "sempv2_password": secured_semp_details['authentication']['password'],
+            "sempv2_timeout": "60",
+            "vpn": msg_vpn_attributes['msgVpn'],
+            "virtual_router": "primary"
+        }
+        if api_token:
+            host_entry.update({'solace_cloud_api_token': api_token})
+        return host_entry
+
     def _extract_formatted_msg_vpn_attributes(self) -> dict:
         msg_vpn_attributes = SolaceBrokerFacts.get_field(
             self.input_dict, 'msgVpnAttributes')
@@ -587,3 +611,60 @@ class SolaceSelfHostedBrokerFacts(SolaceBrokerFacts):
                 "secured": virtual_router
             })
         return formatted_res
+
+
+class SolaceGetFacts(object):
+    # get functions on 'ansible_facts.solace' of a host, see M(solace_get_facts)
+    # also used on the controller by the filter plugins in plugins/filter/solace_facts.py
+
+    # get function: (facts field, SolaceBrokerFacts method)
+    GET_FUNCTIONS = {
+        "get_vpnClientConnectionDetails": ("vpnClientConnectionDetails", "get_all_client_connection_details"),
+        "get_vpnAttributes": ("vpnAttributes", "get_msg_vpn_attributes"),
+        "get_vpnBridgeRemoteMsgVpnLocations": ("vpnBridgeRemoteMsgVpnLocations", "get_bridge_remote_msg_vpn_locations"),
+        "get_serviceTrustStoreDetails": ("serviceTrustStoreDetails", "get_trust_store_details"),
+        "get_serviceVirtualRouterName": ("serviceVirtualRouterName", "get_virtual_router_name"),
+        "get_serviceDmrClusterConnectionDetails": ("serviceDmrClusterConnectionDetails", "get_dmr_cluster_connection_details")
+    }
+    REQUIRES_VPN = [
+        "get_vpnClientConnectionDetails",
+        "get_vpnAttributes",
+        "get_vpnBridgeRemoteMsgVpnLocations"
+    ]
+
+    @staticmethod
+    def get_vpns(solace_facts: dict) -> list:
+        return list(solace_facts['vpns'].keys())
+
+    @staticmethod
+    def get_msg_vpn(solace_facts: dict, msg_vpn: str, get_functions: list) -> str:
+        # returns the vpn to use, the only vpn if msg_vpn is not set
+        vpns = SolaceGetFacts.get_vpns(solace_facts)
+        vpn_name = msg_vpn
+        if not vpn_name and len(vpns) == 1:
+            vpn_name = vpns[0]
+        # check for wrong vpn
+        if vpn_name and vpn_name not in vpns:
+            raise SolaceParamsValidationError(
+                "msg_vpn", msg_vpn, f"vpn does not exist - select one of {vpns}")
+        for get_func in get_functions:
+            if get_func in SolaceGetFacts.REQUIRES_VPN and not vpn_name:
+                raise SolaceParamsValidationError(
+                    "msg_vpn", msg_vpn, f"required for get_function={get_func}. vpns found: {vpns}")
+        return vpn_name
+
+    @staticmethod
+    def get_facts(module_name: str, solace_facts: dict, msg_vpn: str, get_functions: list) -> dict:
+        unknown = [f for f in get_functions if f not in SolaceGetFacts.GET_FUNCTIONS]
+        if unknown:
+            raise SolaceParamsValidationError("get_functions", unknown, f"unknown get_function(s). valid get functions are: {list(SolaceGetFacts.GET_FUNCTIONS)}")
+        vpn_name = SolaceGetFacts.get_msg_vpn(solace_facts, msg_vpn, get_functions)
+        if solace_facts['isSolaceCloud']:
+            solace_broker_facts = SolaceCloudBrokerFacts(module_name, solace_facts, vpn_name)
+        else:
+            solace_broker_facts = SolaceSelfHostedBrokerFacts(module_name, solace_facts, vpn_name)
+        facts = {}
+        for get_func in get_functions:
+            field, method = SolaceGetFacts.GET_FUNCTIONS[get_func]
+            facts[field] = getattr(solace_broker_facts, method)()
+        return facts
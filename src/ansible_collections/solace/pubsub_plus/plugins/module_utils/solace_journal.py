@@ -0,0 +1,120 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceParamsValidationError
+import hashlib
+import json
+import logging
+import os
+import time
+
+
+class SolaceJournalState(object):
+    # the state of an operation read from its journal: the last plan and the actions completed after it
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.plan = None
+        self.done = []
+        # False: the task crashed, the last synced entries may be missing
+        self.is_stopped = False
+
+    def get_uncertain_count(self) -> int:
+        # number of actions following the last completed one which may have been applied without being recorded
+        return 1 if self.is_stopped else SolaceJournal.SYNC_COUNT + 1
+
+    def is_fresh(self, max_age: int) -> bool:
+        return self.plan is not None and (time.time() - self.plan.get('scan_time', 0)) <= max_age
+
+
+class SolaceJournal(object):
+    # append-only ndjson journal of a long running operation, for resume after a failed or interrupted run:
+    # - {"journal": {...}}: the version and the fingerprint of the operation, e.g. host, vpn & target objects
+    # - {"plan": {...}}: the planned actions and the task's state, e.g. the existing objects
+    # - {"done": [...]}: a completed action
+    # - {"end": {"completed": bool}}: written when the task stops, missing if it crashed
+    # entries are fsync'ed in batches: after a crash, up to SYNC_COUNT completed actions may be missing.
+    VERSION = 1
+    SYNC_COUNT = 100
+    SYNC_SECS = 1.0
+
+    def __init__(self, path: str, operation: dict):
+        self.path = path
+        self.fingerprint = self.get_fingerprint(operation)
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @staticmethod
+    def validate_params(params: dict):
+        if params.get('resume') and not params.get('journal'):
+            raise SolaceParamsValidationError('resume', params['resume'], "requires a journal")
+        if params.get('journal_max_age') is not None and params['journal_max_age'] < 0:
+            raise SolaceParamsValidationError('journal_max_age', params['journal_max_age'], "must be >= 0")
+
+    @staticmethod
+    def get_fingerprint(operation: dict) -> str:
+        return hashlib.sha256(json.dumps(operation, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def load(self) -> SolaceJournalState:
+        # returns the state of an incomplete previous run or None
+        if not os.path.isfile(self.path):
+            return None
+        state = None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # the last line is incomplete if the task crashed while writing it
+                    logging.debug("journal '%s': ignoring invalid line %d", self.path, line_number)
+                    continue
+                if state is None:
+                    if 'journal' not in entry or entry['journal'].get('version') != self.VERSION:
+                        raise SolaceParamsValidationError('journal', self.path, "not a journal")
+                    state = SolaceJournalState(entry['journal'].get('fingerprint'))
+                elif 'plan' in entry:
+                    # the plan of a resumed run includes the actions completed before
+                    state.plan = entry['plan']
+                    state.done = []
+                    state.is_stopped = False
+                elif 'done' in entry:
+                    state.done.append(entry['done'])
+                elif 'end' in entry:
+                    if entry['end'].get('completed'):
+                        return None
+                    state.is_stopped = True
+        if state is None:
+            return None
+        if state.fingerprint != self.fingerprint:
+            raise SolaceParamsValidationError('journal', self.path, "written by a different operation, remove it or use resume=false")
+        return state
+
+    def open(self, is_resume: bool):
+        # appends to the journal of the resumed run, otherwise starts a new one
+        self._file = open(self.path, 'a' if is_resume else 'w', encoding='utf-8')
+        if not is_resume:
+            self.append('journal', dict(version=self.VERSION, fingerprint=self.fingerprint, time=time.time()))
+            self.sync()
+
+    def append(self, key: str, value):
+        self._file.write(json.dumps({key: value}) + '\n')
+        self._unsynced += 1
+        if self._unsynced >= self.SYNC_COUNT or time.monotonic() - self._last_sync >= self.SYNC_SECS:
+            self.sync()
+
+    def sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self, is_completed: bool):
+        if self._file is None:
+            return
+        self.append('end', dict(completed=is_completed, time=time.time()))
+        self.sync()
+        self._file.close()
+        self._file = None
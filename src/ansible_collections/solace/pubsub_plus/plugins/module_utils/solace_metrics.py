@@ -0,0 +1,260 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
+import json
+import logging
+import os
+import threading
+import time
+import urllib.parse
+
+
+class SolaceMetrics(object):
+    # http request metrics of a single module run.
+    # - ANSIBLE_SOLACE_ENABLE_METRICS=true: adds the aggregate as 'metrics' to the module result
+    # - ANSIBLE_SOLACE_METRICS_SPAN_FILE={path}: appends one span document (OTLP/JSON) per module run to the file
+    # module runs share the process when using the solace_persistent connection, start() resets the collector.
+
+    SCOPE_NAME = 'solace.pubsub_plus'
+    SERVICE_NAME = 'ansible-solace'
+    # path elements of composed paths which are object keys, replaced by PATH_PARAM in the path template
+    PATH_PARAM = '{}'
+
+    _module_name = None
+    _start_time_ns = None
+    _calls = []
+    _retries = 0
+    _sleep_secs = 0.0
+    # host -> rate limiter state, see SolaceCloudRateLimiter
+    _rate_limits = dict()
+    # calls are recorded by concurrent threads, e.g. sharded listings: a retry is recorded on the last call of its thread
+    _lock = threading.Lock()
+    _thread = threading.local()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return solace_sys.ENABLE_METRICS or solace_sys.METRICS_SPAN_FILE is not None
+
+    @staticmethod
+    def get_time_ns() -> int:
+        # time_ns() requires python 3.7
+        return int(time.time() * 1e9)
+
+    @staticmethod
+    def start(module_name: str):
+        SolaceMetrics._module_name = module_name
+        SolaceMetrics._start_time_ns = SolaceMetrics.get_time_ns()
+        SolaceMetrics._calls = []
+        SolaceMetrics._retries = 0
+        SolaceMetrics._sleep_secs = 0.0
+        SolaceMetrics._rate_limits = dict()
+        SolaceMetrics._thread = threading.local()
+
+    @staticmethod
+    def get_path_template(path_array: list) -> str:
+        # path_array: [api-base, collection, key, collection, key, ..., (action)]
+        # e.g. ['/SEMP/v2/config', 'msgVpns', 'default', 'queues', 'q1'] --> /SEMP/v2/config/msgVpns/{}/queues/{}
+        # solace cloud: the api base is a full url, only its path is used
+        base = path_array[0]
+        if '://' in base:
+            base = '/' + base.split('://', 1)[1].partition('/')[2]
+        elems = [base]
+        for i, path_elem in enumerate(path_array[1:]):
+            elems.append(SolaceMetrics.PATH_PARAM if i % 2 == 1 else path_elem)
+        return '/'.join(elems)
+
+    @staticmethod
+    def get_response_wire_bytes(resp, response_bytes: int) -> int:
+        # bytes received before decompression, response_bytes if the response is not compressed
+        if resp.headers.get('Content-Encoding', 'identity') == 'identity' or resp.raw is None:
+            return response_bytes
+        try:
+            return resp.raw.tell()
+        except (AttributeError, OSError):
+            return int(resp.headers.get('Content-Length', response_bytes))
+
+    @staticmethod
+    def begin_request():
+        # a request of this thread is sent, without a response it has no call to retry
+        SolaceMetrics._thread.call = None
+
+    @staticmethod
+    def record_request(method: str, path_template: str, resp, start_time_ns: int, duration_secs: float):
+        if not SolaceMetrics.is_enabled():
+            return
+        request_body = resp.request.body if resp.request is not None else None
+        response_bytes = len(resp.content) if resp.content else 0
+        call = dict(
+            method=method,
+            path=path_template,
+            host=urllib.parse.urlsplit(resp.url).netloc if resp.url else None,
+            status=resp.status_code,
+            start_time_ns=start_time_ns,
+            duration_secs=duration_secs,
+            request_bytes=len(request_body) if request_body else 0,
+            response_bytes=response_bytes,
+            response_wire_bytes=SolaceMetrics.get_response_wire_bytes(resp, response_bytes),
+            retry=False
+        )
+        SolaceMetrics._thread.call = call
+        with SolaceMetrics._lock:
+            SolaceMetrics._calls.append(call)
+
+    @staticmethod
+    def record_retry(sleep_secs: float):
+        # the last request of this thread is retried after sleep_secs
+        if not SolaceMetrics.is_enabled():
+            return
+        with SolaceMetrics._lock:
+            SolaceMetrics._retries += 1
+            SolaceMetrics._sleep_secs += sleep_secs
+        call = getattr(SolaceMetrics._thread, 'call', None)
+        if call is not None:
+            call['retry'] = True
+
+    @staticmethod
+    def record_sleep(sleep_secs: float):
+        # waiting for a long running request to complete, e.g. polling Solace Cloud
+        if not SolaceMetrics.is_enabled():
+            return
+        with SolaceMetrics._lock:
+            SolaceMetrics._sleep_secs += sleep_secs
+
+    @staticmethod
+    def record_rate_limit(host: str, rate_per_sec: float, wait_secs: float = 0.0, is_throttled: bool = False):
+        # a call waited wait_secs for the rate limiter or was throttled by the server
+        if not SolaceMetrics.is_enabled():
+            return
+        r = SolaceMetrics._rate_limits.setdefault(host, dict(rate_per_sec=rate_per_sec, waits=0, wait_secs=0.0, throttles=0))
+        r['rate_per_sec'] = round(rate_per_sec, 3)
+        if wait_secs > 0:
+            r['waits'] += 1
+            r['wait_secs'] = round(r['wait_secs'] + wait_secs, 3)
+        if is_throttled:
+            r['throttles'] += 1
+
+    @staticmethod
+    def get_metrics() -> dict:
+        calls = SolaceMetrics._calls
+        requests = dict()
+        for call in calls:
+            key = call['method'] + ' ' + call['path']
+            r = requests.setdefault(key, dict(count=0, duration_secs=0.0, max_duration_secs=0.0,
+                                              request_bytes=0, response_bytes=0, response_wire_bytes=0, retries=0, status=dict()))
+            r['count'] += 1
+            r['duration_secs'] += call['duration_secs']
+            r['max_duration_secs'] = max(r['max_duration_secs'], call['duration_secs'])
+            r['request_bytes'] += call['request_bytes']
+            r['response_bytes'] += call['response_bytes']
+            r['response_wire_bytes'] += call['response_wire_bytes']
+            r['retries'] += 1 if call['retry'] else 0
+            r['status'][str(call['status'])] = r['status'].get(str(call['status']), 0) + 1
+        for r in requests.values():
+            r['duration_secs'] = round(r['duration_secs'], 6)
+            r['max_duration_secs'] = round(r['max_duration_secs'], 6)
+        total_secs = (SolaceMetrics.get_time_ns() - SolaceMetrics._start_time_ns) / 1e9 if SolaceMetrics._start_time_ns else 0.0
+        metrics = dict(
+            total_secs=round(total_secs, 6),
+            request_count=len(calls),
+            request_duration_secs=round(sum(c['duration_secs'] for c in calls), 6),
+            request_bytes=sum(c['request_bytes'] for c in calls),
+            response_bytes=sum(c['response_bytes'] for c in calls),
+            response_wire_bytes=sum(c['response_wire_bytes'] for c in calls),
+            retries=SolaceMetrics._retries,
+            sleep_secs=round(SolaceMetrics._sleep_secs, 3),
+            requests=requests,
+            hosts=SolaceMetrics.get_host_transfers(calls)
+        )
+        if SolaceMetrics._rate_limits:
+            metrics['rate_limits'] = SolaceMetrics._rate_limits
+        return metrics
+
+    @staticmethod
+    def get_host_transfers(calls: list) -> dict:
+        # per broker / api host: bytes received uncompressed vs. on the wire
+        hosts = dict()
+        for call in calls:
+            h = hosts.setdefault(call['host'], dict(count=0, compressed_count=0, response_bytes=0, response_wire_bytes=0))
+            h['count'] += 1
+            h['compressed_count'] += 1 if call['response_wire_bytes'] != call['response_bytes'] else 0
+            h['response_bytes'] += call['response_bytes']
+            h['response_wire_bytes'] += call['response_wire_bytes']
+        for h in hosts.values():
+            h['saved_bytes'] = h['response_bytes'] - h['response_wire_bytes']
+        return hosts
+
+    @staticmethod
+    def _attr(key: str, value) -> dict:
+        if isinstance(value, bool):
+            return dict(key=key, value=dict(boolValue=value))
+        if isinstance(value, int):
+            return dict(key=key, value=dict(intValue=str(value)))
+        if isinstance(value, float):
+            return dict(key=key, value=dict(doubleValue=value))
+        return dict(key=key, value=dict(stringValue=str(value)))
+
+    @staticmethod
+    def get_spans(rc: int) -> dict:
+        # OTLP/JSON trace document: one span for the module run, one child span per http request
+        trace_id = os.urandom(16).hex()
+        root_span_id = os.urandom(8).hex()
+        end_time_ns = SolaceMetrics.get_time_ns()
+        spans = [dict(
+            traceId=trace_id,
+            spanId=root_span_id,
+            name=SolaceMetrics._module_name,
+            kind=1,
+            startTimeUnixNano=str(SolaceMetrics._start_time_ns),
+            endTimeUnixNano=str(end_time_ns),
+            attributes=[
+                SolaceMetrics._attr('ansible.module', SolaceMetrics._module_name),
+                SolaceMetrics._attr('ansible.module.rc', rc),
+                SolaceMetrics._attr('solace.retries', SolaceMetrics._retries),
+                SolaceMetrics._attr('solace.sleep_secs', float(SolaceMetrics._sleep_secs)),
+                SolaceMetrics._attr('solace.rate_limit_wait_secs', float(sum(r['wait_secs'] for r in SolaceMetrics._rate_limits.values())))
+            ],
+            status=dict(code=2 if rc else 1)
+        )]
+        for call in SolaceMetrics._calls:
+            spans.append(dict(
+                traceId=trace_id,
+                spanId=os.urandom(8).hex(),
+                parentSpanId=root_span_id,
+                name=call['method'] + ' ' + call['path'],
+                kind=3,
+                startTimeUnixNano=str(call['start_time_ns']),
+                endTimeUnixNano=str(call['start_time_ns'] + int(call['duration_secs'] * 1e9)),
+                attributes=[
+                    SolaceMetrics._attr('http.method', call['method']),
+                    SolaceMetrics._attr('http.route', call['path']),
+                    SolaceMetrics._attr('http.status_code', call['status']),
+                    SolaceMetrics._attr('http.request_content_length', call['request_bytes']),
+                    SolaceMetrics._attr('http.response_content_length', call['response_wire_bytes']),
+                    SolaceMetrics._attr('http.response_content_length_uncompressed', call['response_bytes']),
+                    SolaceMetrics._attr('solace.retried', call['retry'])
+                ],
+                status=dict(code=2 if call['status'] >= 400 else 0)
+            ))
+        return dict(resourceSpans=[dict(
+            resource=dict(attributes=[SolaceMetrics._attr('service.name', SolaceMetrics.SERVICE_NAME)]),
+            scopeSpans=[dict(scope=dict(name=SolaceMetrics.SCOPE_NAME), spans=spans)]
+        )])
+
+    @staticmethod
+    def finish(result: dict):
+        # called once per module run with the final result
+        if not SolaceMetrics.is_enabled() or SolaceMetrics._start_time_ns is None:
+            return
+        if solace_sys.ENABLE_METRICS:
+            result['metrics'] = SolaceMetrics.get_metrics()
+        if solace_sys.METRICS_SPAN_FILE is not None:
+            try:
+                with open(solace_sys.METRICS_SPAN_FILE, 'a') as f:
+                    f.write(json.dumps(SolaceMetrics.get_spans(result.get('rc', 0))) + '\n')
+            except OSError as e:
+                logging.warning("failed to write metrics span file '%s': %s", solace_sys.METRICS_SPAN_FILE, str(e))
+        SolaceMetrics._start_time_ns = None
@@ -0,0 +1,225 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2PagingGetApi
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_vpn_config import SolaceVpnConfigExport
+import csv
+import io
+import hashlib
+import json
+import operator
+import os
+
+
+class SolaceMonitorCollection(object):
+    # a SEMP v2 monitor collection under /msgVpns/{msgVpnName}, read with a fixed select projection
+
+    # keys of the collections which only exist in the monitor api
+    MONITOR_KEYS = {
+        'clients': ['clientName'],
+        'transactions': ['xid']
+    }
+
+    def __init__(self, name: str, select: list, rates: list = None, where: list = None, keys: list = None):
+        self.name = name
+        self.keys = keys or self.get_default_keys(name)
+        self.rates = rates or []
+        self.where = where or []
+        # the keys & counters of the rates are always read
+        self.select = list(dict.fromkeys(self.keys + select + self.rates))
+
+    @classmethod
+    def get_default_keys(cls, name: str) -> list:
+        if name in cls.MONITOR_KEYS:
+            return cls.MONITOR_KEYS[name]
+        for collection in SolaceVpnConfigExport.get_all_collections():
+            if collection.parent is None and collection.collection == name:
+                return collection.keys
+        raise SolaceParamsValidationError('collections', name, "unknown collection, set its 'keys'")
+
+    def get_key(self, data: dict) -> str:
+        return ','.join(str(data.get(k, '')) for k in self.keys)
+
+    def iter_objects(self, module, config: SolaceTaskBrokerConfig, msg_vpn: str, page_count: int):
+        # yields the data of the collection's objects, a single page held in memory
+        api = SolaceSempV2PagingGetApi(module)
+        query_params = dict(select=self.select, where=self.where)
+        for obj in api.iter_objects(config, 'monitor', page_count, ['msgVpns', msg_vpn, self.name], query_params, adaptive_paging=True):
+            yield obj['data']
+
+
+class SolaceMonitorCondition(object):
+    # a predicate over a field of a monitor object, e.g. msgSpoolUsage == 0.
+    # a missing field or values that cannot be compared, e.g. None < 0, are false.
+
+    OPS = {
+        'eq': operator.eq,
+        'ne': operator.ne,
+        'lt': operator.lt,
+        'le': operator.le,
+        'gt': operator.gt,
+        'ge': operator.ge,
+        'in': lambda value, values: value in values,
+        'not_in': lambda value, values: value not in values
+    }
+
+    def __init__(self, field: str, op: str, value):
+        if op in ['in', 'not_in'] and not isinstance(value, list):
+            raise SolaceParamsValidationError('conditions', field, f"op '{op}' requires a list value")
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def get_select(self) -> str:
+        # nested fields, e.g. 'counter.rxMsgCount', are selected by their top level attribute
+        return self.field.split('.')[0]
+
+    def get_field_value(self, data: dict):
+        value = data
+        for name in self.field.split('.'):
+            if not isinstance(value, dict) or name not in value:
+                raise KeyError(self.field)
+            value = value[name]
+        return value
+
+    def is_true(self, data: dict) -> bool:
+        try:
+            return bool(self.OPS[self.op](self.get_field_value(data), self.value))
+        except (KeyError, TypeError):
+            return False
+
+
+class SolaceMonitorConditionResult(object):
+    # the evaluation of the conditions over the objects of a single poll, holds at most MAX_FAILING objects
+
+    MAX_FAILING = 10
+
+    def __init__(self):
+        self.count = 0
+        self.satisfied = 0
+        self.failing = []
+        # changes if any selected value changed, i.e. the broker makes progress
+        self._hash = hashlib.sha256()
+
+    def add(self, data: dict, conditions: list):
+        self.count += 1
+        self._hash.update(json.dumps(data, sort_keys=True, default=str).encode('utf-8'))
+        if all(c.is_true(data) for c in conditions):
+            self.satisfied += 1
+        elif len(self.failing) < self.MAX_FAILING:
+            self.failing.append(data)
+
+    def get_fingerprint(self) -> str:
+        return self._hash.hexdigest()
+
+
+class SolaceMonitorSampler(object):
+    # turns the objects of consecutive samples into rows: the selected attributes and the per-second rates of counters.
+    # only the previous sample's counters of each object are kept, objects no longer returned are dropped.
+
+    RATE_SUFFIX = '_rate'
+
+    def __init__(self, collection: SolaceMonitorCollection):
+        self.collection = collection
+        # key -> (monotonic time, {counter: value})
+        self.previous = {}
+
+    def get_columns(self) -> list:
+        return self.collection.select + [r + self.RATE_SUFFIX for r in self.collection.rates]
+
+    @staticmethod
+    def get_rate(value, prev_value, secs: float):
+        # None: first sample, not a number or the counter was reset, e.g. cleared stats or a new object with the same key
+        if not isinstance(value, (int, float)) or not isinstance(prev_value, (int, float)) or value < prev_value or secs <= 0:
+            return None
+        return round((value - prev_value) / secs, 3)
+
+    def sample(self, objects, sample_time: float, sample_monotonic: float) -> list:
+        rows = []
+        current = {}
+        for data in objects:
+            key = self.collection.get_key(data)
+            row = dict(time=round(sample_time, 3), collection=self.collection.name, key=key)
+            row.update({a: data.get(a) for a in self.collection.select})
+            counters = {r: data.get(r) for r in self.collection.rates}
+            prev = self.previous.get(key)
+            for r in self.collection.rates:
+                row[r + self.RATE_SUFFIX] = self.get_rate(counters[r], prev[1].get(r), sample_monotonic - prev[0]) if prev else None
+            current[key] = (sample_monotonic, counters)
+            rows.append(row)
+        self.previous = current
+        return rows
+
+
+class SolaceMonitorSampleWriter(object):
+    # appends rows to a file, flushed after every sample.
+    # csv: a single header for all collections, the union of their columns. ndjson: a compact json object per row.
+
+    FORMAT_CSV = 'csv'
+    FORMAT_NDJSON = 'ndjson'
+    FORMATS = [FORMAT_CSV, FORMAT_NDJSON]
+    ROW_COLUMNS = ['time', 'collection', 'key']
+
+    def __init__(self, path: str, file_format: str, samplers: list):
+        self.path = path
+        self.format = file_format
+        self.columns = list(self.ROW_COLUMNS)
+        for sampler in samplers:
+            self.columns += [c for c in sampler.get_columns() if c not in self.columns]
+        self._file = None
+        self._csv = None
+
+    @classmethod
+    def get_format(cls, path: str, file_format: str) -> str:
+        if file_format:
+            return file_format
+        return cls.FORMAT_CSV if path.endswith('.csv') else cls.FORMAT_NDJSON
+
+    def _read_header(self) -> str:
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            return f.readline().rstrip('\r\n')
+
+    def open(self):
+        is_new = not os.path.isfile(self.path) or os.path.getsize(self.path) == 0
+        if self.format == self.FORMAT_CSV:
+            header = self._to_csv_line(self.columns)
+            if not is_new and self._read_header() != header.rstrip('\r\n'):
+                raise SolaceParamsValidationError('dest', self.path, "existing csv file has different columns, use a new file")
+        self._file = open(self.path, 'a', encoding='utf-8', newline='')
+        if self.format == self.FORMAT_CSV:
+            self._csv = csv.writer(self._file)
+            if is_new:
+                self._file.write(header)
+
+    @staticmethod
+    def _to_csv_line(values: list) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(values)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _to_csv_value(value):
+        if value is None:
+            return ''
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, separators=(',', ':'))
+        return value
+
+    def write(self, rows: list):
+        for row in rows:
+            if self._csv:
+                self._csv.writerow([self._to_csv_value(row.get(c)) for c in self.columns])
+            else:
+                self._file.write(json.dumps(row, separators=(',', ':')) + '\n')
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
@@ -51,6 +51,30 @@ if enableLoggingEnvVal is not None and enableLoggingEnvVal != '':
         raise ValueError("failed: invalid value for env var: 'ANSIBLE_SOLACE_ENABLE_LOGGING'",
                          enableLoggingEnvVal, "use 'true' or 'false' instead.") from e
 
+
+def _get_env_number(name: str, default, convert_func):
+    val = os.getenv(name)
+    if val is None or val == '':
+        return default
+    try:
+        return convert_func(val)
+    except ValueError as e:
+        raise ValueError(f"failed: invalid value for env var: '{name}'", val, f"use a number instead, default: {default}.") from e
+
+
+# level of the log file: DEBUG logs all SEMP/Solace Cloud calls, INFO only failed calls
+LOG_LEVEL = os.getenv('ANSIBLE_SOLACE_LOG_LEVEL', 'DEBUG').upper()
+if LOG_LEVEL not in ('DEBUG', 'INFO', 'WARNING', 'ERROR'):
+    raise ValueError("failed: invalid value for env var: 'ANSIBLE_SOLACE_LOG_LEVEL'",
+                     LOG_LEVEL, "use 'DEBUG', 'INFO', 'WARNING' or 'ERROR' instead.")
+# max number of characters logged per request / response body, 0: no bodies
+LOG_BODY_MAX_CHARS = _get_env_number('ANSIBLE_SOLACE_LOG_BODY_MAX_CHARS', 2048, int)
+# fraction of successful calls logged with bodies, failed calls are always logged with bodies
+LOG_BODY_SAMPLE_RATE = _get_env_number('ANSIBLE_SOLACE_LOG_BODY_SAMPLE_RATE', 1.0, float)
+# size based rotation of the log file, 0: no rotation
+LOG_MAX_BYTES = _get_env_number('ANSIBLE_SOLACE_LOG_MAX_BYTES', 0, int)
+LOG_BACKUP_COUNT = _get_env_number('ANSIBLE_SOLACE_LOG_BACKUP_COUNT', 5, int)
+
 if ENABLE_LOGGING:
     logFile = './ansible-solace.log'
     if loggingPathEnvVal is not None and loggingPathEnvVal != '':
@@ -62,8 +86,56 @@ if ENABLE_LOGGING:
                 raise ValueError(
                     "failed to make dirs for log path 'ANSIBLE_SOLACE_LOG_PATH'", loggingPathEnvVal) from e
         logFile = loggingPathEnvVal
-    logging.basicConfig(filename=logFile,
-                        level=logging.DEBUG,
+    if LOG_MAX_BYTES > 0:
+        import logging.handlers
+        logHandler = logging.handlers.RotatingFileHandler(logFile, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
+    else:
+        logHandler = logging.FileHandler(logFile)
+    logging.basicConfig(handlers=[logHandler],
+                        level=getattr(logging, LOG_LEVEL),
                         format='%(asctime)s - %(levelname)s - %(name)s - %(module)s - %(funcName)s(): %(message)s')
     logging.info(
         'Module start #############################################################################################')
+
+################################################################################################
+# initialize metrics
+ENABLE_METRICS = False
+enableMetricsEnvVal = os.getenv('ANSIBLE_SOLACE_ENABLE_METRICS')
+METRICS_SPAN_FILE = os.getenv('ANSIBLE_SOLACE_METRICS_SPAN_FILE') or None
+if enableMetricsEnvVal is not None and enableMetricsEnvVal != '':
+    try:
+        ENABLE_METRICS = bool(strtobool(enableMetricsEnvVal))
+    except ValueError as e:
+        raise ValueError("failed: invalid value for env var: 'ANSIBLE_SOLACE_ENABLE_METRICS'",
+                         enableMetricsEnvVal, "use 'true' or 'false' instead.") from e
+
+################################################################################################
+# state shared by the processes on the controller: Solace Cloud api rate limit, circuit breakers
+# directory of the state files, default: the temp dir
+STATE_DIR = os.getenv('ANSIBLE_SOLACE_STATE_DIR') or None
+# max number of calls per second to the Solace Cloud api per host, shared by all processes on the host, 0: no rate limit
+CLOUD_RATE_LIMIT = _get_env_number('ANSIBLE_SOLACE_CLOUD_RATE_LIMIT', 10.0, float)
+# circuit breaker per broker / api host: opens after this many consecutive connection failures within the window, 0: no circuit breaker
+CIRCUIT_BREAKER_FAILURES = _get_env_number('ANSIBLE_SOLACE_CIRCUIT_BREAKER_FAILURES', 3, int)
+CIRCUIT_BREAKER_WINDOW_SECS = _get_env_number('ANSIBLE_SOLACE_CIRCUIT_BREAKER_WINDOW_SECS', 300, int)
+# secs an open circuit breaker fails fast before letting a probe call through
+CIRCUIT_BREAKER_OPEN_SECS = _get_env_number('ANSIBLE_SOLACE_CIRCUIT_BREAKER_OPEN_SECS', 60, int)
+
+################################################################################################
+# concurrent calls of a module run
+# max number of calls in flight & pooled connections per host (host:port), shared by all threads of the process, 0: no limit
+MAX_CONNECTIONS_PER_HOST = _get_env_number('ANSIBLE_SOLACE_MAX_CONNECTIONS_PER_HOST', 16, int)
+# rollback of list modules on error: max number of compensating calls in flight and retries per call
+ROLLBACK_MAX_CONCURRENCY = _get_env_number('ANSIBLE_SOLACE_ROLLBACK_MAX_CONCURRENCY', 8, int)
+ROLLBACK_RETRIES = _get_env_number('ANSIBLE_SOLACE_ROLLBACK_RETRIES', 2, int)
+
+################################################################################################
+# compressed responses: requests 'Accept-Encoding: gzip, deflate', false: 'identity', e.g. for proxies mangling compressed responses
+HTTP_COMPRESSION = True
+httpCompressionEnvVal = os.getenv('ANSIBLE_SOLACE_HTTP_COMPRESSION')
+if httpCompressionEnvVal is not None and httpCompressionEnvVal != '':
+    try:
+        HTTP_COMPRESSION = bool(strtobool(httpCompressionEnvVal))
+    except ValueError as e:
+        raise ValueError("failed: invalid value for env var: 'ANSIBLE_SOLACE_HTTP_COMPRESSION'",
+                         httpCompressionEnvVal, "use 'true' or 'false' instead.") from e
@@ -7,18 +7,20 @@ __metaclass__ = type
 
 from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_utils import SolaceUtils
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceCloudApiResponseDataError, SolaceInternalError, SolaceInternalErrorAbstractMethod, SolaceApiError, SolaceMaxSempv2VersionSupportedError, SolaceModuleUsageError, SolaceParamsValidationError, SolaceError, SolaceFeatureNotSupportedError, SolaceSempv1VersionNotSupportedError, SolaceNoModuleSupportForSolaceCloudError, SolaceNoModuleStateSupportError, SolaceMinSempv2VersionSupportedError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceCloudApiResponseDataError, SolaceInternalError, SolaceInternalErrorAbstractMethod, SolaceApiError, SolaceMaxSempv2VersionSupportedError, SolaceModuleUsageError, SolaceParamsValidationError, SolaceError, SolaceFeatureNotSupportedError, SolaceSempv1VersionNotSupportedError, SolaceNoModuleSupportForSolaceCloudError, SolaceNoModuleStateSupportError, SolaceMinSempv2VersionSupportedError, SolaceTaskDeadlineError
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskConfig, SolaceTaskBrokerConfig, SolaceTaskSolaceCloudServiceConfig, SolaceTaskSolaceCloudConfig
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceApi, SolaceSempV2Api, SolaceCloudApi, SolaceSempV2PagingGetApi
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceApi, SolaceSempV2Api, SolaceSempV2PagingGetApi
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_metrics import SolaceMetrics
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_journal import SolaceJournal, SolaceJournalState
 from ansible.module_utils.basic import AnsibleModule
 import logging
 import json
+import time
 
 SOLACE_TASK_HAS_IMPORT_ERROR = False
 SOLACE_TASK_ERR_TRACEBACK = None
 try:
     import requests
-    import certifi
 except ImportError:
     SOLACE_TASK_HAS_IMPORT_ERROR = True
     SOLACE_TASK_ERR_TRACEBACK = traceback.format_exc()
@@ -44,6 +46,7 @@ class SolaceTask(object):
         self.module = module
         self.changed = False
         self.result = SolaceUtils.create_result()
+        SolaceMetrics.start(module._name)
         return
 
     def assert_max_sempv2_version_supported(self):
@@ -115,6 +118,10 @@ class SolaceTask(object):
     def logExceptionAsWarning(self, message, e):
         self._logException(logging.warn, message, e)
 
+    def exit_json(self, msg, result: dict):
+        SolaceMetrics.finish(result)
+        self.module.exit_json(msg=msg, **result)
+
     def execute(self):
         try:
             self.assert_versions()
@@ -122,14 +129,14 @@ class SolaceTask(object):
             if config:
                 config.validate_params()
             msg, result = self.do_task()
-            self.module.exit_json(msg=msg, **result)
+            self.exit_json(msg, result)
         except SolaceError as e:
             self.logExceptionAsError(type(e), e)
             self.update_result(dict(rc=1, changed=self.changed))
             result_update = e.get_result_update()
             if result_update:
                 self.update_result(result_update)
-            self.module.exit_json(msg=e.to_list(), **self.get_result())
+            self.exit_json(e.to_list(), self.get_result())
         except SolaceApiError as e:
             http_resp = e.get_http_resp()
             if self.get_config().get_reverse_proxy() and http_resp is not None:
@@ -176,7 +183,7 @@ class SolaceTask(object):
                 usr_msg = e.get_ansible_msg()
                 self.logExceptionAsError(type(e), e)
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceInternalError as e:
             self.logExceptionAsError(type(e), e)
             ex = traceback.format_exc()
@@ -184,13 +191,13 @@ class SolaceTask(object):
             usr_msg = [
                 "Pls raise an issue including the full traceback. (hint: use -vvv)"] + ex_msg_list + ex.split('\n')
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceParamsValidationError as e:
             self.logExceptionAsError(type(e), e)
             usr_msg = [
                 f"module '{self.get_module()._name}': argument validation failed", str(e)]
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceFeatureNotSupportedError as e:
             self.logExceptionAsError(type(e), e)
             usr_msg = [
@@ -199,7 +206,7 @@ class SolaceTask(object):
                 str(e)
             ]
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceNoModuleStateSupportError as e:
             usr_msg = [
                 "combination not supported:",
@@ -210,7 +217,7 @@ class SolaceTask(object):
             if e.msg:
                 usr_msg.append(e.msg)
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceModuleUsageError as e:
             usr_msg = [
                 "module usage error:",
@@ -220,28 +227,28 @@ class SolaceTask(object):
             if e.msg:
                 usr_msg.append(e.msg)
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceMinSempv2VersionSupportedError as e:
             self.logExceptionAsError(type(e), e)
             usr_msg = [str(e)]
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceMaxSempv2VersionSupportedError as e:
             self.logExceptionAsError(type(e), e)
             usr_msg = [str(e)]
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceSempv1VersionNotSupportedError as e:
             self.logExceptionAsError(type(e), e)
             usr_msg = [str(e)]
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceNoModuleSupportForSolaceCloudError as e:
             self.logExceptionAsError(type(e), e)
             usr_msg = [str(e), "Solace Cloud not supported",
                        "raise a feature request if required"]
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except SolaceCloudApiResponseDataError as e:
             self.logExceptionAsError(type(e), e)
             ex = traceback.format_exc()
@@ -249,8 +256,9 @@ class SolaceTask(object):
             usr_msg = ["Pls raise an issue including the full traceback. (hint: use -vvv)"] + ex_msg_list + ex.split('\n') + [
                 f"details: {e.details}"]
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except (requests.exceptions.SSLError) as e:
+            import certifi
             # these paths do not seem to work
             # logging.debug("ssl verify paths: %s", SolaceUtils.get_ssl_default_verify_paths())
             log_msg = [
@@ -260,12 +268,12 @@ class SolaceTask(object):
             usr_msg = ["Check SSL configuration & certificate required for host"] + \
                 [f"Certificate authority (CA) bundle used: {certifi.where()}"] + [
                 str(e)]
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
             self.logExceptionAsError(type(e), e)
             self.update_result(dict(rc=1, changed=self.changed))
             usr_msg = str(e)
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
         except Exception as e:
             self.logExceptionAsError(type(e), e)
             ex = traceback.format_exc()
@@ -273,7 +281,7 @@ class SolaceTask(object):
             usr_msg = [
                 "Pls raise an issue including the full traceback. (hint: use -vvv)"] + ex_msg_list + ex.split('\n')
             self.update_result(dict(rc=1, changed=self.changed))
-            self.module.exit_json(msg=usr_msg, **self.get_result())
+            self.exit_json(usr_msg, self.get_result())
 
 
 class SolaceReadFactsTask(SolaceTask):
@@ -424,8 +432,13 @@ class SolaceCRUDListTask(SolaceCRUDTask):
         self.created_key_list = []
         self.deleted_key_list = []
         self.duplicate_key_list = []
+        # [(key, covering key)]
+        self.pruned_key_list = []
         self.error_key_list = []
         self.changed = False
+        self.journal = None
+        self.journal_result = None
+        self.scan_time = None
 
     def get_objects_path_array(self) -> list:
         raise SolaceInternalErrorAbstractMethod()
@@ -460,6 +473,10 @@ class SolaceCRUDListTask(SolaceCRUDTask):
         self.duplicate_key_list = dupes
         return list(dict.fromkeys(key_list))
 
+    def prune_keys(self, key_list) -> list:
+        # override to drop keys covered by other keys in the list, setting self.pruned_key_list
+        return key_list
+
     def validate_key(self, key):
         if SolaceUtils.doesStringContainAnyWhitespaces(key):
             raise SolaceParamsValidationError(
@@ -469,6 +486,7 @@ class SolaceCRUDListTask(SolaceCRUDTask):
         names = self.get_param_names()
         for name in names:
             self.validate_key(name)
+        SolaceJournal.validate_params(self.get_module().params)
         super().validate_params()
 
     def get_objects(self) -> list:
@@ -479,81 +497,190 @@ class SolaceCRUDListTask(SolaceCRUDTask):
         object_key_list = [d['data'][object_key] for d in objects]
         return object_key_list
 
+    def is_existing_object(self, object_key) -> bool:
+        # override to support resume from a journal
+        raise SolaceInternalErrorAbstractMethod()
+
+    def get_journal_operation(self) -> dict:
+        # identifies the operation of a journal, a journal can only be resumed by the same operation
+        params = self.get_module().params
+        return dict(
+            module=self.get_module()._name,
+            host=params.get('host'),
+            port=params.get('port'),
+            path=self.get_objects_path_array(),
+            state=params['state'],
+            names=self.get_param_names(),
+            settings=params.get(self.get_settings_arg_name())
+        )
+
+    def get_resumed_key_list(self, journal_state: SolaceJournalState) -> list:
+        # the existing keys recorded in the journal, updated with the completed actions
+        # and the existence of the uncertain actions read from the broker
+        existing_key_list = list(journal_state.plan['existing'])
+        done = set((action, key) for action, key in journal_state.done)
+        uncertain = [(action, key) for action, key in journal_state.plan['actions'] if (action, key) not in done]
+        uncertain = uncertain[:journal_state.get_uncertain_count()]
+        self.journal_result['verified'] = len(uncertain)
+        exists = dict()
+        for action, key in journal_state.done:
+            exists[key] = (action == 'create')
+        for action, key in uncertain:
+            exists[key] = self.is_existing_object(key)
+        existing_key_list = [k for k in existing_key_list if exists.get(k, True)]
+        existing_keys = set(existing_key_list)
+        existing_key_list += [k for k, is_existing in exists.items() if is_existing and k not in existing_keys]
+        return existing_key_list
+
+    def load_existing_key_list(self):
+        # reads the existing keys, from the journal of a previous run if resumed within journal_max_age
+        params = self.get_module().params
+        journal_state = self.journal.load() if self.journal and params['resume'] else None
+        if self.journal:
+            self.journal_result = dict(path=self.journal.path, resumed=journal_state is not None, scanned=True, verified=0)
+        if journal_state and journal_state.is_fresh(params['journal_max_age']):
+            self.existing_key_list = self.get_resumed_key_list(journal_state)
+            self.journal_result['scanned'] = False
+            self.scan_time = journal_state.plan['scan_time']
+        else:
+            self.scan_time = time.time()
+            self.existing_key_list = self.get_object_key_list(
+                self.get_objects_result_data_object_key())
+        if self.journal:
+            self.journal.open(journal_state is not None)
+
+    def get_plan(self, new_state, target_key_list) -> list:
+        # returns the actions [(action, key)] in the order applied
+        plan = []
+        existing_keys = set(self.existing_key_list)
+        for target_key in target_key_list:
+            target_key_exists = target_key in existing_keys
+            if (new_state == 'present' or new_state == 'exactly') and not target_key_exists:
+                plan.append(('create', target_key))
+            elif new_state == 'absent' and target_key_exists:
+                plan.append(('delete', target_key))
+        if new_state == 'exactly':
+            target_keys = set(target_key_list)
+            for existing_key in self.existing_key_list:
+                if existing_key not in target_keys:
+                    plan.append(('delete', existing_key))
+        return plan
+
+    def compensate(self, compensation: tuple) -> dict:
+        # applies a compensating action with retries, an object already deleted or created counts as compensated
+        action, key = compensation
+        outcome = dict(key=key, action=action, result='failed', attempts=0)
+        crud_args = self.get_crud_args(key)
+        for attempt in range(1 + max(solace_sys.ROLLBACK_RETRIES, 0)):
+            outcome['attempts'] = attempt + 1
+            try:
+                if action == 'delete':
+                    _response = self.delete_func(*crud_args)
+                else:
+                    _response = self.create_func(*crud_args)
+                outcome['result'] = 'ok'
+                outcome.pop('error', None)
+                return outcome
+            except SolaceApiError as e:
+                if e.get_sempv2_error_code() == (6 if action == 'delete' else 10):
+                    # NOT_FOUND / ALREADY_EXISTS
+                    outcome['result'] = 'ok'
+                    outcome.pop('error', None)
+                    return outcome
+                outcome['error'] = e.get_ansible_msg()
+                http_resp = e.get_http_resp()
+                if e.is_broker_error() and http_resp is not None and http_resp.status_code < 500:
+                    # rejected by the broker, a retry fails the same way
+                    return outcome
+            except SolaceTaskDeadlineError as e:
+                outcome['error'] = e.to_list()
+                return outcome
+            except SolaceError as e:
+                outcome['error'] = e.to_list()
+            except Exception as e:
+                # any error: the remaining compensations are still applied
+                outcome['error'] = str(e)
+            time.sleep(0.5 * (2 ** attempt))
+        return outcome
+
+    def get_rollback_inconsistencies(self, touched_keys: list) -> list:
+        # compares the touched keys with a fresh listing, returns the keys whose existence differs from before the task
+        existing_keys = set(self.existing_key_list)
+        current_keys = set(self.get_object_key_list(self.get_objects_result_data_object_key()))
+        return [k for k in touched_keys if (k in existing_keys) != (k in current_keys)]
+
     def do_rollback_on_error(self, error_key, ex):
         self.error_key_list.append({'error': error_key})
-        for created_key in self.created_key_list:
-            crud_args = self.get_crud_args(created_key)
-            _response = self.delete_func(*crud_args)
-        for deleted_key in self.deleted_key_list:
-            crud_args = self.get_crud_args(deleted_key)
-            _response = self.create_func(*crud_args)
-        self.changed = False
-        self.update_result({'response': self.error_key_list})
+        if self.journal:
+            # completed actions are kept, a rerun with resume=true continues
+            self.changed = len(self.created_key_list) + len(self.deleted_key_list) > 0
+            self.update_result({'response': self.error_key_list, 'journal': self.journal_result})
+            raise ex
+        # compensating actions, applied concurrently
+        compensations = [('delete', k) for k in self.created_key_list] + [('create', k) for k in self.deleted_key_list]
+        outcomes = SolaceApi.map_concurrently(self.compensate, compensations, solace_sys.ROLLBACK_MAX_CONCURRENCY)
+        rollback = dict(
+            compensations=outcomes,
+            succeeded=len([o for o in outcomes if o['result'] == 'ok']),
+            failed=len([o for o in outcomes if o['result'] != 'ok'])
+        )
+        # the failed key may have been applied, e.g. after a read timeout
+        touched_keys = list(dict.fromkeys([k for _action, k in compensations] + [error_key]))
+        try:
+            rollback['inconsistent'] = self.get_rollback_inconsistencies(touched_keys)
+            rollback['consistent'] = len(rollback['inconsistent']) == 0
+        except (SolaceApiError, SolaceError) as e:
+            # the original error is raised, the check is reported as not done
+            logging.debug("rollback consistency check failed: %s", str(e))
+            rollback['consistent'] = None
+        self.changed = rollback['failed'] > 0 or rollback['consistent'] is not True
+        self.update_result({'response': self.error_key_list, 'rollback': rollback})
         raise ex
 
     def do_task(self):
         self.validate_params()
         params = self.get_config().get_params()
         is_check_mode = self.get_module().check_mode
-        self.existing_key_list = self.get_object_key_list(
-            self.get_objects_result_data_object_key())
+        if params.get('journal') and not is_check_mode:
+            self.journal = SolaceJournal(params['journal'], self.get_journal_operation())
+        is_completed = False
+        try:
+            self.load_existing_key_list()
+            self.do_task_plan(params, is_check_mode)
+            is_completed = True
+        finally:
+            if self.journal:
+                self.journal.close(is_completed)
+        return None, self.get_result()
+
+    def do_task_plan(self, params, is_check_mode):
         target_key_list = self.deduplicate_keys(self.get_param_names())
         self.set_result(self.create_result(rc=0, changed=False))
-        state_object_combination_error = False
         new_state = params['state']
+        if new_state != 'absent':
+            # covered keys must still be deleted for absent
+            target_key_list = self.prune_keys(target_key_list)
         new_settings = self.get_new_settings()
-        for target_key in target_key_list:
-            crud_args = self.get_crud_args(target_key)
-            target_key_exists = target_key in self.existing_key_list
-            if (new_state == 'present' or new_state == 'exactly') and not target_key_exists:
+        plan = self.get_plan(new_state, target_key_list)
+        if self.journal:
+            self.journal.append('plan', dict(scan_time=self.scan_time, existing=self.existing_key_list, actions=plan))
+        for action, key in plan:
+            if action == 'create':
                 self.changed = True
-                if not is_check_mode:
-                    try:
-                        _response = self.create_func(*crud_args, new_settings)
-                        self.created_key_list.append(target_key)
-                    except Exception as ex:
-                        self.do_rollback_on_error(target_key, ex)
-
-            elif new_state == 'present' and target_key_exists:
-                pass
-            elif new_state == 'absent' and target_key_exists:
-                if not is_check_mode:
-                    try:
-                        _response = self.delete_func(*crud_args)
-                        self.deleted_key_list.append(target_key)
-                    except Exception as ex:
-                        self.do_rollback_on_error(target_key, ex)
-            elif new_state == 'absent' and not target_key_exists:
-                pass
-            elif new_state == 'exactly' and target_key_exists:
-                pass
-            elif new_state == 'exactly':
-                pass
-            else:
-                state_object_combination_error = True
-
-        if new_state == 'exactly':
-            for existing_key in self.existing_key_list:
-                crud_args = self.get_crud_args(existing_key)
-                if new_state == 'exactly' and existing_key not in target_key_list:
-                    if not is_check_mode:
-                        try:
-                            _response = self.delete_func(*crud_args)
-                            self.deleted_key_list.append(existing_key)
-                        except Exception as ex:
-                            self.do_rollback_on_error(existing_key, ex)
-                elif new_state == 'exactly' and existing_key in target_key_list:
-                    pass
+            if is_check_mode:
+                continue
+            crud_args = self.get_crud_args(key)
+            try:
+                if action == 'create':
+                    _response = self.create_func(*crud_args, new_settings)
+                    self.created_key_list.append(key)
                 else:
-                    state_object_combination_error = True
-
-        if state_object_combination_error:
-            raise SolaceInternalError([
-                "unsupported state / object combination",
-                f"state={new_state}",
-                f"target_key_list={target_key_list}",
-                f"existing_key_list={self.existing_key_list}"
-            ])
+                    _response = self.delete_func(*crud_args)
+                    self.deleted_key_list.append(key)
+            except Exception as ex:
+                self.do_rollback_on_error(key, ex)
+            if self.journal:
+                self.journal.append('done', [action, key])
 
         response_list = []
         for k in self.created_key_list:
@@ -564,12 +691,15 @@ class SolaceCRUDListTask(SolaceCRUDTask):
             response_list.append({'duplicate': k})
         if len(response_list) > 0:
             self.changed = True
+        for k, covering_key in self.pruned_key_list:
+            response_list.append({'pruned': k, 'covered_by': covering_key})
         self.update_result(
             {
                 'changed': self.changed,
                 'response': response_list
             })
-        return None, self.get_result()
+        if self.journal:
+            self.update_result({'journal': self.journal_result})
 
 
 class SolaceBrokerCRUDListTask(SolaceCRUDListTask):
@@ -586,10 +716,17 @@ class SolaceBrokerCRUDListTask(SolaceCRUDListTask):
     def get_config(self) -> SolaceTaskBrokerConfig:
         return self.config
 
+    def is_existing_object(self, object_key) -> bool:
+        path_array = [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + self.get_objects_path_array() + [object_key]
+        return self.sempv2_api.get_object_settings(self.get_config(), path_array) is not None
+
     def get_objects(self) -> list:
         objects = self.sempv2_get_paging_api.get_all_objects_from_config_api(
             self.get_config(),
             self.get_objects_path_array())
+        self.update_result({
+            'paging': self.sempv2_get_paging_api.get_paging()
+        })
         return objects
 
 
@@ -597,6 +734,7 @@ class SolaceCloudCRUDListTask(SolaceCRUDListTask):
     def __init__(self, module: AnsibleModule):
         super().__init__(module)
         self.config = SolaceTaskSolaceCloudServiceConfig(module)
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api_cloud import SolaceCloudApi
         self.solace_cloud_api = SolaceCloudApi(module)
 
     def get_settings_arg_name(self) -> str:
@@ -760,6 +898,9 @@ class SolaceBrokerGetTask(SolaceGetTask):
 
 
 class SolaceBrokerGetPagingTask(SolaceGetTask):
+
+    MAX_SHARDS = 32
+
     def __init__(self, module: AnsibleModule):
         super().__init__(module)
         self.config = SolaceTaskBrokerConfig(module)
@@ -784,14 +925,53 @@ class SolaceBrokerGetPagingTask(SolaceGetTask):
     def get_path_array(self, params: dict) -> list:
         raise SolaceInternalErrorAbstractMethod()
 
+    def get_shard_key(self) -> str:
+        # key attribute to split the collection into shards by, None: module does not support shards
+        return None
+
+    def is_sharded(self, params: dict) -> bool:
+        shards = params['shards']
+        if shards <= 1 and not params['shard_prefixes']:
+            return False
+        if self.get_shard_key() is None:
+            raise SolaceParamsValidationError('shards', shards, f"not supported by module '{self.get_module()._name}'")
+        if shards > self.MAX_SHARDS:
+            raise SolaceParamsValidationError('shards', shards, f"must be <= {self.MAX_SHARDS}")
+        return True
+
+    def get_shard_prefixes(self, params: dict) -> list:
+        # returns None if the shards are probed from the keys
+        shard_prefixes = params['shard_prefixes']
+        if not shard_prefixes:
+            return None
+        # the shards must be disjoint: no prefix may start with another one
+        if (len(set(shard_prefixes)) != len(shard_prefixes)
+                or any(p == '' or ',' in p or '*' in p or '?' in p for p in shard_prefixes)
+                or any(p != q and p.startswith(q) for p in shard_prefixes for q in shard_prefixes)):
+            raise SolaceParamsValidationError('shard_prefixes', shard_prefixes, "must be unique, non-empty, without ',', '*', '?' and no prefix of another")
+        return shard_prefixes
+
     def do_task(self):
         params = self.get_config().get_params()
         api = params['api']
         page_count = params['page_count']
         query_params = params['query_params']
-        objects = self.get_sempv2_get_paging_api().get_objects(self.get_config(), api,
-                                                               page_count, self.get_path_array(params), query_params, self.get_monitor_api_base)
+        if self.is_sharded(params):
+            shard_prefixes = self.get_shard_prefixes(params)
+            # explicit prefixes without shards: all prefixes concurrently
+            max_workers = params['shards'] if params['shards'] > 1 else min(len(shard_prefixes) + 1, self.MAX_SHARDS)
+            objects = self.get_sempv2_get_paging_api().get_objects_sharded(self.get_config(), api,
+                                                                           page_count, self.get_path_array(params), query_params, self.get_monitor_api_base,
+                                                                           params['adaptive_paging'], self.get_shard_key(), shard_prefixes,
+                                                                           params['shards'], max_workers)
+        else:
+            objects = self.get_sempv2_get_paging_api().get_objects(self.get_config(), api,
+                                                                   page_count, self.get_path_array(params), query_params, self.get_monitor_api_base,
+                                                                   adaptive_paging=params['adaptive_paging'])
         result = self.create_result_with_list(objects)
+        result.update(dict(
+            paging=self.get_sempv2_get_paging_api().get_paging()
+        ))
         return None, result
 
 
@@ -799,6 +979,7 @@ class SolaceCloudGetTask(SolaceGetTask):
     def __init__(self, module: AnsibleModule):
         super().__init__(module)
         self.config = SolaceTaskSolaceCloudConfig(module)
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api_cloud import SolaceCloudApi
         self.solace_cloud_api = SolaceCloudApi(module)
 
     def get_config(self) -> SolaceTaskSolaceCloudConfig:
@@ -807,5 +988,5 @@ class SolaceCloudGetTask(SolaceGetTask):
     def get_settings_arg_name(self) -> str:
         return 'solace_cloud_settings'
 
-    def get_solace_cloud_api(self) -> SolaceCloudApi:
+    def get_solace_cloud_api(self) -> 'SolaceCloudApi':
         return self.solace_cloud_api
@@ -9,6 +9,8 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_utils import SolaceUtils
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceInternalErrorAbstractMethod, SolaceInternalError, SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceTaskDeadlineError
+import time
 import urllib.parse
 
 SOLACE_TASK_CONFIG_HAS_IMPORT_ERROR = False
@@ -33,6 +35,11 @@ if not SOLACE_TASK_CONFIG_HAS_IMPORT_ERROR:
 class SolaceTaskConfig(object):
     def __init__(self, module: AnsibleModule):
         self.module = module
+        self.timeout = None
+        self.connect_timeout = None
+        self.read_timeout = None
+        self.task_deadline = None
+        self.deadline = None
 
     def get_module(self):
         return self.module
@@ -43,8 +50,48 @@ class SolaceTaskConfig(object):
     def get_params(self) -> list:
         return self.module.params
 
+    def set_timeouts(self, params: dict):
+        # connect & read timeout of each call default to timeout.
+        # task_deadline: time budget of the task from now, bounds all calls, retries, polls and pages.
+        self.timeout = float(params['timeout'])
+        self.connect_timeout = float(params.get('connect_timeout') or self.timeout)
+        self.read_timeout = float(params.get('read_timeout') or self.timeout)
+        self.task_deadline = params.get('task_deadline')
+        if self.task_deadline is not None:
+            if self.task_deadline <= 0:
+                result = SolaceUtils.create_result(rc=1)
+                self.module.fail_json(msg=f"argument: 'task_deadline={self.task_deadline}', must be > 0", **result)
+            self.deadline = time.monotonic() + self.task_deadline
+
     def get_timeout(self) -> float:
-        raise SolaceInternalErrorAbstractMethod()
+        return self.timeout
+
+    def get_remaining_secs(self) -> float:
+        # None: no task deadline
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def check_deadline(self, what: str):
+        remaining = self.get_remaining_secs()
+        if remaining is not None and remaining <= 0:
+            raise SolaceTaskDeadlineError(self.task_deadline, what)
+
+    def get_request_timeout(self, what: str) -> tuple:
+        # (connect, read) timeout of the next call, shrunk to the remaining time budget
+        self.check_deadline(what)
+        remaining = self.get_remaining_secs()
+        if remaining is None:
+            return (self.connect_timeout, self.read_timeout)
+        return (min(self.connect_timeout, remaining), min(self.read_timeout, remaining))
+
+    def get_sleep_secs(self, delay_secs: float, what: str) -> float:
+        # delay before the next retry / poll, shrunk to the remaining time budget
+        self.check_deadline(what)
+        remaining = self.get_remaining_secs()
+        if remaining is None:
+            return delay_secs
+        return min(delay_secs, remaining)
 
     def get_validate_certs(self) -> bool:
         raise SolaceInternalErrorAbstractMethod()
@@ -108,7 +155,7 @@ class SolaceTaskBrokerConfig(SolaceTaskConfig):
         port = module.params['port']
         self.broker_url = ('https' if is_secure else 'http') + \
             '://' + host + ':' + str(port)
-        self.timeout = float(module.params['timeout'])
+        self.set_timeouts(module.params)
         self.validate_certs = bool(module.params['validate_certs'])
         self.x_broker = module.params.get('x_broker', None)
         self.solace_cloud_home = module.params.get('solace_cloud_home', None)
@@ -214,9 +261,6 @@ class SolaceTaskBrokerConfig(SolaceTaskConfig):
                 "config does not contain solace cloud parameters")
         return self.solace_cloud_auth
 
-    def get_timeout(self) -> float:
-        return self.timeout
-
     def get_validate_certs(self) -> bool:
         return self.validate_certs
 
@@ -239,6 +283,9 @@ class SolaceTaskBrokerConfig(SolaceTaskConfig):
             username=dict(type='str', default='admin'),
             password=dict(type='str', default='admin', no_log=True),
             timeout=dict(type='int', default='10', required=False),
+            connect_timeout=dict(type='float', required=False),
+            read_timeout=dict(type='float', required=False),
+            task_deadline=dict(type='float', required=False),
             x_broker=dict(type='str', default=None),
             reverse_proxy=dict(
                 type='dict', required=False,
@@ -283,6 +330,24 @@ class SolaceTaskBrokerConfig(SolaceTaskConfig):
             msg_vpn=dict(type='str', required=True)
         )
 
+    @ staticmethod
+    def arg_spec_brokers() -> dict:
+        # brokers of multi-broker modules, see SolaceTaskBrokerModule
+        return dict(
+            brokers=dict(type='list', required=True, elements='dict', options=dict(
+                name=dict(type='str', required=False),
+                host=dict(type='str', required=False),
+                port=dict(type='int', required=False),
+                secure_connection=dict(type='bool', required=False),
+                validate_certs=dict(type='bool', required=False),
+                username=dict(type='str', required=False),
+                password=dict(type='str', required=False, no_log=True),
+                timeout=dict(type='int', required=False),
+                msg_vpn=dict(type='str', required=False)
+            )),
+            msg_vpn=dict(type='str', required=False)
+        )
+
     @ staticmethod
     def arg_spec_virtual_router():
         return dict(
@@ -319,6 +384,14 @@ class SolaceTaskBrokerConfig(SolaceTaskConfig):
         arg_spec.update(SolaceTaskBrokerConfig.arg_spec_state_crud_list())
         return arg_spec
 
+    @ staticmethod
+    def arg_spec_journal():
+        return dict(
+            journal=dict(type='path', required=False),
+            resume=dict(type='bool', required=False, default=False),
+            journal_max_age=dict(type='int', required=False, default=3600)
+        )
+
     @ staticmethod
     def _arg_spec_get_query_params():
         return dict(
@@ -335,7 +408,10 @@ class SolaceTaskBrokerConfig(SolaceTaskConfig):
     @ staticmethod
     def _arg_spec_get_object_list_page_count():
         return dict(
-            page_count=dict(type='int', default=100, required=False)
+            page_count=dict(type='int', default=100, required=False),
+            adaptive_paging=dict(type='bool', default=False, required=False),
+            shards=dict(type='int', default=1, required=False),
+            shard_prefixes=dict(type='list', elements='str', required=False)
         )
 
     @ staticmethod
@@ -365,7 +441,7 @@ class SolaceTaskSolaceCloudConfig(SolaceTaskConfig):
     def __init__(self, module: AnsibleModule):
         super().__init__(module)
         self.solace_cloud_api_token = module.params[self.PARAM_API_TOKEN]
-        self.timeout = float(module.params['timeout'])
+        self.set_timeouts(module.params)
         self.validate_certs = bool(module.params['validate_certs'])
         self.auth = BearerAuth(self.solace_cloud_api_token)
         self.solace_cloud_home = module.params.get('solace_cloud_home', None)
@@ -379,9 +455,6 @@ class SolaceTaskSolaceCloudConfig(SolaceTaskConfig):
     def get_solace_cloud_auth(self) -> str:
         return self.auth
 
-    def get_timeout(self) -> float:
-        return self.timeout
-
     def get_validate_certs(self) -> bool:
         return self.validate_certs
 
@@ -396,6 +469,9 @@ class SolaceTaskSolaceCloudConfig(SolaceTaskConfig):
             solace_cloud_api_token=dict(
                 type='str', required=True, no_log=True, aliases=['api_token']),
             timeout=dict(type='int', default='60', required=False),
+            connect_timeout=dict(type='float', required=False),
+            read_timeout=dict(type='float', required=False),
+            task_deadline=dict(type='float', required=False),
             validate_certs=dict(type='bool', default=True)
         )
 
@@ -422,3 +498,22 @@ class SolaceTaskSolaceCloudServiceConfig(SolaceTaskSolaceCloudConfig):
             solace_cloud_service_id=dict(
                 type='str', required=True, aliases=['service_id'])
         )
+
+
+class SolaceTaskBrokerModule(object):
+    # stands in for the AnsibleModule of one of the brokers of a multi-broker module: the module's params merged with the broker's.
+    # SolaceTaskBrokerConfig and SolaceSempV2Api only use params, _name, check_mode and fail_json.
+
+    BROKER_ARGS = ['host', 'port', 'secure_connection', 'validate_certs', 'username', 'password', 'timeout', 'msg_vpn']
+
+    def __init__(self, module: AnsibleModule, broker: dict):
+        self._name = module._name
+        self.check_mode = module.check_mode
+        self.params = dict(module.params)
+        self.params.update({k: broker[k] for k in self.BROKER_ARGS if broker.get(k) is not None})
+        self.broker_name = broker.get('name') or f"{self.params['host']}:{self.params['port']}"
+        if not self.params['msg_vpn']:
+            raise SolaceParamsValidationError('brokers', self.broker_name, "msg_vpn is required, either for the broker or the module")
+
+    def fail_json(self, msg, **kwargs):
+        raise SolaceParamsValidationError('brokers', self.broker_name, msg)
@@ -0,0 +1,138 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class _SolaceTopicTrieNode(object):
+
+    def __init__(self):
+        # literal levels, incl. levels only wildcards in other positions, e.g. 'a*b', '>' not as last level
+        self.children = dict()
+        # prefix wildcard levels 'abc*', by prefix 'abc'
+        self.prefix_children = dict()
+        # '*'
+        self.star_child = None
+        # subscription ending here
+        self.subscription = None
+        # subscription ending with '>' below this node
+        self.gt_subscription = None
+
+
+class SolaceTopicTrie(object):
+    # trie of subscriptions in Solace SMF topic syntax, levels separated by '/':
+    # - '*' as a whole level: exactly one level, 'abc*' as a level: one level starting with 'abc'
+    # - '>' as the last level: one or more levels
+    # - '*' and '>' in any other position are literals
+    # - '#noexport/' and '#share/{group}/' prefixes: subscriptions only cover subscriptions with the same prefixes
+    # match() is O(depth x number of matching wildcards), not O(number of subscriptions).
+
+    NOEXPORT = '#noexport'
+    SHARE = '#share'
+
+    def __init__(self, subscriptions: list = None):
+        # one trie per prefix
+        self.roots = dict()
+        for subscription in (subscriptions or []):
+            self.add(subscription)
+
+    @staticmethod
+    def split(subscription: str) -> tuple:
+        # returns (prefix, levels), e.g. '#share/g1/a/b' -> ('#share/g1', ['a', 'b'])
+        levels = subscription.split('/')
+        i = 0
+        if len(levels) > i + 1 and levels[i] == SolaceTopicTrie.NOEXPORT:
+            i += 1
+        if len(levels) > i + 2 and levels[i] == SolaceTopicTrie.SHARE:
+            i += 2
+        return '/'.join(levels[:i]), levels[i:]
+
+    @staticmethod
+    def is_prefix_wildcard(level: str) -> bool:
+        return len(level) > 1 and level.endswith('*')
+
+    def add(self, subscription: str):
+        prefix, levels = self.split(subscription)
+        node = self.roots.setdefault(prefix, _SolaceTopicTrieNode())
+        for i, level in enumerate(levels):
+            if level == '>' and i == len(levels) - 1:
+                if node.gt_subscription is None:
+                    node.gt_subscription = subscription
+                return
+            if level == '*':
+                if node.star_child is None:
+                    node.star_child = _SolaceTopicTrieNode()
+                node = node.star_child
+            elif self.is_prefix_wildcard(level):
+                node = node.prefix_children.setdefault(level[:-1], _SolaceTopicTrieNode())
+            else:
+                node = node.children.setdefault(level, _SolaceTopicTrieNode())
+        if node.subscription is None:
+            node.subscription = subscription
+
+    def _walk(self, node: _SolaceTopicTrieNode, levels: list, i: int, is_subscription: bool, found: list):
+        # collects the subscriptions in the trie covering levels[i:]
+        # is_subscription: levels may contain wildcards, which are only covered by the same or wider wildcards
+        if node.gt_subscription is not None and i < len(levels):
+            found.append(node.gt_subscription)
+        if i == len(levels):
+            if node.subscription is not None:
+                found.append(node.subscription)
+            return
+        level = levels[i]
+        is_last = (i == len(levels) - 1)
+        is_gt = is_subscription and is_last and level == '>'
+        is_star = is_subscription and level == '*'
+        is_prefix_wildcard = is_subscription and self.is_prefix_wildcard(level)
+        if is_gt:
+            # only covered by a '>' at the same level, see above
+            return
+        if node.star_child is not None:
+            self._walk(node.star_child, levels, i + 1, is_subscription, found)
+        if is_star:
+            return
+        # prefix wildcards: 'ab*' covers 'abc' and 'abc*'
+        literal = level[:-1] if is_prefix_wildcard else level
+        if node.prefix_children:
+            for n in range(len(literal) + 1):
+                child = node.prefix_children.get(literal[:n])
+                if child is not None:
+                    self._walk(child, levels, i + 1, is_subscription, found)
+        if is_prefix_wildcard:
+            return
+        child = node.children.get(level)
+        if child is not None:
+            self._walk(child, levels, i + 1, is_subscription, found)
+
+    def match(self, topic: str) -> list:
+        # subscriptions matching the published topic, regardless of their prefixes
+        levels = topic.split('/')
+        found = []
+        for root in self.roots.values():
+            self._walk(root, levels, 0, False, found)
+        return found
+
+    def get_covering(self, subscription: str) -> list:
+        # other subscriptions in the trie covering every topic the subscription matches
+        prefix, levels = self.split(subscription)
+        root = self.roots.get(prefix)
+        if root is None:
+            return []
+        found = []
+        self._walk(root, levels, 0, True, found)
+        return [s for s in found if s != subscription]
+
+    @staticmethod
+    def minimize(subscriptions: list) -> tuple:
+        # returns (subscriptions not covered by another one, [(pruned subscription, covering subscription)]), keeps the order
+        trie = SolaceTopicTrie(subscriptions)
+        kept = []
+        pruned = []
+        for subscription in subscriptions:
+            covering = trie.get_covering(subscription)
+            if covering:
+                pruned.append((subscription, covering[0]))
+            else:
+                kept.append(subscription)
+        return kept, pruned
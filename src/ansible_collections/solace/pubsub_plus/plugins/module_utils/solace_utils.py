@@ -11,18 +11,11 @@ import json
 import re
 import copy
 import ssl
+import importlib.util
 from copy import deepcopy
-import xml.etree.ElementTree as ET
 
-SOLACE_UTILS_HAS_IMPORT_ERROR = False
-SOLACE_UTILS_IMPORT_ERR_TRACEBACK = None
-import traceback
-try:
-    import xmltodict
-    import packaging.version
-except ImportError:
-    SOLACE_UTILS_HAS_IMPORT_ERROR = True
-    SOLACE_UTILS_IMPORT_ERR_TRACEBACK = traceback.format_exc()
+# NOTE: xmltodict, packaging & xml.etree are imported lazily on first use.
+#       most modules only talk SEMP v2 (JSON) and never need them.
 
 
 class SolaceUtils(object):
@@ -45,6 +38,19 @@ class SolaceUtils(object):
                                  rc=solace_sys._SC_SYSTEM_ERR_RC)
         return
 
+    @staticmethod
+    def module_fail_on_missing_import(module: AnsibleModule, *names: str):
+        # check without importing, the actual import happens lazily on first use
+        for name in names:
+            try:
+                is_missing = importlib.util.find_spec(name) is None
+            except (ImportError, ValueError):
+                is_missing = True
+            if is_missing:
+                module.fail_json(
+                    msg=f"Missing module: No module named '{name}'", rc=solace_sys._SC_SYSTEM_ERR_RC)
+        return
+
     @staticmethod
     def create_result(rc=0, changed=False) -> dict:
         result = dict(
@@ -133,6 +139,7 @@ class SolaceUtils(object):
                 resp_body = json.loads(resp_text)
             except json.JSONDecodeError:
                 try:
+                    import xmltodict
                     resp_body = xmltodict.parse(resp_text)
                 except Exception:
                     resp_body = resp_text
@@ -151,8 +158,9 @@ class SolaceUtils(object):
         return merged
 
     @staticmethod
-    def convertDict2XmlElem(tag: str, d: dict) -> ET.Element:
+    def convertDict2XmlElem(tag: str, d: dict) -> 'ET.Element':
         # xml_data = xmltodict.unparse(request)
+        import xml.etree.ElementTree as ET
         elem = ET.Element(tag)
         for key, val in d.items():
             if isinstance(val, dict):
@@ -176,6 +184,7 @@ class SolaceUtils(object):
 
     @staticmethod
     def create_version(s: str):
+        import packaging.version
         try:
             v = packaging.version.Version(s)
         except packaging.version.InvalidVersion as e:
@@ -0,0 +1,586 @@
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceApiError, SolaceInternalError, SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceApi, SolaceSempV2Api, SolaceSempV2PagingGetApi
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_utils import SolaceUtils
+import collections
+import gzip
+import hashlib
+import io
+import json
+import logging
+import threading
+import time
+
+
+class SolaceVpnConfigObjectType(object):
+    # a SEMP v2 config object type of a vpn, same calls as the single object module, e.g. solace_queue
+    # - parent: the object is a child of the parent's object, e.g. queue subscriptions
+    # - references: settings referencing other objects by name, e.g. clientProfileName
+    # - key_reference: the key is the name of another object, e.g. rdp queue bindings
+
+    def __init__(self, name: str, collection: str, key: str, parent: str = None,
+                 references: dict = None, key_reference: str = None, is_updatable: bool = True):
+        self.name = name
+        self.collection = collection
+        self.key = key
+        self.parent = parent
+        self.references = references or {}
+        self.key_reference = key_reference
+        self.is_updatable = is_updatable
+
+
+class SolaceVpnConfigNode(object):
+
+    def __init__(self, object_type: SolaceVpnConfigObjectType, name: str, settings: dict, parent: 'SolaceVpnConfigNode' = None):
+        self.object_type = object_type
+        self.name = name
+        self.settings = settings
+        self.parent = parent
+        self.id = (parent.id if parent else ()) + (object_type.name, name)
+        self.dependencies = []
+        self.action = None
+        self.error = None
+        self.duration_secs = None
+
+    def get_parent_path_array(self) -> list:
+        # the path of the collection, e.g. [queues, {queue}, subscriptions]
+        parent_path_array = self.parent.get_path_array() if self.parent else []
+        return parent_path_array + [self.object_type.collection]
+
+    def get_path_array(self) -> list:
+        return self.get_parent_path_array() + [self.name]
+
+    def get_result(self) -> dict:
+        result = dict(
+            type=self.object_type.name,
+            name=self.name,
+            action=self.action or 'skipped'
+        )
+        if self.parent:
+            result['parent'] = self.parent.name
+        if self.duration_secs is not None:
+            result['duration_secs'] = self.duration_secs
+        if self.error is not None:
+            result['error'] = str(self.error)
+        return result
+
+
+class SolaceVpnConfig(object):
+    # a vpn's desired state as a DAG of config objects, applied with a bounded number of concurrent SEMP v2 calls.
+    # state=present: parents & referenced objects first, state=absent: in reverse.
+
+    OBJECT_TYPES = [
+        SolaceVpnConfigObjectType('client_profiles', 'clientProfiles', 'clientProfileName'),
+        SolaceVpnConfigObjectType('acl_profiles', 'aclProfiles', 'aclProfileName'),
+        SolaceVpnConfigObjectType('client_usernames', 'clientUsernames', 'clientUsername',
+                                  references={'clientProfileName': 'client_profiles', 'aclProfileName': 'acl_profiles'}),
+        SolaceVpnConfigObjectType('queues', 'queues', 'queueName'),
+        SolaceVpnConfigObjectType('subscriptions', 'subscriptions', 'subscriptionTopic', parent='queues', is_updatable=False),
+        SolaceVpnConfigObjectType('rdps', 'restDeliveryPoints', 'restDeliveryPointName',
+                                  references={'clientProfileName': 'client_profiles'}),
+        SolaceVpnConfigObjectType('rest_consumers', 'restConsumers', 'restConsumerName', parent='rdps'),
+        SolaceVpnConfigObjectType('queue_bindings', 'queueBindings', 'queueBindingName', parent='rdps', key_reference='queues')
+    ]
+    OBJECT_TYPES_BY_NAME = {t.name: t for t in OBJECT_TYPES}
+    SETTINGS_KEYS = ['sempv2_settings', 'settings']
+
+    def __init__(self, config: dict, state: str, is_solace_cloud: bool):
+        self.state = state
+        self.is_solace_cloud = is_solace_cloud
+        self.nodes = []
+        self._build(config)
+
+    def _get_child_types(self, parent: str) -> list:
+        return [t for t in self.OBJECT_TYPES if t.parent == parent]
+
+    def _parse_item(self, arg_path: str, item) -> tuple:
+        # item: '{name}' or dict with name, sempv2_settings & child lists
+        if isinstance(item, str):
+            return item, None, {}
+        if not isinstance(item, dict) or not item.get('name'):
+            raise SolaceParamsValidationError(arg_path, item, "must be a name or a dict with 'name'")
+        settings = None
+        for settings_key in self.SETTINGS_KEYS:
+            if item.get(settings_key) is not None:
+                settings = dict(item[settings_key])
+                SolaceUtils.type_conversion(settings, self.is_solace_cloud)
+        return str(item['name']), settings, item
+
+    def _add_nodes(self, arg_path: str, items: dict, parent: SolaceVpnConfigNode = None):
+        child_types = self._get_child_types(parent.object_type.name if parent else None)
+        unknown = set(items.keys()) - set(t.name for t in child_types)
+        if parent:
+            unknown -= set(['name'] + self.SETTINGS_KEYS)
+        if unknown:
+            raise SolaceParamsValidationError(arg_path, sorted(unknown), f"unknown object types, valid: {[t.name for t in child_types]}")
+        for object_type in child_types:
+            type_arg_path = f"{arg_path}.{object_type.name}"
+            seen = set()
+            for item in items.get(object_type.name) or []:
+                name, settings, item_dict = self._parse_item(type_arg_path, item)
+                if name in seen:
+                    raise SolaceParamsValidationError(type_arg_path, name, "duplicate name")
+                seen.add(name)
+                node = SolaceVpnConfigNode(object_type, name, settings, parent)
+                self.nodes.append(node)
+                self._add_nodes(f"{type_arg_path}.{name}", item_dict, node)
+
+    def _build(self, config: dict):
+        self._add_nodes('config', config or {})
+        nodes_by_id = {n.id: n for n in self.nodes}
+        for node in self.nodes:
+            depends_on = []
+            if node.parent:
+                depends_on.append(node.parent)
+            references = [(t, (node.settings or {}).get(k)) for k, t in node.object_type.references.items()]
+            if node.object_type.key_reference:
+                references.append((node.object_type.key_reference, node.name))
+            for type_name, name in references:
+                # references to objects not in the config must exist already
+                referenced = nodes_by_id.get((type_name, name))
+                if referenced is not None:
+                    depends_on.append(referenced)
+            for dependency in depends_on:
+                if self.state == 'absent':
+                    dependency.dependencies.append(node)
+                else:
+                    node.dependencies.append(dependency)
+
+    def get_levels(self) -> int:
+        # length of the longest dependency chain, i.e. the min number of sequential steps
+        levels = {}
+        for node in self._get_topological_order():
+            levels[node.id] = 1 + max([levels[d.id] for d in node.dependencies], default=0)
+        return max(levels.values(), default=0)
+
+    def _get_topological_order(self) -> list:
+        dependents, remaining = self._get_dependents()
+        ready = collections.deque(n for n in self.nodes if remaining[n.id] == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for dependent in dependents[node.id]:
+                remaining[dependent.id] -= 1
+                if remaining[dependent.id] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.nodes):
+            raise SolaceInternalError(f"dependency cycle in vpn config, nodes={len(self.nodes)}, ordered={len(order)}")
+        return order
+
+    def _get_dependents(self) -> tuple:
+        dependents = {n.id: [] for n in self.nodes}
+        remaining = {n.id: len(n.dependencies) for n in self.nodes}
+        for node in self.nodes:
+            for dependency in node.dependencies:
+                dependents[dependency.id].append(node)
+        return dependents, remaining
+
+    def apply(self, func, max_concurrency: int):
+        # calls func(node) -> action for each node once all its dependencies are done, up to max_concurrency at a time:
+        # the nodes whose dependencies are done are applied concurrently, then the nodes depending on them.
+        # after the first error no new nodes are started, the remaining ones are reported as skipped.
+        # returns the first error or None.
+        self._get_topological_order()
+        dependents, remaining = self._get_dependents()
+        ready = [n for n in self.nodes if remaining[n.id] == 0]
+        errors = []
+
+        def _run(node):
+            if errors:
+                return
+            start = time.monotonic()
+            try:
+                node.action = func(node)
+            except Exception as e:
+                logging.debug("vpn config: %s failed: %s", node.id, str(e))
+                node.action = 'failed'
+                node.error = e
+                errors.append(e)
+            finally:
+                node.duration_secs = round(time.monotonic() - start, 3)
+
+        while ready and not errors:
+            SolaceApi.map_concurrently(_run, ready, max_concurrency)
+            done = [n for n in ready if n.action not in [None, 'failed']]
+            ready = []
+            for node in done:
+                for dependent in dependents[node.id]:
+                    remaining[dependent.id] -= 1
+                    if remaining[dependent.id] == 0:
+                        ready.append(dependent)
+        return errors[0] if errors else None
+
+
+class SolaceVpnConfigApi(object):
+    # create / update / delete of a single config object, same as the single object modules
+
+    def __init__(self, sempv2_api: SolaceSempV2Api, config: SolaceTaskBrokerConfig, msg_vpn: str):
+        self.sempv2_api = sempv2_api
+        self.config = config
+        self.msg_vpn = msg_vpn
+
+    def _get_path_array(self, path_array: list) -> list:
+        return [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG, 'msgVpns', self.msg_vpn] + path_array
+
+    def apply_present(self, node: SolaceVpnConfigNode) -> str:
+        current_settings = self.sempv2_api.get_object_settings(self.config, self._get_path_array(node.get_path_array()))
+        if current_settings is None:
+            data = {
+                node.object_type.key: node.name
+            }
+            data.update(node.settings or {})
+            self.sempv2_api.make_post_request(self.config, self._get_path_array(node.get_parent_path_array()), data)
+            return 'created'
+        if not node.settings or not node.object_type.is_updatable:
+            return 'unchanged'
+        if not SolaceUtils.deep_dict_diff(node.settings, current_settings, {}):
+            return 'unchanged'
+        # sending all settings to update, same as the single object modules
+        self.sempv2_api.make_patch_request(self.config, self._get_path_array(node.get_path_array()), node.settings)
+        return 'updated'
+
+    def apply_absent(self, node: SolaceVpnConfigNode) -> str:
+        path_array = self._get_path_array(node.get_path_array())
+        if self.sempv2_api.get_object_settings(self.config, path_array) is None:
+            return 'unchanged'
+        self.sempv2_api.make_delete_request(self.config, path_array)
+        return 'deleted'
+
+
+class SolaceVpnConfigCollection(object):
+    # a SEMP v2 config collection under /msgVpns/{msgVpnName}, keys in the order of the object's path
+
+    def __init__(self, collection: str, keys: list, children: list = None, is_supports_paging: bool = True):
+        self.collection = collection
+        self.keys = keys
+        self.children = children or []
+        self.is_supports_paging = is_supports_paging
+        self.type_name = None
+        self.parent = None
+
+    def get_path_key(self, data: dict) -> str:
+        return ','.join(str(data.get(k, '')) for k in self.keys)
+
+
+class SolaceVpnConfigExport(object):
+    # reads all config collections of a vpn concurrently, incl. nested collections once their parent objects are read.
+    # writes a deterministic file: objects sorted by collection & key, keys sorted, no timestamps.
+    # collections not known by the broker (e.g. older SEMP versions, Solace Cloud) are reported as unsupported.
+
+    FORMAT_VERSION = 1
+    FORMAT_JSON = 'json'
+    FORMAT_NDJSON = 'ndjson'
+    FORMATS = [FORMAT_NDJSON, FORMAT_JSON]
+    # INVALID_PATH
+    UNSUPPORTED_SEMPV2_ERROR_CODES = [11]
+
+    C = SolaceVpnConfigCollection
+    COLLECTIONS = [
+        C('aclProfiles', ['aclProfileName'], [
+            C('clientConnectExceptions', ['clientConnectExceptionAddress']),
+            C('publishTopicExceptions', ['publishTopicExceptionSyntax', 'publishTopicException']),
+            C('subscribeShareNameExceptions', ['subscribeShareNameExceptionSyntax', 'subscribeShareNameException']),
+            C('subscribeTopicExceptions', ['subscribeTopicExceptionSyntax', 'subscribeTopicException'])]),
+        C('authenticationOauthProfiles', ['oauthProfileName'], [
+            C('clientRequiredClaims', ['clientRequiredClaimName']),
+            C('resourceServerRequiredClaims', ['resourceServerRequiredClaimName'])]),
+        C('authenticationOauthProviders', ['oauthProviderName']),
+        C('authorizationGroups', ['authorizationGroupName']),
+        C('bridges', ['bridgeName', 'bridgeVirtualRouter'], [
+            C('remoteMsgVpns', ['remoteMsgVpnName', 'remoteMsgVpnLocation', 'remoteMsgVpnInterface'], is_supports_paging=False),
+            C('remoteSubscriptions', ['remoteSubscriptionTopic']),
+            C('tlsTrustedCommonNames', ['tlsTrustedCommonName'], is_supports_paging=False)]),
+        C('certMatchingRules', ['ruleName'], [
+            C('attributeFilters', ['filterName']),
+            C('conditions', ['source'])]),
+        C('clientProfiles', ['clientProfileName']),
+        C('clientUsernames', ['clientUsername'], [
+            C('attributes', ['attributeName', 'attributeValue'])]),
+        C('distributedCaches', ['cacheName'], [
+            C('clusters', ['clusterName'], [
+                C('globalCachingHomeClusters', ['homeClusterName'], [
+                    C('topicPrefixes', ['topicPrefix'])]),
+                C('instances', ['instanceName']),
+                C('topics', ['topic'])])]),
+        C('dmrBridges', ['remoteNodeName']),
+        C('jndiConnectionFactories', ['connectionFactoryName']),
+        C('jndiQueues', ['queueName']),
+        C('jndiTopics', ['topicName']),
+        C('mqttRetainCaches', ['cacheName']),
+        C('mqttSessions', ['mqttSessionClientId', 'mqttSessionVirtualRouter'], [
+            C('subscriptions', ['subscriptionTopic'])]),
+        C('queueTemplates', ['queueTemplateName']),
+        C('queues', ['queueName'], [
+            C('subscriptions', ['subscriptionTopic'])]),
+        C('replayLogs', ['replayLogName'], [
+            C('topicFilterSubscriptions', ['topicFilterSubscription'])]),
+        C('replicatedTopics', ['replicatedTopic']),
+        C('restDeliveryPoints', ['restDeliveryPointName'], [
+            C('queueBindings', ['queueBindingName'], [
+                C('protectedRequestHeaders', ['headerName']),
+                C('requestHeaders', ['headerName'])]),
+            C('restConsumers', ['restConsumerName'], [
+                C('oauthJwtClaims', ['oauthJwtClaimName']),
+                C('tlsTrustedCommonNames', ['tlsTrustedCommonName'], is_supports_paging=False)])]),
+        C('sequencedTopics', ['sequencedTopic']),
+        C('telemetryProfiles', ['telemetryProfileName'], [
+            C('receiverAclConnectExceptions', ['receiverAclConnectExceptionAddress']),
+            C('traceFilters', ['traceFilterName'], [
+                C('subscriptions', ['subscription', 'subscriptionSyntax'])])]),
+        C('topicEndpointTemplates', ['topicEndpointTemplateName']),
+        C('topicEndpoints', ['topicEndpointName'])
+    ]
+    del C
+
+    def __init__(self, module, config: SolaceTaskBrokerConfig, msg_vpn: str, page_count: int, include: list = None):
+        self.module = module
+        self.config = config
+        self.msg_vpn = msg_vpn
+        self.page_count = page_count
+        self.collections = self.get_collections(include)
+        # type name -> [(parent keys, data)]
+        self.objects = {}
+        self.unsupported = set()
+        self.stats = dict(collections_read=0, round_trips=0)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _iter_collections(cls, collections: list, parent: SolaceVpnConfigCollection = None):
+        for collection in collections:
+            collection.parent = parent
+            collection.type_name = f"{parent.type_name}.{collection.collection}" if parent else collection.collection
+            yield collection
+            for child in cls._iter_collections(collection.children, collection):
+                yield child
+
+    @classmethod
+    def get_all_collections(cls) -> list:
+        return list(cls._iter_collections(cls.COLLECTIONS))
+
+    def get_collections(self, type_names: list = None) -> list:
+        # all collections or the given ones incl. their parents, in table order
+        all_collections = self.get_all_collections()
+        if not type_names:
+            return all_collections
+        valid = [c.type_name for c in all_collections]
+        invalid = [t for t in type_names if t not in valid]
+        if invalid:
+            raise SolaceParamsValidationError('include', invalid, f"unknown collections, valid: {valid}")
+        selected = set()
+        for type_name in type_names:
+            parts = type_name.split('.')
+            selected.update('.'.join(parts[:i]) for i in range(1, len(parts) + 1))
+        return [c for c in all_collections if c.type_name in selected]
+
+    def _is_unsupported(self, e: SolaceApiError) -> bool:
+        resp = e.get_resp()
+        status_code = resp.get('status_code') if isinstance(resp, dict) else None
+        return status_code == 404 or e.get_sempv2_error_code() in self.UNSUPPORTED_SEMPV2_ERROR_CODES
+
+    def _read_collection(self, collection: SolaceVpnConfigCollection, parent_keys: list, parent_path_array: list) -> list:
+        # returns the data of the collection's objects, None if the collection is not supported
+        api = SolaceSempV2PagingGetApi(self.module, collection.is_supports_paging)
+        path_array = ['msgVpns', self.msg_vpn] + parent_path_array + [collection.collection]
+        try:
+            objects = api.get_objects(self.config, SolaceSempV2Api.API_BASE_SEMPV2_CONFIG, self.page_count, path_array, adaptive_paging=True)
+        except SolaceApiError as e:
+            if not self._is_unsupported(e):
+                raise
+            logging.debug("vpn config export: collection '%s' not supported: %s", collection.type_name, str(e))
+            with self._lock:
+                self.unsupported.add(collection.type_name)
+            return None
+        # the parents' keys are in the record's parent keys
+        redundant_keys = ['msgVpnName']
+        ancestor = collection.parent
+        while ancestor is not None:
+            redundant_keys += ancestor.keys
+            ancestor = ancestor.parent
+        data_list = []
+        for o in objects:
+            data_list.append({k: v for k, v in o['data'].items() if k not in redundant_keys})
+        with self._lock:
+            self.stats['collections_read'] += 1
+            self.stats['round_trips'] += api.get_paging()['round_trips']
+            self.objects.setdefault(collection.type_name, []).extend((parent_keys, data) for data in data_list)
+        return data_list
+
+    def read(self, max_concurrency: int):
+        # reads the top level collections, then the children of each object read, up to max_concurrency at a time
+        children = {c.type_name: [] for c in self.collections}
+        top_level = []
+        for c in self.collections:
+            if c.parent is None:
+                top_level.append(c)
+            else:
+                children[c.parent.type_name].append(c)
+        vpn = SolaceSempV2Api(self.module).make_get_request(
+            self.config, [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG, 'msgVpns', self.msg_vpn])
+        self.objects['msgVpn'] = [([], vpn)]
+        # (collection, parent keys, parent path array): the collections of a level are read concurrently, then their children
+        reads = [(c, [], []) for c in top_level]
+        while reads:
+            data_lists = SolaceApi.map_concurrently(lambda r: self._read_collection(*r), reads, max_concurrency)
+            child_reads = []
+            for (collection, parent_keys, parent_path_array), data_list in zip(reads, data_lists):
+                for data in data_list or []:
+                    path_key = collection.get_path_key(data)
+                    path_array = parent_path_array + [collection.collection, path_key]
+                    child_reads += [(child, parent_keys + [path_key], path_array) for child in children[collection.type_name]]
+            reads = child_reads
+
+    def get_records(self) -> list:
+        # records in deterministic order: msgVpn, then collections in table order, sorted by parent keys & key
+        records = [dict(type='msgVpn', data=self.objects['msgVpn'][0][1])]
+        for c in self.collections:
+            entries = self.objects.get(c.type_name, [])
+            entries = sorted(entries, key=lambda e: (e[0], c.get_path_key(e[1])))
+            for parent_keys, data in entries:
+                record = dict(type=c.type_name, data=data)
+                if parent_keys:
+                    record['parent'] = parent_keys
+                records.append(record)
+        return records
+
+    @staticmethod
+    def get_record_lines(records: list) -> list:
+        return [json.dumps(r, sort_keys=True, separators=(',', ':')) for r in records]
+
+    @staticmethod
+    def get_sha256(lines: list) -> str:
+        return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+
+    def serialize(self, out_format: str, sempv2_version: str) -> tuple:
+        # returns (bytes, manifest)
+        records = self.get_records()
+        lines = self.get_record_lines(records)
+        counts = collections.Counter(r['type'] for r in records)
+        manifest = dict(
+            format_version=self.FORMAT_VERSION,
+            format=out_format,
+            msg_vpn=self.msg_vpn,
+            sempv2_version=sempv2_version,
+            collections=[c.type_name for c in self.collections],
+            counts=dict(sorted(counts.items())),
+            total=len(lines),
+            unsupported=sorted(self.unsupported),
+            sha256=self.get_sha256(lines)
+        )
+        manifest_line = json.dumps(dict(manifest=manifest), sort_keys=True, separators=(',', ':'))
+        if out_format == self.FORMAT_NDJSON:
+            text = '\n'.join([manifest_line] + lines) + '\n'
+        else:
+            text = manifest_line[:-1] + ',"objects":[' + ','.join(lines) + ']}\n'
+        return text.encode('utf-8'), manifest
+
+    @staticmethod
+    def compress(content: bytes) -> bytes:
+        # mtime=0 & no filename: same content, same bytes
+        buf = io.BytesIO()
+        with gzip.GzipFile(filename='', mode='wb', fileobj=buf, mtime=0) as f:
+            f.write(content)
+        return buf.getvalue()
+
+    @classmethod
+    def load(cls, content: bytes) -> tuple:
+        # returns (manifest, records) of a file written by serialize(), compressed or not.
+        # raises ValueError if the file is not an export or the records do not match the manifest's sha256.
+        if content[:2] == b'\x1f\x8b':
+            content = gzip.decompress(content)
+        lines = content.decode('utf-8').split('\n')
+        first = json.loads(lines[0])
+        if 'manifest' not in first:
+            raise ValueError("no manifest found")
+        manifest = first['manifest']
+        if 'objects' in first:
+            records = first['objects']
+        else:
+            records = [json.loads(line) for line in lines[1:] if line]
+        if cls.get_sha256(cls.get_record_lines(records)) != manifest.get('sha256'):
+            raise ValueError("records do not match the manifest's sha256")
+        return manifest, records
+
+
+class SolaceVpnConfigHashTree(object):
+    # Merkle-style hashes of a vpn's config records, as returned by SolaceVpnConfigExport:
+    # - object: sha256 of the canonical data: ignored attributes dropped, types coerced as in SolaceUtils.type_conversion, keys sorted
+    # - collection: sha256 of the collection's (parent keys, key, object hash), sorted
+    # - vpn: sha256 of the (collection, collection hash), sorted
+    # two trees are only compared object by object in the collections whose hashes differ.
+
+    DEFAULT_IGNORE_ATTRIBUTES = ['msgVpnName']
+    VPN_TYPE_NAME = 'msgVpn'
+
+    def __init__(self, records: list, type_names: list, ignore_attributes: list = None):
+        self.ignore_attributes = set(self.DEFAULT_IGNORE_ATTRIBUTES + (ignore_attributes or []))
+        collections_by_type = {c.type_name: c for c in SolaceVpnConfigExport.get_all_collections()}
+        # type name -> {(parent keys, key): (hash, canonical data)}
+        self.objects = {t: {} for t in [self.VPN_TYPE_NAME] + type_names}
+        for record in records:
+            type_name = record['type']
+            if type_name not in self.objects:
+                continue
+            collection = collections_by_type.get(type_name)
+            key = collection.get_path_key(record['data']) if collection else ''
+            data = self.canonicalize(record['data'])
+            self.objects[type_name][(tuple(record.get('parent', [])), key)] = (self.hash_data(data), data)
+        self.collection_hashes = {t: self._hash_collection(objects) for t, objects in self.objects.items()}
+        self.vpn_hash = self.hash_lines(sorted(f"{t}|{h}" for t, h in self.collection_hashes.items()))
+
+    def canonicalize(self, data: dict) -> dict:
+        canonical = {k: v for k, v in data.items() if k not in self.ignore_attributes}
+        return SolaceUtils.type_conversion(json.loads(json.dumps(canonical)), False)
+
+    @staticmethod
+    def hash_data(data: dict) -> str:
+        return hashlib.sha256(json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def hash_lines(lines: list) -> str:
+        return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+
+    def _hash_collection(self, objects: dict) -> str:
+        return self.hash_lines(sorted(f"{json.dumps(list(p))}|{k}|{h}" for (p, k), (h, _d) in objects.items()))
+
+    def get_differences(self, other: 'SolaceVpnConfigHashTree', max_differences: int) -> tuple:
+        # returns (differing collections, up to max_differences differences of other compared to self, total number of differences)
+        differing = [t for t in self.collection_hashes if other.collection_hashes.get(t) != self.collection_hashes[t]]
+        differences = []
+        count = 0
+        for type_name in differing:
+            expected = self.objects[type_name]
+            actual = other.objects.get(type_name, {})
+            for parent_key in sorted(set(expected) | set(actual)):
+                difference = self._get_difference(expected.get(parent_key), actual.get(parent_key))
+                if difference is None:
+                    continue
+                count += 1
+                if len(differences) < max_differences:
+                    parent, key = parent_key
+                    difference.update(dict(type=type_name, key=key))
+                    if parent:
+                        difference['parent'] = list(parent)
+                    differences.append(difference)
+        return differing, differences, count
+
+    @staticmethod
+    def _get_difference(expected: tuple, actual: tuple) -> dict:
+        if actual is None:
+            return dict(change='missing')
+        if expected is None:
+            return dict(change='unexpected')
+        if expected[0] == actual[0]:
+            return None
+        expected_data, actual_data = expected[1], actual[1]
+        attributes = {}
+        for k in sorted(set(expected_data) | set(actual_data)):
+            if expected_data.get(k) != actual_data.get(k):
+                attributes[k] = dict(expected=expected_data.get(k), actual=actual_data.get(k))
+        return dict(change='changed', attributes=attributes)
@@ -20,6 +20,7 @@ description:
 - "Supports 'transactional' behavior with rollback to original list in case of error."
 - "De-duplicates Remote Subscription object list."
 - "Reports which topics were added, deleted and omitted (duplicates). In case of an error, reports the invalid Remote Subscription object."
+- "Optionally minimizes the list by dropping remote subscriptions covered by other remote subscriptions in the list, see C(minimize)."
 - "To delete all Remote Subscription objects, use state='exactly' with an empty/null list (see examples)."
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/bridge/createMsgVpnBridgeRemoteSubscription"
@@ -44,11 +45,22 @@ options:
       - backup
       - auto
     aliases: [virtual_router]
+  minimize:
+    description:
+    - "If true, drops remote subscriptions covered by another one in the list before applying it, e.g. 'a/b/c' and 'a/*/c' are covered by 'a/>'."
+    - "Covering follows the Solace topic syntax: '*' and 'prefix*' match one level, a trailing '>' matches one or more levels.
+      Subscriptions with '#share/{group}/' or '#noexport/' prefixes are only covered by subscriptions with the same prefixes."
+    - "Reports the dropped remote subscriptions as 'pruned' with the covering remote subscription in 'covered_by'."
+    - "With state='exactly', existing remote subscriptions covered by another one are deleted. Ignored for state='absent'."
+    required: false
+    type: bool
+    default: false
 extends_documentation_fragment:
 - solace.pubsub_plus.solace.broker
 - solace.pubsub_plus.solace.vpn
 - solace.pubsub_plus.solace.sempv2_settings
 - solace.pubsub_plus.solace.state_crud_list
+- solace.pubsub_plus.solace.journal
 seealso:
 - module: solace_bridge
 - module: solace_bridge_remote_subscription
@@ -235,9 +247,43 @@ response:
           -   deleted: topic-4
           -   deleted: topic-5
           -   duplicate: duplicate-topic
+          -   pruned: a/b/c
+              covered_by: a/>
       error:
         response:
           -   error: /invalid-topic
+journal:
+    description: The journal, if resumed, whether all existing objects were read and the number of objects read to verify uncertain actions.
+    type: dict
+    returned: if journal
+    sample:
+        path: ./journal.ndjson
+        resumed: true
+        scanned: false
+        verified: 1
+rollback:
+    description:
+    - The rollback after an error, without a journal. The created objects are deleted and the deleted objects created again, concurrently, with retries.
+    - "C(compensations): the outcome of each compensating action. C(inconsistent): the keys whose existence differs from before the task,
+      read from a fresh listing, incl. the key of the failed action. C(consistent) is null if the listing failed."
+    type: dict
+    returned: error
+    sample:
+        compensations:
+            - key: topic-1
+              action: delete
+              result: ok
+              attempts: 1
+            - key: topic-2
+              action: delete
+              result: failed
+              attempts: 3
+              error: "..."
+        succeeded: 1
+        failed: 1
+        consistent: false
+        inconsistent:
+            - topic-2
 msg:
     description: The response from the HTTP call in case of error.
     type: dict
@@ -257,6 +303,7 @@ from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_s
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerCRUDListTask
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_topic import SolaceTopicTrie
 from ansible.module_utils.basic import AnsibleModule
 
 
@@ -281,6 +328,12 @@ class SolaceBridgeRemoteSubscriptionsTask(SolaceBrokerCRUDListTask):
         params = self.get_module().params
         return [params['msg_vpn'], params['bridge_virtual_router'], params['bridge_name'], object_key]
 
+    def prune_keys(self, key_list) -> list:
+        if not self.get_module().params['minimize']:
+            return key_list
+        key_list, self.pruned_key_list = SolaceTopicTrie.minimize(key_list)
+        return key_list
+
     def create_func(self, vpn_name, bridge_virtual_router, bridge_name, remote_subscription_topic, settings=None):
         # POST /msgVpns/{msgVpnName}/bridges/{bridgeName},{bridgeVirtualRouter}/remoteSubscriptions
         data = {
@@ -314,10 +367,12 @@ def run_module():
                    aliases=['topics', 'remote_subscription_topics'],
                    elements='str'
                    ),
+        minimize=dict(type='bool', required=False, default=False)
     )
     arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
     arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
     arg_spec.update(SolaceTaskBrokerConfig.arg_spec_crud_list())
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_journal())
     arg_spec.update(module_args)
 
     module = AnsibleModule(
@@ -193,7 +193,7 @@ rc:
 from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerCRUDTask
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_consts import SolaceTaskOps
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api, SolaceCloudApiCertAuthority
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceInternalError, SolaceParamsValidationError
 from ansible.module_utils.basic import AnsibleModule
@@ -213,7 +213,10 @@ class SolaceClientCertAuthorityTask(SolaceBrokerCRUDTask):
     def __init__(self, module):
         super().__init__(module)
         self.sempv2_api = SolaceSempV2Api(module)
-        self.solace_cloud_api = SolaceCloudApiCertAuthority(module)
+        self.solace_cloud_api = None
+        if self.get_config().is_solace_cloud():
+            from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api_cloud import SolaceCloudApiCertAuthority
+            self.solace_cloud_api = SolaceCloudApiCertAuthority(module)
 
     def validate_params(self):
         params = self.get_module().params
@@ -229,7 +232,7 @@ class SolaceClientCertAuthorityTask(SolaceBrokerCRUDTask):
     def _get_func_solace_cloud(self, cert_authority_name):
         # GET services/{serviceId}/serviceCertificateAuthorities/{certAuthorityName}
         service_id = self.get_config().get_params()['solace_cloud_service_id']
-        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), SolaceCloudApiCertAuthority.API_SERVICES,
+        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), self.solace_cloud_api.API_SERVICES,
                       service_id, 'serviceCertificateAuthorities', cert_authority_name]
         return self.solace_cloud_api.get_object_settings(self.get_config(), path_array)
 
@@ -270,8 +273,8 @@ class SolaceClientCertAuthorityTask(SolaceBrokerCRUDTask):
         body.update(self.SOLACE_CLOUD_DEFAULTS)
         body.update(settings if settings else {})
         service_id = self.get_config().get_params()['solace_cloud_service_id']
-        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), SolaceCloudApiCertAuthority.API_SERVICES,
-                      service_id, SolaceCloudApiCertAuthority.API_REQUESTS, 'serviceCertificateAuthorityRequests']
+        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), self.solace_cloud_api.API_SERVICES,
+                      service_id, self.solace_cloud_api.API_REQUESTS, 'serviceCertificateAuthorityRequests']
         return self.solace_cloud_api.make_service_post_request(
             self.get_config(),
             path_array,
@@ -308,8 +311,8 @@ class SolaceClientCertAuthorityTask(SolaceBrokerCRUDTask):
             body['certificate'].update({'content': cert_content})
         body.update(settings if settings else {})
         service_id = self.get_config().get_params()['solace_cloud_service_id']
-        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), SolaceCloudApiCertAuthority.API_SERVICES,
-                      service_id, SolaceCloudApiCertAuthority.API_REQUESTS, 'serviceCertificateAuthorityRequests']
+        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), self.solace_cloud_api.API_SERVICES,
+                      service_id, self.solace_cloud_api.API_REQUESTS, 'serviceCertificateAuthorityRequests']
         return self.solace_cloud_api.make_service_post_request(
             self.get_config(),
             path_array,
@@ -335,8 +338,8 @@ class SolaceClientCertAuthorityTask(SolaceBrokerCRUDTask):
             }
         }
         service_id = self.get_config().get_params()['solace_cloud_service_id']
-        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), SolaceCloudApiCertAuthority.API_SERVICES,
-                      service_id, SolaceCloudApiCertAuthority.API_REQUESTS, 'serviceCertificateAuthorityRequests']
+        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), self.solace_cloud_api.API_SERVICES,
+                      service_id, self.solace_cloud_api.API_REQUESTS, 'serviceCertificateAuthorityRequests']
         return self.solace_cloud_api.make_service_post_request(
             self.get_config(),
             path_array,
@@ -0,0 +1,165 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: solace_client_usernames_bulk
+short_description: provision client usernames from a file
+description:
+- "Creates, updates or deletes the client usernames of an input file, e.g. for onboarding 100k+ devices."
+- "Records: C(name) (the client username) and the SEMP v2 settings, see M(solace.pubsub_plus.solace_client_username)."
+- "C(password) is only sent on create, it is not returned by SEMP and cannot be compared."
+notes:
+- "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/clientUsername"
+extends_documentation_fragment:
+- solace.pubsub_plus.solace.broker
+- solace.pubsub_plus.solace.vpn
+- solace.pubsub_plus.solace.bulk
+- solace.pubsub_plus.solace.journal
+seealso:
+- module: solace_client_username
+- module: solace_mqtt_sessions_bulk
+author:
+- Ricardo Gomez-Ulmke (@rjgu)
+'''
+
+EXAMPLES = '''
+hosts: all
+gather_facts: no
+any_errors_fatal: true
+collections:
+- solace.pubsub_plus
+module_defaults:
+  solace_client_usernames_bulk:
+    host: "{{ sempv2_host }}"
+    port: "{{ sempv2_port }}"
+    secure_connection: "{{ sempv2_is_secure_connection }}"
+    username: "{{ sempv2_username }}"
+    password: "{{ sempv2_password }}"
+    timeout: "{{ sempv2_timeout }}"
+    msg_vpn: "{{ vpn }}"
+tasks:
+  # devices.ndjson:
+  # {"name": "device-000001", "settings": {"clientProfileName": "devices", "aclProfileName": "devices", "enabled": true, "password": "..."}}
+  # {"name": "device-000002", "settings": {"clientProfileName": "devices", "aclProfileName": "devices", "enabled": true, "password": "..."}}
+  - name: provision client usernames
+    solace_client_usernames_bulk:
+      src: ./devices.ndjson
+      dest: ./devices.result.ndjson
+    register: result
+
+  # devices.csv:
+  # name,clientProfileName,aclProfileName,enabled
+  # device-000001,devices,devices,true
+  - name: provision client usernames from csv
+    solace_client_usernames_bulk:
+      src: ./devices.csv.gz
+      dest: ./devices.result.ndjson
+      chunk_size: 2000
+      max_concurrency: 16
+      journal: ./devices.journal.ndjson
+      resume: true
+
+  - name: delete client usernames
+    solace_client_usernames_bulk:
+      src: ./devices.ndjson
+      dest: ./devices.result.ndjson
+      state: absent
+'''
+
+RETURN = '''
+dest:
+    description: The output file with the result of every record.
+    type: str
+    returned: success
+records:
+    description: Number of records read.
+    type: int
+    returned: success
+chunks:
+    description: Number of chunks applied.
+    type: int
+    returned: success
+counts:
+    description: Number of records per action.
+    type: dict
+    returned: success
+    sample:
+        created: 99000
+        updated: 10
+        unchanged: 990
+        deleted: 0
+        failed: 0
+duration_secs:
+    description: The duration.
+    type: float
+    returned: success
+journal:
+    description: The journal, if resumed and the number of records skipped, completed by previous runs.
+    type: dict
+    returned: if journal
+    sample:
+        path: ./devices.journal.ndjson
+        resumed: true
+        skipped: 30000
+msg:
+    description: Number of failed records in case of error.
+    type: list
+    returned: error
+rc:
+    description: Return code. rc=0 on success, rc=1 on error.
+    type: int
+    returned: always
+    sample:
+        success:
+            rc: 0
+        error:
+            rc: 1
+'''
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_bulk import SolaceBulkTask, SolaceBulkObjectType
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible.module_utils.basic import AnsibleModule
+
+
+class SolaceClientUsernamesBulkTask(SolaceBulkTask):
+
+    OBJECT_TYPE = SolaceBulkObjectType('client_usernames', 'clientUsernames', ['clientUsername'], ['name'], write_only=['password'])
+
+    def __init__(self, module):
+        super().__init__(module)
+
+    def get_object_type(self) -> SolaceBulkObjectType:
+        return self.OBJECT_TYPE
+
+
+def run_module():
+    arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
+    arg_spec.update(SolaceBulkTask.arg_spec_bulk())
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_journal())
+
+    module = AnsibleModule(
+        argument_spec=arg_spec,
+        supports_check_mode=False
+    )
+    solace_task = SolaceClientUsernamesBulkTask(module)
+    solace_task.execute()
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -385,28 +385,7 @@ class SolaceCloudGetFactsTask(SolaceReadFactsTask):
             all={}
         )
         hosts = {}
-        secured_semp_details = solace_cloud_service_facts.get_semp_client_connection_details()
-        msg_vpn_attributes = solace_cloud_service_facts.get_msg_vpn_attributes()
-        # import logging, json
-        # logging.debug(f"secured_semp_details=\n{secured_semp_details}")
-        # logging.debug(f"msg_vpn_attributes=\n{msg_vpn_attributes}")
-        hosts[host_entry] = {
-            'meta': meta,
-            'ansible_connection': 'local',
-            'broker_type': 'solace_cloud',
-            'solace_cloud_service_id': search_dict['serviceId'],
-            'sempv2_host': secured_semp_details['secured']['uri_components']['host'],
-            "sempv2_port": secured_semp_details['secured']['uri_components']['port'],
-            "sempv2_is_secure_connection": True,
-            "sempv2_validate_certs": True,
-            "sempv2_username": secured_semp_details['authentication']['username'],
-            "sempv2_password": secured_semp_details['authentication']['password'],
-            "sempv2_timeout": "60",
-            "vpn": msg_vpn_attributes['msgVpn'],
-            "virtual_router": "primary"
-        }
-        if api_token:
-            hosts[host_entry].update({'solace_cloud_api_token': api_token})
+        hosts[host_entry] = solace_cloud_service_facts.get_host_inventory_entry(api_token, meta)
         inv['all']['hosts'] = hosts
         return 'formattedHostInventory', inv
 
@@ -95,6 +95,29 @@ response:
         response:
           - added: manage-list-hostname-1.messaging.solace.cloud
           - added: manage-list-hostname-2.messaging.solace.cloud
+rollback:
+    description:
+    - The rollback after an error. The created objects are deleted and the deleted objects created again, concurrently, with retries.
+    - "C(compensations): the outcome of each compensating action. C(inconsistent): the keys whose existence differs from before the task,
+      read from a fresh listing, incl. the key of the failed action. C(consistent) is null if the listing failed."
+    type: dict
+    returned: error
+    sample:
+        compensations:
+            - key: topic-1
+              action: delete
+              result: ok
+              attempts: 1
+            - key: topic-2
+              action: delete
+              result: failed
+              attempts: 3
+              error: "..."
+        succeeded: 1
+        failed: 1
+        consistent: false
+        inconsistent:
+            - topic-2
 msg:
     description: The response from the HTTP call in case of error.
     type: dict
@@ -113,7 +136,7 @@ rc:
 from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceCloudCRUDListTask
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskSolaceCloudServiceConfig
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceCloudApi
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api_cloud import SolaceCloudApi
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_consts import SolaceTaskOps
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
 from ansible.module_utils.basic import AnsibleModule
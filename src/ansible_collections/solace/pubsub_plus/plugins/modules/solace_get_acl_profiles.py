@@ -19,6 +19,7 @@ description:
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/aclProfile/getMsgVpnAclProfiles"
 - "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/aclProfile/getMsgVpnAclProfiles"
+- "Supports C(shards) and C(shard_prefixes), the shards are split on C(aclProfileName)."
 extends_documentation_fragment:
 - solace.pubsub_plus.solace.broker
 - solace.pubsub_plus.solace.vpn
@@ -131,6 +132,9 @@ class SolaceGetAclProfilesTask(SolaceBrokerGetPagingTask):
         # GET /msgVpns/{msgVpnName}/aclProfiles
         return ['msgVpns', params['msg_vpn'], 'aclProfiles']
 
+    def get_shard_key(self) -> str:
+        return 'aclProfileName'
+
 
 def run_module():
     module_args = {}
@@ -15,19 +15,36 @@ DOCUMENTATION = '''
 module: solace_get_available
 short_description: check if broker semp & spool is available
 description:
-- Check if broker service is reachable via SEMP and if the spool is ready. Calls "GET /about/api" and creates/deletes a test queue.
+- Check if broker service is reachable via SEMP and if the spool is ready.
+- "SEMP: calls 'GET /about/api'."
+- "Spool, C(probe=read_only): checks the message vpn's operational state is 'up' and reads its queues via the monitor api."
+- "Spool, C(probe=write): creates/deletes a test queue."
 - To check, evaluate the return ``is_available``. ``rc==1`` is only set in case of a module or API error.
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/about/getAbout"
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/queue/createMsgVpnQueue"
+- "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/msgVpn/getMsgVpn"
+- "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/queue/getMsgVpnQueues"
 options:
   wait_timeout_seconds:
     description:
-    - Number of seconds to run tests for SEMP and spool availability. Polls every 5 seconds for `wait_timeout_seconds` until service is available.
+    - Number of seconds to run tests for SEMP and spool availability. Polls for `wait_timeout_seconds` until service is available.
+    - Polls every 0.25 seconds at first, increasing the interval up to 5 seconds.
     - Value must be `> 0`.
     type: int
     required: false
     default: 600
+  probe:
+    description:
+    - How to check if the spool is available.
+    - "read_only: GET the message vpn's state and queues via the monitor api. Does not change the configuration."
+    - "write: create and delete a test queue. Requires a user with write access to the vpn."
+    type: str
+    required: false
+    default: read_only
+    choices:
+      - read_only
+      - write
 extends_documentation_fragment:
 - solace.pubsub_plus.solace.broker
 - solace.pubsub_plus.solace.vpn
@@ -88,34 +105,17 @@ rc:
             rc: 1
 '''
 
-import traceback
-import uuid
 import time
-import logging
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceApiError, SolaceParamsValidationError
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_available import SolaceBrokerAvailability
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerGetTask
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_utils import SolaceUtils
-from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
-
-SOLACE_GET_AVAILABLE_HAS_IMPORT_ERROR = False
-SOLACE_GET_AVAILABLE_ERR_TRACEBACK = None
-try:
-    import requests
-except ImportError:
-    SOLACE_GET_AVAILABLE_HAS_IMPORT_ERROR = True
-    SOLACE_GET_AVAILABLE_ERR_TRACEBACK = traceback.format_exc()
 
 
 class SolaceGetAvailableTask(SolaceBrokerGetTask):
 
-    DELAY_SECONDS = 5
-
     def __init__(self, module):
-        SolaceUtils.module_fail_on_import_error(
-            module, SOLACE_GET_AVAILABLE_HAS_IMPORT_ERROR, SOLACE_GET_AVAILABLE_ERR_TRACEBACK)
         super().__init__(module)
 
     def validate_params(self):
@@ -125,64 +125,6 @@ class SolaceGetAvailableTask(SolaceBrokerGetTask):
             raise SolaceParamsValidationError(
                 'wait_timeout_seconds', wait_timeout_seconds, "must be >= 0")
 
-    def calculate_max_tries(self, wait_timeout_seconds):
-        if wait_timeout_seconds > self.DELAY_SECONDS:
-            return wait_timeout_seconds // self.DELAY_SECONDS
-        return 1
-
-    def do_wait_semp_available(self, wait_timeout_seconds):
-        ex = None
-        try_count = 0
-        max_tries = self.calculate_max_tries(wait_timeout_seconds)
-        while try_count < max_tries:
-            logging.debug("try number: %d", try_count)
-            try:
-                self.sempv2_api.make_get_request(
-                    self.get_config(), [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG] + ["about", "api"])
-                return True, None
-            except SolaceApiError as e:
-                if try_count + 1 >= max_tries or e.get_sempv2_error_code() == 72:
-                    raise e
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.SSLError) as e:
-                self.logExceptionAsDebug(type(e), e)
-                ex = str(e)
-            try_count += 1
-            if try_count < max_tries:
-                time.sleep(self.DELAY_SECONDS)
-        return False, ex
-
-    def do_wait_spool_available(self, wait_timeout_seconds):
-        ex = None
-        try_count = 0
-        max_tries = self.calculate_max_tries(wait_timeout_seconds)
-        vpn_name = self.get_module().params['msg_vpn']
-        queue_name = str(uuid.uuid4())
-        data = {
-            'msgVpnName': vpn_name,
-            'queueName': queue_name
-        }
-        create_path_array = [
-            SolaceSempV2Api.API_BASE_SEMPV2_CONFIG, 'msgVpns', vpn_name, 'queues']
-        delete_path_array = [SolaceSempV2Api.API_BASE_SEMPV2_CONFIG,
-                             'msgVpns', vpn_name, 'queues', queue_name]
-        while try_count < max_tries:
-            logging.debug("try number: %d", try_count)
-            try:
-                self.sempv2_api.make_post_request(
-                    self.get_config(), create_path_array, data)
-                self.sempv2_api.make_delete_request(
-                    self.get_config(), delete_path_array)
-                return True, None
-            except SolaceApiError as e:
-                if try_count + 1 >= max_tries or e.get_sempv2_error_code() == 72:
-                    raise e
-                self.logExceptionAsDebug(type(e), e)
-                ex = e.get_ansible_msg()
-            try_count += 1
-            if try_count < max_tries:
-                time.sleep(self.DELAY_SECONDS)
-        return False, ex
-
     def do_task(self):
         self.validate_params()
         self.update_result({
@@ -190,18 +132,22 @@ class SolaceGetAvailableTask(SolaceBrokerGetTask):
             'is_semp_available': False,
             'is_spool_available': False
         })
-        wait_timeout_seconds = self.get_module().params['wait_timeout_seconds']
-        is_semp_available = False
+        params = self.get_module().params
+        wait_timeout_seconds = params['wait_timeout_seconds']
+        availability = SolaceBrokerAvailability(
+            self.get_sempv2_api(), self.get_config(), params['msg_vpn'], params['probe'])
         is_spool_available = False
         is_spool_tested = False
-        semp_ex = None
         spool_ex = None
-        is_semp_available, semp_ex = self.do_wait_semp_available(
-            wait_timeout_seconds)
+        is_semp_available, semp_ex = availability.wait_semp_available(
+            time.monotonic() + wait_timeout_seconds)
+        self.update_result({
+            'is_semp_available': is_semp_available
+        })
         if is_semp_available:
             is_spool_tested = True
-            is_spool_available, spool_ex = self.do_wait_spool_available(
-                wait_timeout_seconds)
+            is_spool_available, spool_ex = availability.wait_spool_available(
+                time.monotonic() + wait_timeout_seconds)
         self.update_result({
             'is_semp_available': is_semp_available,
             'is_available': is_semp_available and is_spool_available
@@ -221,7 +167,8 @@ class SolaceGetAvailableTask(SolaceBrokerGetTask):
 
 def run_module():
     module_args = dict(
-        wait_timeout_seconds=dict(type='int', required=False, default=600)
+        wait_timeout_seconds=dict(type='int', required=False, default=600),
+        probe=dict(type='str', required=False, default=SolaceBrokerAvailability.PROBE_READ_ONLY, choices=SolaceBrokerAvailability.PROBES)
     )
     arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
     arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
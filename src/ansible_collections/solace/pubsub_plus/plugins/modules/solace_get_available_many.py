@@ -0,0 +1,246 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: solace_get_available_many
+short_description: check if multiple brokers' semp & spool are available
+description:
+- Same checks as M(solace.pubsub_plus.solace_get_available), for a list of brokers, e.g. an HA triplet or the nodes of a DMR cluster.
+- The brokers are checked concurrently with a shared deadline of C(wait_timeout_seconds), i.e. waiting takes as long as the slowest broker.
+- Each entry in C(brokers) overrides the broker connection arguments of the module,
+  e.g. set the common C(username), C(password) at module level and the C(host), C(port) per broker.
+- To check, evaluate the return ``is_available`` or the per broker ``brokers[].is_available``. ``rc==1`` is only set in case of a module or API error.
+notes:
+- "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/about/getAbout"
+- "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/msgVpn/getMsgVpn"
+- "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/queue/getMsgVpnQueues"
+options:
+  wait_timeout_seconds:
+    description:
+    - Number of seconds to wait for all brokers to become available, shared by the SEMP and spool checks.
+    - Polls every 0.25 seconds at first, increasing the interval up to 5 seconds.
+    - Value must be `> 0`.
+    type: int
+    required: false
+    default: 600
+  probe:
+    description:
+    - How to check if the spool is available. See M(solace.pubsub_plus.solace_get_available).
+    type: str
+    required: false
+    default: read_only
+    choices:
+      - read_only
+      - write
+  max_concurrency:
+    description: Max number of brokers checked concurrently.
+    type: int
+    required: false
+    default: 16
+extends_documentation_fragment:
+- solace.pubsub_plus.solace.broker
+- solace.pubsub_plus.solace.brokers
+seealso:
+- module: solace_get_available
+author:
+- Ricardo Gomez-Ulmke (@rjgu)
+'''
+
+EXAMPLES = '''
+hosts: localhost
+gather_facts: no
+any_errors_fatal: true
+tasks:
+  - name: "Wait until all nodes of the HA triplet are available"
+    solace.pubsub_plus.solace_get_available_many:
+      username: "{{ sempv2_username }}"
+      password: "{{ sempv2_password }}"
+      msg_vpn: default
+      wait_timeout_seconds: 300
+      brokers:
+        - name: primary
+          host: "{{ primary_host }}"
+          port: 8080
+        - name: backup
+          host: "{{ backup_host }}"
+          port: 8080
+        - name: monitor
+          host: "{{ monitor_host }}"
+          port: 8080
+    register: result
+
+  - name: "Check if available"
+    assert:
+      that:
+        - result.is_available
+      fail_msg: "{{ result.brokers | rejectattr('is_available') | map(attribute='name') | list }} not available"
+'''
+
+RETURN = '''
+is_available:
+    description: Flag indicating whether all brokers are available.
+    type: bool
+    returned: always
+brokers:
+    description: The availability of each broker, in the order of the argument C(brokers).
+    type: list
+    elements: dict
+    returned: success
+    sample:
+        - name: primary
+          is_available: true
+          is_semp_available: true
+          is_spool_available: true
+          time_to_ready_secs: 12.5
+        - name: backup
+          is_available: false
+          is_semp_available: true
+          is_spool_available: false
+          time_to_ready_secs: null
+          msg:
+          - "SPOOL response:"
+          - "msgVpn 'default': state=down"
+msg:
+    description: Details in case of an error.
+    type: dict
+    returned: error
+rc:
+    description: Return code. rc=0 on success, rc=1 on error.
+    type: int
+    returned: always
+    sample:
+        success:
+            rc: 0
+        error:
+            rc: 1
+'''
+
+import logging
+import time
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceApiError, SolaceError, SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceApi, SolaceSempV2Api
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_available import SolaceBrokerAvailability
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig, SolaceTaskBrokerModule
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerGetTask
+
+
+class SolaceGetAvailableManyTask(SolaceBrokerGetTask):
+
+    def __init__(self, module):
+        super().__init__(module)
+
+    def validate_params(self):
+        params = self.get_module().params
+        wait_timeout_seconds = params['wait_timeout_seconds']
+        if wait_timeout_seconds <= 0:
+            raise SolaceParamsValidationError(
+                'wait_timeout_seconds', wait_timeout_seconds, "must be >= 0")
+        if params['max_concurrency'] <= 0:
+            raise SolaceParamsValidationError(
+                'max_concurrency', params['max_concurrency'], "must be > 0")
+
+    def get_broker_availabilities(self) -> list:
+        # returns [(broker name, SolaceBrokerAvailability)], module args merged with each broker's args
+        params = self.get_module().params
+        availabilities = []
+        for broker in params['brokers']:
+            broker_module = SolaceTaskBrokerModule(self.get_module(), broker)
+            availability = SolaceBrokerAvailability(
+                SolaceSempV2Api(broker_module), SolaceTaskBrokerConfig(broker_module), broker_module.params['msg_vpn'], params['probe'])
+            availabilities.append((broker_module.broker_name, availability))
+        return availabilities
+
+    def wait_broker_available(self, broker_name: str, availability: SolaceBrokerAvailability, start_time: float, deadline: float) -> dict:
+        broker_result = dict(
+            name=broker_name,
+            is_available=False,
+            is_semp_available=False,
+            is_spool_available=False,
+            time_to_ready_secs=None
+        )
+        _msg = []
+        try:
+            is_semp_available, semp_ex = availability.wait_semp_available(deadline)
+            broker_result['is_semp_available'] = is_semp_available
+            if semp_ex:
+                _msg += ['HTTP response:', semp_ex]
+            if is_semp_available:
+                is_spool_available, spool_ex = availability.wait_spool_available(deadline)
+                broker_result['is_spool_available'] = is_spool_available
+                if spool_ex:
+                    _msg += ['SPOOL response:', spool_ex]
+        except SolaceApiError as e:
+            # reported per broker, the other brokers are still waited for
+            logging.debug("broker '%s': %s", broker_name, str(e))
+            broker_result['api_error'] = True
+            _msg += ['API error:', e.get_ansible_msg()]
+        except SolaceError as e:
+            # e.g. the circuit breaker is open or the task deadline has passed
+            logging.debug("broker '%s': %s", broker_name, str(e))
+            broker_result['api_error'] = True
+            _msg += ['Error:'] + e.to_list()
+        broker_result['is_available'] = broker_result['is_semp_available'] and broker_result['is_spool_available']
+        if broker_result['is_available']:
+            broker_result['time_to_ready_secs'] = round(time.monotonic() - start_time, 3)
+        if _msg:
+            broker_result['msg'] = _msg
+        return broker_result
+
+    def do_task(self):
+        self.validate_params()
+        params = self.get_module().params
+        self.update_result({
+            'is_available': False
+        })
+        availabilities = self.get_broker_availabilities()
+        start_time = time.monotonic()
+        deadline = start_time + params['wait_timeout_seconds']
+        broker_results = SolaceApi.map_concurrently(
+            lambda name_availability: self.wait_broker_available(*name_availability, start_time, deadline), availabilities, params['max_concurrency'])
+        api_errors = [b['name'] for b in broker_results if b.pop('api_error', False)]
+        self.update_result({
+            'is_available': all(b['is_available'] for b in broker_results),
+            'brokers': broker_results
+        })
+        msg = None
+        if api_errors:
+            self.update_result({'rc': 1})
+            msg = [f"API error for brokers: {api_errors}, see brokers[].msg"]
+        return msg, self.get_result()
+
+
+def run_module():
+    module_args = dict(
+        wait_timeout_seconds=dict(type='int', required=False, default=600),
+        probe=dict(type='str', required=False, default=SolaceBrokerAvailability.PROBE_READ_ONLY, choices=SolaceBrokerAvailability.PROBES),
+        max_concurrency=dict(type='int', required=False, default=16)
+    )
+    arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_brokers())
+    arg_spec.update(module_args)
+
+    module = AnsibleModule(
+        argument_spec=arg_spec,
+        supports_check_mode=False
+    )
+    solace_task = SolaceGetAvailableManyTask(module)
+    solace_task.execute()
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
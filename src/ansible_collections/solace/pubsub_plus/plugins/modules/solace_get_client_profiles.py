@@ -25,6 +25,7 @@ seealso:
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/clientProfile/getMsgVpnClientProfiles"
 - "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/clientProfile/getMsgVpnClientProfiles"
+- "Supports C(shards) and C(shard_prefixes), the shards are split on C(clientProfileName)."
 author:
   - Ricardo Gomez-Ulmke (@rjgu)
 '''
@@ -129,6 +130,9 @@ class SolaceGetClientProfilesTask(SolaceBrokerGetPagingTask):
         # GET /msgVpns/{msgVpnName}/clientProfiles
         return ['msgVpns', params['msg_vpn'], 'clientProfiles']
 
+    def get_shard_key(self) -> str:
+        return 'clientProfileName'
+
 
 def run_module():
     module_args = {}
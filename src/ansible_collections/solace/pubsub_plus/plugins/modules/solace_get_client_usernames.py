@@ -25,6 +25,7 @@ seealso:
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/clientUsername/getMsgVpnClientUsernames"
 - "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/clientUsername/getMsgVpnClientUsernames"
+- "Supports C(shards) and C(shard_prefixes), the shards are split on C(clientUsername)."
 author:
   - Ricardo Gomez-Ulmke (@rjgu)
 '''
@@ -125,6 +126,9 @@ class SolaceGetClientUsernamesTask(SolaceBrokerGetPagingTask):
         # GET /msgVpns/{msgVpnName}/clientUsernames
         return ['msgVpns', params['msg_vpn'], 'clientUsernames']
 
+    def get_shard_key(self) -> str:
+        return 'clientUsername'
+
 
 def run_module():
     module_args = {}
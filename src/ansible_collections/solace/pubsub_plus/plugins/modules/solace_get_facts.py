@@ -18,6 +18,10 @@ description:
 - Provides convenience functions to access solace facts retrieved from broker service using M(solace_gather_facts) from 'ansible_facts.solace'.
 notes:
 - In order to access other hosts' facts (other than the current 'inventory_host'), you must not use the 'serial' strategy for the playbook.
+- "The module sends the entire 'hostvars' of all hosts to the target. For large inventories, use the filters instead, which run on the controller
+   on a single host's facts, e.g. '{{ hostvars[inventory_hostname] | solace.pubsub_plus.solace_facts(get_functions, msg_vpn=vpn) }}'."
+- "Filters: solace_facts, solace_vpn_client_connection_details, solace_vpn_attributes, solace_vpn_bridge_remote_msg_vpn_locations,
+   solace_service_trust_store_details, solace_service_virtual_router_name, solace_service_dmr_cluster_connection_details."
 options:
   hostvars:
     description:
@@ -445,30 +449,15 @@ rc:
 
 from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceReadFactsTask
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_facts import SolaceBrokerFacts, SolaceCloudBrokerFacts, SolaceSelfHostedBrokerFacts
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_facts import SolaceGetFacts
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceParamsValidationError
 from ansible.module_utils.basic import AnsibleModule
 
 
 class SolaceGetFactsTask(SolaceReadFactsTask):
 
-    GET_FUNCTIONS = [
-        "get_vpnClientConnectionDetails",
-        "get_vpnAttributes",
-        "get_vpnBridgeRemoteMsgVpnLocations",
-        "get_serviceTrustStoreDetails",
-        "get_serviceVirtualRouterName",
-        "get_serviceDmrClusterConnectionDetails"
-    ]
-    REQUIRES_VPN = [
-        "get_vpnClientConnectionDetails",
-        "get_vpnAttributes",
-        "get_vpnBridgeRemoteMsgVpnLocations"
-    ]
-
     def __init__(self, module):
         super().__init__(module)
-        self.vpn_name = None
 
     def validate_params(self):
         params = self.get_module().params
@@ -487,75 +476,21 @@ class SolaceGetFactsTask(SolaceReadFactsTask):
                                               hostvars[hostvars_inventory_hostname]['ansible_facts'], "cannot find 'solace'")
         # get funcs
         has_get_funcs = self.validate_param_get_functions(
-            self.GET_FUNCTIONS, param_get_functions)
+            list(SolaceGetFacts.GET_FUNCTIONS), param_get_functions)
         if not has_get_funcs:
             raise SolaceParamsValidationError(
                 "get_functions", param_get_functions, "empty. specify at least one")
-        # check vpn exists
-        search_dict = hostvars[hostvars_inventory_hostname]['ansible_facts']['solace']
-        vpns = self.get_vpns(search_dict)
-        vpn_name = params['msg_vpn']
-        if not vpn_name and len(vpns) == 1:
-            vpn_name = vpns[0]
-        # check for wrong vpn
-        if vpn_name and vpn_name not in vpns:
-            raise SolaceParamsValidationError(
-                "msg_vpn", params['msg_vpn'], f"vpn does not exist - select one of {vpns}")
-        self.vpn_name = vpn_name
-        get_functions = params['get_functions']
-        if get_functions and len(get_functions) > 0:
-            for get_func in get_functions:
-                if get_func in self.REQUIRES_VPN and not self.vpn_name:
-                    raise SolaceParamsValidationError(
-                        "msg_vpn", params['msg_vpn'], f"required for get_function={get_func}. vpns found: {vpns}")
 
     def do_task(self):
+        # note: same as filter solace.pubsub_plus.solace_facts, which does not require hostvars
         self.validate_params()
         params = self.get_module().params
-        hostvars = params['hostvars']
-        hostvars_inventory_hostname = params['hostvars_inventory_hostname']
-        search_dict = hostvars[hostvars_inventory_hostname]['ansible_facts']['solace']
-        get_functions = params['get_functions']
-        facts = {}
-
-        if search_dict['isSolaceCloud']:
-            solaceBrokerFacts = SolaceCloudBrokerFacts(self.get_module()._name,
-                                                       search_dict, self.vpn_name)
-        else:
-            solaceBrokerFacts = SolaceSelfHostedBrokerFacts(self.get_module()._name,
-                                                            search_dict, self.vpn_name)
-
-        if get_functions and len(get_functions) > 0:
-            for get_func in get_functions:
-                field, value = self.call_dynamic_func(
-                    get_func, solaceBrokerFacts)
-                facts[field] = value
-
+        search_dict = params['hostvars'][params['hostvars_inventory_hostname']]['ansible_facts']['solace']
+        facts = SolaceGetFacts.get_facts(self.get_module()._name, search_dict, params['msg_vpn'], params['get_functions'])
         result = self.create_result(rc=0, changed=False)
         result['facts'] = facts
         return None, result
 
-    def get_vpns(self, search_dict: dict) -> list:
-        return list(search_dict['vpns'].keys())
-
-    def get_vpnClientConnectionDetails(self, solace_broker_facts: SolaceBrokerFacts):
-        return 'vpnClientConnectionDetails', solace_broker_facts.get_all_client_connection_details()
-
-    def get_vpnAttributes(self, solace_broker_facts: SolaceBrokerFacts):
-        return 'vpnAttributes', solace_broker_facts.get_msg_vpn_attributes()
-
-    def get_vpnBridgeRemoteMsgVpnLocations(self, solace_broker_facts: SolaceBrokerFacts):
-        return 'vpnBridgeRemoteMsgVpnLocations', solace_broker_facts.get_bridge_remote_msg_vpn_locations()
-
-    def get_serviceTrustStoreDetails(self, solace_broker_facts: SolaceBrokerFacts):
-        return 'serviceTrustStoreDetails', solace_broker_facts.get_trust_store_details()
-
-    def get_serviceVirtualRouterName(self, solace_broker_facts: SolaceBrokerFacts):
-        return 'serviceVirtualRouterName', solace_broker_facts.get_virtual_router_name()
-
-    def get_serviceDmrClusterConnectionDetails(self, solace_broker_facts: SolaceBrokerFacts):
-        return 'serviceDmrClusterConnectionDetails', solace_broker_facts.get_dmr_cluster_connection_details()
-
 
 def run_module():
     module_args = dict(
@@ -19,6 +19,7 @@ description:
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/mqttSession/getMsgVpnMqttSessions"
 - "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/mqttSession/getMsgVpnMqttSessions"
+- "Supports C(shards) and C(shard_prefixes), the shards are split on C(mqttSessionClientId)."
 extends_documentation_fragment:
 - solace.pubsub_plus.solace.broker
 - solace.pubsub_plus.solace.vpn
@@ -131,6 +132,9 @@ class SolaceGetMqttSessionsTask(SolaceBrokerGetPagingTask):
         # GET /msgVpns/{msgVpnName}/mqttSessions
         return ['msgVpns', params['msg_vpn'], 'mqttSessions']
 
+    def get_shard_key(self) -> str:
+        return 'mqttSessionClientId'
+
 
 def run_module():
     module_args = {}
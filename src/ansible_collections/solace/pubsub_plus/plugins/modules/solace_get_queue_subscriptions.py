@@ -19,6 +19,7 @@ description:
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/queue/getMsgVpnQueueSubscriptions"
 - "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/queue/getMsgVpnQueueSubscriptions"
+- "Supports C(shards) and C(shard_prefixes), the shards are split on C(subscriptionTopic)."
 options:
   queue_name:
     description: The name of the queue. Maps to 'queueName' in the API.
@@ -147,6 +148,9 @@ class SolaceGetQueueSubscriptionsTask(SolaceBrokerGetPagingTask):
         # GET /msgVpns/{msgVpnName}/queues/{queueName}/subscriptions
         return ['msgVpns', params['msg_vpn'], 'queues', params['queue_name'], 'subscriptions']
 
+    def get_shard_key(self) -> str:
+        return 'subscriptionTopic'
+
 
 def run_module():
     module_args = dict(
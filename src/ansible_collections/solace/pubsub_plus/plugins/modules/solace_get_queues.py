@@ -19,6 +19,7 @@ description:
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/queue/getMsgVpnQueues"
 - "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/queue/getMsgVpnQueues"
+- "Supports C(shards) and C(shard_prefixes), the shards are split on C(queueName)."
 extends_documentation_fragment:
 - solace.pubsub_plus.solace.broker
 - solace.pubsub_plus.solace.vpn
@@ -134,6 +135,9 @@ class SolaceGetQueuesTask(SolaceBrokerGetPagingTask):
         # __private_monitor__
         return ['msgVpns', params['msg_vpn'], 'queues']
 
+    def get_shard_key(self) -> str:
+        return 'queueName'
+
 
 def run_module():
     module_args = {}
@@ -19,6 +19,7 @@ description:
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/topicEndpoint/getMsgVpnTopicEndpoints"
 - "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/topicEndpoint/getMsgVpnTopicEndpoints"
+- "Supports C(shards) and C(shard_prefixes), the shards are split on C(topicEndpointName)."
 extends_documentation_fragment:
 - solace.pubsub_plus.solace.broker
 - solace.pubsub_plus.solace.vpn
@@ -126,6 +127,9 @@ class SolaceGetTopicEndpointTask(SolaceBrokerGetPagingTask):
         # GET /msgVpns/{msgVpnName}/topicEndpoints
         return ['msgVpns', params['msg_vpn'], 'topicEndpoints']
 
+    def get_shard_key(self) -> str:
+        return 'topicEndpointName'
+
 
 def run_module():
     module_args = {}
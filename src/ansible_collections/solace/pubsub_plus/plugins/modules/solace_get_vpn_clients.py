@@ -18,6 +18,7 @@ description:
 - "Get a list of VPN Client objects."
 notes:
 - "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/client/getMsgVpnClients"
+- "Supports C(shards) and C(shard_prefixes), the shards are split on C(clientName)."
 extends_documentation_fragment:
 - solace.pubsub_plus.solace.broker
 - solace.pubsub_plus.solace.vpn
@@ -93,6 +94,9 @@ class SolaceGetVpnClientsTask(SolaceBrokerGetPagingTask):
         # GET /msgVpns/{msgVpnName}/clients
         return ['msgVpns', params['msg_vpn'], 'clients']
 
+    def get_shard_key(self) -> str:
+        return 'clientName'
+
 
 def run_module():
     module_args = {}
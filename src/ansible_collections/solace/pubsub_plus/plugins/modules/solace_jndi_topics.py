@@ -35,6 +35,7 @@ extends_documentation_fragment:
 - solace.pubsub_plus.solace.vpn
 - solace.pubsub_plus.solace.sempv2_settings
 - solace.pubsub_plus.solace.state_crud_list
+- solace.pubsub_plus.solace.journal
 seealso:
 - module: solace_jndi_topic
 - module: solace_get_jndi_topics
@@ -107,6 +108,38 @@ response:
       error:
         response:
           -   error: "{the invalid jndi topic name (could be an invalid physicalName)...}"
+journal:
+    description: The journal, if resumed, whether all existing objects were read and the number of objects read to verify uncertain actions.
+    type: dict
+    returned: if journal
+    sample:
+        path: ./journal.ndjson
+        resumed: true
+        scanned: false
+        verified: 1
+rollback:
+    description:
+    - The rollback after an error, without a journal. The created objects are deleted and the deleted objects created again, concurrently, with retries.
+    - "C(compensations): the outcome of each compensating action. C(inconsistent): the keys whose existence differs from before the task,
+      read from a fresh listing, incl. the key of the failed action. C(consistent) is null if the listing failed."
+    type: dict
+    returned: error
+    sample:
+        compensations:
+            - key: topic-1
+              action: delete
+              result: ok
+              attempts: 1
+            - key: topic-2
+              action: delete
+              result: failed
+              attempts: 3
+              error: "..."
+        succeeded: 1
+        failed: 1
+        consistent: false
+        inconsistent:
+            - topic-2
 msg:
     description: The response from the HTTP call in case of error.
     type: dict
@@ -178,6 +211,7 @@ def run_module():
     arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
     arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
     arg_spec.update(SolaceTaskBrokerConfig.arg_spec_crud_list())
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_journal())
     arg_spec.update(module_args)
 
     module = AnsibleModule(
@@ -0,0 +1,306 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: solace_monitor_sample
+short_description: sample monitor collections of a vpn into a file
+description:
+- "Reads the given SEMP v2 monitor collections of a vpn every C(interval) seconds for C(duration) seconds and appends a row per object and sample to a file."
+- "Each collection is read with a fixed C(select) projection, collections are read concurrently over the same http connections in every sample."
+- "Computes the per-second rate of the counters in C(rates) from the previous sample of the same object, e.g. C(rxMsgCount) -> C(rxMsgCount_rate).
+  The rate is null in the first sample of an object and after a counter reset."
+- "Rows are written as they are sampled, the file is flushed after every sample. A sample taking longer than C(interval) skips the missed samples."
+- "The rows are not returned, the result only contains the counts."
+notes:
+- "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html#/msgVpn"
+- "A C(task_deadline) shorter than C(duration) fails the task, the rows sampled until then are kept."
+- "Check mode: the collections are sampled for C(duration), C(dest) is not written."
+options:
+  collections:
+    description: The monitor collections to sample.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description: The collection under /msgVpns/{msgVpnName}, e.g. 'queues', 'clients', 'bridges', 'mqttSessions'.
+        type: str
+        required: true
+      select:
+        description: The attributes to read & write. The keys and the counters in C(rates) are added.
+        type: list
+        elements: str
+        required: true
+      rates:
+        description: The counters to compute the per-second rate for, e.g. C(rxMsgCount), C(spooledMsgCount).
+        type: list
+        elements: str
+        required: false
+      where:
+        description: The SEMP v2 where filter, e.g. C(queueName==orders*).
+        type: list
+        elements: str
+        required: false
+      keys:
+        description:
+        - "The attributes identifying an object, written as C(key), joined with ','."
+        - "Default: the keys of the collection, e.g. C(queueName), C(clientName), C(mqttSessionClientId,mqttSessionVirtualRouter)."
+        type: list
+        elements: str
+        required: false
+  interval:
+    description: The seconds between samples.
+    type: float
+    required: false
+    default: 10
+  duration:
+    description: The seconds to sample for. The first sample is taken immediately, i.e. C(duration) / C(interval) samples.
+    type: float
+    required: false
+    default: 60
+  dest:
+    description: The file to append the rows to.
+    type: path
+    required: true
+  format:
+    description:
+    - "C(csv): a header with the columns of all collections, then a row per object and sample. An existing file must have the same header."
+    - "C(ndjson): a json object per object and sample."
+    - "Columns: C(time) (epoch seconds), C(collection), C(key), the selected attributes and the rates."
+    - "Default: C(csv) if C(dest) ends with '.csv', C(ndjson) otherwise."
+    type: str
+    required: false
+    choices:
+      - csv
+      - ndjson
+  page_count:
+    description: The initial page size of the collection reads, see C(adaptive_paging) of the M(solace.pubsub_plus.solace_get_queues) module.
+    type: int
+    required: false
+    default: 100
+extends_documentation_fragment:
+- solace.pubsub_plus.solace.broker
+- solace.pubsub_plus.solace.vpn
+seealso:
+- module: solace_get_queues
+- module: solace_get_vpn_clients
+author:
+- Ricardo Gomez-Ulmke (@rjgu)
+'''
+
+EXAMPLES = '''
+hosts: all
+gather_facts: no
+any_errors_fatal: true
+collections:
+- solace.pubsub_plus
+module_defaults:
+  solace_monitor_sample:
+    host: "{{ sempv2_host }}"
+    port: "{{ sempv2_port }}"
+    secure_connection: "{{ sempv2_is_secure_connection }}"
+    username: "{{ sempv2_username }}"
+    password: "{{ sempv2_password }}"
+    timeout: "{{ sempv2_timeout }}"
+    msg_vpn: "{{ vpn }}"
+tasks:
+  - name: sample queues & clients every 5 secs for 10 mins
+    solace_monitor_sample:
+      collections:
+        - name: queues
+          select:
+            - msgSpoolUsage
+            - bindCount
+          rates:
+            - rxMsgCount
+            - txMsgCount
+          where:
+            - queueName==orders*
+        - name: clients
+          select:
+            - clientUsername
+            - uptime
+          rates:
+            - dataRxMsgCount
+            - dataTxMsgCount
+      interval: 5
+      duration: 600
+      dest: ./stats.csv
+    register: result
+'''
+
+RETURN = '''
+dest:
+    description: The file the rows were appended to.
+    type: str
+    returned: success
+format:
+    description: The format of the file.
+    type: str
+    returned: success
+samples:
+    description: Number of samples taken.
+    type: int
+    returned: success
+missed:
+    description: Number of samples skipped because a sample took longer than C(interval).
+    type: int
+    returned: success
+rows:
+    description: Number of rows written, in check mode the number of rows sampled.
+    type: int
+    returned: success
+collections:
+    description: The number of objects in the last sample per collection.
+    type: dict
+    returned: success
+    sample:
+        queues: 120
+        clients: 3400
+duration_secs:
+    description: The duration.
+    type: float
+    returned: success
+msg:
+    description: The response from the HTTP call in case of error.
+    type: dict
+    returned: error
+rc:
+    description: Return code. rc=0 on success, rc=1 on error.
+    type: int
+    returned: always
+    sample:
+        success:
+            rc: 0
+        error:
+            rc: 1
+'''
+
+import time
+from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_monitor import SolaceMonitorCollection, SolaceMonitorSampler, SolaceMonitorSampleWriter
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerGetTask
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible.module_utils.basic import AnsibleModule
+
+
+class SolaceMonitorSampleTask(SolaceBrokerGetTask):
+
+    def __init__(self, module):
+        super().__init__(module)
+
+    def validate_params(self):
+        params = self.get_module().params
+        for arg in ['interval', 'duration', 'page_count']:
+            if params[arg] <= 0:
+                raise SolaceParamsValidationError(arg, params[arg], "must be > 0")
+        if not params['collections']:
+            raise SolaceParamsValidationError('collections', params['collections'], "must not be empty")
+
+    def get_samplers(self) -> list:
+        samplers = []
+        for c in self.get_module().params['collections']:
+            collection = SolaceMonitorCollection(c['name'], c['select'], c.get('rates'), c.get('where'), c.get('keys'))
+            samplers.append(SolaceMonitorSampler(collection))
+        return samplers
+
+    def sample(self, sampler: SolaceMonitorSampler) -> list:
+        params = self.get_module().params
+        sample_time, sample_monotonic = time.time(), time.monotonic()
+        objects = sampler.collection.iter_objects(self.get_module(), self.get_config(), params['msg_vpn'], params['page_count'])
+        return sampler.sample(objects, sample_time, sample_monotonic)
+
+    def do_task(self):
+        self.validate_params()
+        params = self.get_module().params
+        samplers = self.get_samplers()
+        file_format = SolaceMonitorSampleWriter.get_format(params['dest'], params['format'])
+        writer = SolaceMonitorSampleWriter(params['dest'], file_format, samplers)
+        interval = params['interval']
+        samples = 0
+        missed = 0
+        start = time.monotonic()
+        end = start + params['duration']
+        next_sample = start
+        row_count = 0
+        is_check_mode = self.get_module().check_mode
+        if not is_check_mode:
+            writer.open()
+        try:
+            while next_sample < end:
+                for rows in SolaceSempV2Api.map_concurrently(self.sample, samplers, len(samplers)):
+                    if not is_check_mode:
+                        writer.write(rows)
+                    row_count += len(rows)
+                    # check mode: rows would be written
+                    self.changed = self.changed or len(rows) > 0
+                samples += 1
+                next_sample += interval
+                now = time.monotonic()
+                # skip the samples missed while sampling, stay on the schedule
+                while next_sample <= now and next_sample < end:
+                    next_sample += interval
+                    missed += 1
+                if next_sample < end:
+                    time.sleep(self.get_config().get_sleep_secs(next_sample - now, 'monitor sample'))
+        finally:
+            writer.close()
+        self.update_result({
+            'changed': self.changed,
+            'dest': params['dest'],
+            'format': file_format,
+            'samples': samples,
+            'missed': missed,
+            'rows': row_count,
+            'collections': {s.collection.name: len(s.previous) for s in samplers},
+            'duration_secs': round(time.monotonic() - start, 3)
+        })
+        return None, self.get_result()
+
+
+def run_module():
+    module_args = dict(
+        collections=dict(type='list', required=True, elements='dict', options=dict(
+            name=dict(type='str', required=True),
+            select=dict(type='list', required=True, elements='str'),
+            rates=dict(type='list', required=False, elements='str'),
+            where=dict(type='list', required=False, elements='str'),
+            keys=dict(type='list', required=False, elements='str', no_log=False)
+        )),
+        interval=dict(type='float', required=False, default=10),
+        duration=dict(type='float', required=False, default=60),
+        dest=dict(type='path', required=True),
+        format=dict(type='str', required=False, choices=SolaceMonitorSampleWriter.FORMATS),
+        page_count=dict(type='int', required=False, default=100)
+    )
+    arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
+    arg_spec.update(module_args)
+
+    module = AnsibleModule(
+        argument_spec=arg_spec,
+        supports_check_mode=True
+    )
+
+    solace_task = SolaceMonitorSampleTask(module)
+    solace_task.execute()
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
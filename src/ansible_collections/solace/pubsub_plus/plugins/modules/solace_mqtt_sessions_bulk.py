@@ -0,0 +1,174 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: solace_mqtt_sessions_bulk
+short_description: provision mqtt sessions & their subscriptions from a file
+description:
+- "Creates, updates or deletes the mqtt sessions of an input file, incl. their subscriptions, e.g. for onboarding 100k+ devices."
+- "Records: C(name) (the mqtt session client id), optionally C(virtual_router), the SEMP v2 settings, see M(solace.pubsub_plus.solace_mqtt_session),
+  and C(subscriptions)."
+- "C(subscriptions): ndjson: a list of topics or dicts with C(name) and C(sempv2_settings), e.g. C(subscriptionQos).
+  csv: the topics separated by whitespace."
+- "Subscriptions missing on the broker are created, those with different settings updated. Subscriptions not in the record are kept."
+notes:
+- "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/mqttSession"
+options:
+  virtual_router:
+    description: The virtual router of records without C(virtual_router).
+    required: false
+    type: str
+    default: primary
+    choices:
+      - primary
+      - backup
+extends_documentation_fragment:
+- solace.pubsub_plus.solace.broker
+- solace.pubsub_plus.solace.vpn
+- solace.pubsub_plus.solace.bulk
+- solace.pubsub_plus.solace.journal
+seealso:
+- module: solace_mqtt_session
+- module: solace_mqtt_session_subscription
+- module: solace_client_usernames_bulk
+author:
+- Ricardo Gomez-Ulmke (@rjgu)
+'''
+
+EXAMPLES = '''
+hosts: all
+gather_facts: no
+any_errors_fatal: true
+collections:
+- solace.pubsub_plus
+module_defaults:
+  solace_mqtt_sessions_bulk:
+    host: "{{ sempv2_host }}"
+    port: "{{ sempv2_port }}"
+    secure_connection: "{{ sempv2_is_secure_connection }}"
+    username: "{{ sempv2_username }}"
+    password: "{{ sempv2_password }}"
+    timeout: "{{ sempv2_timeout }}"
+    msg_vpn: "{{ vpn }}"
+tasks:
+  # sessions.ndjson:
+  # {"name": "device-000001", "settings": {"enabled": true, "owner": "device-000001"}, "subscriptions": ["devices/000001/cmd/#"]}
+  # {"name": "device-000002", "settings": {"enabled": true}, "subscriptions": [{"name": "devices/000002/cmd/#", "settings": {"subscriptionQos": 1}}]}
+  - name: provision mqtt sessions
+    solace_mqtt_sessions_bulk:
+      src: ./sessions.ndjson.gz
+      dest: ./sessions.result.ndjson
+    register: result
+
+  # sessions.csv:
+  # name,enabled,owner,subscriptions
+  # device-000001,true,device-000001,devices/000001/cmd/# devices/all/cmd/#
+  - name: provision mqtt sessions from csv
+    solace_mqtt_sessions_bulk:
+      src: ./sessions.csv
+      dest: ./sessions.result.ndjson
+'''
+
+RETURN = '''
+dest:
+    description: The output file with the result of every record.
+    type: str
+    returned: success
+records:
+    description: Number of records read.
+    type: int
+    returned: success
+chunks:
+    description: Number of chunks applied.
+    type: int
+    returned: success
+counts:
+    description: Number of records per action. A session is 'updated' if its settings or any of its subscriptions changed.
+    type: dict
+    returned: success
+    sample:
+        created: 99000
+        updated: 10
+        unchanged: 990
+        deleted: 0
+        failed: 0
+duration_secs:
+    description: The duration.
+    type: float
+    returned: success
+journal:
+    description: The journal, if resumed and the number of records skipped, completed by previous runs.
+    type: dict
+    returned: if journal
+    sample:
+        path: ./devices.journal.ndjson
+        resumed: true
+        skipped: 30000
+msg:
+    description: Number of failed records in case of error.
+    type: list
+    returned: error
+rc:
+    description: Return code. rc=0 on success, rc=1 on error.
+    type: int
+    returned: always
+    sample:
+        success:
+            rc: 0
+        error:
+            rc: 1
+'''
+
+from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_bulk import SolaceBulkTask, SolaceBulkObjectType
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible.module_utils.basic import AnsibleModule
+
+
+class SolaceMqttSessionsBulkTask(SolaceBulkTask):
+
+    OBJECT_TYPE = SolaceBulkObjectType(
+        'mqtt_sessions', 'mqttSessions', ['mqttSessionClientId', 'mqttSessionVirtualRouter'], ['name', 'virtual_router'],
+        child=SolaceBulkObjectType('subscriptions', 'subscriptions', ['subscriptionTopic'], ['name']))
+
+    def __init__(self, module):
+        super().__init__(module)
+
+    def get_object_type(self) -> SolaceBulkObjectType:
+        return self.OBJECT_TYPE
+
+    def get_key_defaults(self) -> dict:
+        return dict(virtual_router=self.get_module().params['virtual_router'])
+
+
+def run_module():
+    arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_virtual_router())
+    arg_spec.update(SolaceBulkTask.arg_spec_bulk())
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_journal())
+
+    module = AnsibleModule(
+        argument_spec=arg_spec,
+        supports_check_mode=False
+    )
+    solace_task = SolaceMqttSessionsBulkTask(module)
+    solace_task.execute()
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
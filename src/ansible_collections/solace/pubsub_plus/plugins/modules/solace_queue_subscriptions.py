@@ -20,6 +20,7 @@ description:
 - "Supports 'transactional' behavior with rollback to original list in case of error."
 - "De-duplicates Subscription object list."
 - "Reports which topics were added, deleted and omitted (duplicates). In case of an error, reports the invalid Subscription object."
+- "Optionally minimizes the list by dropping subscriptions covered by other subscriptions in the list, see C(minimize)."
 - "To delete all Subscription objects, use state='exactly' with an empty/null list (see examples)."
 notes:
 - "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/queue/createMsgVpnQueueSubscription"
@@ -35,11 +36,22 @@ options:
     required: true
     type: str
     aliases: [queue_name]
+  minimize:
+    description:
+    - "If true, drops subscriptions covered by another subscription in the list before applying it, e.g. 'a/b/c' and 'a/*/c' are covered by 'a/>'."
+    - "Covering follows the Solace topic syntax: '*' and 'prefix*' match one level, a trailing '>' matches one or more levels.
+      Subscriptions with '#share/{group}/' or '#noexport/' prefixes are only covered by subscriptions with the same prefixes."
+    - "Reports the dropped subscriptions as 'pruned' with the covering subscription in 'covered_by'."
+    - "With state='exactly', existing subscriptions covered by another one are deleted. Ignored for state='absent'."
+    required: false
+    type: bool
+    default: false
 extends_documentation_fragment:
 - solace.pubsub_plus.solace.broker
 - solace.pubsub_plus.solace.vpn
 - solace.pubsub_plus.solace.sempv2_settings
 - solace.pubsub_plus.solace.state_crud_list
+- solace.pubsub_plus.solace.journal
 seealso:
 - module: solace_queue
 - module: solace_queue_subscription
@@ -136,6 +148,25 @@ EXAMPLES = '''
     solace_get_queue_subscriptions:
       queue_name: q/foo
 
+  - name: replace subscriptions with the minimal list
+    solace_queue_subscriptions:
+      queue_name: q/foo
+      subscription_topics:
+        - a/>
+        - a/b/c
+        - a/*/c
+        - b/*
+      minimize: true
+      state: exactly
+
+  - name: replace a large list of subscriptions, resume after a failed run
+    solace_queue_subscriptions:
+      queue_name: q/foo
+      subscription_topics: "{{ lookup('file', 'topics.txt').splitlines() }}"
+      state: exactly
+      journal: ./q-foo.journal.ndjson
+      resume: true
+
   - name: delete all subscriptions
     solace_queue_subscriptions:
       queue_name: q/foo
@@ -164,9 +195,43 @@ response:
           -   deleted: topic-4
           -   deleted: topic-5
           -   duplicate: duplicate-topic
+          -   pruned: a/b/c
+              covered_by: a/>
       error:
         response:
           -   error: /invalid-topic
+journal:
+    description: The journal, if resumed, whether all existing objects were read and the number of objects read to verify uncertain actions.
+    type: dict
+    returned: if journal
+    sample:
+        path: ./queue-subscriptions.journal.ndjson
+        resumed: true
+        scanned: false
+        verified: 1
+rollback:
+    description:
+    - The rollback after an error, without a journal. The created objects are deleted and the deleted objects created again, concurrently, with retries.
+    - "C(compensations): the outcome of each compensating action. C(inconsistent): the keys whose existence differs from before the task,
+      read from a fresh listing, incl. the key of the failed action. C(consistent) is null if the listing failed."
+    type: dict
+    returned: error
+    sample:
+        compensations:
+            - key: topic-1
+              action: delete
+              result: ok
+              attempts: 1
+            - key: topic-2
+              action: delete
+              result: failed
+              attempts: 3
+              error: "..."
+        succeeded: 1
+        failed: 1
+        consistent: false
+        inconsistent:
+            - topic-2
 msg:
     description: The response from the HTTP call in case of error.
     type: dict
@@ -186,6 +251,7 @@ from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_s
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerCRUDListTask
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_topic import SolaceTopicTrie
 from ansible.module_utils.basic import AnsibleModule
 
 
@@ -208,6 +274,12 @@ class SolaceQueueSubscriptionsTask(SolaceBrokerCRUDListTask):
         params = self.get_module().params
         return [params['msg_vpn'], params['queue_name'], object_key]
 
+    def prune_keys(self, key_list) -> list:
+        if not self.get_module().params['minimize']:
+            return key_list
+        key_list, self.pruned_key_list = SolaceTopicTrie.minimize(key_list)
+        return key_list
+
     def create_func(self, vpn_name, queue_name, subscription_topic, settings=None):
         # POST /msgVpns/{msgVpnName}/queues/{queueName}/subscriptions
         data = {
@@ -233,10 +305,12 @@ def run_module():
                    aliases=['topics', 'subscription_topics'],
                    elements='str'
                    ),
+        minimize=dict(type='bool', required=False, default=False)
     )
     arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
     arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
     arg_spec.update(SolaceTaskBrokerConfig.arg_spec_crud_list())
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_journal())
     arg_spec.update(module_args)
 
     module = AnsibleModule(
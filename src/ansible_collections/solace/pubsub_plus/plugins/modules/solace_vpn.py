@@ -118,7 +118,7 @@ from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_s
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_utils import SolaceUtils
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_consts import SolaceTaskOps
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerCRUDTask
-from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api, SolaceCloudApi
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
 from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceInternalError, SolaceModuleUsageError
 from ansible.module_utils.basic import AnsibleModule
@@ -140,7 +140,10 @@ class SolaceVpnTask(SolaceBrokerCRUDTask):
     def __init__(self, module):
         super().__init__(module)
         self.sempv2_api = SolaceSempV2Api(module)
-        self.solace_cloud_api = SolaceCloudApi(module)
+        self.solace_cloud_api = None
+        if self.get_config().is_solace_cloud():
+            from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api_cloud import SolaceCloudApi
+            self.solace_cloud_api = SolaceCloudApi(module)
         self.current_settings = None
 
     def validate_params(self):
@@ -232,8 +235,8 @@ class SolaceVpnTask(SolaceBrokerCRUDTask):
         # POST: services/{service-id}}/requests/updateAuthenticationRequests
         module_op = SolaceTaskOps.OP_UPDATE_OBJECT
         service_id = self.get_config().get_params()['solace_cloud_service_id']
-        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), SolaceCloudApi.API_SERVICES,
-                      service_id, SolaceCloudApi.API_REQUESTS, 'updateAuthenticationRequests']
+        path_array = [self.solace_cloud_api.get_api_base_path(self.get_config()), self.solace_cloud_api.API_SERVICES,
+                      service_id, self.solace_cloud_api.API_REQUESTS, 'updateAuthenticationRequests']
         solace_cloud_resp = self.solace_cloud_api.make_service_post_request(
             self.get_config(),
             path_array,
@@ -0,0 +1,246 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: solace_vpn_config_apply
+short_description: apply the configuration of a vpn
+description:
+- "Apply the desired state of a vpn's client profiles, acl profiles, client usernames, queues, queue subscriptions,
+  rdps, rest consumers and queue bindings in a single task."
+- "Orders the objects by their dependencies: children after their parent, e.g. subscriptions after their queue,
+  client usernames after the client & acl profiles they reference, queue bindings after their queue."
+- "Independent objects are applied concurrently, up to C(max_concurrency) SEMP calls at a time."
+- "Each object is applied like the corresponding single object module: created if it does not exist, updated if its settings differ.
+  State 'absent' deletes the objects in reverse order."
+- "Not transactional: after the first error no further objects are applied, objects already applied are not rolled back. Reports the action per object."
+notes:
+- "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html"
+options:
+  config:
+    description:
+    - "The desired state of the vpn's objects. Top level keys: C(client_profiles), C(acl_profiles), C(client_usernames), C(queues), C(rdps)."
+    - "Each a list of objects, either a name or a dict with C(name), C(sempv2_settings) (alias C(settings)) and child object lists."
+    - "Child object lists: C(queues[].subscriptions), C(rdps[].rest_consumers), C(rdps[].queue_bindings)."
+    - "Settings are the SEMP v2 settings of the object, see the single object modules, e.g. M(solace.pubsub_plus.solace_queue)."
+    - "Objects referenced but not in the config, e.g. the 'default' client profile, must exist."
+    type: dict
+    required: true
+  state:
+    description: Target state of the objects in C(config).
+    type: str
+    required: false
+    default: present
+    choices:
+      - present
+      - absent
+  max_concurrency:
+    description: Max number of objects applied concurrently.
+    type: int
+    required: false
+    default: 8
+extends_documentation_fragment:
+- solace.pubsub_plus.solace.broker
+- solace.pubsub_plus.solace.vpn
+seealso:
+- module: solace_client_profile
+- module: solace_acl_profile
+- module: solace_client_username
+- module: solace_queue
+- module: solace_queue_subscription
+- module: solace_rdp
+- module: solace_rdp_rest_consumer
+- module: solace_rdp_queue_binding
+author:
+- Ricardo Gomez-Ulmke (@rjgu)
+'''
+
+EXAMPLES = '''
+hosts: all
+gather_facts: no
+any_errors_fatal: true
+collections:
+- solace.pubsub_plus
+module_defaults:
+  solace_vpn_config_apply:
+    host: "{{ sempv2_host }}"
+    port: "{{ sempv2_port }}"
+    secure_connection: "{{ sempv2_is_secure_connection }}"
+    username: "{{ sempv2_username }}"
+    password: "{{ sempv2_password }}"
+    timeout: "{{ sempv2_timeout }}"
+    msg_vpn: "{{ vpn }}"
+tasks:
+  - name: apply vpn config
+    solace_vpn_config_apply:
+      config:
+        client_profiles:
+          - name: cp-app
+            sempv2_settings:
+              allowGuaranteedMsgSendEnabled: true
+              allowGuaranteedMsgReceiveEnabled: true
+        acl_profiles:
+          - name: acl-app
+            sempv2_settings:
+              clientConnectDefaultAction: allow
+        client_usernames:
+          - name: app
+            sempv2_settings:
+              clientProfileName: cp-app
+              aclProfileName: acl-app
+              enabled: true
+        queues:
+          - name: q-orders
+            sempv2_settings:
+              egressEnabled: true
+              ingressEnabled: true
+            subscriptions:
+              - orders/>
+          - name: q-rdp
+            subscriptions:
+              - rdp/>
+        rdps:
+          - name: rdp-orders
+            sempv2_settings:
+              clientProfileName: cp-app
+            rest_consumers:
+              - name: rc-orders
+                sempv2_settings:
+                  remoteHost: orders.example.com
+                  remotePort: 443
+            queue_bindings:
+              - q-rdp
+    register: result
+
+  - name: delete vpn config
+    solace_vpn_config_apply:
+      config: "{{ vpn_config }}"
+      state: absent
+'''
+
+RETURN = '''
+objects:
+    description: The action per object, in the order of the config.
+    type: list
+    elements: dict
+    returned: always
+    sample:
+        - type: queues
+          name: q-orders
+          action: created
+          duration_secs: 0.041
+        - type: subscriptions
+          name: orders/>
+          parent: q-orders
+          action: unchanged
+          duration_secs: 0.012
+        - type: queue_bindings
+          name: q-rdp
+          parent: rdp-orders
+          action: skipped
+schedule:
+    description: "Number of objects, length of the longest dependency chain (levels), the concurrency and the duration."
+    type: dict
+    returned: success
+    sample:
+        objects: 9
+        levels: 3
+        max_concurrency: 8
+        duration_secs: 0.35
+msg:
+    description: The response from the HTTP call in case of error.
+    type: dict
+    returned: error
+rc:
+    description: Return code. rc=0 on success, rc=1 on error.
+    type: int
+    returned: always
+    sample:
+        success:
+            rc: 0
+        error:
+            rc: 1
+'''
+
+import time
+from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerActionTask
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2Api
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_vpn_config import SolaceVpnConfig, SolaceVpnConfigApi
+from ansible.module_utils.basic import AnsibleModule
+
+
+class SolaceVpnConfigApplyTask(SolaceBrokerActionTask):
+
+    ACTIONS_CHANGED = ['created', 'updated', 'deleted']
+
+    def __init__(self, module):
+        super().__init__(module)
+        self.sempv2_api = SolaceSempV2Api(module)
+
+    def validate_params(self):
+        max_concurrency = self.get_module().params['max_concurrency']
+        if max_concurrency <= 0:
+            raise SolaceParamsValidationError('max_concurrency', max_concurrency, "must be > 0")
+
+    def do_task(self):
+        self.validate_params()
+        params = self.get_module().params
+        vpn_config = SolaceVpnConfig(params['config'], params['state'], self.get_config().is_solace_cloud())
+        vpn_config_api = SolaceVpnConfigApi(self.sempv2_api, self.get_config(), params['msg_vpn'])
+        apply_func = vpn_config_api.apply_absent if params['state'] == 'absent' else vpn_config_api.apply_present
+        start = time.monotonic()
+        error = vpn_config.apply(apply_func, params['max_concurrency'])
+        objects = [node.get_result() for node in vpn_config.nodes]
+        self.changed = any(o['action'] in self.ACTIONS_CHANGED for o in objects)
+        self.update_result({
+            'changed': self.changed,
+            'objects': objects,
+            'schedule': {
+                'objects': len(objects),
+                'levels': vpn_config.get_levels(),
+                'max_concurrency': params['max_concurrency'],
+                'duration_secs': round(time.monotonic() - start, 3)
+            }
+        })
+        if error is not None:
+            raise error
+        return None, self.get_result()
+
+
+def run_module():
+    module_args = dict(
+        config=dict(type='dict', required=True),
+        state=dict(type='str', default='present', choices=['present', 'absent']),
+        max_concurrency=dict(type='int', required=False, default=8)
+    )
+    arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
+    arg_spec.update(module_args)
+
+    module = AnsibleModule(
+        argument_spec=arg_spec,
+        supports_check_mode=False
+    )
+
+    solace_task = SolaceVpnConfigApplyTask(module)
+    solace_task.execute()
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: solace_vpn_config_drift
+short_description: detect configuration drift of a vpn across brokers
+description:
+- "Compares the vpn configuration of multiple brokers with a reference file written by M(solace.pubsub_plus.solace_vpn_config_export)."
+- "The brokers are read concurrently, up to C(max_concurrency) at a time, each reading the collections of the reference file."
+- "Each object is hashed in a canonical form: ignored attributes removed, values converted to their types, keys sorted.
+  The object hashes are combined into a hash per collection and a hash per vpn."
+- "Only the collections whose hashes differ from the reference are compared object by object."
+- "To check, evaluate the return ``in_spec`` or the per broker ``brokers[].in_spec``. ``rc==1`` is only set in case of a module or API error."
+notes:
+- "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/msgVpn"
+options:
+  reference:
+    description:
+    - The reference file, written by M(solace.pubsub_plus.solace_vpn_config_export), in any format, compressed or not.
+    - The collections exported to the file are compared.
+    type: path
+    required: true
+  ignore_attributes:
+    description:
+    - Attributes ignored in all objects, in addition to 'msgVpnName'.
+    - "Use for attributes that differ by design, e.g. 'replicationRole' or 'dmrBridges' remote node names."
+    type: list
+    elements: str
+    required: false
+  max_differences:
+    description: Max number of differences reported per broker. Use 0 to only report the number of differences.
+    type: int
+    required: false
+    default: 100
+  page_count:
+    description: The initial page size of the collection reads, see M(solace.pubsub_plus.solace_vpn_config_export).
+    type: int
+    required: false
+    default: 100
+  max_concurrency:
+    description: Max number of brokers read concurrently.
+    type: int
+    required: false
+    default: 8
+  max_concurrency_per_broker:
+    description: Max number of collections read concurrently per broker.
+    type: int
+    required: false
+    default: 4
+extends_documentation_fragment:
+- solace.pubsub_plus.solace.broker
+- solace.pubsub_plus.solace.brokers
+seealso:
+- module: solace_vpn_config_export
+- module: solace_vpn_config_apply
+author:
+- Ricardo Gomez-Ulmke (@rjgu)
+'''
+
+EXAMPLES = '''
+hosts: localhost
+gather_facts: no
+any_errors_fatal: true
+tasks:
+  - name: "Export the reference config"
+    solace.pubsub_plus.solace_vpn_config_export:
+      host: "{{ reference_host }}"
+      username: "{{ sempv2_username }}"
+      password: "{{ sempv2_password }}"
+      msg_vpn: "{{ vpn }}"
+      dest: ./reference.ndjson.gz
+      include:
+        - clientProfiles
+        - aclProfiles
+        - clientUsernames
+        - queues.subscriptions
+
+  - name: "Check the fleet against the reference"
+    solace.pubsub_plus.solace_vpn_config_drift:
+      username: "{{ sempv2_username }}"
+      password: "{{ sempv2_password }}"
+      msg_vpn: "{{ vpn }}"
+      reference: ./reference.ndjson.gz
+      brokers:
+        - host: "{{ site_1_host }}"
+        - host: "{{ site_2_host }}"
+        - host: "{{ site_3_host }}"
+    register: result
+
+  - name: "Check if in spec"
+    assert:
+      that:
+        - result.in_spec
+      fail_msg: "{{ result.brokers | rejectattr('in_spec') | list }}"
+'''
+
+RETURN = '''
+in_spec:
+    description: Flag indicating whether the configuration of all brokers matches the reference.
+    type: bool
+    returned: always
+reference:
+    description: The reference's msg vpn, vpn hash and the collections compared.
+    type: dict
+    returned: success
+    sample:
+        msg_vpn: default
+        vpn_hash: 1c0e6f3a...
+        collections:
+            - queues
+            - queues.subscriptions
+brokers:
+    description: The drift of each broker, in the order of the argument C(brokers).
+    type: list
+    elements: dict
+    returned: success
+    sample:
+        - name: site-1
+          in_spec: true
+          vpn_hash: 1c0e6f3a...
+          collections: []
+          differences: []
+          differences_count: 0
+        - name: site-2
+          in_spec: false
+          vpn_hash: 9a2b7d10...
+          collections:
+            - queues
+            - queues.subscriptions
+          differences:
+            - type: queues
+              key: q-orders
+              change: changed
+              attributes:
+                maxMsgSpoolUsage:
+                  expected: 5000
+                  actual: 1000
+            - type: queues.subscriptions
+              parent:
+                - q-orders
+              key: orders/>
+              change: missing
+            - type: queues
+              key: q-tmp
+              change: unexpected
+          differences_count: 3
+msg:
+    description: Details in case of an error.
+    type: dict
+    returned: error
+rc:
+    description: Return code. rc=0 on success, rc=1 on error.
+    type: int
+    returned: always
+    sample:
+        success:
+            rc: 0
+        error:
+            rc: 1
+'''
+
+import logging
+import os
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceApi
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceApiError, SolaceError, SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig, SolaceTaskBrokerModule
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerGetTask
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_vpn_config import SolaceVpnConfigExport, SolaceVpnConfigHashTree
+
+try:
+    import requests
+except ImportError:
+    # reported by the import checks of solace_api
+    pass
+
+
+class SolaceVpnConfigDriftTask(SolaceBrokerGetTask):
+
+    def __init__(self, module):
+        super().__init__(module)
+
+    def validate_params(self):
+        params = self.get_module().params
+        if params['max_differences'] < 0:
+            raise SolaceParamsValidationError('max_differences', params['max_differences'], "must be >= 0")
+        for arg in ['page_count', 'max_concurrency', 'max_concurrency_per_broker']:
+            if params[arg] <= 0:
+                raise SolaceParamsValidationError(arg, params[arg], "must be > 0")
+
+    def load_reference(self, path: str) -> tuple:
+        # returns (manifest, records)
+        if not os.path.isfile(path):
+            raise SolaceParamsValidationError('reference', path, "file not found")
+        with open(path, 'rb') as f:
+            content = f.read()
+        try:
+            return SolaceVpnConfigExport.load(content)
+        except ValueError as e:
+            raise SolaceParamsValidationError('reference', path, f"not a vpn config export: {e}")
+
+    def get_broker_drift(self, broker: dict, type_names: list, reference_tree: SolaceVpnConfigHashTree) -> dict:
+        params = self.get_module().params
+        broker_module = SolaceTaskBrokerModule(self.get_module(), broker)
+        broker_result = dict(
+            name=broker_module.broker_name,
+            in_spec=False
+        )
+        try:
+            export = SolaceVpnConfigExport(
+                broker_module, SolaceTaskBrokerConfig(broker_module), broker_module.params['msg_vpn'], params['page_count'], type_names)
+            export.read(params['max_concurrency_per_broker'])
+        except SolaceApiError as e:
+            # reported per broker, the other brokers are still compared
+            logging.debug("broker '%s': %s", broker_result['name'], str(e))
+            broker_result['api_error'] = True
+            broker_result['msg'] = ['API error:', e.get_ansible_msg()]
+            return broker_result
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.SSLError) as e:
+            logging.debug("broker '%s': %s", broker_result['name'], str(e))
+            broker_result['api_error'] = True
+            broker_result['msg'] = ['Connection error:', str(e)]
+            return broker_result
+        except SolaceError as e:
+            # e.g. the circuit breaker is open or the task deadline has passed
+            logging.debug("broker '%s': %s", broker_result['name'], str(e))
+            broker_result['api_error'] = True
+            broker_result['msg'] = ['Error:'] + e.to_list()
+            return broker_result
+        tree = SolaceVpnConfigHashTree(export.get_records(), type_names, params['ignore_attributes'])
+        differing, differences, count = reference_tree.get_differences(tree, params['max_differences'])
+        broker_result.update(dict(
+            in_spec=(tree.vpn_hash == reference_tree.vpn_hash),
+            vpn_hash=tree.vpn_hash,
+            collections=differing,
+            differences=differences,
+            differences_count=count
+        ))
+        return broker_result
+
+    def do_task(self):
+        self.validate_params()
+        params = self.get_module().params
+        self.update_result({
+            'in_spec': False
+        })
+        manifest, records = self.load_reference(params['reference'])
+        # exports without the list of collections: all collections found in the file
+        type_names = manifest.get('collections') or sorted(set(r['type'] for r in records) - set([SolaceVpnConfigHashTree.VPN_TYPE_NAME]))
+        reference_tree = SolaceVpnConfigHashTree(records, type_names, params['ignore_attributes'])
+        broker_results = SolaceApi.map_concurrently(
+            lambda b: self.get_broker_drift(b, type_names, reference_tree), params['brokers'], params['max_concurrency'])
+        api_errors = [b['name'] for b in broker_results if b.pop('api_error', False)]
+        self.update_result({
+            'in_spec': all(b['in_spec'] for b in broker_results),
+            'reference': {
+                'msg_vpn': manifest.get('msg_vpn'),
+                'vpn_hash': reference_tree.vpn_hash,
+                'collections': type_names
+            },
+            'brokers': broker_results
+        })
+        msg = None
+        if api_errors:
+            self.update_result({'rc': 1})
+            msg = [f"API error for brokers: {api_errors}, see brokers[].msg"]
+        return msg, self.get_result()
+
+
+def run_module():
+    module_args = dict(
+        reference=dict(type='path', required=True),
+        ignore_attributes=dict(type='list', required=False, elements='str'),
+        max_differences=dict(type='int', required=False, default=100),
+        page_count=dict(type='int', required=False, default=100),
+        max_concurrency=dict(type='int', required=False, default=8),
+        max_concurrency_per_broker=dict(type='int', required=False, default=4)
+    )
+    arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_brokers())
+    arg_spec.update(module_args)
+
+    module = AnsibleModule(
+        argument_spec=arg_spec,
+        supports_check_mode=True
+    )
+    solace_task = SolaceVpnConfigDriftTask(module)
+    solace_task.execute()
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: solace_vpn_config_export
+short_description: export the configuration of a vpn to a file
+description:
+- "Reads the vpn and all its SEMP v2 config collections, incl. nested collections such as queue subscriptions and rdp queue bindings,
+  and writes them to a single file."
+- "Collections are read concurrently, up to C(max_concurrency) at a time, each with adaptive paging.
+  Nested collections are read once all collections of the level above are read."
+- "The file is deterministic: objects sorted by collection and key, keys sorted, no timestamps. The same configuration always results in the same file,
+  so the file can be compared and checked in."
+- "The file starts with a manifest: format version, msg vpn, SEMP version, object counts per collection, unsupported collections and the sha256 of the objects."
+- "Collections the broker does not know (e.g. on older SEMP versions) are listed as unsupported in the manifest."
+- "Passwords and other write-only attributes are not returned by SEMP and are not exported."
+notes:
+- "Module Sempv2 Config: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/config/index.html#/msgVpn"
+options:
+  dest:
+    description: The file to write. Only written if the content changed.
+    type: path
+    required: true
+  format:
+    description:
+    - "C(ndjson): one json object per line, the manifest first, then one line per object."
+    - "C(json): a single json object with C(manifest) and C(objects)."
+    - "Objects: C(type) (the collection path, e.g. 'queues.subscriptions'), C(parent) (the keys of the parent objects) and C(data)."
+    type: str
+    required: false
+    default: ndjson
+    choices:
+      - ndjson
+      - json
+  compress:
+    description: If true, compresses the file with gzip.
+    type: bool
+    required: false
+    default: true
+  include:
+    description:
+    - "The collections to export, e.g. 'queues', 'queues.subscriptions'. Parents of nested collections are exported as well."
+    - "Default: all collections."
+    type: list
+    elements: str
+    required: false
+  page_count:
+    description: The initial page size of the collection reads, see C(adaptive_paging) of the M(solace.pubsub_plus.solace_get_queues) module.
+    type: int
+    required: false
+    default: 100
+  max_concurrency:
+    description: Max number of collections read concurrently.
+    type: int
+    required: false
+    default: 8
+extends_documentation_fragment:
+- solace.pubsub_plus.solace.broker
+- solace.pubsub_plus.solace.vpn
+seealso:
+- module: solace_vpn_config_apply
+author:
+- Ricardo Gomez-Ulmke (@rjgu)
+'''
+
+EXAMPLES = '''
+hosts: all
+gather_facts: no
+any_errors_fatal: true
+collections:
+- solace.pubsub_plus
+module_defaults:
+  solace_vpn_config_export:
+    host: "{{ sempv2_host }}"
+    port: "{{ sempv2_port }}"
+    secure_connection: "{{ sempv2_is_secure_connection }}"
+    username: "{{ sempv2_username }}"
+    password: "{{ sempv2_password }}"
+    timeout: "{{ sempv2_timeout }}"
+    msg_vpn: "{{ vpn }}"
+tasks:
+  - name: export vpn config
+    solace_vpn_config_export:
+      dest: "./backup/{{ inventory_hostname }}.{{ vpn }}.ndjson.gz"
+    register: result
+
+  - name: "export queues & subscriptions, uncompressed"
+    solace_vpn_config_export:
+      dest: "./backup/{{ inventory_hostname }}.{{ vpn }}.queues.json"
+      format: json
+      compress: false
+      include:
+        - queues.subscriptions
+'''
+
+RETURN = '''
+dest:
+    description: The file written.
+    type: str
+    returned: success
+manifest:
+    description: The manifest of the file.
+    type: dict
+    returned: success
+    sample:
+        format_version: 1
+        format: ndjson
+        msg_vpn: default
+        sempv2_version: "2.26"
+        counts:
+            msgVpn: 1
+            queues: 5000
+            queues.subscriptions: 10000
+        total: 15001
+        unsupported: []
+        sha256: 5b4f0c1f9e...
+size_bytes:
+    description: Size of the file in bytes.
+    type: int
+    returned: success
+stats:
+    description: "Number of collection reads, SEMP round trips and the duration."
+    type: dict
+    returned: success
+    sample:
+        collections_read: 5021
+        round_trips: 5034
+        duration_secs: 4.2
+msg:
+    description: The response from the HTTP call in case of error.
+    type: dict
+    returned: error
+rc:
+    description: Return code. rc=0 on success, rc=1 on error.
+    type: int
+    returned: always
+    sample:
+        success:
+            rc: 0
+        error:
+            rc: 1
+'''
+
+import os
+import tempfile
+import time
+from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerGetTask
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_vpn_config import SolaceVpnConfigExport
+from ansible.module_utils.basic import AnsibleModule
+
+
+class SolaceVpnConfigExportTask(SolaceBrokerGetTask):
+
+    def __init__(self, module):
+        super().__init__(module)
+
+    def validate_params(self):
+        params = self.get_module().params
+        for arg in ['page_count', 'max_concurrency']:
+            if params[arg] <= 0:
+                raise SolaceParamsValidationError(arg, params[arg], "must be > 0")
+
+    def read_file(self, path: str) -> bytes:
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def write_file(self, path: str, content: bytes):
+        # write to a temp file in the same directory & rename, the file is either old or new
+        dir_name = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix='.' + os.path.basename(path) + '.')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def do_task(self):
+        self.validate_params()
+        params = self.get_module().params
+        start = time.monotonic()
+        export = SolaceVpnConfigExport(self.get_module(), self.get_config(), params['msg_vpn'], params['page_count'], params['include'])
+        export.read(params['max_concurrency'])
+        raw_sempv2_version, _v = self.get_sempv2_api().get_sempv2_version(self.get_config())
+        content, manifest = export.serialize(params['format'], raw_sempv2_version)
+        if params['compress']:
+            content = SolaceVpnConfigExport.compress(content)
+        dest = params['dest']
+        self.changed = self.read_file(dest) != content
+        if self.changed and not self.get_module().check_mode:
+            self.write_file(dest, content)
+        stats = dict(export.stats)
+        stats['duration_secs'] = round(time.monotonic() - start, 3)
+        self.update_result({
+            'changed': self.changed,
+            'dest': dest,
+            'manifest': manifest,
+            'size_bytes': len(content),
+            'stats': stats
+        })
+        return None, self.get_result()
+
+
+def run_module():
+    module_args = dict(
+        dest=dict(type='path', required=True),
+        format=dict(type='str', default=SolaceVpnConfigExport.FORMAT_NDJSON, choices=SolaceVpnConfigExport.FORMATS),
+        compress=dict(type='bool', default=True),
+        include=dict(type='list', required=False, elements='str'),
+        page_count=dict(type='int', required=False, default=100),
+        max_concurrency=dict(type='int', required=False, default=8)
+    )
+    arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
+    arg_spec.update(module_args)
+
+    module = AnsibleModule(
+        argument_spec=arg_spec,
+        supports_check_mode=True
+    )
+
+    solace_task = SolaceVpnConfigExportTask(module)
+    solace_task.execute()
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,380 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: solace_wait_for
+short_description: wait for a condition on monitor objects
+description:
+- "Polls a SEMP v2 monitor collection until the C(conditions) hold for its objects or C(wait_timeout_seconds) have passed,
+  e.g. until a queue is drained, a bridge is up or a DMR link is operational."
+- "Each poll reads all objects matching C(where), page by page, with the C(select) projection and the fields of the C(conditions)."
+- "Adaptive polling: polls every C(min_poll_seconds) while the selected values change,
+  increasing the interval by 1.5 up to C(max_poll_seconds) while they don't."
+- "Returns as soon as the condition holds. Fails with rc=1 if it does not hold within C(wait_timeout_seconds)."
+notes:
+- "Module Sempv2 Monitor: https://docs.solace.com/API-Developer-Online-Ref-Documentation/swagger-ui/monitor/index.html"
+options:
+  path:
+    description:
+    - "The monitor collection, as a list of path elements, relative to C(scope), e.g. C([queues]), C([bridges]), C([dmrClusters, cluster-1, links])."
+    - "To wait for a single object, use C(where) with its key, e.g. C(queueName==q/foo)."
+    type: list
+    elements: str
+    required: true
+  scope:
+    description: "C(vpn): C(path) is relative to /msgVpns/{msg_vpn}. C(broker): C(path) is relative to the monitor api, e.g. for dmr clusters."
+    type: str
+    required: false
+    default: vpn
+    choices:
+      - vpn
+      - broker
+  select:
+    description: Additional attributes to read, returned for the failing objects. The fields of the C(conditions) are always read.
+    type: list
+    elements: str
+    required: false
+  where:
+    description: The SEMP v2 where filter, e.g. C(queueName==orders*).
+    type: list
+    elements: str
+    required: false
+  conditions:
+    description: The conditions an object satisfies, all must be true. Default none, i.e. every object satisfies them, see C(min_count) and C(max_count).
+    type: list
+    elements: dict
+    required: false
+    suboptions:
+      field:
+        description: The attribute, nested attributes separated by '.', e.g. C(msgSpoolUsage), C(counter.rxMsgCount).
+        type: str
+        required: true
+      op:
+        description: The comparison of the field with C(value). A missing field is false.
+        type: str
+        required: false
+        default: eq
+        choices:
+          - eq
+          - ne
+          - lt
+          - le
+          - gt
+          - ge
+          - in
+          - not_in
+      value:
+        description: The value to compare with, a list for C(in) and C(not_in).
+        type: raw
+        required: false
+  match:
+    description: "C(all): all objects must satisfy the conditions. C(any): at least one object must satisfy them."
+    type: str
+    required: false
+    default: all
+    choices:
+      - all
+      - any
+  min_count:
+    description: The min number of objects matching C(where), e.g. 0 to accept none.
+    type: int
+    required: false
+    default: 1
+  max_count:
+    description: The max number of objects matching C(where), e.g. 0 to wait until all objects are gone.
+    type: int
+    required: false
+  wait_timeout_seconds:
+    description: Number of seconds to wait for the condition. Value must be `> 0`.
+    type: int
+    required: false
+    default: 600
+  min_poll_seconds:
+    description: The interval between polls while the selected values change.
+    type: float
+    required: false
+    default: 0.5
+  max_poll_seconds:
+    description: The max interval between polls while the selected values don't change.
+    type: float
+    required: false
+    default: 10
+  page_count:
+    description: The initial page size of the reads, see C(adaptive_paging) of the M(solace.pubsub_plus.solace_get_queues) module.
+    type: int
+    required: false
+    default: 100
+extends_documentation_fragment:
+- solace.pubsub_plus.solace.broker
+- solace.pubsub_plus.solace.vpn
+seealso:
+- module: solace_get_available
+- module: solace_monitor_sample
+author:
+- Ricardo Gomez-Ulmke (@rjgu)
+'''
+
+EXAMPLES = '''
+hosts: all
+gather_facts: no
+any_errors_fatal: true
+collections:
+- solace.pubsub_plus
+module_defaults:
+  solace_wait_for:
+    host: "{{ sempv2_host }}"
+    port: "{{ sempv2_port }}"
+    secure_connection: "{{ sempv2_is_secure_connection }}"
+    username: "{{ sempv2_username }}"
+    password: "{{ sempv2_password }}"
+    timeout: "{{ sempv2_timeout }}"
+    msg_vpn: "{{ vpn }}"
+tasks:
+  - name: wait until queue is drained
+    solace_wait_for:
+      path: [queues]
+      where:
+        - queueName==q/foo
+      conditions:
+        - field: spooledMsgCount
+          value: 0
+      wait_timeout_seconds: 300
+
+  - name: wait until all order queues are bound
+    solace_wait_for:
+      path: [queues]
+      where:
+        - queueName==orders*
+      select:
+        - queueName
+      conditions:
+        - field: bindCount
+          op: gt
+          value: 0
+
+  - name: wait until bridge is up
+    solace_wait_for:
+      path: [bridges]
+      where:
+        - bridgeName==bridge-1
+      conditions:
+        - field: inboundState
+          value: ready-in-sync
+        - field: outboundState
+          value: ready
+
+  - name: wait until dmr link is operational
+    solace_wait_for:
+      path: [dmrClusters, "{{ dmr_cluster_name }}", links]
+      scope: broker
+      conditions:
+        - field: up
+          value: true
+
+  - name: wait until all clients of a username are disconnected
+    solace_wait_for:
+      path: [clients]
+      where:
+        - clientUsername==app-1
+      min_count: 0
+      max_count: 0
+'''
+
+RETURN = '''
+is_satisfied:
+    description: True if the condition holds.
+    type: bool
+    returned: always
+polls:
+    description: Number of polls.
+    type: int
+    returned: always
+objects:
+    description: Number of objects matching C(where) in the last poll.
+    type: int
+    returned: always
+satisfied:
+    description: Number of objects satisfying the conditions in the last poll.
+    type: int
+    returned: always
+failing:
+    description: The selected attributes of up to 10 objects not satisfying the conditions in the last poll.
+    type: list
+    returned: always
+    sample:
+        - queueName: q/foo
+          spooledMsgCount: 1200
+duration_secs:
+    description: The time waited.
+    type: float
+    returned: always
+msg:
+    description: The reason in case of error.
+    type: list
+    returned: error
+rc:
+    description: Return code. rc=0 on success, rc=1 on error.
+    type: int
+    returned: always
+    sample:
+        success:
+            rc: 0
+        error:
+            rc: 1
+'''
+
+import logging
+import time
+from ansible_collections.solace.pubsub_plus.plugins.module_utils import solace_sys
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2PagingGetApi
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_error import SolaceParamsValidationError
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_monitor import SolaceMonitorCondition, SolaceMonitorConditionResult
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task import SolaceBrokerGetTask
+from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+from ansible.module_utils.basic import AnsibleModule
+
+
+class SolaceWaitForTask(SolaceBrokerGetTask):
+
+    BACKOFF_FACTOR = 1.5
+
+    def __init__(self, module):
+        super().__init__(module)
+
+    def validate_params(self):
+        params = self.get_module().params
+        for arg in ['wait_timeout_seconds', 'min_poll_seconds', 'max_poll_seconds', 'page_count']:
+            if params[arg] <= 0:
+                raise SolaceParamsValidationError(arg, params[arg], "must be > 0")
+        if params['max_poll_seconds'] < params['min_poll_seconds']:
+            raise SolaceParamsValidationError('max_poll_seconds', params['max_poll_seconds'], "must be >= min_poll_seconds")
+        if params['min_count'] < 0:
+            raise SolaceParamsValidationError('min_count', params['min_count'], "must be >= 0")
+        if params['max_count'] is not None and params['max_count'] < params['min_count']:
+            raise SolaceParamsValidationError('max_count', params['max_count'], "must be >= min_count")
+        # a collection: /{collection}[/{key}/{collection}]*
+        if len(params['path']) % 2 == 0:
+            raise SolaceParamsValidationError('path', params['path'], "must be a collection, e.g. [queues]")
+
+    def get_path_array(self) -> list:
+        params = self.get_module().params
+        if params['scope'] == 'vpn':
+            return ['msgVpns', params['msg_vpn']] + params['path']
+        return params['path']
+
+    def get_conditions(self) -> list:
+        return [SolaceMonitorCondition(c['field'], c['op'], c.get('value')) for c in self.get_module().params['conditions'] or []]
+
+    def poll(self, conditions: list, select: list) -> SolaceMonitorConditionResult:
+        params = self.get_module().params
+        api = SolaceSempV2PagingGetApi(self.get_module())
+        query_params = dict(select=select, where=params['where'])
+        result = SolaceMonitorConditionResult()
+        for obj in api.iter_objects(self.get_config(), 'monitor', params['page_count'], self.get_path_array(), query_params, adaptive_paging=True):
+            result.add(obj['data'], conditions)
+        return result
+
+    def is_satisfied(self, result: SolaceMonitorConditionResult) -> bool:
+        params = self.get_module().params
+        if result.count < params['min_count']:
+            return False
+        if params['max_count'] is not None and result.count > params['max_count']:
+            return False
+        if params['match'] == 'any':
+            return result.satisfied > 0 or result.count == 0
+        return result.satisfied == result.count
+
+    def do_task(self):
+        self.validate_params()
+        params = self.get_module().params
+        conditions = self.get_conditions()
+        select = list(dict.fromkeys((params['select'] or []) + [c.get_select() for c in conditions]))
+        start = time.monotonic()
+        # the deadline is bounded by the task deadline
+        deadline = start + params['wait_timeout_seconds']
+        remaining = self.get_config().get_remaining_secs()
+        if remaining is not None:
+            deadline = min(deadline, start + remaining)
+        delay = params['min_poll_seconds']
+        fingerprint = None
+        polls = 0
+        while True:
+            result = self.poll(conditions, select)
+            polls += 1
+            is_satisfied = self.is_satisfied(result)
+            now = time.monotonic()
+            if is_satisfied or now >= deadline:
+                break
+            # poll fast while the broker makes progress, back off while nothing changes
+            if fingerprint is not None and result.get_fingerprint() == fingerprint:
+                delay = min(delay * self.BACKOFF_FACTOR, params['max_poll_seconds'])
+            else:
+                delay = params['min_poll_seconds']
+            fingerprint = result.get_fingerprint()
+            logging.debug("poll %d: objects=%d, satisfied=%d, next poll in %.2f secs", polls, result.count, result.satisfied, delay)
+            # the last poll at the deadline
+            time.sleep(min(delay, deadline - now))
+        duration_secs = round(time.monotonic() - start, 3)
+        self.update_result({
+            'is_satisfied': is_satisfied,
+            'polls': polls,
+            'objects': result.count,
+            'satisfied': result.satisfied,
+            'failing': result.failing,
+            'duration_secs': duration_secs
+        })
+        msg = None
+        if not is_satisfied:
+            self.update_result({'rc': 1})
+            msg = [f"condition not satisfied after {duration_secs} secs: objects={result.count}, satisfied={result.satisfied}, see failing"]
+        return msg, self.get_result()
+
+
+def run_module():
+    module_args = dict(
+        path=dict(type='list', required=True, elements='str'),
+        scope=dict(type='str', required=False, default='vpn', choices=['vpn', 'broker']),
+        select=dict(type='list', required=False, elements='str'),
+        where=dict(type='list', required=False, elements='str'),
+        conditions=dict(type='list', required=False, elements='dict', options=dict(
+            field=dict(type='str', required=True),
+            op=dict(type='str', required=False, default='eq', choices=list(SolaceMonitorCondition.OPS)),
+            value=dict(type='raw', required=False)
+        )),
+        match=dict(type='str', required=False, default='all', choices=['all', 'any']),
+        min_count=dict(type='int', required=False, default=1),
+        max_count=dict(type='int', required=False),
+        wait_timeout_seconds=dict(type='int', required=False, default=600),
+        min_poll_seconds=dict(type='float', required=False, default=0.5),
+        max_poll_seconds=dict(type='float', required=False, default=10),
+        page_count=dict(type='int', required=False, default=100)
+    )
+    arg_spec = SolaceTaskBrokerConfig.arg_spec_broker_config()
+    arg_spec.update(SolaceTaskBrokerConfig.arg_spec_vpn())
+    arg_spec.update(module_args)
+
+    module = AnsibleModule(
+        argument_spec=arg_spec,
+        supports_check_mode=True
+    )
+
+    solace_task = SolaceWaitForTask(module)
+    solace_task.execute()
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
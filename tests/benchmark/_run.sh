@@ -0,0 +1,37 @@
+#!/usr/bin/env bash
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+scriptDir=$(cd $(dirname "$0") && pwd);
+scriptName=$(basename $(test -L "$0" && readlink "$0" || echo "$0"));
+testTarget=${scriptDir##*/}
+scriptLogName="$testTarget.$scriptName"
+if [ -z "$PROJECT_HOME" ]; then echo ">>> XT_ERROR: - $scriptLogName - missing env var: PROJECT_HOME"; exit 1; fi
+source $PROJECT_HOME/.lib/functions.sh
+
+############################################################################################################################
+# Environment Variables
+
+  if [ -z "$LOG_DIR" ]; then echo ">>> XT_ERROR: - $scriptLogName - missing env var: LOG_DIR"; exit 1; fi
+  if [ -z "$ASC_BENCHMARK_OBJECTS" ]; then export ASC_BENCHMARK_OBJECTS="100,1000"; fi
+  if [ -z "$ASC_BENCHMARK_LATENCY_MS" ]; then export ASC_BENCHMARK_LATENCY_MS="0"; fi
+
+##############################################################################################################################
+# Settings
+  collectionsRootDir="$PROJECT_HOME/src"
+  benchmarkScript=$(assertFile $scriptLogName "$scriptDir/benchmark.py") || exit
+  resultsFile="$LOG_DIR/$scriptLogName.results.json"
+
+##############################################################################################################################
+# Run
+  python $benchmarkScript $collectionsRootDir \
+    --objects $ASC_BENCHMARK_OBJECTS \
+    --latency-ms $ASC_BENCHMARK_LATENCY_MS \
+    --json $resultsFile > $LOG_DIR/$scriptLogName.out 2>&1
+  code=$?; if [[ $code != 0 ]]; then cat $LOG_DIR/$scriptLogName.out; echo ">>> XT_ERROR - $code - script:$scriptLogName"; exit 1; fi
+  cat $LOG_DIR/$scriptLogName.out
+
+echo ">>> SUCCESS: $scriptLogName"
+
+###
+# The End.
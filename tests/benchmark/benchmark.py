@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Load benchmark of the collection's SEMP / Solace Cloud api layer against the local mock server (solace_mock_server.py).
+# Runs the collection code in-process, no broker or Solace Cloud account required.
+#
+# scenarios:
+#   paging_get:    SolaceSempV2PagingGetApi.get_objects() on a list of N queues, config & monitor api
+#   crud_list:     module solace_queue_subscriptions (SolaceBrokerCRUDListTask): present / exactly / absent with N subscriptions
+#   sempv1_paging: SolaceSempV1PagingGetApi.get_objects() on a list of N queues ('show queue')
+#   cloud_polling: SolaceCloudApi create service, poll until completed, service requests, list services (N services)
+#
+# reports per scenario & object count: wall time, requests, requests/s, p50/p99 request latency, KB received, max RSS
+#
+# usage: benchmark.py {collections-root-dir} [--objects 100,1000] [--latency-ms 0] [--scenarios ...] [--json {file}]
+#   --url: use an already running mock server, e.g. http://localhost:18080
+#   --gzip-min-bytes: the mock server gzips responses of at least this size, compare 'received_kb' with & without
+#   note: injected faults (502/504/500) trigger the api's retry delay of 30 secs per retry
+#   note: the Solace Cloud rate limit is off unless ANSIBLE_SOLACE_CLOUD_RATE_LIMIT is set
+
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+import urllib.request
+
+SCENARIOS = ['paging_get', 'crud_list', 'sempv1_paging', 'cloud_polling']
+VPN = 'default'
+QUEUE = 'bench-q'
+CLOUD_API_TOKEN = 'mock-token'
+
+
+class MockControl(object):
+    # client for the mock server's /__mock__ control api
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def _call(self, method: str, name: str, body: dict = None) -> dict:
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        req = urllib.request.Request(f"{self.url}/__mock__/{name}", data=data, method=method, headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(req) as resp:
+            return json.loads(resp.read().decode('utf-8'))
+
+    def reset(self):
+        return self._call('POST', 'reset', {})
+
+    def configure(self, **kwargs):
+        return self._call('PATCH', 'config', kwargs)
+
+    def seed(self, **kwargs):
+        return self._call('POST', 'seed', kwargs)
+
+    def stats(self) -> dict:
+        return self._call('GET', 'stats')
+
+    def reset_stats(self):
+        return self._call('DELETE', 'stats')
+
+
+class LatencyRecorder(object):
+    # 'response' hook for the pooled http sessions of the api layer
+
+    def __init__(self):
+        self.latencies = []
+
+    def __call__(self, resp, *args, **kwargs):
+        self.latencies.append(resp.elapsed.total_seconds())
+        return resp
+
+    def reset(self):
+        self.latencies = []
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies:
+            return 0.0
+        s = sorted(self.latencies)
+        return s[min(len(s) - 1, int(round(p / 100 * (len(s) - 1))))]
+
+
+def rss_mb() -> dict:
+    # current & max resident set size of this process in MB
+    current = None
+    try:
+        with open('/proc/self/statm') as f:
+            current = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError):
+        pass
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux: KB, macOS: bytes
+    max_rss = max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+    return dict(current=current, max=max_rss)
+
+
+def create_module(argument_spec: dict, module_args: dict):
+    from ansible.module_utils import basic
+    from ansible.module_utils._text import to_bytes
+    basic._ANSIBLE_ARGS = to_bytes(json.dumps(dict(ANSIBLE_MODULE_ARGS=module_args)))
+    try:
+        return basic.AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    finally:
+        basic._ANSIBLE_ARGS = None
+
+
+class Benchmark(object):
+
+    def __init__(self, mock_url: str, page_count: int):
+        import urllib.parse
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceApi
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import BearerAuth
+        self.mock_url = mock_url
+        self.mock = MockControl(mock_url)
+        self.page_count = page_count
+        url_parts = urllib.parse.urlsplit(mock_url)
+        self.host = url_parts.hostname
+        self.port = url_parts.port
+        self.broker_args = dict(host=self.host, port=self.port, secure_connection=False, username='admin', password='admin', timeout=60)
+        # sessions are pooled per (scheme, host:port, user), record latencies of all requests
+        self.latencies = LatencyRecorder()
+        for auth in [('admin', 'admin'), BearerAuth(CLOUD_API_TOKEN)]:
+            SolaceApi.get_session(mock_url, auth).hooks['response'].append(self.latencies)
+
+    def broker_config(self):
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskBrokerConfig
+        module = create_module(SolaceTaskBrokerConfig.arg_spec_broker_config(), self.broker_args)
+        return module, SolaceTaskBrokerConfig(module)
+
+    def run(self, scenario: str, num_objects: int) -> dict:
+        self.mock.reset()
+        getattr(self, f"setup_{scenario}")(num_objects)
+        self.mock.reset_stats()
+        self.latencies.reset()
+        start = time.perf_counter()
+        error = None
+        try:
+            getattr(self, f"run_{scenario}")(num_objects)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+        stats = self.mock.stats()
+        return dict(
+            scenario=scenario,
+            objects=num_objects,
+            seconds=round(elapsed, 3),
+            requests=stats['requests'],
+            requests_per_sec=round(stats['requests'] / elapsed, 1) if elapsed > 0 else None,
+            latency_p50_ms=round(self.latencies.percentile(50) * 1000, 2),
+            latency_p99_ms=round(self.latencies.percentile(99) * 1000, 2),
+            received_kb=round(stats['bytes_sent'] / 1024, 1),
+            rss_mb=rss_mb(),
+            faults_injected=stats['faults_injected'],
+            error=error
+        )
+
+    # paging_get
+
+    def setup_paging_get(self, num_objects: int):
+        self.mock.seed(collection=f"/msgVpns/{VPN}/queues", count=num_objects, key_prefix='q-', settings=dict(ingressEnabled=True, egressEnabled=True))
+
+    def run_paging_get(self, num_objects: int):
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api import SolaceSempV2PagingGetApi
+        module, config = self.broker_config()
+        api = SolaceSempV2PagingGetApi(module)
+        for api_name in ['config', 'monitor']:
+            objects = api.get_objects(config, api_name, self.page_count, ['msgVpns', VPN, 'queues'], dict(where=['queueName==q-*'], select=None), api.get_monitor_api_base)
+            if len(objects) != num_objects:
+                raise AssertionError(f"{api_name}: expected {num_objects} queues, got {len(objects)}")
+
+    # crud_list
+
+    def setup_crud_list(self, num_objects: int):
+        self.mock.seed(collection=f"/msgVpns/{VPN}/queues", count=1, key_prefix=QUEUE)
+
+    def run_crud_list(self, num_objects: int):
+        from ansible_collections.solace.pubsub_plus.plugins.connection.solace_persistent import Connection
+        from ansible_collections.solace.pubsub_plus.plugins.modules import solace_queue_subscriptions
+        queue_name = f"{QUEUE}0"
+        topics = [f"bench/topic/{n}/>" for n in range(num_objects)]
+        runs = [
+            ('present', topics),
+            ('present', topics),
+            ('exactly', topics[:num_objects // 2]),
+            ('absent', topics)
+        ]
+        for state, names in runs:
+            module_args = dict(self.broker_args, msg_vpn=VPN, queue_name=queue_name, names=names, state=state)
+            res = Connection._run_module(solace_queue_subscriptions, module_args)
+            if res['rc'] != 0:
+                raise AssertionError(f"state={state}: rc={res['rc']}, {res['stdout'] or res['stderr']}")
+
+    # sempv1_paging
+
+    def setup_sempv1_paging(self, num_objects: int):
+        self.setup_paging_get(num_objects)
+
+    def run_sempv1_paging(self, num_objects: int):
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api_sempv1 import SolaceSempV1PagingGetApi
+        module, config = self.broker_config()
+        api = SolaceSempV1PagingGetApi(module)
+        rpc_xml = f"<rpc><show><queue><name>*</name><vpn-name>{VPN}</vpn-name><count/><num-elements>{self.page_count}</num-elements></queue></show></rpc>"
+        objects = api.get_objects(config, rpc_xml, ['rpc-reply', 'rpc', 'show', 'queue', 'queues', 'queue'])
+        if len(objects) != num_objects:
+            raise AssertionError(f"expected {num_objects} queues, got {len(objects)}")
+
+    # cloud_polling
+
+    def setup_cloud_polling(self, num_objects: int):
+        self.mock.configure(cloud_creation_polls=3, cloud_request_polls=3)
+        self.mock.seed(cloud_services=num_objects)
+
+    def run_cloud_polling(self, num_objects: int):
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_task_config import SolaceTaskSolaceCloudConfig
+        from ansible_collections.solace.pubsub_plus.plugins.module_utils.solace_api_cloud import SolaceCloudApi
+        mock_url = self.mock_url
+
+        class MockSolaceCloudApi(SolaceCloudApi):
+            def get_api_base_path(self, config: SolaceTaskSolaceCloudConfig) -> str:
+                return mock_url + '/api/v0'
+
+        module = create_module(SolaceTaskSolaceCloudConfig.arg_spec_solace_cloud(), dict(api_token=CLOUD_API_TOKEN, timeout=60, validate_certs=False))
+        config = SolaceTaskSolaceCloudConfig(module)
+        api = MockSolaceCloudApi(module)
+        base_path = api.get_api_base_path(config)
+        # create without waiting, then poll, same requests as wait_for_service_create_completion() without the delay
+        service = api.create_service(config, 0, dict(name='bench-service', datacenterId='aws-ca-central-1a'))
+        service_id = service['serviceId']
+        while api.get_service(config, service_id)['creationState'] != 'completed':
+            pass
+        # long running service request, same requests as make_service_post_request() without the delay
+        path_array = [base_path, api.API_SERVICES, service_id, api.API_REQUESTS, 'clientProfileRequests']
+        request = api.make_post_request(config, path_array, dict(clientProfileName='bench'))
+        while api.get_service_request_status(config, service_id, request['id'])['adminProgress'] != 'completed':
+            pass
+        api.wait_for_service_requests_to_finish(config, 0, service_id)
+        services = api.get_services_with_details(config)
+        if len(services) != num_objects + 1:
+            raise AssertionError(f"expected {num_objects + 1} services, got {len(services)}")
+        api.delete_service(config, service_id)
+
+
+def print_table(results: list):
+    columns = ['scenario', 'objects', 'seconds', 'requests', 'requests_per_sec', 'latency_p50_ms', 'latency_p99_ms', 'received_kb', 'rss_max_mb', 'error']
+    rows = []
+    for r in results:
+        row = dict(r, rss_max_mb=round(r['rss_mb']['max'], 1))
+        rows.append([str(row[c]) if row[c] is not None else '' for c in columns])
+    widths = [max(len(c), *(len(row[i]) for row in rows)) for i, c in enumerate(columns)]
+    print('  '.join(c.ljust(widths[i]) for i, c in enumerate(columns)))
+    for row in rows:
+        print('  '.join(v.ljust(widths[i]) for i, v in enumerate(row)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='benchmark of the collection api layer against the solace mock server')
+    parser.add_argument('collections_root', help='directory containing ansible_collections/solace/pubsub_plus')
+    parser.add_argument('--url', default=None, help='url of a running mock server, default: start one in-process')
+    parser.add_argument('--objects', default='100,1000', help='comma separated list of object counts')
+    parser.add_argument('--page-count', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--latency-ms', type=float, default=0, help='latency added by the mock server per request')
+    parser.add_argument('--fault-rate', type=float, default=0.0, help='probability of a 502 response per request')
+    parser.add_argument('--gzip-min-bytes', type=int, default=None, help='the mock server gzips responses of at least this size, default: never')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--json', default=None, help='write the results to this file')
+    args = parser.parse_args()
+
+    # measure the api layer, not the Solace Cloud rate limit. read at import of the collection code.
+    os.environ.setdefault('ANSIBLE_SOLACE_CLOUD_RATE_LIMIT', '0')
+    sys.path.insert(0, os.path.abspath(args.collections_root))
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    scenarios = [s for s in args.scenarios.split(',') if s]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {unknown}, valid: {SCENARIOS}")
+
+    server = None
+    mock_url = args.url
+    if mock_url is None:
+        from solace_mock_server import SolaceMockServer
+        server = SolaceMockServer('127.0.0.1', 0)
+        server.start_in_thread()
+        mock_url = server.url
+    benchmark = Benchmark(mock_url, args.page_count)
+    benchmark.mock.configure(latency_ms=args.latency_ms, fault_rate=args.fault_rate, gzip_min_bytes=args.gzip_min_bytes)
+
+    results = []
+    try:
+        for scenario in scenarios:
+            for num_objects in [int(n) for n in args.objects.split(',') if n]:
+                for _i in range(args.repeat):
+                    results.append(benchmark.run(scenario, num_objects))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print_table(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(dict(mock_url=mock_url, page_count=args.page_count, latency_ms=args.latency_ms, results=results), f, indent=2)
+    errors = [r for r in results if r['error']]
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,841 @@
+#!/usr/bin/env python3
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Local stand-in for a Solace PubSub+ broker (SEMP v2, SEMP v1) and the Solace Cloud api (v0).
+# Pure python, standard library only. Used by the benchmark and for tests without a broker / cloud account.
+#
+# SEMP v2: /SEMP/v2/{config|monitor|action}, incl. __private_*__ variants, all share one object tree
+#   - objects: /{collection}/{key}/{collection}/{key}/..., e.g. /msgVpns/default/queues/q1/subscriptions/a%2Fb
+#   - GET collection: 'count', 'cursor', 'where', 'select', paging via meta.paging.nextPageUri
+#   - POST (create), PATCH (update), PUT (replace), DELETE
+#   - errors: 6=NOT_FOUND, 10=ALREADY_EXISTS, 11=INVALID_PATH (bad query / path), 72=NOT_ALLOWED (injected only)
+#   - monitor: msgVpns have an operational 'state'
+# SEMP v1: POST /SEMP
+#   - 'show service', 'show queue' (reads SEMP v2 queues) with num-elements / more-cookie paging
+# Solace Cloud: /api/v0/datacenters, /api/v0/services[/{serviceId}[/requests[/{requestId}]]], POST /api/v0/services/{serviceId}/requests/*
+#   - services & requests are 'completed' after a configurable number of GETs
+# Control: /__mock__/{config|stats|seed|reset}
+#   - GET|PATCH config: latency, faults, versions, polls, gzip
+#   - faults: list of {http_status, sub_code, semp_error_code, method, match, skip, count}, applied in order to matching requests,
+#     after 'skip' matching requests passed
+#
+# usage: solace_mock_server.py [--host 127.0.0.1] [--port 18080] [--latency-ms 0] [--latency-jitter-ms 0] [--gzip-min-bytes N]
+
+import argparse
+import base64
+import bisect
+import fnmatch
+import gzip
+import http.server
+import json
+import random
+import re
+import socketserver
+import threading
+import time
+import urllib.parse
+import uuid
+import xml.etree.ElementTree as ET
+
+CLOUD_SERVICE_DETAILS = ['serviceConnectionEndpoints', 'managementProtocols', 'messagingProtocols']
+SEMPV2_API_BASES = ['config', 'monitor', 'action', '__private_config__', '__private_monitor__', '__private_action__']
+SEMPV2_ERROR_CODES = {
+    6: 'NOT_FOUND',
+    10: 'ALREADY_EXISTS',
+    11: 'INVALID_PATH',
+    72: 'NOT_ALLOWED'
+}
+# key attributes per collection, default: '{collection singular}Name'
+SEMPV2_KEY_ATTRS = {
+    'aclProfiles': ['aclProfileName'],
+    'authenticationOauthProviders': ['oauthProviderName'],
+    'authorizationGroups': ['authorizationGroupName'],
+    'bridges': ['bridgeName', 'bridgeVirtualRouter'],
+    'certAuthorities': ['certAuthorityName'],
+    'clientCertAuthorities': ['certAuthorityName'],
+    'clientConnectExceptions': ['clientConnectExceptionAddress'],
+    'clientProfiles': ['clientProfileName'],
+    'clientUsernames': ['clientUsername'],
+    'dmrBridges': ['remoteNodeName'],
+    'dmrClusters': ['dmrClusterName'],
+    'domainCertAuthorities': ['certAuthorityName'],
+    'jndiConnectionFactories': ['connectionFactoryName'],
+    'jndiQueues': ['queueName'],
+    'jndiTopics': ['topicName'],
+    'links': ['remoteNodeName'],
+    'mqttSessions': ['mqttSessionClientId', 'mqttSessionVirtualRouter'],
+    'msgVpns': ['msgVpnName'],
+    'protectedRequestHeaders': ['headerName'],
+    'publishTopicExceptions': ['publishTopicExceptionSyntax', 'publishTopicException'],
+    'queueBindings': ['queueBindingName'],
+    'queues': ['queueName'],
+    'remoteAddresses': ['remoteAddress'],
+    'remoteMsgVpns': ['remoteMsgVpnName', 'remoteMsgVpnLocation', 'remoteMsgVpnInterface'],
+    'remoteSubscriptions': ['remoteSubscriptionTopic'],
+    'replicatedTopics': ['replicatedTopic'],
+    'requestHeaders': ['headerName'],
+    'restConsumers': ['restConsumerName'],
+    'restDeliveryPoints': ['restDeliveryPointName'],
+    'subscribeShareNameExceptions': ['subscribeShareNameExceptionSyntax', 'subscribeShareNameException'],
+    'subscribeTopicExceptions': ['subscribeTopicExceptionSyntax', 'subscribeTopicException'],
+    'subscriptions': ['subscriptionTopic'],
+    'trustedCommonNames': ['trustedCommonName'],
+    'virtualHostnames': ['virtualHostname']
+}
+WHERE_CLAUSE_RE = re.compile(r'^([A-Za-z0-9_.]+)(==|!=|<=|>=|<|>)(.*)$')
+DEFAULT_CONFIG = {
+    'latency_ms': 0,
+    'latency_jitter_ms': 0,
+    # list of fault specs, see apply_fault()
+    'faults': [],
+    # probability [0..1] of injecting 'random_fault' into any non-control request
+    'fault_rate': 0.0,
+    'random_fault': {'http_status': 502},
+    'sempv2_version': '2.26',
+    'sempv1_version': 'soltr/9_13VMR',
+    'sempv2_default_count': 10,
+    'sempv2_max_count': 1000,
+    # operational state of enabled vpns in the monitor api, e.g. 'down' while the broker is starting
+    'msg_vpn_state': 'up',
+    # number of GETs until a new cloud service / service request is completed
+    'cloud_creation_polls': 2,
+    # responses of at least this size are gzip compressed if the client accepts gzip, None: never
+    'gzip_min_bytes': None,
+    'cloud_request_polls': 1
+}
+
+
+def key_attrs_of(collection: str) -> list:
+    if collection in SEMPV2_KEY_ATTRS:
+        return SEMPV2_KEY_ATTRS[collection]
+    singular = collection[:-1] if collection.endswith('s') else collection
+    return [singular + 'Name']
+
+
+class SempNode(object):
+    # an object in the SEMP v2 tree, with its child collections
+    def __init__(self, data: dict):
+        self.data = data
+        self.collections = dict()
+
+    def get_collection(self, name: str) -> 'SempCollection':
+        if name not in self.collections:
+            self.collections[name] = SempCollection(name)
+        return self.collections[name]
+
+
+class SempCollection(object):
+    def __init__(self, name: str):
+        self.name = name
+        self.nodes = dict()
+        self._sorted_keys = None
+
+    def sorted_keys(self) -> list:
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self.nodes.keys())
+        return self._sorted_keys
+
+    def put(self, key: str, node: SempNode):
+        self.nodes[key] = node
+        self._sorted_keys = None
+
+    def remove(self, key: str):
+        del self.nodes[key]
+        self._sorted_keys = None
+
+
+class SempError(Exception):
+    def __init__(self, code: int, description: str, http_status: int = 400):
+        super().__init__(description)
+        self.code = code
+        self.description = description
+        self.http_status = http_status
+
+
+class MockState(object):
+
+    def __init__(self, config: dict = None):
+        self.lock = threading.RLock()
+        self.config = dict(DEFAULT_CONFIG)
+        if config:
+            self.config.update(config)
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.root = SempNode({})
+            self.root.get_collection('msgVpns').put('default', SempNode({'msgVpnName': 'default', 'enabled': True}))
+            self.cloud_services = dict()
+            self.cloud_requests = dict()
+            self.reset_stats()
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats = {
+                'requests': 0,
+                'requests_by_api': {},
+                'requests_by_method': {},
+                'faults_injected': 0,
+                'bytes_sent': 0,
+                'handler_seconds': 0.0
+            }
+
+    def count_request(self, api: str, method: str, bytes_sent: int, handler_seconds: float):
+        with self.lock:
+            self.stats['requests'] += 1
+            self.stats['requests_by_api'][api] = self.stats['requests_by_api'].get(api, 0) + 1
+            self.stats['requests_by_method'][method] = self.stats['requests_by_method'].get(method, 0) + 1
+            self.stats['bytes_sent'] += bytes_sent
+            self.stats['handler_seconds'] += handler_seconds
+
+    def next_fault(self, method: str, path: str) -> dict:
+        with self.lock:
+            for fault in self.config['faults']:
+                if fault.get('count', 1) <= 0:
+                    continue
+                if fault.get('method') and fault['method'] != method:
+                    continue
+                if fault.get('match') and fault['match'] not in path:
+                    continue
+                if fault.get('skip', 0) > 0:
+                    fault['skip'] -= 1
+                    continue
+                fault['count'] = fault.get('count', 1) - 1
+                self.stats['faults_injected'] += 1
+                return fault
+            if self.config['fault_rate'] > 0 and random.random() < self.config['fault_rate']:
+                self.stats['faults_injected'] += 1
+                return self.config['random_fault']
+        return None
+
+    # ---------------------------------------------------------------------------------------------
+    # SEMP v2 object tree
+
+    def resolve(self, segments: list, create_missing_collection: bool = False):
+        # returns: parent node, collection (or None), node (or None), parent key attrs
+        node = self.root
+        parent_keys = {}
+        collection = None
+        i = 0
+        while i < len(segments):
+            name = segments[i]
+            if name not in node.collections and not create_missing_collection:
+                collection = SempCollection(name)
+            else:
+                collection = node.get_collection(name)
+            if i + 1 == len(segments):
+                return node, collection, None, parent_keys
+            key = segments[i + 1]
+            if key not in collection.nodes:
+                raise SempError(6, f"Could not find match for {name} '{key}'")
+            node = collection.nodes[key]
+            parent_keys.update({k: v for k, v in node.data.items() if k in key_attrs_of(name)})
+            i += 2
+        return None, collection, node, parent_keys
+
+    def get_object(self, segments: list) -> SempNode:
+        if not segments:
+            return self.root
+        _parent, _collection, node, _keys = self.resolve(segments)
+        if node is None:
+            raise SempError(11, "Invalid path: expected an object, got a collection")
+        return node
+
+    def create_object(self, segments: list, body: dict) -> dict:
+        parent, collection, node, parent_keys = self.resolve(segments, create_missing_collection=True)
+        if node is not None:
+            raise SempError(11, "Invalid path: cannot POST to an object")
+        key_attrs = key_attrs_of(collection.name)
+        data = dict(parent_keys)
+        data.update(body)
+        missing = [k for k in key_attrs if k not in data or data[k] in (None, '')]
+        if missing:
+            raise SempError(11, f"Missing attribute(s): {', '.join(missing)}")
+        key = ','.join(str(data[k]) for k in key_attrs)
+        if key in collection.nodes:
+            raise SempError(10, f"Object '{key}' already exists")
+        collection.put(key, SempNode(data))
+        return data
+
+    def list_objects(self, segments: list, count: int, cursor: str, where: list, select: list):
+        # returns: list of (data, node), next cursor or None
+        _parent, collection, node, _keys = self.resolve(segments)
+        if node is not None:
+            raise SempError(11, "Invalid path: expected a collection, got an object")
+        keys = collection.sorted_keys()
+        start = bisect.bisect_left(keys, cursor) if cursor else 0
+        result = []
+        i = start
+        while i < len(keys) and len(result) < count:
+            _node = collection.nodes[keys[i]]
+            if matches_where(_node.data, where):
+                result.append((apply_select(_node.data, select), _node))
+            i += 1
+        # skip non-matching objects so a cursor is only returned if there is more
+        while i < len(keys) and where and not matches_where(collection.nodes[keys[i]].data, where):
+            i += 1
+        next_cursor = keys[i] if i < len(keys) else None
+        return result, next_cursor
+
+    def seed(self, segments: list, count: int, key_prefix: str, settings: dict) -> int:
+        _parent, collection, node, parent_keys = self.resolve(segments, create_missing_collection=True)
+        if node is not None:
+            raise SempError(11, "Invalid path: seed requires a collection")
+        key_attrs = key_attrs_of(collection.name)
+        width = len(str(count))
+        for n in range(count):
+            data = dict(parent_keys)
+            data.update(settings or {})
+            for k in key_attrs:
+                data[k] = f"{key_prefix}{n:0{width}d}"
+            collection.put(','.join(data[k] for k in key_attrs), SempNode(data))
+        return count
+
+
+def parse_where(where_str: str) -> list:
+    clauses = []
+    if not where_str:
+        return clauses
+    for clause in where_str.split(','):
+        m = WHERE_CLAUSE_RE.match(clause)
+        if not m:
+            raise SempError(11, f"Invalid where clause: '{clause}'")
+        clauses.append((m.group(1), m.group(2), m.group(3)))
+    return clauses
+
+
+def _compare(a, op: str, b: str) -> bool:
+    try:
+        a_val, b_val = float(a), float(b)
+    except (TypeError, ValueError):
+        a_val, b_val = str(a), b
+    if op == '<':
+        return a_val < b_val
+    if op == '>':
+        return a_val > b_val
+    if op == '<=':
+        return a_val <= b_val
+    return a_val >= b_val
+
+
+def matches_where(data: dict, where: list) -> bool:
+    for attr, op, value in where:
+        if attr not in data:
+            return False
+        attr_value = data[attr]
+        if isinstance(attr_value, bool):
+            attr_value = 'true' if attr_value else 'false'
+        if op in ('==', '!='):
+            is_match = fnmatch.fnmatchcase(str(attr_value), value)
+            if is_match != (op == '=='):
+                return False
+        elif not _compare(attr_value, op, value):
+            return False
+    return True
+
+
+def apply_select(data: dict, select: list) -> dict:
+    if not select:
+        return data
+    return {k: v for k, v in data.items() if any(fnmatch.fnmatchcase(k, s) for s in select)}
+
+
+def semp_meta(request_method: str, uri: str, response_code: int = 200, error: dict = None, **kwargs) -> dict:
+    meta = {
+        'request': {'method': request_method, 'uri': uri},
+        'responseCode': response_code
+    }
+    if error:
+        meta['error'] = error
+    meta.update(kwargs)
+    return meta
+
+
+class SolaceMockHandler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # keep-alive: headers & body are written separately, don't wait for delayed ACKs
+    disable_nagle_algorithm = True
+    server_version = 'SolaceMock/1.0'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self) -> MockState:
+        return self.server.state
+
+    def do_GET(self):
+        self.handle_request('GET')
+
+    def do_POST(self):
+        self.handle_request('POST')
+
+    def do_PUT(self):
+        self.handle_request('PUT')
+
+    def do_PATCH(self):
+        self.handle_request('PATCH')
+
+    def do_DELETE(self):
+        self.handle_request('DELETE')
+
+    def read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        return self.rfile.read(length) if length > 0 else b''
+
+    def read_json_body(self) -> dict:
+        raw = self.read_body()
+        if not raw:
+            return {}
+        try:
+            return json.loads(raw.decode('utf-8'))
+        except ValueError:
+            raise SempError(11, 'Invalid JSON body')
+
+    def send(self, status: int, body, content_type: str = 'application/json') -> int:
+        if isinstance(body, (dict, list)):
+            payload = json.dumps(body).encode('utf-8')
+        elif isinstance(body, str):
+            payload = body.encode('utf-8')
+        else:
+            payload = body or b''
+        gzip_min_bytes = self.state.config['gzip_min_bytes']
+        is_gzip = (gzip_min_bytes is not None and len(payload) >= gzip_min_bytes
+                   and 'gzip' in self.headers.get('Accept-Encoding', ''))
+        if is_gzip:
+            payload = gzip.compress(payload)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if is_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        return len(payload)
+
+    def handle_request(self, method: str):
+        start = time.perf_counter()
+        url = urllib.parse.urlsplit(self.path)
+        path = url.path
+        query = urllib.parse.parse_qs(url.query, keep_blank_values=True)
+        if path.startswith('/__mock__/'):
+            self.handle_control(method, path[len('/__mock__/'):], query)
+            return
+        if path.startswith('/SEMP/v2/'):
+            api = 'sempv2'
+        elif path.rstrip('/') == '/SEMP':
+            api = 'sempv1'
+        elif path.startswith('/api/v0/'):
+            api = 'cloud'
+        else:
+            api = 'unknown'
+        config = self.state.config
+        latency_ms = config['latency_ms'] + random.uniform(0, config['latency_jitter_ms'])
+        if latency_ms > 0:
+            time.sleep(latency_ms / 1000)
+        fault = self.state.next_fault(method, path)
+        if fault:
+            self.read_body()
+            bytes_sent = self.apply_fault(api, method, fault)
+        elif api == 'sempv2':
+            bytes_sent = self.handle_sempv2(method, path, query)
+        elif api == 'sempv1':
+            bytes_sent = self.handle_sempv1()
+        elif api == 'cloud':
+            bytes_sent = self.handle_cloud(method, path)
+        else:
+            self.read_body()
+            bytes_sent = self.send(404, {'message': f"unknown path: {path}"})
+        self.state.count_request(api, method, bytes_sent, time.perf_counter() - start)
+
+    def apply_fault(self, api: str, method: str, fault: dict) -> int:
+        # fault: {http_status: 502|504|500|..., sub_code: '5000_104', semp_error_code: 6|11|72|...}
+        if 'semp_error_code' in fault:
+            code = fault['semp_error_code']
+            error = {'code': code, 'description': 'injected fault', 'status': SEMPV2_ERROR_CODES.get(code, 'ERROR')}
+            return self.send(fault.get('http_status', 400), {'meta': semp_meta(method, self.path, fault.get('http_status', 400), error)})
+        status = fault.get('http_status', 502)
+        if 'sub_code' in fault:
+            return self.send(status, {
+                'message': fault.get('message', 'The server is too busy to respond'),
+                'subCode': fault['sub_code'],
+                'errorId': uuid.uuid4().hex[:16],
+                'traceId': uuid.uuid4().hex[:16]
+            })
+        return self.send(status, f"<html><body>{status} injected fault</body></html>", content_type='text/html')
+
+    # ---------------------------------------------------------------------------------------------
+    # control
+
+    def handle_control(self, method: str, name: str, query: dict):
+        try:
+            body = self.read_json_body() if method in ('POST', 'PATCH', 'PUT') else {}
+        except SempError as e:
+            self.send(400, {'message': e.description})
+            return
+        with self.state.lock:
+            if name == 'config' and method == 'GET':
+                self.send(200, self.state.config)
+            elif name == 'config' and method in ('PATCH', 'PUT', 'POST'):
+                self.state.config.update(body)
+                self.send(200, self.state.config)
+            elif name == 'stats' and method == 'GET':
+                self.send(200, self.state.stats)
+            elif name == 'stats' and method == 'DELETE':
+                self.state.reset_stats()
+                self.send(200, self.state.stats)
+            elif name == 'reset' and method == 'POST':
+                self.state.reset()
+                self.send(200, {})
+            elif name == 'seed' and method == 'POST':
+                self.handle_seed(body)
+            else:
+                self.send(404, {'message': f"unknown control: {method} {name}"})
+
+    def handle_seed(self, body: dict):
+        # {"collection": "/msgVpns/default/queues", "count": 1000, "key_prefix": "q-", "settings": {}}
+        # {"cloud_services": 10}
+        created = 0
+        try:
+            if 'collection' in body:
+                segments = [s for s in body['collection'].split('/') if s]
+                created = self.state.seed(segments, int(body.get('count', 0)), body.get('key_prefix', 'obj-'), body.get('settings', None))
+            for _i in range(int(body.get('cloud_services', 0))):
+                self.create_cloud_service({'name': f"svc-{uuid.uuid4().hex[:8]}"}, completed=True)
+                created += 1
+        except SempError as e:
+            self.send(400, {'message': e.description})
+            return
+        self.send(200, {'created': created})
+
+    # ---------------------------------------------------------------------------------------------
+    # SEMP v2
+
+    def handle_sempv2(self, method: str, path: str, query: dict) -> int:
+        raw_segments = path[len('/SEMP/v2/'):].split('/')
+        api_base = raw_segments[0]
+        segments = [urllib.parse.unquote_plus(s) for s in raw_segments[1:] if s != '']
+        try:
+            body = self.read_json_body() if method in ('POST', 'PATCH', 'PUT') else {}
+            if api_base not in SEMPV2_API_BASES:
+                raise SempError(11, f"Invalid path: unknown api '{api_base}'")
+            if segments[:1] == ['about']:
+                return self.handle_sempv2_about(method, segments)
+            with self.state.lock:
+                if api_base.endswith('action'):
+                    return self.handle_sempv2_action(method, segments)
+                is_monitor = api_base.endswith('monitor')
+                if method == 'GET':
+                    if len(segments) % 2 == 1:
+                        return self.handle_sempv2_list(segments, query, is_monitor)
+                    node = self.state.get_object(segments)
+                    data = node.data
+                    if is_monitor and len(segments) == 2 and segments[0] == 'msgVpns':
+                        data = dict(data, state=self.state.config['msg_vpn_state'] if data.get('enabled', True) else 'down')
+                    select = [s for s in query.get('select', [''])[0].split(',') if s]
+                    resp = {'data': apply_select(data, select), 'meta': semp_meta(method, self.path)}
+                    if is_monitor:
+                        resp['collections'] = {k: {'count': len(c.nodes)} for k, c in node.collections.items()}
+                    return self.send(200, resp)
+                if is_monitor:
+                    raise SempError(11, "Invalid path: monitor api is read only")
+                if method == 'POST':
+                    data = self.state.create_object(segments, body)
+                    return self.send(200, {'data': data, 'meta': semp_meta(method, self.path)})
+                if method in ('PATCH', 'PUT'):
+                    node = self.state.get_object(segments)
+                    if method == 'PUT' and segments:
+                        keys = {k: v for k, v in node.data.items() if k in key_attrs_of(segments[-2])}
+                        node.data = dict(keys)
+                    node.data.update(body)
+                    return self.send(200, {'data': node.data, 'meta': semp_meta(method, self.path)})
+                if method == 'DELETE':
+                    if len(segments) % 2 == 1 or not segments:
+                        raise SempError(11, "Invalid path: DELETE requires an object")
+                    self.state.get_object(segments)
+                    parent_node = self.state.get_object(segments[:-2]) if len(segments) > 2 else self.state.root
+                    parent_node.collections[segments[-2]].remove(segments[-1])
+                    return self.send(200, {'meta': semp_meta(method, self.path)})
+                raise SempError(11, f"Invalid method: {method}")
+        except SempError as e:
+            error = {'code': e.code, 'description': e.description, 'status': SEMPV2_ERROR_CODES.get(e.code, 'ERROR')}
+            return self.send(e.http_status, {'meta': semp_meta(method, self.path, e.http_status, error)})
+
+    def handle_sempv2_about(self, method: str, segments: list) -> int:
+        if method != 'GET':
+            raise SempError(11, "Invalid path: about is read only")
+        if segments == ['about', 'api']:
+            data = {'platform': 'VMR', 'sempVersion': self.state.config['sempv2_version']}
+        elif segments == ['about', 'user']:
+            data = {'globalAccessLevel': 'admin', 'username': 'admin'}
+        elif segments == ['about']:
+            data = {}
+        else:
+            raise SempError(6, f"Could not find match for {'/'.join(segments)}")
+        return self.send(200, {'data': data, 'meta': semp_meta(method, self.path)})
+
+    def handle_sempv2_action(self, method: str, segments: list) -> int:
+        # e.g. PUT /msgVpns/{msgVpnName}/queues/{queueName}/clearStats
+        if method == 'GET':
+            if len(segments) % 2 == 0:
+                self.state.get_object(segments)
+            return self.send(200, {'data': {'actions': []}, 'meta': semp_meta(method, self.path)})
+        if method != 'PUT' or len(segments) % 2 == 0:
+            raise SempError(11, "Invalid path: actions are executed with PUT {object}/{action}")
+        self.state.get_object(segments[:-1])
+        return self.send(200, {'data': {}, 'meta': semp_meta(method, self.path)})
+
+    def handle_sempv2_list(self, segments: list, query: dict, is_monitor: bool) -> int:
+        config = self.state.config
+        try:
+            count = int(query.get('count', [config['sempv2_default_count']])[0])
+        except ValueError:
+            raise SempError(11, "Invalid query: 'count' must be an integer")
+        if count < 1 or count > config['sempv2_max_count']:
+            raise SempError(11, f"Invalid query: 'count' must be 1..{config['sempv2_max_count']}")
+        cursor = None
+        if 'cursor' in query:
+            try:
+                cursor = base64.urlsafe_b64decode(query['cursor'][0].encode()).decode('utf-8')
+            except (ValueError, UnicodeDecodeError):
+                raise SempError(11, "Invalid query: 'cursor'")
+        where_str = query.get('where', [''])[0]
+        where = parse_where(where_str)
+        select_str = query.get('select', [''])[0]
+        select = [s for s in select_str.split(',') if s]
+        items, next_cursor = self.state.list_objects(segments, count, cursor, where, select)
+        meta = semp_meta('GET', self.path, count=len(items))
+        if next_cursor is not None:
+            next_query = {'count': count, 'cursor': base64.urlsafe_b64encode(next_cursor.encode('utf-8')).decode()}
+            if where_str:
+                next_query['where'] = where_str
+            if select_str:
+                next_query['select'] = select_str
+            host = self.headers.get('Host', f"{self.server.server_address[0]}:{self.server.server_address[1]}")
+            next_uri = f"http://{host}{urllib.parse.urlsplit(self.path).path}?{urllib.parse.urlencode(next_query, safe=',*')}"
+            meta['paging'] = {'cursorQuery': next_query['cursor'], 'nextPageUri': next_uri}
+        resp = {'data': [data for data, _node in items], 'links': [{} for _i in items], 'meta': meta}
+        if is_monitor:
+            resp['collections'] = [{k: {'count': len(c.nodes)} for k, c in node.collections.items()} for _data, node in items]
+        return self.send(200, resp)
+
+    # ---------------------------------------------------------------------------------------------
+    # SEMP v1
+
+    def handle_sempv1(self) -> int:
+        raw = self.read_body()
+        try:
+            rpc = ET.fromstring(raw.decode('utf-8'))
+        except ET.ParseError as e:
+            return self.send_sempv1_reply(None, 'fail', f"parse error: {e}")
+        show = rpc.find('show')
+        if rpc.tag != 'rpc' or show is None or len(show) == 0:
+            return self.send_sempv1_reply(None, 'fail', 'mock: only <rpc><show>...</show></rpc> is supported')
+        command = show[0]
+        if command.tag == 'service':
+            reply_elem = ET.Element('service')
+            ET.SubElement(reply_elem, 'services')
+            return self.send_sempv1_reply(reply_elem, 'ok')
+        if command.tag == 'queue':
+            return self.handle_sempv1_show_queue(command)
+        return self.send_sempv1_reply(None, 'fail', f"mock: unsupported command: show {command.tag}")
+
+    def handle_sempv1_show_queue(self, command) -> int:
+        name_pattern = command.findtext('name', '*')
+        vpn_pattern = command.findtext('vpn-name', '*')
+        num_elements = command.findtext('num-elements')
+        cursor = command.findtext('mock-cursor')
+        limit = int(num_elements) if num_elements else None
+        queues = []
+        with self.state.lock:
+            vpns = self.state.root.get_collection('msgVpns')
+            for vpn_name in vpns.sorted_keys():
+                if not fnmatch.fnmatchcase(vpn_name, vpn_pattern):
+                    continue
+                queue_collection = vpns.nodes[vpn_name].get_collection('queues')
+                for queue_name in queue_collection.sorted_keys():
+                    if fnmatch.fnmatchcase(queue_name, name_pattern):
+                        queues.append((f"{vpn_name},{queue_name}", vpn_name, queue_name, queue_collection.nodes[queue_name].data))
+        if cursor:
+            queues = [q for q in queues if q[0] >= cursor]
+        more = None
+        if limit is not None and len(queues) > limit:
+            more = queues[limit][0]
+            queues = queues[:limit]
+        reply_elem = ET.Element('queue')
+        if queues:
+            queues_elem = ET.SubElement(reply_elem, 'queues')
+            for _key, vpn_name, queue_name, data in queues:
+                queue_elem = ET.SubElement(queues_elem, 'queue')
+                ET.SubElement(queue_elem, 'name').text = queue_name
+                info_elem = ET.SubElement(queue_elem, 'info')
+                ET.SubElement(info_elem, 'message-vpn').text = vpn_name
+                ET.SubElement(info_elem, 'durable').text = 'true'
+                ET.SubElement(info_elem, 'ingress-config-status').text = 'Up' if data.get('ingressEnabled') else 'Down'
+                ET.SubElement(info_elem, 'egress-config-status').text = 'Up' if data.get('egressEnabled') else 'Down'
+        more_cookie = None
+        if more is not None:
+            more_cookie = ET.Element('more-cookie')
+            rpc_elem = ET.SubElement(more_cookie, 'rpc')
+            queue_elem = ET.SubElement(ET.SubElement(rpc_elem, 'show'), 'queue')
+            ET.SubElement(queue_elem, 'name').text = name_pattern
+            ET.SubElement(queue_elem, 'vpn-name').text = vpn_pattern
+            ET.SubElement(queue_elem, 'count')
+            ET.SubElement(queue_elem, 'num-elements').text = str(limit)
+            ET.SubElement(queue_elem, 'mock-cursor').text = more
+        return self.send_sempv1_reply(reply_elem, 'ok', more_cookie=more_cookie)
+
+    def send_sempv1_reply(self, show_elem, code: str, reason: str = None, more_cookie=None) -> int:
+        reply = ET.Element('rpc-reply', {'semp-version': self.state.config['sempv1_version']})
+        if show_elem is not None:
+            ET.SubElement(ET.SubElement(reply, 'rpc'), 'show').append(show_elem)
+        result = ET.SubElement(reply, 'execute-result', {'code': code})
+        if reason:
+            result.set('reason', reason)
+        if more_cookie is not None:
+            reply.append(more_cookie)
+        return self.send(200, ET.tostring(reply, encoding='utf-8'), content_type='text/xml')
+
+    # ---------------------------------------------------------------------------------------------
+    # Solace Cloud
+
+    def create_cloud_service(self, body: dict, completed: bool = False) -> dict:
+        service_id = uuid.uuid4().hex[:10]
+        name = body.get('name', service_id)
+        service = {
+            'serviceId': service_id,
+            'name': name,
+            'datacenterId': body.get('datacenterId', 'aws-ca-central-1a'),
+            'serviceTypeId': body.get('serviceTypeId', 'enterprise'),
+            'serviceClassId': body.get('serviceClassId', 'enterprise-250-nano'),
+            'adminState': 'start',
+            'creationState': 'completed' if completed else 'pending',
+            'msgVpnName': name,
+            'eventBrokerVersion': body.get('eventBrokerVersion', '9.13'),
+            'msgVpnAttributes': {
+                'vmrVersion': '9.13.1.38',
+                'vpnName': name,
+                'subDomainName': f"{service_id}.messaging.solace.cloud",
+                'vpnAdminUsername': f"{name}-admin",
+                'vpnAdminPassword': 'mock-password'
+            },
+            'serviceConnectionEndpoints': [],
+            'managementProtocols': [{
+                'name': 'SEMP',
+                'username': f"{name}-admin",
+                'password': 'mock-password',
+                'endPoints': [{'name': 'Secured SEMP Config', 'uris': [f"https://{service_id}.messaging.solace.cloud:943"]}]
+            }],
+            'messagingProtocols': []
+        }
+        self.state.cloud_services[service_id] = {'service': service, 'polls': 0}
+        return service
+
+    def handle_cloud(self, method: str, path: str) -> int:
+        auth = self.headers.get('Authorization', '')
+        body = self.read_json_body() if method in ('POST', 'PATCH', 'PUT') else {}
+        if not auth.lower().startswith('bearer '):
+            return self.send(401, {'message': 'Unauthorized', 'subCode': '4010_100'})
+        segments = [urllib.parse.unquote(s) for s in path[len('/api/v0/'):].split('/') if s]
+        config = self.state.config
+        with self.state.lock:
+            if segments == ['datacenters'] and method == 'GET':
+                return self.send(200, {'data': [{'id': 'aws-ca-central-1a', 'name': 'Canada (Central)', 'provider': 'aws'}]})
+            if segments[:1] != ['services']:
+                return self.send(404, {'message': f"Unknown resource: {path}", 'subCode': '4040_100'})
+            if len(segments) == 1:
+                if method == 'GET':
+                    # the list has no connection details, same as the api
+                    return self.send(200, {'data': [{k: v for k, v in entry['service'].items() if k not in CLOUD_SERVICE_DETAILS}
+                                                    for entry in self.state.cloud_services.values()]})
+                if method == 'POST':
+                    return self.send(201, {'data': self.create_cloud_service(body)})
+            service_id = segments[1] if len(segments) > 1 else None
+            entry = self.state.cloud_services.get(service_id)
+            if entry is None:
+                return self.send(404, {'message': f"Service '{service_id}' not found", 'subCode': '4040_101'})
+            service = entry['service']
+            if len(segments) == 2:
+                if method == 'GET':
+                    entry['polls'] += 1
+                    if service['creationState'] == 'pending' and entry['polls'] >= config['cloud_creation_polls']:
+                        service['creationState'] = 'completed'
+                    return self.send(200, {'data': service})
+                if method == 'DELETE':
+                    del self.state.cloud_services[service_id]
+                    return self.send(202, {'data': service})
+            if segments[2:3] == ['requests']:
+                requests_of_service = self.state.cloud_requests.setdefault(service_id, dict())
+                if len(segments) == 3 and method == 'GET':
+                    return self.send(200, {'data': [self.poll_cloud_request(r) for r in requests_of_service.values()]})
+                if len(segments) == 4 and method == 'GET':
+                    request = requests_of_service.get(segments[3])
+                    if request is None:
+                        return self.send(404, {'message': f"Request '{segments[3]}' not found", 'subCode': '4040_102'})
+                    return self.send(200, {'data': self.poll_cloud_request(request)})
+                if method == 'POST':
+                    # e.g. POST /services/{serviceId}/requests/clientProfileRequests
+                    request_id = uuid.uuid4().hex[:10]
+                    request = {'id': request_id, 'adminProgress': 'inProgress', 'operation': segments[-1], 'polls': 0, 'body': body}
+                    requests_of_service[request_id] = request
+                    return self.send(202, {'data': {k: v for k, v in request.items() if k != 'polls'}})
+            return self.send(404, {'message': f"Unknown resource: {method} {path}", 'subCode': '4040_100'})
+
+    def poll_cloud_request(self, request: dict) -> dict:
+        request['polls'] += 1
+        if request['adminProgress'] == 'inProgress' and request['polls'] >= self.state.config['cloud_request_polls']:
+            request['adminProgress'] = 'completed'
+        return {k: v for k, v in request.items() if k != 'polls'}
+
+
+class SolaceMockServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, config: dict = None):
+        super().__init__((host, port), SolaceMockHandler)
+        self.state = MockState(config)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.port}"
+
+    def start_in_thread(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, name='solace-mock-server', daemon=True)
+        thread.start()
+        return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Solace PubSub+ SEMP & Solace Cloud api mock server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=18080)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--latency-jitter-ms', type=float, default=0)
+    parser.add_argument('--fault-rate', type=float, default=0.0, help='probability of a 502 response')
+    parser.add_argument('--gzip-min-bytes', type=int, default=None, help='gzip responses of at least this size, default: never')
+    args = parser.parse_args()
+    server = SolaceMockServer(args.host, args.port, {
+        'latency_ms': args.latency_ms,
+        'latency_jitter_ms': args.latency_jitter_ms,
+        'fault_rate': args.fault_rate,
+        'gzip_min_bytes': args.gzip_min_bytes
+    })
+    print(f"solace mock server listening on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Guards the cold-start (import) time of every module in the collection.
+# Uses 'python -X importtime' to:
+#   - check that no module imports SEMP v1/XML or packaging at import time
+#   - check that the collection's own import overhead stays within a budget
+#
+# usage: check_module_startup.py {collections-root-dir}
+# env vars:
+#   ASC_MODULE_STARTUP_BUDGET_MS: max import overhead per module in ms, default: 150
+#   ASC_MODULE_STARTUP_RUNS: number of runs per module, the median is used, default: 3
+
+import os
+import sys
+import subprocess
+import statistics
+
+COLLECTION_PATH = os.path.join('ansible_collections', 'solace', 'pubsub_plus')
+MODULE_IMPORT_PREFIX = 'ansible_collections.solace.pubsub_plus.plugins.modules.'
+BASELINE_IMPORTS = 'import ansible.module_utils.basic, requests'
+# must only be imported on first use
+LAZY_IMPORTS = [
+    'xmltodict',
+    'packaging.version',
+    'xml.etree.ElementTree'
+]
+
+
+def import_time(collections_root: str, statement: str):
+    # returns: total cumulative import time in us, set of imported module names
+    env = dict(os.environ)
+    env['PYTHONPATH'] = collections_root + os.pathsep + env.get('PYTHONPATH', '')
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{proc.stderr}")
+    total_us = 0
+    imported = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imported.add(name.strip())
+        # top level imports only, nested ones are included in cumulative
+        if not name.startswith('  '):
+            total_us += int(cumulative_us)
+    return total_us, imported
+
+
+def median_import_time(collections_root: str, statement: str, runs: int):
+    samples = []
+    imported = set()
+    for _i in range(runs):
+        total_us, imported = import_time(collections_root, statement)
+        samples.append(total_us)
+    return statistics.median(samples), imported
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(f"usage: {sys.argv[0]} {{collections-root-dir}}")
+        return 2
+    collections_root = sys.argv[1]
+    budget_ms = float(os.getenv('ASC_MODULE_STARTUP_BUDGET_MS', '150'))
+    runs = int(os.getenv('ASC_MODULE_STARTUP_RUNS', '3'))
+    modules_dir = os.path.join(collections_root, COLLECTION_PATH, 'plugins', 'modules')
+    module_names = sorted(f[:-3] for f in os.listdir(modules_dir) if f.endswith('.py') and not f.startswith('_'))
+
+    baseline_us, _imported = median_import_time(collections_root, BASELINE_IMPORTS, runs)
+    print(f"baseline ({BASELINE_IMPORTS}): {baseline_us / 1000:.1f} ms")
+
+    errors = []
+    for module_name in module_names:
+        total_us, imported = median_import_time(collections_root, f"import {MODULE_IMPORT_PREFIX}{module_name}", runs)
+        overhead_ms = max(total_us - baseline_us, 0) / 1000
+        eager = [name for name in LAZY_IMPORTS if name in imported]
+        print(f"{module_name}: total={total_us / 1000:.1f} ms, overhead={overhead_ms:.1f} ms")
+        if eager:
+            errors.append(f"{module_name}: imports {eager} at import time, must be imported lazily")
+        if overhead_ms > budget_ms:
+            errors.append(f"{module_name}: import overhead {overhead_ms:.1f} ms exceeds budget of {budget_ms} ms")
+
+    for error in errors:
+        print(f">>> XT_ERROR: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
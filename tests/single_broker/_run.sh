@@ -25,10 +25,19 @@ source $PROJECT_HOME/.lib/functions.sh
       "solace_get_list"
       "solace_service_auth"
       "solace_get_available"
+      "solace_get_available_many"
+      "solace_persistent"
+      "solace_metrics"
       "solace_auth"
       "solace_oauth"
       "solace_facts"
       "solace_vpn"
+      "solace_vpn_config_apply"
+      "solace_vpn_config_export"
+      "solace_vpn_config_drift"
+      "solace_bulk"
+      "solace_monitor_sample"
+      "solace_wait_for"
       "solace_acl_profile"
       "solace_rdp"
       "solace_cert_authority"
@@ -27,6 +27,7 @@ playbooks=(
   "$scriptDir/get.playbook.yml"
   "$scriptDir/subscription_list.playbook.yml"
   "$scriptDir/subscription_list.exceptions.playbook.yml"
+  "$scriptDir/subscription_list.journal.playbook.yml"
   "$scriptDir/subscription_list.doc-example.playbook.yml"
 )
 
@@ -20,6 +20,7 @@ source $PROJECT_HOME/.lib/functions.sh
       "setup"
       "solace_cloud_service_hostnames"
       "solace_cloud_service"
+      "solace_cloud_inventory"
       "teardown"
     )
   fi
@@ -0,0 +1,69 @@
+#!/usr/bin/env bash
+# Copyright (c) 2022, Solace Corporation, Ricardo Gomez-Ulmke, <ricardo.gomez-ulmke@solace.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+scriptDir=$(cd $(dirname "$0") && pwd);
+scriptName=$(basename $(test -L "$0" && readlink "$0" || echo "$0"));
+testTarget=${scriptDir##*/}
+scriptLogName="$testTargetGroup.$testTarget.$scriptName"
+if [ -z "$PROJECT_HOME" ]; then echo ">>> XT_ERROR: - $scriptLogName - missing env var: PROJECT_HOME"; exit 1; fi
+source $PROJECT_HOME/.lib/functions.sh
+
+############################################################################################################################
+# Environment Variables
+
+  if [ -z "$LOG_DIR" ]; then echo ">>> XT_ERROR: - $scriptLogName - missing env var: LOG_DIR"; exit 1; fi
+  if [ -z "$WORKING_DIR" ]; then echo ">>> XT_ERROR: - $scriptLogName - missing env var: WORKING_DIR"; exit 1; fi
+  if [ -z "$SOLACE_CLOUD_API_TOKEN_ALL_PERMISSIONS" ]; then echo ">>> XT_ERROR: - $scriptLogName - missing env var: SOLACE_CLOUD_API_TOKEN_ALL_PERMISSIONS"; exit 1; fi
+  if [ -z "$SOLACE_CLOUD_INVENTORY_FILE_NAME" ]; then echo ">>> XT_ERROR: - $scriptLogName - missing env var: SOLACE_CLOUD_INVENTORY_FILE_NAME"; exit 1; fi
+
+##############################################################################################################################
+# Settings
+
+  export ANSIBLE_SOLACE_LOG_PATH="$LOG_DIR/$scriptLogName.ansible-solace.log"
+  export ANSIBLE_LOG_PATH="$LOG_DIR/$scriptLogName.ansible.log"
+  export SOLACE_CLOUD_API_TOKEN=$SOLACE_CLOUD_API_TOKEN_ALL_PERMISSIONS
+
+##############################################################################################################################
+# Prepare
+
+  scInventory=$(assertFile $scriptLogName "$WORKING_DIR/$SOLACE_CLOUD_INVENTORY_FILE_NAME") || exit
+  pluginInventory="$WORKING_DIR/test.solace_cloud.yml"
+  cat > $pluginInventory << EOI
+plugin: solace.pubsub_plus.solace_cloud
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: $WORKING_DIR/inventory-cache
+cache_timeout: 600
+EOI
+
+##############################################################################################################################
+# Run
+
+  # from the solace cloud api
+  rm -rf $WORKING_DIR/inventory-cache
+  ansible-inventory -i $pluginInventory --list > $WORKING_DIR/solace_cloud_inventory.api.json
+  code=$?; if [[ $code != 0 ]]; then echo ">>> XT_ERROR - $code - script:$scriptLogName, ansible-inventory"; exit 1; fi
+  # from the cache
+  ansible-inventory -i $pluginInventory --list > $WORKING_DIR/solace_cloud_inventory.cache.json
+  code=$?; if [[ $code != 0 ]]; then echo ">>> XT_ERROR - $code - script:$scriptLogName, ansible-inventory"; exit 1; fi
+
+  playbooks=(
+    "$scriptDir/main.playbook.yml"
+  )
+
+  for playbook in ${playbooks[@]}; do
+
+    playbook=$(assertFile $scriptLogName $playbook) || exit
+    ansible-playbook \
+                  -i $scInventory \
+                  $playbook \
+                  --extra-vars "WORKING_DIR=$WORKING_DIR"
+    code=$?; if [[ $code != 0 ]]; then echo ">>> XT_ERROR - $code - script:$scriptLogName, playbook:$playbook"; exit 1; fi
+
+  done
+
+echo ">>> SUCCESS: $scriptLogName"
+
+###
+# The End.